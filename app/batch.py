@@ -0,0 +1,222 @@
+"""
+In-process execution of POST /batch sub-requests.
+
+Each sub-request is a GET on one of the API's own routes. It is run through
+the ASGI app directly, with no socket or HTTP parsing, so it goes through
+the same validation, error handling and caches as a real request. The
+routes do blocking SQLite and CPU work, so sub-requests run in a pool of
+BATCH_WORKERS threads, each with its own event loop and SQLite connection,
+rather than on the server's event loop, which stays free for other
+requests. Their JSON bodies are spliced into the combined response as-is
+rather than parsed and re-serialized. The in-memory indexes' caches are
+locked, so concurrent items are safe.
+
+The streamed /geojson routes cannot be batched. Body chunks are counted
+against the batch's MAX_BATCH_BYTES as the routes send them, and the item
+that would go over is aborted mid-response; it and every item after it get
+a 413, so one batch never holds much more than that in memory.
+
+Items still unfinished BATCH_TIMEOUT seconds after the batch started get a
+504. Queued items are dropped, and a running item's SQLite query is
+aborted through a progress handler on its thread's connection, freeing the
+worker. Pure-Python work between queries (a few milliseconds per route at
+most) is not interrupted and finishes before the worker moves on.
+"""
+
+import asyncio
+import atexit
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlencode, urlsplit
+
+from ghanageo.database import db
+
+# Most sub-requests per batch
+MAX_BATCH_REQUESTS = 20
+
+# Most bytes of sub-request bodies per batch
+MAX_BATCH_BYTES = 4 * 1024 * 1024
+
+# Sub-requests running at once, across all batches
+BATCH_WORKERS = 4
+
+# Seconds a whole batch may take
+BATCH_TIMEOUT = 10.0
+
+# Routes a batch may not call
+_EXCLUDED_PREFIXES = ("/batch", "/docs", "/redoc", "/openapi.json", "/geojson")
+
+
+def _check_path(path: str) -> Optional[str]:
+    """Why `path` cannot be run in a batch, or None"""
+    if not path.startswith("/") or path.startswith("//"):
+        return "path must be an API path such as /regions"
+    if any(path == p or path.startswith(p + "/") or path.startswith(p + "?") for p in _EXCLUDED_PREFIXES):
+        return f"{urlsplit(path).path} cannot be called from a batch"
+    return None
+
+
+class _Budget:
+    """Bytes a batch may still buffer, shared by its items' threads"""
+
+    def __init__(self, size: int):
+        self.left = size
+        self._lock = threading.Lock()
+
+    def take(self, size: int) -> bool:
+        """Reserve `size` bytes; once that fails the budget is spent for good"""
+        with self._lock:
+            if size > self.left:
+                self.left = -1
+                return False
+            self.left -= size
+            return True
+
+
+class _TooLarge(Exception):
+    pass
+
+
+async def _get(app, path: str, params: Optional[Dict],
+               budget: Optional[_Budget] = None) -> Tuple[int, bytes, bytes]:
+    """(status, content type, body) of GET `path` on `app`
+
+    Raises _TooLarge, abandoning the response, when a body chunk would
+    overrun `budget`.
+    """
+    url = urlsplit(path)
+    query = url.query
+    if params:
+        query = "&".join(filter(None, (query, urlencode(params, doseq=True))))
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": url.path,
+        "raw_path": url.path.encode(),
+        "query_string": query.encode(),
+        "root_path": "",
+        "headers": [(b"host", b"batch")],
+        "client": None,
+        "server": None,
+    }
+    status, content_type, chunks = 500, b"", []
+    requested, finished = False, asyncio.Event()
+
+    async def receive():
+        # The empty request body once, then a disconnect when the response is done
+        nonlocal requested
+        if not requested:
+            requested = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await finished.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal status, content_type
+        if message["type"] == "http.response.start":
+            status = message["status"]
+            content_type = dict(message.get("headers", ())).get(b"content-type", b"")
+        elif message["type"] == "http.response.body":
+            chunk = message.get("body", b"")
+            if budget is not None and not budget.take(len(chunk)):
+                raise _TooLarge
+            chunks.append(chunk)
+
+    try:
+        await app(scope, receive, send)
+    finally:
+        finished.set()
+    return status, content_type, b"".join(chunks)
+
+
+_local = threading.local()
+_loops: List[asyncio.AbstractEventLoop] = []
+
+
+def _start_worker() -> None:
+    _local.loop = asyncio.new_event_loop()
+    _loops.append(_local.loop)
+
+
+@atexit.register
+def _close_loops() -> None:
+    # Runs after the pool's threads have been joined
+    while _loops:
+        _loops.pop().close()
+
+
+_pool = ThreadPoolExecutor(BATCH_WORKERS, thread_name_prefix="batch", initializer=_start_worker)
+
+
+class _Expired(Exception):
+    pass
+
+
+def _get_in_thread(app, path: str, params: Optional[Dict], deadline: float,
+                   budget: _Budget) -> Tuple[int, bytes, bytes]:
+    """`_get` on the pool thread's own event loop, its SQLite queries aborted at `deadline`"""
+    if time.monotonic() >= deadline:
+        raise _Expired
+    conn = db.get_connection()
+    conn.set_progress_handler(lambda: time.monotonic() >= deadline, 10_000)
+    try:
+        response = _local.loop.run_until_complete(_get(app, path, params, budget))
+    except Exception:
+        if time.monotonic() >= deadline:
+            raise _Expired  # aborted by the progress handler
+        raise
+    finally:
+        conn.set_progress_handler(None, 0)
+    if time.monotonic() >= deadline:
+        raise _Expired  # possibly cut short by the progress handler
+    return response
+
+
+def _item(path: str, status: int, body: bytes) -> bytes:
+    return b'{"path":%s,"status":%d,"body":%s}' % (json.dumps(path).encode(), status, body)
+
+
+async def run_batch(app, requests: List[Dict]) -> bytes:
+    """The combined JSON response to `requests` ({'path', 'params'} dicts), in order"""
+    budget = _Budget(MAX_BATCH_BYTES)
+    deadline = time.monotonic() + BATCH_TIMEOUT
+    loop = asyncio.get_running_loop()
+
+    def too_large(path: str) -> bytes:
+        detail = f"batch responses exceed {MAX_BATCH_BYTES} bytes; split the batch"
+        return _item(path, 413, json.dumps({"detail": detail}).encode())
+
+    async def run(request: Dict) -> bytes:
+        path = request["path"]
+        problem = _check_path(path)
+        if problem:
+            return _item(path, 400, json.dumps({"detail": problem}).encode())
+        if budget.left < 0:
+            return too_large(path)
+        remaining = deadline - time.monotonic()
+        try:
+            if remaining <= 0:
+                raise _Expired
+            status, content_type, body = await asyncio.wait_for(
+                loop.run_in_executor(_pool, _get_in_thread, app, path, request.get("params"),
+                                     deadline, budget),
+                remaining)
+        except _TooLarge:
+            return too_large(path)
+        except (asyncio.TimeoutError, _Expired):
+            detail = f"batch did not finish within {BATCH_TIMEOUT:g} seconds"
+            return _item(path, 504, json.dumps({"detail": detail}).encode())
+        except Exception as e:
+            return _item(path, 500, json.dumps({"detail": str(e)}).encode())
+        if not (content_type.startswith(b"application/") and b"json" in content_type.split(b";")[0]):
+            body = json.dumps(body.decode("utf-8", "replace")).encode()
+        return _item(path, status, body or b"null")
+
+    items = await asyncio.gather(*(run(r) for r in requests))
+    return b'{"success":true,"count":%d,"data":[%s]}' % (len(items), b",".join(items))
@@ -1,8 +1,18 @@
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 import ghanageo
-from typing import Optional, List, Dict
+from ghanageo.models import (
+    Region, District, Town, SearchResult, Ancestor,
+    RegionListResponse, RegionResponse, DistrictListResponse, DistrictResponse,
+    TownListResponse, TownResponse, SearchResponse, AutocompleteResponse, LookupResponse,
+    StatisticsResponse, AncestorsResponse, ChildrenResponse,
+    BatchGetRequest, BatchGetResponse, BatchItem, BatchRequest, BatchResponse,
+    Cluster, ClustersResponse, Coordinates
+)
+from app.batch import MAX_BATCH_REQUESTS, run_batch
+from app.responses import ModelResponse, accepts_gzip, construct, construct_all, gzip_chunks
+from typing import Optional, List, Dict, Union
 import os
 
 # Create FastAPI app
@@ -28,7 +38,7 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
     allow_credentials=False,
-    allow_methods=["GET"],
+    allow_methods=["GET", "POST"],
     allow_headers=["*"],
 )
 
@@ -45,7 +55,13 @@ async def root():
             "regions": "/regions",
             "districts": "/districts?region=GR",
             "towns": "/towns?district=GR-01",
+            "ancestors": "/locations/{id}/ancestors",
+            "children": "/locations/{id}/children",
             "search": "/search?q=query",
+            "batch_get": "POST /batch/get",
+            "batch": "POST /batch",
+            "geojson": "/geojson/towns?bbox=min_lng,min_lat,max_lng,max_lat",
+            "clusters": "/clusters?bbox=min_lng,min_lat,max_lng,max_lat&zoom=7",
             "statistics": "/statistics"
         }
     }
@@ -72,140 +88,364 @@ async def health_check():
         )
 
 # Geographic endpoints
-@app.get("/regions", tags=["Geographic Data"])
+@app.get("/regions", tags=["Geographic Data"], response_model=RegionListResponse)
 async def get_regions():
     """Get all Ghana regions (Free tier)"""
     try:
         regions = ghanageo.get_regions()
-        return {
-            "success": True,
-            "count": len(regions),
-            "data": regions
-        }
+        return ModelResponse(RegionListResponse.model_construct(
+            success=True,
+            count=len(regions),
+            data=construct_all(Region, regions)
+        ))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/regions/{region_id}", tags=["Geographic Data"])
+@app.get("/regions/{region_id}", tags=["Geographic Data"], response_model=RegionResponse)
 async def get_region(region_id: str):
     """Get specific region by ID or code (Free tier)"""
     try:
         region = ghanageo.get_region(region_id)
-        return {
-            "success": True,
-            "data": region
-        }
+        return ModelResponse(RegionResponse.model_construct(
+            success=True,
+            data=construct(Region, region)
+        ))
     except ghanageo.DataNotFoundError:
         raise HTTPException(status_code=404, detail=f"Region '{region_id}' not found")
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/districts", tags=["Geographic Data"])
+@app.get("/districts", tags=["Geographic Data"], response_model=DistrictListResponse)
 async def get_districts(region: Optional[str] = None):
     """Get districts, optionally filtered by region (Free tier)"""
     try:
         districts = ghanageo.get_districts(region=region)
-        return {
-            "success": True,
-            "count": len(districts),
-            "data": districts
-        }
+        return ModelResponse(DistrictListResponse.model_construct(
+            success=True,
+            count=len(districts),
+            data=construct_all(District, districts)
+        ))
     except ghanageo.DataNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/towns", tags=["Geographic Data"])
+@app.get("/districts/{district_id}", tags=["Geographic Data"], response_model=DistrictResponse)
+async def get_district(district_id: str):
+    """Get a specific district by ID"""
+    try:
+        district = ghanageo.get_district(district_id)
+        return ModelResponse(DistrictResponse.model_construct(
+            success=True,
+            data=construct(District, district)
+        ))
+    except ghanageo.DataNotFoundError:
+        raise HTTPException(status_code=404, detail=f"District '{district_id}' not found")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+# Most ids one GET /towns?ids= or POST /batch/get resolves
+MAX_BATCH_IDS = 5000
+
+_ENTITY_MODELS = {"region": Region, "district": District, "town": Town}
+
+
+def _batch_response(ids: List[str], level: Optional[str] = None) -> ModelResponse:
+    if len(ids) > MAX_BATCH_IDS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BATCH_IDS} ids per request")
+    entries = ghanageo.get_many(ids, level=level)
+    data = [
+        BatchItem.model_construct(**{**e, "data": construct(_ENTITY_MODELS[e["level"]], e["data"])})
+        if e["found"] else BatchItem.model_construct(**e)
+        for e in entries
+    ]
+    return ModelResponse(BatchGetResponse.model_construct(
+        success=True,
+        count=len(data),
+        found=sum(1 for e in entries if e["found"]),
+        data=data
+    ))
+
+
+@app.get("/towns", tags=["Geographic Data"], response_model=Union[TownListResponse, BatchGetResponse],
+         response_model_exclude_unset=True)
 async def get_towns(
+    ids: Optional[str] = Query(None, description=f"Comma-separated town IDs (at most {MAX_BATCH_IDS}); "
+                                                 "returns them in order, with not-found markers"),
     district: Optional[str] = None,
     region: Optional[str] = None,
-    limit: int = Query(500, le=1000, description="Max results (when no filter applied)"),
-    offset: int = Query(0, description="Pagination offset")
+    limit: int = Query(500, le=1000, description="Max results (with no district/region, or with filters)"),
+    offset: int = Query(0, description="Pagination offset"),
+    type: Optional[str] = Query(None, description="Only these types, e.g. 'City,Town'"),
+    min_population: Optional[int] = Query(None, description="Only towns with at least this population"),
+    max_population: Optional[int] = Query(None, description="Only towns with at most this population"),
+    has_coordinates: Optional[bool] = Query(None, description="Only towns with (true) or without (false) coordinates"),
+    sort: Optional[str] = Query(None, description="'name', 'population' or '-population'",
+                                pattern="^(name|population|-population)$")
 ):
-    """Get towns/villages, optionally filtered by district or region"""
+    """Get towns/villages, optionally filtered by district or region, type and population"""
+    if ids is not None:
+        return _batch_response([i.strip() for i in ids.split(",") if i.strip()], level="town")
     try:
-        towns = ghanageo.get_towns(district=district, region=region, limit=limit, offset=offset)
-        return {
-            "success": True,
-            "count": len(towns),
-            "data": towns
-        }
+        filters = dict(
+            type=[t.strip() for t in type.split(",") if t.strip()] if type else None,
+            min_population=min_population, max_population=max_population,
+            has_coordinates=has_coordinates,
+        )
+        towns = ghanageo.get_towns(district=district, region=region, limit=limit, offset=offset,
+                                   sort=sort, **filters)
+        filtered = sort or any(v is not None for v in filters.values())
+        return ModelResponse(TownListResponse.model_construct(
+            success=True,
+            count=len(towns),
+            data=construct_all(Town, towns),
+            **({"total": ghanageo.count_towns(district=district, region=region, **filters)} if filtered else {})
+        ))
     except ghanageo.DataNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/towns/{town_id}", tags=["Geographic Data"])
+@app.post("/batch/get", tags=["Geographic Data"], response_model=BatchGetResponse, response_model_exclude_unset=True)
+async def batch_get(request: BatchGetRequest):
+    """Regions, districts and towns for up to MAX_BATCH_IDS mixed IDs, in request order"""
+    return _batch_response(request.ids)
+
+@app.post("/batch", tags=["Batch"], response_model=BatchResponse)
+async def batch(request: BatchRequest):
+    """Run up to MAX_BATCH_REQUESTS GET sub-requests in one call
+
+    Each sub-request names an API path (`/districts`, `/towns?district=AS-01`)
+    and optional `params`. They run concurrently inside the server, and the
+    response lists each one's `status` and `body` in request order.
+    """
+    if len(request.requests) > MAX_BATCH_REQUESTS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BATCH_REQUESTS} requests per batch")
+    body = await run_batch(app, [r.model_dump() for r in request.requests])
+    return Response(body, media_type="application/json")
+
+@app.get("/towns/{town_id}", tags=["Geographic Data"], response_model=TownResponse)
 async def get_town(town_id: str):
     """Get a specific town by ID"""
     try:
         town = ghanageo.get_town(town_id)
-        return {
-            "success": True,
-            "data": town
-        }
+        return ModelResponse(TownResponse.model_construct(
+            success=True,
+            data=construct(Town, town)
+        ))
     except ghanageo.DataNotFoundError:
         raise HTTPException(status_code=404, detail=f"Town '{town_id}' not found")
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/districts/{district_id}/towns", tags=["Geographic Data"])
+@app.get("/districts/{district_id}/towns", tags=["Geographic Data"], response_model=TownListResponse, response_model_exclude_unset=True)
 async def get_district_towns(district_id: str):
     """Get all towns in a specific district"""
     try:
         towns = ghanageo.get_towns(district=district_id)
-        return {
-            "success": True,
-            "district_id": district_id,
-            "count": len(towns),
-            "data": towns
-        }
+        return ModelResponse(TownListResponse.model_construct(
+            success=True,
+            district_id=district_id,
+            count=len(towns),
+            data=construct_all(Town, towns)
+        ))
     except ghanageo.DataNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/regions/{region_id}/towns", tags=["Geographic Data"])
+@app.get("/regions/{region_id}/towns", tags=["Geographic Data"], response_model=TownListResponse, response_model_exclude_unset=True)
 async def get_region_towns(region_id: str):
     """Get all towns in a specific region"""
     try:
         towns = ghanageo.get_towns(region=region_id)
-        return {
-            "success": True,
-            "region_id": region_id,
-            "count": len(towns),
-            "data": towns
-        }
+        return ModelResponse(TownListResponse.model_construct(
+            success=True,
+            region_id=region_id,
+            count=len(towns),
+            data=construct_all(Town, towns)
+        ))
+    except ghanageo.DataNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+def _geojson_response(request: Request, level: str, bbox: Optional[str],
+                      region: Optional[str] = None, district: Optional[str] = None):
+    try:
+        box = tuple(float(v) for v in bbox.split(",")) if bbox else None
+        chunks = ghanageo.geojson(level, bbox=box, region=region, district=district)
+    except ghanageo.DataNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="bbox must be min_lng,min_lat,max_lng,max_lat")
+    headers = {"Vary": "Accept-Encoding"}
+    if accepts_gzip(request.headers.get("accept-encoding", "")):
+        chunks = gzip_chunks(chunks)
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(chunks, media_type="application/geo+json", headers=headers)
+
+_BBOX = Query(None, description="min_lng,min_lat,max_lng,max_lat")
+
+@app.get("/geojson/regions", tags=["GeoJSON"])
+async def geojson_regions(request: Request, bbox: Optional[str] = _BBOX):
+    """Regions as a GeoJSON FeatureCollection of points, streamed"""
+    return _geojson_response(request, "region", bbox)
+
+@app.get("/geojson/districts", tags=["GeoJSON"])
+async def geojson_districts(request: Request, bbox: Optional[str] = _BBOX,
+                            region: Optional[str] = Query(None, description="Only this region's districts")):
+    """Districts as a GeoJSON FeatureCollection of points, streamed"""
+    return _geojson_response(request, "district", bbox, region=region)
+
+@app.get("/geojson/towns", tags=["GeoJSON"])
+async def geojson_towns(request: Request, bbox: Optional[str] = _BBOX,
+                        region: Optional[str] = Query(None, description="Only this region's towns"),
+                        district: Optional[str] = Query(None, description="Only this district's towns")):
+    """Towns as a GeoJSON FeatureCollection of points, streamed (gzip when accepted)"""
+    return _geojson_response(request, "town", bbox, region=region, district=district)
+
+@app.get("/clusters", tags=["GeoJSON"], response_model=ClustersResponse, response_model_exclude_unset=True)
+async def get_clusters(
+    bbox: str = Query(..., description="min_lng,min_lat,max_lng,max_lat"),
+    zoom: int = Query(..., ge=0, le=22, description="Map zoom level")
+):
+    """Towns grouped into clusters for drawing a map viewport at a zoom level"""
+    try:
+        found = ghanageo.clusters(tuple(float(v) for v in bbox.split(",")), zoom)
+    except ghanageo.TooManyCellsError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="bbox must be min_lng,min_lat,max_lng,max_lat")
+    return ModelResponse(ClustersResponse.model_construct(
+        success=True,
+        zoom=zoom,
+        count=len(found),
+        data=[Cluster.model_construct(count=c["count"],
+                                      centroid=Coordinates.model_construct(**c["centroid"]),
+                                      town=construct(SearchResult, c["town"]))
+              for c in found]
+    ))
+
+@app.get("/locations/{location_id}/ancestors", tags=["Hierarchy"], response_model=AncestorsResponse)
+async def get_ancestors(location_id: str):
+    """Parent chain (region, then district) of any region, district or town"""
+    try:
+        ancestors = ghanageo.get_ancestors(location_id)
+        return ModelResponse(AncestorsResponse.model_construct(
+            success=True,
+            id=location_id,
+            level=ghanageo.api.get_level(location_id),
+            count=len(ancestors),
+            data=construct_all(Ancestor, ancestors)
+        ))
+    except ghanageo.DataNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/locations/{location_id}/children", tags=["Hierarchy"], response_model=ChildrenResponse)
+async def get_children(location_id: str):
+    """Districts of a region or towns of a district"""
+    try:
+        children = ghanageo.get_children(location_id)
+        level = ghanageo.api.get_level(location_id)
+        return ModelResponse(ChildrenResponse.model_construct(
+            success=True,
+            id=location_id,
+            level=level,
+            count=len(children),
+            data=construct_all(District if level == "region" else Town, children)
+        ))
     except ghanageo.DataNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/search", tags=["Search"])
+@app.get("/search", tags=["Search"], response_model=SearchResponse, response_model_exclude_unset=True)
 async def search(
     q: str = Query(..., description="Search query", min_length=1),
-    limit: int = Query(10, le=50, description="Maximum results to return")
+    limit: int = Query(10, ge=1, le=50, description="Maximum results to return"),
+    fuzzy: bool = Query(False, description="Match misspelled names, best first"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    facets: Optional[str] = Query(None, description="Count all matches by these, e.g. 'type,region,level'")
 ):
     """Search regions and districts by name (Free tier)"""
     try:
-        results = ghanageo.search(q, limit=limit)
-        return {
-            "success": True,
-            "query": q,
-            "count": len(results),
-            "data": results
-        }
+        next_cursor = None
+        if fuzzy:
+            if facets:
+                raise ValueError("facets are not supported with fuzzy search")
+            results = ghanageo.search(q, limit=limit, fuzzy=True, cursor=cursor)
+        else:
+            results, next_cursor = ghanageo.search_page(q, limit=limit, cursor=cursor)
+        counts = ghanageo.search_facets(q, [f.strip() for f in facets.split(",") if f.strip()]) if facets else None
+        return ModelResponse(SearchResponse.model_construct(
+            success=True,
+            query=q,
+            count=len(results),
+            data=construct_all(SearchResult, results),
+            **({"next_cursor": next_cursor} if next_cursor else {}),
+            **({"facets": counts} if counts is not None else {})
+        ))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/statistics", tags=["Data"])
+@app.get("/autocomplete", tags=["Search"], response_model=AutocompleteResponse, response_model_exclude_unset=True)
+async def autocomplete(
+    q: str = Query(..., description="What has been typed so far", min_length=1),
+    limit: int = Query(10, ge=1, le=50, description="Maximum results to return"),
+    level: Optional[str] = Query(None, description="Only 'region', 'district' or 'town' matches",
+                                 pattern="^(region|district|town)$"),
+    region: Optional[str] = Query(None, description="Only matches in this region (ID or code)"),
+    district: Optional[str] = Query(None, description="Only matches in this district")
+):
+    """Prefix completions for address forms, most popular first"""
+    try:
+        results = ghanageo.autocomplete(q, limit=limit, level=level, region=region, district=district)
+        return ModelResponse(AutocompleteResponse.model_construct(
+            success=True,
+            query=q,
+            count=len(results),
+            data=construct_all(SearchResult, results)
+        ))
+    except ghanageo.DataNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/lookup", tags=["Search"], response_model=LookupResponse, response_model_exclude_unset=True)
+async def lookup(
+    name: str = Query(..., description="Exact place name; case, spacing and hyphens are ignored", min_length=1),
+    level: Optional[str] = Query(None, description="Only 'region', 'district' or 'town' matches",
+                                 pattern="^(region|district|town)$")
+):
+    """Exact-name lookup, regions first then by population"""
+    try:
+        results = ghanageo.lookup(name, level=level)
+        return ModelResponse(LookupResponse.model_construct(
+            success=True,
+            name=name,
+            count=len(results),
+            data=construct_all(SearchResult, results),
+            **({"level": level} if level else {})
+        ))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/statistics", tags=["Data"], response_model=StatisticsResponse)
 async def get_statistics():
     """Get statistical overview of Ghana geographic data"""
     try:
         stats = ghanageo.get_statistics()
-        return {
-            "success": True,
-            "data": stats
-        }
+        return ModelResponse(StatisticsResponse.model_construct(
+            success=True,
+            data=stats
+        ))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -0,0 +1,70 @@
+"""
+Typed JSON responses without revalidation.
+
+Rows coming out of ghanageo are already trusted, so routes build their
+response models with `model_construct` (no validation) and hand them to
+`ModelResponse`, which serializes through pydantic-core's Rust serializer
+straight to bytes. FastAPI skips its own `jsonable_encoder` pass for
+Response objects, while the declared `response_model` still drives the
+OpenAPI schema.
+"""
+
+import zlib
+from typing import Dict, Iterable, Iterator, List, Type, TypeVar
+
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+from ghanageo.models import Coordinates
+
+M = TypeVar("M", bound=BaseModel)
+
+
+class ModelResponse(Response):
+    media_type = "application/json"
+
+    def render(self, content: BaseModel) -> bytes:
+        # exclude_unset keeps the output keys identical to the source dicts
+        return content.__pydantic_serializer__.to_json(content, exclude_unset=True)
+
+
+def construct(model: Type[M], row: Dict) -> M:
+    """Build `model` from a trusted row dict, including its nested coordinates"""
+    coords = row.get("coordinates")
+    if coords is not None:
+        return model.model_construct(**{**row, "coordinates": Coordinates.model_construct(**coords)})
+    return model.model_construct(**row)
+
+
+def construct_all(model: Type[M], rows: Iterable[Dict]) -> List[M]:
+    return [construct(model, row) for row in rows]
+
+
+def gzip_chunks(chunks: Iterable[bytes], level: int = 6) -> Iterator[bytes]:
+    """Gzip a byte stream chunk by chunk, for a streaming response"""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def accepts_gzip(accept_encoding: str) -> bool:
+    """Whether an Accept-Encoding header allows gzip, honouring q-values ("gzip;q=0" refuses it)"""
+    weights = {}
+    for part in accept_encoding.lower().split(","):
+        coding, _, params = part.partition(";")
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        weights[coding.strip()] = q
+    for coding in ("gzip", "x-gzip", "*"):
+        if coding in weights:
+            return weights[coding] > 0
+    return False
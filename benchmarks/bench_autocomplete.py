@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Autocomplete latency per keystroke, at the real dataset size and at 1M towns.
+
+Types a few place names one letter at a time and reports the median and
+worst time of a `complete()` call over all prefixes, unscoped and scoped to
+a region. The large dataset comes from bench_fuzzy.synthetic_towns.
+
+Run: python3 benchmarks/bench_autocomplete.py [--towns 1000000]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+from bench_fuzzy import entities, synthetic_towns  # noqa: E402
+from ghanageo.api import _hierarchy  # noqa: E402
+from ghanageo.completion import PrefixIndex  # noqa: E402
+
+TYPED = ["Kumasi", "Accra", "Tamale", "Sefwi Wiawso", "Bolgatanga", "Ho", "Nkawkaw"]
+
+
+def measure(index, accept=None, repeat=20):
+    times = []
+    for name in TYPED:
+        for end in range(1, len(name) + 1):
+            for _ in range(repeat):
+                started = time.perf_counter()
+                index.complete(name[:end], 10, accept)
+                times.append(time.perf_counter() - started)
+    return statistics.median(times) * 1000, max(times) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--towns", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    in_ashanti = lambda level, row: (row["id"] if level == "region" else row["region_id"]) == "AS"  # noqa: E731
+    for label, towns in (("real", _hierarchy().towns), (f"{args.towns:,}", synthetic_towns(args.towns))):
+        started = time.perf_counter()
+        index = PrefixIndex(entities(towns))
+        built = time.perf_counter() - started
+        print(f"\n{label} towns: built in {built:.2f} s")
+        # The first call per short prefix sorts its range once; warm those up
+        measure(index, repeat=1)
+        for scope, accept in (("all", None), ("Ashanti", in_ashanti)):
+            median, worst = measure(index, accept)
+            print(f"  {scope:8} median {median:.3f} ms   max {worst:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+GhanaGeo client vs the module-level ghanageo functions.
+
+The module functions open a new SQLite connection per call; the client keeps
+one connection and caches hot lookups. "client, no cache" isolates the
+connection reuse; "client, cached" is the steady state of a long-lived client.
+
+Run: python3 benchmarks/bench_client.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import ghanageo  # noqa: E402
+from ghanageo.client import GhanaGeo  # noqa: E402
+
+TOWN_ID = ghanageo.get_towns(region="GR")[0]["id"]
+
+
+def workload(api):
+    return [
+        lambda: api.get_region("AS"),
+        lambda: api.get_districts(region="AS"),
+        lambda: api.get_town(TOWN_ID),
+        lambda: api.get_towns(district="GR-01"),
+        lambda: api.search("Kumasi", limit=10),
+        lambda: api.get_statistics(),
+    ]
+
+
+def per_call_us(fn, n=200):
+    fn()
+    started = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return (time.perf_counter() - started) / n * 1e6
+
+
+def main():
+    labels = ["get_region", "get_districts(region)", "get_town", "get_towns(district)",
+              "search", "get_statistics"]
+    uncached = GhanaGeo(cache_size=0)
+    cached = GhanaGeo()
+    columns = [("module", workload(ghanageo)), ("client, no cache", workload(uncached)),
+               ("client, cached", workload(cached))]
+    print(f"{'call (us/call)':<24}" + "".join(f"{name:>18}" for name, _ in columns))
+    for i, label in enumerate(labels):
+        row = [per_call_us(calls[i]) for _, calls in columns]
+        print(f"{label:<24}" + "".join(f"{v:>18,.1f}" for v in row))
+
+
+if __name__ == "__main__":
+    main()
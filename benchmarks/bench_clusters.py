@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Map clusters: pyramid build time and per-request latency.
+
+For the real towns and a synthetic tier (bench_fuzzy's generated towns,
+1M by default), reports the time to build the cluster pyramid, then the
+first (tiles computed) and cached latency of a whole-country viewport at
+low zooms and a city viewport at high zooms.
+
+Run: python3 benchmarks/bench_clusters.py [--towns 1000000]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from ghanageo.api import _hierarchy  # noqa: E402
+from ghanageo.pyramid import ClusterPyramid  # noqa: E402
+from bench_fuzzy import synthetic_towns  # noqa: E402
+
+GHANA_BBOX = (-3.3, 4.7, 1.2, 11.2)
+KUMASI_BBOX = (-1.75, 6.55, -1.5, 6.8)
+VIEWS = [("Ghana", GHANA_BBOX, 5), ("Ghana", GHANA_BBOX, 7), ("Ghana", GHANA_BBOX, 9),
+         ("Kumasi", KUMASI_BBOX, 12), ("Kumasi", KUMASI_BBOX, 14)]
+
+
+def timed(fn):
+    started = time.perf_counter()
+    result = fn()
+    return (time.perf_counter() - started) * 1000, result
+
+
+def report(label, towns):
+    print(f"\n{label}: {len(towns):,} towns")
+    ms, pyramid = timed(lambda: ClusterPyramid(towns))
+    print(f"  build                {ms:>9.1f} ms")
+    for name, bbox, zoom in VIEWS:
+        first, found = timed(lambda: pyramid.clusters(bbox, zoom))
+        cached, _ = timed(lambda: pyramid.clusters(bbox, zoom))
+        print(f"  {name:<7} zoom {zoom:<2}  {len(found):>6} clusters  first {first:>7.2f} ms  cached {cached:>6.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--towns", type=int, default=1_000_000)
+    args = parser.parse_args()
+    report("real", _hierarchy().towns)
+    report("synthetic", synthetic_towns(args.towns))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Fuzzy search latency: the trigram index at the real dataset size and at 1M towns.
+
+The large dataset keeps the real regions and districts and fills them with
+generated towns: repeats and one-letter misspellings of real town names,
+and names made of real name words, so trigram frequencies stay close to
+the real ones. Queries are misspellings of real places.
+
+Run: python3 benchmarks/bench_fuzzy.py [--towns 1000000]
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from ghanageo.api import _hierarchy  # noqa: E402
+from ghanageo.fuzzy import TrigramIndex  # noqa: E402
+
+QUERIES = ["Kumase", "Techimann", "Sefwi Wiaso", "acra", "Bolgatang", "Nkawkaw",
+           "Tamalle", "Koforidua", "Hoo", "Wenchi Municipal"]
+LETTERS = "abdefghikmnoprstuwy"
+
+
+def entities(towns):
+    hierarchy = _hierarchy()
+    return ([("region", r) for r in hierarchy.regions]
+            + [("district", d) for d in hierarchy.districts]
+            + [("town", t) for t in towns])
+
+
+def _misspell(rng, name):
+    i = rng.randrange(len(name))
+    letter = rng.choice(LETTERS)
+    edit = rng.randrange(3)
+    if edit == 0:
+        return name[:i] + letter + name[i + 1:]
+    if edit == 1:
+        return name[:i] + letter + name[i:]
+    return name[:i] + name[i + 1:] or name
+
+
+def synthetic_towns(count):
+    rng = random.Random(7)
+    real = _hierarchy().towns
+    words = sorted({w for t in real for w in t["name"].split()})
+    towns = []
+    for i in range(count):
+        base = real[i % len(real)]
+        name = base["name"]
+        if i >= len(real):
+            roll = rng.random()
+            if roll < 0.4:
+                name = _misspell(rng, name)
+            elif roll < 0.7:
+                name = f"{rng.choice(words)} {rng.choice(words)}"
+            elif roll < 0.9:
+                name = f"{name} {rng.choice(words)}"
+        towns.append(dict(base, id=f"{base['id']}-{i}", name=name,
+                          population=rng.choice([None, rng.randint(50, 50000)])))
+    return towns
+
+
+def measure(index, repeat=50):
+    rows = []
+    for query in QUERIES:
+        times = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            index.search(query, limit=10)
+            times.append(time.perf_counter() - started)
+        rows.append((query, statistics.median(times) * 1000))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--towns", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    for label, towns in (("real", _hierarchy().towns), (f"{args.towns:,}", synthetic_towns(args.towns))):
+        started = time.perf_counter()
+        index = TrigramIndex(entities(towns))
+        built = time.perf_counter() - started
+        print(f"\n{label} towns: {len(index):,} distinct names, built in {built:.2f} s")
+        for query, ms in measure(index):
+            top = index.search(query, limit=1)
+            print(f"  {query:18} {ms:7.3f} ms   {top[0]['name'] if top else '-'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+GeoJSON streaming: time, size and memory of a full FeatureCollection.
+
+For the real towns and for a synthetic tier (bench_fuzzy's generated towns,
+1M by default), reports the time to stream every town with features
+rendered on the fly (first request) and from the feature cache (later
+requests), the gzipped size, a city-sized bbox, and the peak memory
+allocated while streaming (tracemalloc, index already built), which should
+stay at about one chunk whatever the count.
+
+Run: python3 benchmarks/bench_geojson.py [--towns 1000000]
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from app.responses import gzip_chunks  # noqa: E402
+from ghanageo.api import _hierarchy  # noqa: E402
+from ghanageo.features import FeatureIndex, feature_collection  # noqa: E402
+from bench_fuzzy import synthetic_towns  # noqa: E402
+
+KUMASI_BBOX = (-1.75, 6.55, -1.5, 6.8)
+
+
+def stream(index, bbox=None, gzip=False):
+    chunks = feature_collection(index.features("town", bbox=bbox))
+    if gzip:
+        chunks = gzip_chunks(chunks)
+    size = 0
+    started = time.perf_counter()
+    for chunk in chunks:
+        size += len(chunk)
+    return (time.perf_counter() - started) * 1000, size
+
+
+def report(label, towns):
+    index = FeatureIndex({"town": towns})
+    print(f"\n{label}: {len(towns):,} towns")
+    ms, size = stream(index)
+    print(f"  all, first request   {ms:>9.1f} ms  {size / 1e6:>7.1f} MB")
+    ms, size = stream(index)
+    print(f"  all, cached          {ms:>9.1f} ms  {size / 1e6:>7.1f} MB")
+    ms, size = stream(index, gzip=True)
+    print(f"  all, gzip            {ms:>9.1f} ms  {size / 1e6:>7.1f} MB")
+    ms, size = stream(index, bbox=KUMASI_BBOX)
+    print(f"  Kumasi bbox          {ms:>9.1f} ms  {size / 1e3:>7.1f} KB")
+    tracemalloc.start()
+    stream(index)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  peak while streaming {peak / 1e6:>9.2f} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--towns", type=int, default=1_000_000)
+    args = parser.parse_args()
+    report("real", _hierarchy().towns)
+    report("synthetic", synthetic_towns(args.towns))
+
+
+if __name__ == "__main__":
+    main()
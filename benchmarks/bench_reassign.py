@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Throughput of the spatial reassignment stage on synthetic data.
+
+District polygons are Voronoi cells around random "capitals" clipped to
+Ghana's bounding box; towns are uniform random points over a slightly larger
+box so some fall outside every polygon and exercise the centroid fallback.
+
+Run: python3 benchmarks/bench_reassign.py [--sizes 15000 1000000] [--workers 4]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import shapely
+from shapely.geometry import Point, box
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+from reassign_spatial import PolygonIndex, assign_districts  # noqa: E402
+
+GHANA_BBOX = (-3.26, 4.74, 1.19, 11.17)  # min_lng, min_lat, max_lng, max_lat
+
+
+def synthetic_districts(n=261, seed=7):
+    rng = np.random.default_rng(seed)
+    min_lng, min_lat, max_lng, max_lat = GHANA_BBOX
+    capitals = shapely.multipoints(np.column_stack((
+        rng.uniform(min_lng, max_lng, n), rng.uniform(min_lat, max_lat, n)
+    )))
+    frame = box(*GHANA_BBOX)
+    cells = shapely.get_parts(shapely.voronoi_polygons(capitals, extend_to=frame))
+    return list(shapely.intersection(cells, frame))
+
+
+def synthetic_towns(n, seed=11):
+    rng = np.random.default_rng(seed)
+    min_lng, min_lat, max_lng, max_lat = GHANA_BBOX
+    lats = rng.uniform(min_lat - 0.2, max_lat + 0.2, n)
+    lngs = rng.uniform(min_lng - 0.2, max_lng + 0.2, n)
+    return lats, lngs
+
+
+def legacy_assign(lats, lngs, geoms):
+    """The previous per-town loop: query, contains, then min() over centroids."""
+    tree = shapely.STRtree(geoms)
+    out = []
+    for lat, lng in zip(lats, lngs):
+        pt = Point(lng, lat)
+        found = -1
+        for idx in tree.query(pt):
+            if geoms[idx].contains(pt):
+                found = int(idx)
+                break
+        if found < 0:
+            found = min(range(len(geoms)), key=lambda i: geoms[i].centroid.distance(pt))
+        out.append(found)
+    return np.array(out)
+
+
+def timed(fn):
+    started = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[15_000, 1_000_000])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--legacy-max", type=int, default=15_000,
+                        help="Skip the legacy loop above this many towns")
+    args = parser.parse_args()
+
+    geoms = synthetic_districts()
+    index = PolygonIndex(geoms)
+    print(f"{len(geoms)} synthetic district polygons\n")
+    print(f"{'towns':>10}  {'method':<18} {'seconds':>8} {'towns/s':>12}")
+
+    for n in args.sizes:
+        lats, lngs = synthetic_towns(n)
+        runs = [("bulk", lambda: assign_districts(lats, lngs, index))]
+        if args.workers > 1:
+            runs.append((f"bulk x{args.workers} procs",
+                         lambda: assign_districts(lats, lngs, index, workers=args.workers)))
+        if n <= args.legacy_max:
+            runs.append(("legacy loop", lambda: legacy_assign(lats, lngs, geoms)))
+
+        baseline = None
+        for label, fn in runs:
+            result, elapsed = timed(fn)
+            if baseline is None:
+                baseline = result
+            else:
+                mismatched = int(np.count_nonzero(result != baseline))
+                if mismatched:
+                    label += f" ({mismatched} differ)"
+            print(f"{n:>10,}  {label:<18} {elapsed:>8.2f} {n / elapsed:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Memory per row and throughput: dict rows vs compact records.
+
+Loads every town (and the Ashanti region listing) through GhanaGeoDB's dict
+path and through the NamedTuple record path, measuring retained memory with
+tracemalloc and build time over repeated runs.
+
+Run: python3 benchmarks/bench_records.py
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from ghanageo.database import db  # noqa: E402
+
+
+def all_town_dicts():
+    return db.get_all_towns(limit=10 ** 9)
+
+
+def all_town_records():
+    return db.get_town_records(limit=10 ** 9)
+
+
+def retained(fn):
+    gc.collect()
+    tracemalloc.start()
+    result = fn()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current
+
+
+def throughput(fn, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        rows = fn()
+        best = min(best, time.perf_counter() - started)
+    return len(rows) / best, best
+
+
+def main():
+    cases = [
+        ("all towns, dict", all_town_dicts),
+        ("all towns, record", all_town_records),
+        ("all towns, record.to_dict", lambda: [r.to_dict() for r in all_town_records()]),
+        ("Ashanti towns, dict", lambda: db.get_towns_by_region("AS")),
+        ("Ashanti towns, record", lambda: db.get_town_records(region_id="AS")),
+    ]
+    print(f"{'case':<28} {'rows':>7} {'bytes/row':>10} {'rows/s':>11} {'ms':>8}")
+    for label, fn in cases:
+        rows, size = retained(fn)
+        rate, best = throughput(fn)
+        print(f"{label:<28} {len(rows):>7,} {size / len(rows):>10,.0f} {rate:>11,.0f} {best * 1000:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Storage footprint and query latency: denormalized tables vs the normalized layout.
+
+The "before" database is rebuilt from ghana.db in the old layout (the view
+rows written back into plain regions/districts/towns tables with their
+original indexes), so both sides hold identical data. Reported:
+
+  file size    after VACUUM
+  table/index  bytes per b-tree from the dbstat virtual table
+  cold         a fresh connection with the file evicted from the OS page
+               cache (posix_fadvise DONTNEED) before every query
+  warm         the same query repeated on one connection
+
+Run: python3 benchmarks/bench_schema.py
+"""
+
+import os
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from ghanageo.database import DATABASE_PATH  # noqa: E402
+
+LEGACY_SCHEMA = """
+CREATE TABLE regions (id TEXT PRIMARY KEY, name TEXT NOT NULL, code TEXT UNIQUE NOT NULL,
+    capital TEXT NOT NULL, population INTEGER, area_km2 REAL, coordinates TEXT,
+    created_date TEXT, economic_data TEXT);
+CREATE TABLE districts (id TEXT PRIMARY KEY, name TEXT NOT NULL, region_id TEXT NOT NULL,
+    region_name TEXT NOT NULL, type TEXT NOT NULL, capital TEXT NOT NULL,
+    population INTEGER, area_km2 REAL, coordinates TEXT);
+CREATE TABLE towns (id TEXT PRIMARY KEY, name TEXT NOT NULL, district_id TEXT NOT NULL,
+    district_name TEXT NOT NULL, region_id TEXT NOT NULL, region_name TEXT NOT NULL,
+    type TEXT NOT NULL, population INTEGER, coordinates TEXT);
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE INDEX idx_regions_name ON regions(name);
+CREATE INDEX idx_districts_region ON districts(region_id);
+CREATE INDEX idx_districts_name ON districts(name);
+CREATE INDEX idx_districts_type ON districts(type);
+CREATE INDEX idx_towns_district ON towns(district_id);
+CREATE INDEX idx_towns_region ON towns(region_id);
+CREATE INDEX idx_towns_name ON towns(name);
+"""
+
+QUERIES = {
+    "town by id": ("SELECT * FROM towns WHERE id = ?", "town_id"),
+    "towns in district": ("SELECT * FROM towns WHERE district_id = ? ORDER BY name", "district_id"),
+    "towns in region": ("SELECT * FROM towns WHERE region_id = ? ORDER BY name", "region_id"),
+    "towns page": ("SELECT * FROM towns ORDER BY region_id, name LIMIT 500 OFFSET 5000", None),
+    "region by code": ("SELECT * FROM regions WHERE id = ? OR code = ?", "region_pair"),
+    "district page": ("SELECT * FROM towns WHERE id > '' AND district_id = ? ORDER BY id LIMIT 100",
+                      "district_id"),
+    "town name search": ("SELECT * FROM towns WHERE name LIKE ?", "pattern"),
+}
+
+
+def build_legacy(source: Path, dest: Path) -> None:
+    conn = sqlite3.connect(dest)
+    conn.executescript(LEGACY_SCHEMA)
+    conn.execute("ATTACH DATABASE ? AS src", (str(source),))
+    with conn:
+        for table in ("regions", "districts", "towns"):
+            conn.execute(f"INSERT INTO {table} SELECT * FROM src.{table} ORDER BY id")
+    conn.execute("DETACH DATABASE src")
+    conn.execute("VACUUM")
+    conn.close()
+
+
+def btree_sizes(path: Path):
+    conn = sqlite3.connect(path)
+    kinds = dict(conn.execute("SELECT name, type FROM sqlite_master"))
+    tables = indexes = 0
+    for name, size in conn.execute("SELECT name, SUM(pgsize) FROM dbstat GROUP BY name"):
+        if kinds.get(name) == "index" or name.startswith("sqlite_autoindex"):
+            indexes += size
+        else:
+            tables += size
+    conn.close()
+    return tables, indexes
+
+
+def evict(path: Path) -> None:
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+
+
+def params_for(path: Path):
+    conn = sqlite3.connect(path)
+    town_id, district_id, region_id = conn.execute(
+        "SELECT id, district_id, region_id FROM towns ORDER BY id LIMIT 1 OFFSET 7000"
+    ).fetchone()
+    conn.close()
+    return {"town_id": (town_id,), "district_id": (district_id,), "region_id": (region_id,),
+            "region_pair": ("AS", "AS"), "pattern": ("%kuma%",), None: ()}
+
+
+def latency(path: Path, sql: str, params, cold: bool, repeat: int) -> float:
+    times = []
+    conn = None if cold else sqlite3.connect(path)
+    for _ in range(repeat):
+        if cold:
+            evict(path)
+            started = time.perf_counter()
+            c = sqlite3.connect(path)
+            c.execute(sql, params).fetchall()
+            c.close()
+        else:
+            started = time.perf_counter()
+            conn.execute(sql, params).fetchall()
+        times.append(time.perf_counter() - started)
+    if conn is not None:
+        conn.close()
+    return statistics.median(times) * 1000
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        before = Path(tmp) / "legacy.db"
+        after = Path(tmp) / "normalized.db"
+        build_legacy(DATABASE_PATH, before)
+        conn = sqlite3.connect(DATABASE_PATH)
+        conn.execute("VACUUM INTO ?", (str(after),))
+        conn.close()
+
+        print(f"{'':18} {'before':>12} {'after':>12}")
+        sizes = {db: btree_sizes(db) for db in (before, after)}
+        print(f"{'file size':18} {before.stat().st_size / 1024:>9.0f} KB "
+              f"{after.stat().st_size / 1024:>9.0f} KB")
+        print(f"{'table b-trees':18} {sizes[before][0] / 1024:>9.0f} KB {sizes[after][0] / 1024:>9.0f} KB")
+        print(f"{'index b-trees':18} {sizes[before][1] / 1024:>9.0f} KB {sizes[after][1] / 1024:>9.0f} KB")
+
+        params = params_for(before)
+        for cold, repeat in ((True, 15), (False, 200)):
+            print(f"\n{'cold' if cold else 'warm'} latency (median ms)")
+            for label, (sql, key) in QUERIES.items():
+                b = latency(before, sql, params[key], cold, repeat)
+                a = latency(after, sql, params[key], cold, repeat)
+                print(f"  {label:16} {b:>10.3f}   {a:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Response serialization: FastAPI's generic dict path vs typed model_construct.
+
+"dict" is what an untyped route costs: jsonable_encoder over the envelope,
+then JSONResponse's json.dumps. "typed" is the current route path:
+model_construct (no validation) and pydantic-core's to_json straight to
+bytes. Both start from the same rows; end-to-end numbers go through the app.
+
+Run: python3 benchmarks/bench_serialization.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+import ghanageo  # noqa: E402
+from app.main import app  # noqa: E402
+from app.responses import ModelResponse, construct_all  # noqa: E402
+from ghanageo.models import Town, TownListResponse  # noqa: E402
+
+
+def best_of(fn, repeat=20):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def dict_path(towns, **extra):
+    return JSONResponse(jsonable_encoder({"success": True, **extra, "count": len(towns), "data": towns})).body
+
+
+def typed_path(towns, **extra):
+    return ModelResponse(TownListResponse.model_construct(
+        success=True, **extra, count=len(towns), data=construct_all(Town, towns)
+    )).body
+
+
+def main():
+    client = TestClient(app)
+    cases = [
+        ("/towns?limit=1000", ghanageo.get_towns(limit=1000), {}),
+        ("/regions/AS/towns", ghanageo.get_towns(region="AS"), {"region_id": "AS"}),
+    ]
+    print(f"{'endpoint':<20} {'rows':>6} {'dict ms':>8} {'typed ms':>9} {'speedup':>8} {'e2e ms':>7}")
+    for url, towns, extra in cases:
+        dict_ms = best_of(lambda: dict_path(towns, **extra))
+        typed_ms = best_of(lambda: typed_path(towns, **extra))
+        e2e_ms = best_of(lambda: client.get(url), repeat=10)
+        print(f"{url:<20} {len(towns):>6,} {dict_ms:>8.2f} {typed_ms:>9.2f} "
+              f"{dict_ms / typed_ms:>7.1f}x {e2e_ms:>7.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Host memory at 1, 4 and 16 workers: per-process datasets vs the shared pack.
+
+Each worker is a separate interpreter that loads the dataset one way, touches
+all of it, then idles while the parent reads its memory from
+/proc/<pid>/smaps_rollup (Linux only):
+
+  idle     imports ghanageo only (interpreter baseline)
+  private  every worker holds its own id -> town dict index read from SQLite
+  shared   GHANAGEO_SHARED=1: the first worker builds the pack in /dev/shm,
+           the rest map the same file
+
+PSS splits shared pages between the processes mapping them, so the PSS total
+is the real host footprint; USS is what each extra worker costs.
+
+Run: python3 benchmarks/bench_shared_memory.py [--workers 1 4 16]
+"""
+
+import argparse
+import hashlib
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+MODES = ("idle", "private", "shared")
+
+
+def worker(mode):
+    from ghanageo.database import db
+    from ghanageo.pack import load_pack
+
+    if mode == "private":
+        index = {t["id"]: t for t in db.get_all_towns(limit=10 ** 9)}
+        count = len(index)
+    elif mode == "shared":
+        pack = load_pack(db_path=db.db_path)
+        hashlib.sha256(pack._buf).digest()  # fault in every page of the mapping
+        count = sum(1 for i in range(pack.counts["towns"]) if pack.row("towns", i)["id"])
+    else:
+        count = 0
+    print(f"ready {count}", flush=True)
+    sys.stdin.read()  # idle until the parent closes our stdin
+
+
+def smaps(pid):
+    fields = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == "kB":
+                fields[parts[0].rstrip(":")] = int(parts[1])
+    return fields["Pss"], fields["Private_Clean"] + fields["Private_Dirty"]
+
+
+def run(mode, workers, shared_dir):
+    env = dict(os.environ, GHANAGEO_SHARED_DIR=shared_dir)
+    env.pop("GHANAGEO_PACK", None)
+    if mode == "shared":
+        env["GHANAGEO_SHARED"] = "1"
+    else:
+        env.pop("GHANAGEO_SHARED", None)
+
+    started = time.perf_counter()
+    procs = [
+        subprocess.Popen([sys.executable, __file__, "--worker", mode], env=env,
+                         stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+        for _ in range(workers)
+    ]
+    try:
+        for p in procs:
+            p.stdout.readline()
+        ready = time.perf_counter() - started
+        usage = [smaps(p.pid) for p in procs]
+    finally:
+        for p in procs:
+            p.stdin.close()
+            p.wait()
+    pss = sum(u[0] for u in usage)
+    uss = sum(u[1] for u in usage) / workers
+    return pss, uss, ready
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--worker", choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.worker:
+        worker(args.worker)
+        return
+
+    if not Path("/proc/self/smaps_rollup").exists():
+        sys.exit("needs Linux /proc/<pid>/smaps_rollup")
+
+    with tempfile.TemporaryDirectory() as shared_dir:
+        print(f"{'workers':>7} {'mode':>8} {'PSS total':>11} {'USS/worker':>11} {'ready':>8}")
+        for n in args.workers:
+            for mode in MODES:
+                pss, uss, ready = run(mode, n, shared_dir)
+                print(f"{n:>7} {mode:>8} {pss / 1024:>8.1f} MB {uss / 1024:>8.1f} MB {ready:>7.2f}s")
+            print()
+
+
+if __name__ == "__main__":
+    main()
@@ -9,28 +9,58 @@ from .api import (
     get_regions,
     get_region,
     get_districts,
+    get_district,
     get_towns,
+    count_towns,
     get_town,
+    get_many,
+    get_ancestors,
+    get_children,
     search,
+    search_page,
+    search_facets,
+    lookup,
+    autocomplete,
+    geojson,
+    clusters,
     get_statistics,
-    DataNotFoundError
+    preload,
+    DataNotFoundError,
+    TooManyCellsError
 )
 
 from .models import Region, District, Town, SearchResult, Coordinates
+from .records import RegionRecord, DistrictRecord, TownRecord
 
 __version__ = "2.0.0"
 __all__ = [
     "get_regions",
     "get_region",
     "get_districts",
+    "get_district",
     "get_towns",
+    "count_towns",
     "get_town",
+    "get_many",
+    "get_ancestors",
+    "get_children",
     "search",
+    "search_page",
+    "search_facets",
+    "lookup",
+    "autocomplete",
+    "geojson",
+    "clusters",
     "get_statistics",
+    "preload",
     "DataNotFoundError",
+    "TooManyCellsError",
     "Region",
     "District",
     "Town",
     "SearchResult",
-    "Coordinates"
+    "Coordinates",
+    "RegionRecord",
+    "DistrictRecord",
+    "TownRecord"
 ]
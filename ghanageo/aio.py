@@ -0,0 +1,173 @@
+"""
+Asyncio client for embedding ghanageo in async services.
+
+`AsyncGhanaGeo` mirrors the module-level API as coroutines. Queries run on
+a dedicated thread pool in which every worker thread owns its own read-only
+connection, so the event loop never blocks on SQLite. Concurrency is bounded
+by a semaphore. Cancelling an awaiting task drops the query if it is still
+queued, or interrupts SQLite if it is already running.
+
+    async with AsyncGhanaGeo() as geo:
+        regions = await geo.get_regions()
+        async for town in geo.iter_towns(region="AS"):
+            ...
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import AsyncIterator, Callable, Dict, List, Optional
+
+from .api import DataNotFoundError
+from .client import GhanaGeo
+
+
+class _Job:
+    """Tracks which worker connection a call landed on, so it can be interrupted."""
+
+    __slots__ = ("client", "cancelled", "lock")
+
+    def __init__(self):
+        self.client = None
+        self.cancelled = False
+        self.lock = threading.Lock()
+
+    def interrupt(self):
+        with self.lock:
+            self.cancelled = True
+            if self.client is not None and self.client._conn is not None:
+                self.client._conn.interrupt()
+
+
+class AsyncGhanaGeo:
+    def __init__(self, db_path: Optional[str] = None, max_workers: int = 4,
+                 max_concurrency: Optional[int] = None):
+        self.db_path = Path(db_path) if db_path else Path(__file__).parent / "data" / "ghana.db"
+        if not self.db_path.exists():
+            raise FileNotFoundError(f"Database not found at {self.db_path}")
+        self.max_concurrency = max_concurrency or max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                            thread_name_prefix="ghanageo")
+        self._local = threading.local()
+        self._clients: List[GhanaGeo] = []
+        self._clients_lock = threading.Lock()
+        self._semaphore = None
+        self._closed = False
+
+    # -- lifecycle ------------------------------------------------------------
+
+    async def close(self) -> None:
+        """Wait for running queries, then close every worker connection."""
+        if self._closed:
+            return
+        self._closed = True
+        await asyncio.get_running_loop().run_in_executor(
+            None, lambda: self._executor.shutdown(wait=True)
+        )
+        with self._clients_lock:
+            for client in self._clients:
+                client.close()
+            self._clients.clear()
+
+    async def __aenter__(self) -> "AsyncGhanaGeo":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    # -- execution ------------------------------------------------------------
+
+    def _client(self) -> GhanaGeo:
+        client = getattr(self._local, "client", None)
+        if client is None:
+            # Caching stays off: one cache per worker thread would only duplicate
+            client = self._local.client = GhanaGeo(self.db_path, cache_size=0)
+            with self._clients_lock:
+                self._clients.append(client)
+        return client
+
+    def _call(self, job: _Job, fn: Callable):
+        client = self._client()
+        with job.lock:
+            if job.cancelled:
+                raise asyncio.CancelledError()
+            job.client = client
+        try:
+            return fn(client)
+        finally:
+            with job.lock:
+                job.client = None
+
+    async def _run(self, fn: Callable):
+        if self._closed:
+            raise RuntimeError("AsyncGhanaGeo is closed")
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with self._semaphore:
+            job = _Job()
+            future = asyncio.get_running_loop().run_in_executor(
+                self._executor, self._call, job, fn
+            )
+            try:
+                return await future
+            except asyncio.CancelledError:
+                job.interrupt()
+                raise
+
+    # -- API ------------------------------------------------------------------
+
+    async def get_regions(self) -> List[Dict]:
+        return await self._run(lambda geo: geo.get_regions())
+
+    async def get_region(self, region_id: str) -> Dict:
+        region = await self._run(lambda geo: geo.get_region(region_id))
+        if not region:
+            raise DataNotFoundError(f"Region '{region_id}' not found")
+        return region
+
+    async def get_districts(self, region: Optional[str] = None) -> List[Dict]:
+        if region:
+            await self.get_region(region)
+        return await self._run(lambda geo: geo.get_districts(region=region))
+
+    async def get_district(self, district_id: str) -> Dict:
+        district = await self._run(lambda geo: geo.get_district(district_id))
+        if not district:
+            raise DataNotFoundError(f"District '{district_id}' not found")
+        return district
+
+    async def get_towns(self, district: Optional[str] = None, region: Optional[str] = None,
+                        limit: int = 500, offset: int = 0) -> List[Dict]:
+        if region and not district:
+            await self.get_region(region)
+        return await self._run(
+            lambda geo: geo.get_towns(district=district, region=region, limit=limit, offset=offset)
+        )
+
+    async def get_town(self, town_id: str) -> Dict:
+        town = await self._run(lambda geo: geo.get_town(town_id))
+        if not town:
+            raise DataNotFoundError(f"Town '{town_id}' not found")
+        return town
+
+    async def iter_towns(self, district: Optional[str] = None, region: Optional[str] = None,
+                         batch_size: int = 500) -> AsyncIterator[Dict]:
+        """Yield towns (all, or within a district/region) ordered by ID, one page at a time."""
+        region_id = (await self.get_region(region))["id"] if region and not district else None
+        after = ""
+        while True:
+            page = await self._run(lambda geo: geo._db.get_towns_page(
+                district_id=district, region_id=region_id, after=after, limit=batch_size
+            ))
+            for town in page:
+                yield town
+            if len(page) < batch_size:
+                return
+            after = page[-1]["id"]
+
+    async def search(self, query: str, limit: int = 50) -> List[Dict]:
+        return await self._run(lambda geo: geo.search(query, limit=limit))
+
+    async def get_statistics(self) -> Dict:
+        return await self._run(lambda geo: geo.get_statistics())
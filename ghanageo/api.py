@@ -1,63 +1,362 @@
-from typing import List, Dict, Optional
+import base64
+import json
+from typing import Iterator, List, Dict, Optional, Tuple, Union
 from .database import db
+from . import completion as _completion, features as _features, fuzzy as _fuzzy, pyramid as _pyramid
+from .pyramid import TooManyCellsError
+from .hierarchy import PackHierarchy, load_hierarchy
 from .models import Region, District, Town, SearchResult
+from .names import normalize_name
+from .pack import load_pack
 
 class DataNotFoundError(Exception):
     """Raised when requested data is not found"""
     pass
 
-def get_regions() -> List[Dict]:
-    return db.get_all_regions()
+def _reader():
+    """The mmapped dataset pack when one is built for this database, else SQLite"""
+    return load_pack(db_path=db.db_path) or db
+
+def _hierarchy():
+    """Region/district/town index for the current dataset, built once per version"""
+    return load_hierarchy(db.db_path, _reader)
+
+def _fresh(row: Dict) -> Dict:
+    """A caller-owned copy of a row shared by the in-memory indexes"""
+    row = dict(row)
+    if row.get('coordinates'):
+        row['coordinates'] = dict(row['coordinates'])
+    return row
+
+def preload() -> None:
+    """Open the dataset and build in-memory indexes now rather than on first use
+
+    Called by the server in the parent process before forking workers, so
+    they inherit (and share copy-on-write) everything built here.
+
+    When the hierarchy is served from the dataset pack (GHANAGEO_SHARED=1 or
+    GHANAGEO_PACK), only the pack is mapped: the fuzzy, autocomplete, GeoJSON
+    and cluster indexes decode and keep their own town rows, so each process
+    builds them on first use instead. A shared-mode worker then idles at an
+    idle interpreter's 38 MB RSS on the bundled dataset (the pack's pages are
+    shared), against 104 MB with every index preloaded.
+    """
+    hierarchy = _hierarchy()
+    if isinstance(hierarchy, PackHierarchy):
+        return
+    _fuzzy.index_for(hierarchy)
+    _completion.index_for(hierarchy)
+    _features.index_for(hierarchy).prerender()
+    _pyramid.pyramid_for(hierarchy)
+
+def get_regions(as_records: bool = False) -> List[Dict]:
+    if as_records:
+        return db.get_region_records()
+    return [_fresh(r) for r in _hierarchy().regions]
 
 def get_region(region_id: str) -> Dict:
-    region = db.get_region_by_id(region_id)
+    region = _hierarchy().region(region_id)
     if not region:
         raise DataNotFoundError(f"Region '{region_id}' not found")
-    return region
+    return _fresh(region)
 
-def get_districts(region: Optional[str] = None) -> List[Dict]:
+def get_districts(region: Optional[str] = None, as_records: bool = False) -> List[Dict]:
+    hierarchy = _hierarchy()
     if region:
         region_data = get_region(region)
-        return db.get_districts_by_region(region_data['id'])
+        if as_records:
+            return db.get_district_records(region_data['id'])
+        return [_fresh(d) for d in hierarchy.children(region_data['id'])]
+
+    if as_records:
+        return [d for r in hierarchy.regions for d in db.get_district_records(r['id'])]
+    return [_fresh(d) for d in hierarchy.districts]
 
-    all_districts = []
-    regions = get_regions()
-    for region_data in regions:
-        districts = db.get_districts_by_region(region_data['id'])
-        all_districts.extend(districts)
-    return all_districts
+def get_district(district_id: str) -> Dict:
+    district = _hierarchy().district(district_id)
+    if not district:
+        raise DataNotFoundError(f"District '{district_id}' not found")
+    return _fresh(district)
 
 def get_towns(district: Optional[str] = None, region: Optional[str] = None,
-              limit: int = 500, offset: int = 0) -> List[Dict]:
+              limit: int = 500, offset: int = 0, as_records: bool = False,
+              type: Optional[Union[str, List[str]]] = None, min_population: Optional[int] = None,
+              max_population: Optional[int] = None, has_coordinates: Optional[bool] = None,
+              sort: Optional[str] = None) -> List[Dict]:
+    """Towns of a district, of a region or of the country
+
+    With any of `type` (one or several), `min_population`/`max_population`,
+    `has_coordinates` or `sort` ('name', 'population', '-population'), the
+    matching towns are read from SQLite indexes, `limit` at a time in every
+    scope; `count_towns` gives their total.
+    """
+    if sort or type or (min_population, max_population, has_coordinates) != (None, None, None):
+        filters = _town_filters(district, region, type, min_population, max_population, has_coordinates)
+        if filters is None:
+            return []
+        return db.find_towns(sort=sort or 'name', limit=limit, offset=offset, **filters)
+    if as_records:
+        region_id = get_region(region)['id'] if region and not district else None
+        return db.get_town_records(district_id=district, region_id=region_id,
+                                   limit=limit, offset=offset)
+    hierarchy = _hierarchy()
     if district:
-        return db.get_towns_by_district(district)
+        return [_fresh(t) for t in hierarchy.children(district)] if hierarchy.district(district) else []
     if region:
         region_data = get_region(region)
-        return db.get_towns_by_region(region_data['id'])
-    return db.get_all_towns(limit=limit, offset=offset)
+        return [_fresh(t) for t in hierarchy.region_towns(region_data['id'])]
+    return _reader().get_all_towns(limit=limit, offset=offset)
+
+def count_towns(district: Optional[str] = None, region: Optional[str] = None,
+                type: Optional[Union[str, List[str]]] = None, min_population: Optional[int] = None,
+                max_population: Optional[int] = None, has_coordinates: Optional[bool] = None) -> int:
+    """How many towns `get_towns` matches with these filters, ignoring limit and offset"""
+    filters = _town_filters(district, region, type, min_population, max_population, has_coordinates)
+    return db.count_towns(**filters) if filters is not None else 0
+
+def _town_filters(district, region, type, min_population, max_population, has_coordinates):
+    """GhanaGeoDB.find_towns keyword arguments, or None for an unknown district"""
+    if district and not _hierarchy().district(district):
+        return None
+    filters = {'district_id': district,
+               'region_id': get_region(region)['id'] if region and not district else None}
+    if type:
+        filters['types'] = [type] if isinstance(type, str) else list(type)
+    if min_population is not None:
+        filters['min_population'] = min_population
+    if max_population is not None:
+        filters['max_population'] = max_population
+    if has_coordinates is not None:
+        filters['has_coordinates'] = has_coordinates
+    return filters
 
 def get_town(town_id: str) -> Dict:
-    town = db.get_town_by_id(town_id)
+    town = _hierarchy().town(town_id)
     if not town:
         raise DataNotFoundError(f"Town '{town_id}' not found")
-    return town
+    return _fresh(town)
+
+def get_many(ids: List[str], level: Optional[str] = None) -> List[Dict]:
+    """Regions, districts and towns for a list of ids (or region codes), in input order
+
+    Each entry is {'id', 'found': True, 'level', 'data'}, or {'id', 'found':
+    False} for an unknown id or, with `level`, one at another level. Every id
+    is one dict lookup in the hierarchy index, with no queries.
+    """
+    if level is not None and level not in _LEVEL_RANK:
+        raise ValueError(f"level must be one of {', '.join(_LEVEL_RANK)}")
+    hierarchy = _hierarchy()
+    entries = []
+    for entity_id in ids:
+        entry = hierarchy.get(entity_id)
+        if entry and (level is None or entry[0] == level):
+            entries.append({'id': entity_id, 'found': True, 'level': entry[0], 'data': _fresh(entry[1])})
+        else:
+            entries.append({'id': entity_id, 'found': False})
+    return entries
+
+def get_level(entity_id: str) -> str:
+    """'region', 'district' or 'town' for any id (or region code)"""
+    entry = _hierarchy().get(entity_id)
+    if not entry:
+        raise DataNotFoundError(f"Location '{entity_id}' not found")
+    return entry[0]
+
+def get_ancestors(entity_id: str) -> List[Dict]:
+    """Parent chain of any region, district or town, region first
+
+    Each entry is {'id', 'name', 'level'}; a town yields its region and district.
+    """
+    ancestors = _hierarchy().ancestors(entity_id)
+    if ancestors is None:
+        raise DataNotFoundError(f"Location '{entity_id}' not found")
+    return [dict(a) for a in ancestors]
+
+def get_children(entity_id: str) -> List[Dict]:
+    """Districts of a region or towns of a district; towns have no children"""
+    children = _hierarchy().children(entity_id)
+    if children is None:
+        raise DataNotFoundError(f"Location '{entity_id}' not found")
+    return [_fresh(c) for c in children]
+
+def search(query: str, limit: int = 50, fuzzy: bool = False,
+           cursor: Optional[str] = None) -> List[Dict]:
+    """Regions, districts and towns whose name contains `query`, best first
+
+    Exact names (or region codes) rank first, then prefixes, word prefixes
+    and other substrings; within each, regions, districts, towns, then
+    larger population. Pass a `cursor` from `search_page` to continue.
+
+    With `fuzzy`, names similar to it instead ("Kumase" finds Kumasi), best
+    first, each with a `score` between 0 and 1.
+    """
+    if fuzzy:
+        if cursor:
+            raise ValueError("cursor is not supported with fuzzy search")
+        if not query.strip():
+            return []
+        return _fuzzy.index_for(_hierarchy()).search(query, limit)
+    return search_page(query, limit, cursor)[0]
 
-def search(query: str, limit: int = 50) -> List[Dict]:
+def search_page(query: str, limit: int = 50,
+                cursor: Optional[str] = None) -> Tuple[List[Dict], Optional[str]]:
+    """One page of `search` results and the cursor for the next (None after the last)
+
+    The cursor holds the last result's rank, so the next page starts right
+    after it instead of recomputing and skipping this one.
+    """
+    if not query.strip() or limit <= 0:
+        return [], None
+    after = _decode_cursor(cursor, query) if cursor else None
+    ranked = db.search_ranked(query, limit + 1, after)
+    page = ranked[:limit]
+    next_cursor = _encode_cursor(query, page[-1][0]) if len(ranked) > limit else None
+    return [result for _, result in page], next_cursor
+
+SEARCH_FACETS = ('level', 'type', 'region')
+
+def search_facets(query: str, facets=SEARCH_FACETS) -> Dict[str, Dict[str, int]]:
+    """Counts of every `search` match by level, type and/or region, largest first
+
+    All facets come from one grouped pass over the matching set, so asking
+    for several costs the same as asking for one.
+    """
+    unknown = [f for f in facets if f not in SEARCH_FACETS]
+    if unknown:
+        raise ValueError(f"facets must be among {', '.join(SEARCH_FACETS)}")
+    counts = {facet: {} for facet in facets}
     if not query.strip():
+        return counts
+    for group in db.search_facets(query):
+        for facet, values in counts.items():
+            value = group[facet]
+            if value is not None:
+                values[value] = values.get(value, 0) + group['count']
+    return {facet: dict(sorted(values.items(), key=lambda item: (-item[1], item[0])))
+            for facet, values in counts.items()}
+
+def _encode_cursor(query: str, key: tuple) -> str:
+    payload = json.dumps([query, list(key)], separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip('=')
+
+def _decode_cursor(cursor: str, query: str) -> tuple:
+    try:
+        payload = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        cursor_query, key = json.loads(payload)
+        tier, level, neg_pop, name, entity_id = key
+    except (ValueError, TypeError):
+        raise ValueError("Invalid search cursor") from None
+    if cursor_query != query:
+        raise ValueError("Search cursor belongs to a different query")
+    return tier, level, neg_pop, name, entity_id
+
+_LEVEL_RANK = {'region': 0, 'district': 1, 'town': 2}
+
+def autocomplete(query: str, limit: int = 10, level: Optional[str] = None,
+                 region: Optional[str] = None, district: Optional[str] = None) -> List[Dict]:
+    """Locations with a word starting with `query`, most popular first
+
+    Regions rank before districts before towns, then by population. `level`
+    keeps one of them; `region` (id or code) or `district` limits matches
+    to that area.
+    """
+    if level is not None and level not in _LEVEL_RANK:
+        raise ValueError(f"level must be one of {', '.join(_LEVEL_RANK)}")
+    hierarchy = _hierarchy()
+    region_id = get_region(region)['id'] if region else None
+    district_id = get_district(district)['id'] if district else None
+
+    def accept(row_level: str, row: Dict) -> bool:
+        if level and row_level != level:
+            return False
+        if region_id and (row['id'] if row_level == 'region' else row['region_id']) != region_id:
+            return False
+        if district_id and (row['id'] if row_level == 'district' else row.get('district_id')) != district_id:
+            return False
+        return True
+
+    filtered = level or region_id or district_id
+    return _completion.index_for(hierarchy).complete(query, limit, accept if filtered else None)
+
+def lookup(name: str, level: Optional[str] = None) -> List[Dict]:
+    """Every location whose name equals `name` after normalization
+
+    Case, Unicode forms, hyphens/spaces and a trailing "Municipal",
+    "District", "Region" etc. are ignored. Regions come first, then
+    districts, then towns; ties go to the larger population.
+    """
+    if level is not None and level not in _LEVEL_RANK:
+        raise ValueError(f"level must be one of {', '.join(_LEVEL_RANK)}")
+    key = normalize_name(name)
+    if not key:
         return []
-    return db.search_locations(query, limit)
+    results = db.lookup_name(key, level)
+    results.sort(key=lambda r: (_LEVEL_RANK[r['type']], -(r.get('population') or 0),
+                                r['name'], r['id']))
+    return results
+
+def geojson(level: str, bbox: Optional[Tuple[float, float, float, float]] = None,
+            region: Optional[str] = None, district: Optional[str] = None) -> Iterator[bytes]:
+    """A GeoJSON FeatureCollection of one level's entities, as a stream of byte chunks
+
+    `bbox` is (min lng, min lat, max lng, max lat); `region` (id or code) and
+    `district` keep the entities inside that area. Arguments are checked
+    before the first chunk is produced.
+    """
+    if level not in _LEVEL_RANK:
+        raise ValueError(f"level must be one of {', '.join(_LEVEL_RANK)}")
+    if bbox is not None:
+        bbox = tuple(float(v) for v in bbox)
+        if len(bbox) != 4 or bbox[0] > bbox[2] or bbox[1] > bbox[3]:
+            raise ValueError("bbox must be min_lng,min_lat,max_lng,max_lat")
+    hierarchy = _hierarchy()
+    rows = None
+    if district:
+        district_row = get_district(district)
+        if level == 'town':
+            rows = hierarchy.children(district_row['id'])
+        elif level == 'district':
+            rows = [district_row]
+        else:
+            rows = [hierarchy.region(district_row['region_id'])]
+    elif region:
+        region_row = get_region(region)
+        if level == 'town':
+            rows = hierarchy.region_towns(region_row['id'])
+        elif level == 'district':
+            rows = hierarchy.children(region_row['id'])
+        else:
+            rows = [region_row]
+    index = _features.index_for(hierarchy)
+    return _features.feature_collection(index.features(level, rows, bbox))
+
+def clusters(bbox: Tuple[float, float, float, float], zoom: int) -> List[Dict]:
+    """Town clusters visible in `bbox` (min lng, min lat, max lng, max lat) at map `zoom`
+
+    Each is {'count', 'centroid': {'lat', 'lng'}, 'town'}, `town` being the
+    cluster's most populous town. Raises TooManyCellsError (a ValueError)
+    when `bbox` covers more than pyramid.MAX_CELLS cells at this zoom.
+    """
+    bbox = tuple(float(v) for v in bbox)
+    if len(bbox) != 4 or bbox[0] > bbox[2] or bbox[1] > bbox[3]:
+        raise ValueError("bbox must be min_lng,min_lat,max_lng,max_lat")
+    if zoom < 0:
+        raise ValueError("zoom must be 0 or more")
+    return [dict(c, centroid=dict(c['centroid']), town=_fresh(c['town']))
+            for c in _pyramid.pyramid_for(_hierarchy()).clusters(bbox, zoom)]
 
 def get_statistics() -> Dict:
-    regions = get_regions()
-    all_districts = get_districts()
-    towns_count = db.get_towns_count()
+    hierarchy = _hierarchy()
+    return summarize(hierarchy.regions, len(hierarchy.districts), hierarchy.towns_count)
 
+def summarize(regions: List[Dict], districts_count: int, towns_count: int) -> Dict:
+    """Statistics overview from the region rows and entity counts"""
     total_population = sum(r.get('population', 0) for r in regions)
     total_area = sum(r.get('area_km2', 0) for r in regions)
 
     return {
         'total_regions': len(regions),
-        'total_districts': len(all_districts),
+        'total_districts': districts_count,
         'total_towns': towns_count,
         'total_population': total_population,
         'total_area_km2': round(total_area, 2),
@@ -0,0 +1,46 @@
+"""Command line entry point: `ghanageo <command>`."""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from .database import DATABASE_PATH
+from .pack import DEFAULT_PACK_PATH, build_pack
+
+
+def _build_pack(args) -> int:
+    started = time.perf_counter()
+    meta = build_pack(args.db, args.output)
+    elapsed = time.perf_counter() - started
+    counts = ", ".join(f"{t['count']:,} {name}" for name, t in meta["tables"].items())
+    size = Path(args.output).stat().st_size
+    print(f"Wrote {args.output} ({size / 1024:,.0f} KB): {counts} in {elapsed:.2f}s")
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="ghanageo", description="GhanaGeo dataset tools")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    pack = commands.add_parser("build-pack", help="Compile ghana.db into a memory-mappable pack")
+    pack.add_argument("--db", type=Path, default=DATABASE_PATH, help="Source database")
+    pack.add_argument("-o", "--output", type=Path, default=DEFAULT_PACK_PATH,
+                      help="Pack file to write")
+    pack.set_defaults(handler=_build_pack)
+
+    serve = commands.add_parser("serve", help="Run the HTTP API (same options as ghanageo-api)",
+                                add_help=False)
+    serve.set_defaults(handler=None)
+
+    args, rest = parser.parse_known_args(argv)
+    if args.command == "serve":
+        from .client import serve_api
+        return serve_api(rest)
+    if rest:
+        parser.error(f"unrecognized arguments: {' '.join(rest)}")
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
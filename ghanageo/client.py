@@ -1,12 +1,53 @@
 # ghanageo/client.py
+import argparse
+import copy
+import gc
+import os
+import signal
 import sqlite3
-import json
+import sys
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Union
+
+from .api import summarize
+from .database import GhanaGeoDB
+from .schema import schema_version
+
+
+class _ConnectionDB(GhanaGeoDB):
+    """GhanaGeoDB whose queries all run on one caller-owned connection."""
+
+    def __init__(self, db_path: Path, conn: sqlite3.Connection):
+        # The client only reads an existing database: skip table creation
+        self.db_path = str(db_path)
+        self._conn = conn
+        self.schema_version = schema_version(conn)
+
+    def get_connection(self):
+        return self._conn
 
 
 class GhanaGeo:
-    def __init__(self, db_path: Optional[str] = None):
+    """
+    Client over a GhanaGeo database with one long-lived connection.
+
+    Covers the SQLite-backed part of the module-level `ghanageo` functions:
+    regions, districts, towns (with their filters and `count_towns`), name
+    search and statistics. Lookups, autocomplete, hierarchy walks, search
+    pages, GeoJSON and clusters need the in-memory indexes and stay
+    module-level. Hot lookups are cached per instance (LRU, `cache_size`
+    entries; 0 disables) and every call returns its own copy; call
+    `clear_cache()` after the database changes. Safe to share across threads
+    (queries are serialized).
+
+        with GhanaGeo() as geo:
+            geo.get_towns(region="AS")
+    """
+
+    def __init__(self, db_path: Optional[str] = None, cache_size: int = 1024):
         if db_path is None:
             # Use the bundled database
             db_path = Path(__file__).parent / "data" / "ghana.db"
@@ -15,91 +56,288 @@ class GhanaGeo:
         if not self.db_path.exists():
             raise FileNotFoundError(f"Database not found at {self.db_path}")
 
-    def _row_to_dict(self, row: sqlite3.Row) -> Dict[str, Any]:
-        """Convert sqlite Row to dict and parse JSON fields."""
-        record = dict(row)
-        if "coordinates" in record and record["coordinates"]:
-            try:
-                record["coordinates"] = json.loads(record["coordinates"])
-            except json.JSONDecodeError:
-                record["coordinates"] = None
-        return record
+        self._conn = sqlite3.connect(
+            f"file:{self.db_path}?mode=ro", uri=True, check_same_thread=False
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._db = _ConnectionDB(self.db_path, self._conn)
+        self._lock = threading.RLock()
+        self._cache_size = cache_size
+        self._cache: "OrderedDict[tuple, Any]" = OrderedDict()
+
+    # -- lifecycle ------------------------------------------------------------
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+            self._cache.clear()
+
+    def __enter__(self) -> "GhanaGeo":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def clear_cache(self) -> None:
+        """Drop every cached lookup, e.g. after the database was rebuilt."""
+        with self._lock:
+            self._cache.clear()
+
+    def _check_open(self) -> None:
+        if self._conn is None:
+            raise sqlite3.ProgrammingError("GhanaGeo client is closed")
+
+    def _cached(self, key: tuple, fetch):
+        """`fetch()` through the LRU, as a copy the caller may modify"""
+        with self._lock:
+            self._check_open()
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return copy.deepcopy(self._cache[key])
+            value = fetch()
+            if self._cache_size > 0:
+                self._cache[key] = value
+                if len(self._cache) > self._cache_size:
+                    self._cache.popitem(last=False)
+                return copy.deepcopy(value)
+            return value
+
+    # -- regions and districts -----------------------------------------------
 
     def get_regions(self) -> List[Dict]:
         """Get all Ghana regions."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute("SELECT * FROM regions ORDER BY name")
-            return [self._row_to_dict(row) for row in cursor.fetchall()]
+        return self._cached(("regions",), self._db.get_all_regions)
 
     def get_region(self, region_id: str) -> Optional[Dict]:
         """Get specific region by ID or code."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute(
-                "SELECT * FROM regions WHERE id = ? OR code = ?",
-                (region_id, region_id),
-            )
-            row = cursor.fetchone()
-            return self._row_to_dict(row) if row else None
+        return self._cached(("region", region_id),
+                            lambda: self._db.get_region_by_id(region_id))
 
     def get_districts(self, region: Optional[str] = None) -> List[Dict]:
         """Get districts, optionally filtered by region code/ID."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            if region:
-                cursor = conn.execute(
-                    "SELECT * FROM districts WHERE region_id = ? ORDER BY name",
-                    (region,),
-                )
-            else:
-                cursor = conn.execute(
-                    "SELECT * FROM districts ORDER BY region_name, name"
-                )
-            return [self._row_to_dict(row) for row in cursor.fetchall()]
+        if region:
+            region_data = self.get_region(region)
+            if not region_data:
+                return []
+            return self._cached(("districts", region_data["id"]),
+                                lambda: self._db.get_districts_by_region(region_data["id"]))
+
+        def fetch():
+            districts = []
+            for region_data in self.get_regions():
+                districts.extend(self.get_districts(region_data["id"]))
+            return districts
+        return self._cached(("districts", None), fetch)
 
     def get_district(self, district_id: str) -> Optional[Dict]:
-        """Get specific district by ID or code."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute(
-                "SELECT * FROM districts WHERE id = ? OR code = ?",
-                (district_id, district_id),
-            )
-            row = cursor.fetchone()
-            return self._row_to_dict(row) if row else None
+        """Get specific district by ID."""
+        return self._cached(("district", district_id),
+                            lambda: self._db.get_district_by_id(district_id))
+
+    # -- towns ------------------------------------------------------------------
+
+    def get_towns(self, district: Optional[str] = None, region: Optional[str] = None,
+                  limit: int = 500, offset: int = 0,
+                  type: Optional[Union[str, List[str]]] = None, min_population: Optional[int] = None,
+                  max_population: Optional[int] = None, has_coordinates: Optional[bool] = None,
+                  sort: Optional[str] = None) -> List[Dict]:
+        """Get towns in a district or region, or a page of all towns.
+
+        Filters and `sort` behave as in `ghanageo.get_towns()`; filtered
+        listings are read from SQLite each call rather than cached.
+        """
+        if sort or type or (min_population, max_population, has_coordinates) != (None, None, None):
+            filters = self._town_filters(district, region, type, min_population,
+                                         max_population, has_coordinates)
+            if filters is None:
+                return []
+            with self._lock:
+                self._check_open()
+                return self._db.find_towns(sort=sort or "name", limit=limit, offset=offset,
+                                           **filters)
+        if district:
+            return self._cached(("towns", "district", district),
+                                lambda: self._db.get_towns_by_district(district))
+        if region:
+            region_data = self.get_region(region)
+            if not region_data:
+                return []
+            return self._cached(("towns", "region", region_data["id"]),
+                                lambda: self._db.get_towns_by_region(region_data["id"]))
+        return self._cached(("towns", None, limit, offset),
+                            lambda: self._db.get_all_towns(limit=limit, offset=offset))
+
+    def count_towns(self, district: Optional[str] = None, region: Optional[str] = None,
+                    type: Optional[Union[str, List[str]]] = None, min_population: Optional[int] = None,
+                    max_population: Optional[int] = None, has_coordinates: Optional[bool] = None) -> int:
+        """How many towns `get_towns` matches with these filters."""
+        filters = self._town_filters(district, region, type, min_population,
+                                     max_population, has_coordinates)
+        if filters is None:
+            return 0
+        with self._lock:
+            self._check_open()
+            return self._db.count_towns(**filters)
+
+    def _town_filters(self, district, region, type, min_population, max_population, has_coordinates):
+        """GhanaGeoDB.find_towns keyword arguments, or None for an unknown place"""
+        if district and not self.get_district(district):
+            return None
+        filters = {"district_id": district, "region_id": None}
+        if region and not district:
+            region_data = self.get_region(region)
+            if not region_data:
+                return None
+            filters["region_id"] = region_data["id"]
+        if type:
+            filters["types"] = [type] if isinstance(type, str) else list(type)
+        if min_population is not None:
+            filters["min_population"] = min_population
+        if max_population is not None:
+            filters["max_population"] = max_population
+        if has_coordinates is not None:
+            filters["has_coordinates"] = has_coordinates
+        return filters
+
+    def get_town(self, town_id: str) -> Optional[Dict]:
+        """Get a specific town by ID."""
+        return self._cached(("town", town_id), lambda: self._db.get_town_by_id(town_id))
+
+    # -- search and statistics ------------------------------------------------
 
     def search(self, query: str, limit: int = 50) -> List[Dict]:
-        """Search regions and districts by name."""
-        results: List[Dict] = []
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-
-            # Search regions
-            cursor = conn.execute(
-                """
-                SELECT id, name, 'region' as type, capital, coordinates
-                FROM regions
-                WHERE name LIKE ?
-                LIMIT ?
-                """,
-                (f"%{query}%", limit),
-            )
-            results.extend([self._row_to_dict(row) for row in cursor.fetchall()])
-
-            # Search districts if space remains
-            if len(results) < limit:
-                remaining = limit - len(results)
-                cursor = conn.execute(
-                    """
-                    SELECT id, name, 'district' as type, capital,
-                           region_name as region, coordinates
-                    FROM districts
-                    WHERE name LIKE ?
-                    LIMIT ?
-                    """,
-                    (f"%{query}%", remaining),
-                )
-                results.extend([self._row_to_dict(row) for row in cursor.fetchall()])
-
-        return results
+        """Search regions, districts and towns by name."""
+        if not query.strip():
+            return []
+        return self._cached(("search", query, limit),
+                            lambda: self._db.search_locations(query, limit))
+
+    def get_statistics(self) -> Dict:
+        """Statistical overview, as returned by `ghanageo.get_statistics()`."""
+        return self._cached(("statistics",), lambda: summarize(
+            self.get_regions(), len(self.get_districts()), self._db.get_towns_count()
+        ))
+
+
+# ---------------------------------------------------------------------------
+# Production server (`ghanageo-api` console script)
+# ---------------------------------------------------------------------------
+
+def _available(module: str) -> bool:
+    try:
+        __import__(module)
+    except ImportError:
+        return False
+    return True
+
+
+def _default_workers() -> int:
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _server_args(argv):
+    parser = argparse.ArgumentParser(
+        prog="ghanageo-api", description="Serve the GhanaGeo HTTP API with a production profile"
+    )
+    parser.add_argument("--app", default="app.main:app", help="ASGI app as module:attribute")
+    parser.add_argument("--host", default=os.environ.get("API_HOST", "0.0.0.0"))
+    parser.add_argument("--port", type=int,
+                        default=int(os.environ.get("PORT") or os.environ.get("API_PORT") or 8000))
+    parser.add_argument("--workers", type=int,
+                        default=int(os.environ.get("WEB_CONCURRENCY") or _default_workers()),
+                        help="Worker processes (default: $WEB_CONCURRENCY or CPU count)")
+    parser.add_argument("--backlog", type=int, default=2048, help="Listen backlog")
+    parser.add_argument("--keep-alive", type=int, default=75,
+                        help="Seconds to hold idle keep-alive connections")
+    parser.add_argument("--log-level", default="info")
+    return parser.parse_args(argv)
+
+
+def serve_api(argv=None) -> int:
+    """
+    Run app.main:app with a pre-fork worker model.
+
+    The parent binds the socket, imports the app and calls `ghanageo.preload()`
+    so the dataset and indexes are built once, freezes the GC so inherited
+    objects are not dirtied by collections, then forks the workers. Each worker
+    runs its own uvicorn server (uvloop/httptools when installed) on the shared
+    socket and inherits the preloaded data copy-on-write. Workers that die
+    unexpectedly are replaced; SIGTERM/SIGINT shut them all down gracefully.
+    """
+    import uvicorn
+    from . import api
+
+    args = _server_args(argv)
+    config = uvicorn.Config(
+        args.app,
+        host=args.host,
+        port=args.port,
+        loop="uvloop" if _available("uvloop") else "asyncio",
+        http="httptools" if _available("httptools") else "h11",
+        backlog=args.backlog,
+        timeout_keep_alive=args.keep_alive,
+        log_level=args.log_level,
+        proxy_headers=True,
+    )
+    config.load()  # imports the app in the parent
+    api.preload()
+
+    if args.workers <= 1 or not hasattr(os, "fork"):
+        uvicorn.Server(config).run()
+        return 0
+
+    sock = config.bind_socket()
+    gc.collect()
+    if hasattr(gc, "freeze"):
+        gc.freeze()
+
+    workers: Dict[int, float] = {}
+    stopping = False
+
+    def spawn():
+        pid = os.fork()
+        if pid == 0:
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            try:
+                uvicorn.Server(config).run(sockets=[sock])
+            finally:
+                os._exit(0)
+        workers[pid] = time.monotonic()
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+        for pid in list(workers):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    for _ in range(args.workers):
+        spawn()
+
+    while workers:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        except InterruptedError:
+            continue
+        started = workers.pop(pid, None)
+        if started is None or stopping:
+            continue
+        code = os.waitstatus_to_exitcode(status) if hasattr(os, "waitstatus_to_exitcode") else status
+        print(f"ghanageo-api: worker {pid} exited ({code}), restarting", file=sys.stderr)
+        if time.monotonic() - started < 1:
+            time.sleep(1)  # don't spin on a worker that crashes at startup
+        spawn()
+
+    sock.close()
+    return 0
@@ -0,0 +1,128 @@
+"""
+Prefix autocomplete over a sorted array of folded names.
+
+Every region, district and town is entered once per word of its folded name
+(ghanageo.names.fold_name), so "acc" finds "Accra" and "Greater Accra
+Region" alike. Entries are sorted by that text, so the matches of a prefix
+are one contiguous range found with two bisections.
+
+Each entry also has a precomputed popularity rank: matches on the first word
+first, then regions, districts and towns, then larger population. A query
+walks its range in rank order and stops after `limit` hits. Ranges too large
+to sort per request (short prefixes like "a") are sorted once and kept in an
+LRU holding at most SORTED_CACHE_ENTRIES ranked entries, so memory stays
+bounded whatever prefixes clients send. The LRU is locked, so threads may
+share an index.
+
+One index is built per hierarchy, i.e. per dataset version.
+"""
+
+import threading
+import weakref
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional
+
+from .hierarchy import LEVEL_RANK, search_result
+from .names import fold_name
+
+# Ranges up to this size are ranked per request; larger ones once, then cached
+SORT_ONCE = 256
+# Ranked entries kept across all cached ranges (4 bytes each)
+SORTED_CACHE_ENTRIES = 2_000_000
+
+
+class PrefixIndex:
+    """Folded names of every entity, sorted, with a popularity rank per entry"""
+
+    def __init__(self, entities):
+        """`entities`: iterable of (level, row) pairs"""
+        self._entities = []
+        entries = []
+        for level, row in entities:
+            entity = len(self._entities)
+            self._entities.append((level, row))
+            folded = fold_name(row["name"])
+            popularity = (LEVEL_RANK[level], -(row.get("population") or 0), folded, row["id"])
+            start = 0
+            while start < len(folded):
+                entries.append((folded[start:], (start > 0,) + popularity, entity))
+                space = folded.find(" ", start)
+                if space < 0:
+                    break
+                start = space + 1
+
+        entries.sort()
+        self._keys = [text for text, _, _ in entries]
+        self._entity = array("I", (entity for _, _, entity in entries))
+        by_rank = sorted(range(len(entries)), key=lambda i: entries[i][1])
+        self._rank = array("I", bytes(4 * len(entries)))
+        for rank, i in enumerate(by_rank):
+            self._rank[i] = rank
+        self._sorted: "OrderedDict[str, array]" = OrderedDict()
+        self._sorted_size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entities)
+
+    def _ranked(self, prefix: str, lo: int, hi: int):
+        if hi - lo <= SORT_ONCE:
+            return sorted(range(lo, hi), key=self._rank.__getitem__)
+        with self._lock:
+            ranked = self._sorted.get(prefix)
+            if ranked is not None:
+                self._sorted.move_to_end(prefix)
+                return ranked
+        ranked = array("I", sorted(range(lo, hi), key=self._rank.__getitem__))
+        if len(ranked) <= SORTED_CACHE_ENTRIES:
+            with self._lock:
+                if prefix not in self._sorted:
+                    self._sorted[prefix] = ranked
+                    self._sorted_size += len(ranked)
+                while self._sorted_size > SORTED_CACHE_ENTRIES:
+                    self._sorted_size -= len(self._sorted.popitem(last=False)[1])
+        return ranked
+
+    def complete(self, prefix: str, limit: int = 10,
+                 accept: Optional[Callable[[str, Dict], bool]] = None) -> List[Dict]:
+        """Most popular entities with a word starting with `prefix`
+
+        `accept(level, row)`, when given, filters entities (level, scope).
+        """
+        prefix = fold_name(prefix)
+        if not prefix or limit <= 0:
+            return []
+        keys = self._keys
+        lo = bisect_left(keys, prefix)
+        hi = bisect_left(keys, prefix + "\U0010ffff", lo)
+
+        results = []
+        seen = set()
+        for i in self._ranked(prefix, lo, hi):
+            entity = self._entity[i]
+            if entity in seen:
+                continue
+            seen.add(entity)
+            level, row = self._entities[entity]
+            if accept is None or accept(level, row):
+                results.append(search_result(level, row))
+                if len(results) == limit:
+                    break
+        return results
+
+
+_indexes: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def index_for(hierarchy) -> PrefixIndex:
+    """The prefix index of a Hierarchy, built on first use"""
+    index = _indexes.get(hierarchy)
+    if index is None:
+        index = _indexes[hierarchy] = PrefixIndex(
+            [("region", r) for r in hierarchy.regions]
+            + [("district", d) for d in hierarchy.districts]
+            + [("town", t) for t in hierarchy.towns]
+        )
+    return index
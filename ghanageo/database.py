@@ -1,9 +1,168 @@
+import heapq
 import sqlite3
 import json
 import os
+import threading
+from itertools import islice
+from operator import itemgetter
 from pathlib import Path
 from typing import List, Dict, Optional
 from .models import Region, District, Town, Coordinates
+from .records import RegionRecord, DistrictRecord, TownRecord
+from .names import fold_name
+from .schema import SCHEMA_VERSION, OutdatedDatabaseError, ensure_schema, schema_version
+
+# Per level: the view, its storage table and the level's own result columns;
+# region codes match like names. See search_ranked
+_SEARCH_SOURCES = (
+    ("region", "regions", "region_rows", ("code",)),
+    ("district", "districts", "district_rows", ("region_name",)),
+    ("town", "towns", "town_rows", ("region_name", "district_name")),
+)
+_LEVEL_COLUMNS = ("code", "region_name", "district_name")
+
+
+def _escape_like(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _like(column: str, param: str) -> str:
+    return f"{column} LIKE :{param} ESCAPE '\\'"
+
+
+def _tier(column: str, prefix: str = "", code: Optional[str] = None) -> str:
+    """SQL for the match tier: 0 exact, 1 prefix, 2 word prefix, 3 substring"""
+    exact = _like(column, prefix + "exact")
+    if code:
+        exact += " OR " + _like(code, "exact")
+    return f"""CASE WHEN {exact} THEN 0
+                    WHEN {_like(column, prefix + "prefix")} THEN 1
+                    WHEN {_like(column, prefix + "word")} OR {_like(column, prefix + "part")} THEN 2
+                    ELSE 3 END"""
+
+
+def _matches(alias: str, codes: bool) -> str:
+    """SQL true when the entity's own name (or region code) contains the query"""
+    matches = _like(f"{alias}.name", "any")
+    if codes:
+        matches += " OR " + _like(f"{alias}.code", "any")
+    return f"likelihood({matches}, 0.01)"
+
+
+def _keyset(level: str) -> str:
+    return f"AND (tier, {level}, neg_pop, name, id) > (:a_tier, :a_level, :a_pop, :a_name, :a_id)"
+
+
+def _own_sql(level: str, view: str, columns, after: bool) -> str:
+    """A level's page of matches on the entity's own name
+
+    Entities with a better matching alternate name are left to _alternate_sql.
+    """
+    codes = level == "region"
+    return f"""SELECT * FROM (
+                   SELECT e.id, e.name, '{level}' as type, {", ".join("e." + c for c in columns)},
+                          e.coordinates, {_tier("e.name", code=codes and "e.code")} AS tier,
+                          -COALESCE(e.population, 0) AS neg_pop
+                   FROM {view} e WHERE {_matches("e", codes)}) q
+               WHERE NOT EXISTS (
+                   SELECT 1 FROM alternate_names a
+                   WHERE a.entity_id = q.id AND {_like("a.name_key", "fany")}
+                     AND {_tier("a.name_key", "f")} < q.tier) {_keyset(":level") if after else ""}
+               ORDER BY tier, neg_pop, name, id LIMIT :limit"""
+
+
+def _alternate_sql(after: bool) -> str:
+    """One page of matches on alternate names only, over every level
+
+    alternate_names is scanned once; each entity keeps its best alternate, and
+    only when it beats the entity's own name. The few matches drive the joins.
+    """
+    selects = []
+    for rank, (level, view, rows, columns) in enumerate(_SEARCH_SOURCES):
+        codes = level == "region"
+        own_tier = f"CASE WHEN {_matches('r', codes)} THEN {_tier('r.name', code=codes and 'r.code')} ELSE 4 END"
+        selects.append(f"""
+            SELECT {rank} AS level, e.id, e.name, '{level}' as type,
+                   {", ".join(("e." if c in columns else "NULL AS ") + c for c in _LEVEL_COLUMNS)},
+                   e.coordinates, x.matched_name, x.tier, -COALESCE(r.population, 0) AS neg_pop
+            FROM x CROSS JOIN {rows} r ON r.id = x.entity_id JOIN {view} e ON e.id = r.id
+            WHERE x.tier < {own_tier}""")
+    return f"""WITH x AS MATERIALIZED (
+                   SELECT entity_id, name AS matched_name, MIN({_tier("name_key", "f")}) AS tier
+                   FROM alternate_names WHERE likelihood({_like("name_key", "fany")}, 0.01)
+                   GROUP BY entity_id)
+               SELECT * FROM ({" UNION ALL ".join(selects)})
+               WHERE 1 {_keyset("level") if after else ""}
+               ORDER BY tier, level, neg_pop, name, id LIMIT :limit"""
+
+
+def _search_params(query: str) -> Dict:
+    """LIKE patterns of a search query, on the raw and on the folded name"""
+    # LIKE already folds ASCII case the way LOWER() did. likelihood()
+    # tells the planner matches are rare, so it scans each table once
+    # instead of walking every parent's index. Alternate names are
+    # matched on their folded key, so "Kwaebibirem" finds "Kwaɛbibirɛm";
+    # a query with accents or Ghanaian letters is folded for the own
+    # names too, which are spelled in ASCII
+    folded = _escape_like(fold_name(query))
+    q = _escape_like(query.lower()) if query.isascii() else folded
+    return {
+        "exact": q, "prefix": f"{q}%", "any": f"%{q}%", "word": f"% {q}%", "part": f"%-{q}%",
+        "fexact": folded, "fprefix": f"{folded}%", "fany": f"%{folded}%",
+        # Folded keys have no hyphens left
+        "fword": f"% {folded}%", "fpart": f"% {folded}%",
+    }
+
+
+_TOWN_SORTS = {'name': 't.name', 'population': 't.population', '-population': 't.population DESC'}
+
+
+def _town_filters(district_id, region_id, types, min_population, max_population, has_coordinates):
+    """WHERE clause on town_rows `t` and its parameters for find_towns/count_towns"""
+    where, params = ['1'], []
+    if district_id:
+        where.append('t.district_key = (SELECT district_key FROM district_rows WHERE id = ?)')
+        params.append(district_id)
+    elif region_id:
+        where.append('t.region_key = (SELECT region_key FROM region_rows WHERE id = ?)')
+        params.append(region_id)
+    if types:
+        where.append(f"t.type_key IN (SELECT type_key FROM types WHERE name IN ({', '.join('?' * len(types))}))")
+        params.extend(types)
+    if min_population is not None:
+        where.append('t.population >= ?')
+        params.append(min_population)
+    if max_population is not None:
+        where.append('t.population <= ?')
+        params.append(max_population)
+    if has_coordinates is not None:
+        where.append('t.lat IS NOT NULL' if has_coordinates else 't.lat IS NULL')
+    return ' AND '.join(where), params
+
+
+def _ranked_rows(cursor, level: Optional[int] = None):
+    for row in cursor:
+        rank = row['level'] if level is None else level
+        yield (row['tier'], rank, row['neg_pop'], row['name'], row['id']), _search_result(row)
+
+
+def _search_result(row) -> Dict:
+    result = dict(row)
+    del result['tier'], result['neg_pop']
+    if 'level' in result:
+        # An alternate-name match: drop the other levels' columns
+        del result['level']
+        for column in _LEVEL_COLUMNS:
+            if result[column] is None:
+                del result[column]
+    if 'region_name' in result:
+        result['region'] = result.pop('region_name')
+    if 'district_name' in result:
+        result['district'] = result.pop('district_name')
+    if result['coordinates']:
+        result['coordinates'] = json.loads(result['coordinates'])
+    return result
+
 
 # Database path
 BASE_DIR = Path(__file__).parent
@@ -12,85 +171,51 @@ DATABASE_PATH = BASE_DIR / "data" / "ghana.db"
 class GhanaGeoDB:
     def __init__(self, db_path: Optional[str] = None):
         self.db_path = db_path or str(DATABASE_PATH)
+        self._local = threading.local()
         self._ensure_database_exists()
     
     def _ensure_database_exists(self):
-        """Create database and tables if they don't exist"""
-        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
-        
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute('''
-                CREATE TABLE IF NOT EXISTS regions (
-                    id TEXT PRIMARY KEY,
-                    name TEXT NOT NULL,
-                    code TEXT UNIQUE NOT NULL,
-                    capital TEXT NOT NULL,
-                    population INTEGER,
-                    area_km2 REAL,
-                    coordinates TEXT,
-                    created_date TEXT,
-                    economic_data TEXT
-                )
-            ''')
-            
-            conn.execute('''
-                CREATE TABLE IF NOT EXISTS districts (
-                    id TEXT PRIMARY KEY,
-                    name TEXT NOT NULL,
-                    region_id TEXT NOT NULL,
-                    region_name TEXT NOT NULL,
-                    type TEXT NOT NULL,
-                    capital TEXT NOT NULL,
-                    population INTEGER,
-                    area_km2 REAL,
-                    coordinates TEXT,
-                    FOREIGN KEY (region_id) REFERENCES regions (id)
-                )
-            ''')
-            
-            conn.execute('''
-                CREATE TABLE IF NOT EXISTS towns (
-                    id TEXT PRIMARY KEY,
-                    name TEXT NOT NULL,
-                    district_id TEXT NOT NULL,
-                    district_name TEXT NOT NULL,
-                    region_id TEXT NOT NULL,
-                    region_name TEXT NOT NULL,
-                    type TEXT NOT NULL,
-                    population INTEGER,
-                    coordinates TEXT,
-                    FOREIGN KEY (district_id) REFERENCES districts (id),
-                    FOREIGN KEY (region_id) REFERENCES regions (id)
-                )
-            ''')
-
-            conn.execute('''
-                CREATE INDEX IF NOT EXISTS idx_regions_name ON regions(name);
-            ''')
-
-            conn.execute('''
-                CREATE INDEX IF NOT EXISTS idx_districts_region ON districts(region_id);
-            ''')
-
-            conn.execute('''
-                CREATE INDEX IF NOT EXISTS idx_towns_district ON towns(district_id);
-            ''')
-
-            conn.execute('''
-                CREATE INDEX IF NOT EXISTS idx_towns_region ON towns(region_id);
-            ''')
-
-            conn.execute('''
-                CREATE INDEX IF NOT EXISTS idx_towns_name ON towns(name);
-            ''')
-
-            conn.commit()
+        """Create the database and its schema if there is none yet
+
+        An existing database is only read, never written: the build step
+        (scripts/setup_database.py) upgrades older layouts. Until then the
+        regions, districts and towns views (or legacy tables) still answer,
+        and the queries needing the current layout raise OutdatedDatabaseError.
+        """
+        path = Path(self.db_path)
+        if not path.exists() or path.stat().st_size == 0:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path)
+        else:
+            conn = sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)
+        try:
+            if conn.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()[0] == 0:
+                ensure_schema(conn)
+            self.schema_version = schema_version(conn)
+        finally:
+            conn.close()
+
+    def _require_current(self):
+        if self.schema_version != SCHEMA_VERSION:
+            found = "the denormalized layout" if self.schema_version is None \
+                else f"schema version {self.schema_version}"
+            raise OutdatedDatabaseError(
+                f"{self.db_path} has {found}, this ghanageo needs version {SCHEMA_VERSION}; "
+                f"run `python scripts/setup_database.py --db {self.db_path}` to upgrade it"
+            )
     
     def get_connection(self):
-        """Get database connection with row factory"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
+        """Get this thread's database connection (row factory set), opened on first use
+
+        Reusing it spares every call SQLite's schema parse for the views and
+        triggers. A forked child opens its own rather than sharing the parent's.
+        """
+        local = self._local
+        if getattr(local, "pid", None) != os.getpid():
+            local.conn = sqlite3.connect(self.db_path)
+            local.conn.row_factory = sqlite3.Row
+            local.pid = os.getpid()
+        return local.conn
     
     def get_all_regions(self) -> List[Dict]:
         """Get all regions"""
@@ -135,6 +260,18 @@ class GhanaGeoDB:
                 districts.append(district_data)
             return districts
     
+    def get_district_by_id(self, district_id: str) -> Optional[Dict]:
+        """Get a specific district by ID"""
+        with self.get_connection() as conn:
+            cursor = conn.execute('SELECT * FROM districts WHERE id = ?', (district_id,))
+            row = cursor.fetchone()
+            if row:
+                district_data = dict(row)
+                if district_data['coordinates']:
+                    district_data['coordinates'] = json.loads(district_data['coordinates'])
+                return district_data
+            return None
+
     def get_towns_by_district(self, district_id: str) -> List[Dict]:
         """Get all towns in a district"""
         with self.get_connection() as conn:
@@ -192,55 +329,199 @@ class GhanaGeoDB:
                 towns.append(town_data)
             return towns
 
+    def get_towns_page(self, district_id: Optional[str] = None,
+                       region_id: Optional[str] = None,
+                       after: str = '', limit: int = 500) -> List[Dict]:
+        """Towns ordered by ID, starting after the given ID (keyset pagination)"""
+        where, params = 'id > ?', [after]
+        if district_id:
+            where, params = where + ' AND district_id = ?', params + [district_id]
+        elif region_id:
+            where, params = where + ' AND region_id = ?', params + [region_id]
+        with self.get_connection() as conn:
+            cursor = conn.execute(
+                f'SELECT * FROM towns WHERE {where} ORDER BY id LIMIT ?',
+                params + [limit]
+            )
+            towns = []
+            for row in cursor.fetchall():
+                town_data = dict(row)
+                if town_data['coordinates']:
+                    town_data['coordinates'] = json.loads(town_data['coordinates'])
+                towns.append(town_data)
+            return towns
+
     def get_towns_count(self) -> int:
         """Get total number of towns"""
         with self.get_connection() as conn:
             cursor = conn.execute('SELECT COUNT(*) FROM towns')
             return cursor.fetchone()[0]
 
-    def search_locations(self, query: str, limit: int = 50) -> List[Dict]:
-        """Search regions and districts"""
-        results = []
-        query_lower = f"%{query.lower()}%"
-        
+    def find_towns(self, district_id: Optional[str] = None, region_id: Optional[str] = None,
+                   types: Optional[List[str]] = None, min_population: Optional[int] = None,
+                   max_population: Optional[int] = None, has_coordinates: Optional[bool] = None,
+                   sort: str = 'name', limit: int = 500, offset: int = 0) -> List[Dict]:
+        """Towns matching every given filter, in `sort` order ('name', 'population', '-population')
+
+        Population orders walk a (scope, population, type, lat) index, which
+        also checks the type and coordinate filters, and stop after `limit`
+        rows; towns without a population come first in ascending order.
+        """
+        if sort not in _TOWN_SORTS:
+            raise ValueError(f"sort must be one of {', '.join(_TOWN_SORTS)}")
+        self._require_current()
+        where, params = _town_filters(district_id, region_id, types, min_population,
+                                      max_population, has_coordinates)
+        order = _TOWN_SORTS[sort]
+        if sort == 'name' and not (district_id or region_id):
+            # The country-wide name index is case-insensitive
+            order += ' COLLATE NOCASE'
         with self.get_connection() as conn:
-            # Search regions
             cursor = conn.execute(
-                "SELECT id, name, 'region' as type, code, coordinates FROM regions WHERE LOWER(name) LIKE ? OR LOWER(code) LIKE ?",
-                (query_lower, query_lower)
-            )
-            for row in cursor.fetchall():
-                result = dict(row)
-                if result['coordinates']:
-                    result['coordinates'] = json.loads(result['coordinates'])
-                results.append(result)
-            
-            # Search districts
-            cursor = conn.execute(
-                "SELECT d.id, d.name, 'district' as type, d.region_name, d.coordinates FROM districts d WHERE LOWER(d.name) LIKE ?",
-                (query_lower,)
+                f"""SELECT v.* FROM town_rows t JOIN towns v ON v.id = t.id
+                    WHERE {where} ORDER BY {order} LIMIT ? OFFSET ?""",
+                params + [limit, offset]
             )
+            towns = []
             for row in cursor.fetchall():
-                result = dict(row)
-                result['region'] = result.pop('region_name')
-                if result['coordinates']:
-                    result['coordinates'] = json.loads(result['coordinates'])
-                results.append(result)
+                town_data = dict(row)
+                if town_data['coordinates']:
+                    town_data['coordinates'] = json.loads(town_data['coordinates'])
+                towns.append(town_data)
+            return towns
 
-            # Search towns
+    def count_towns(self, district_id: Optional[str] = None, region_id: Optional[str] = None,
+                    types: Optional[List[str]] = None, min_population: Optional[int] = None,
+                    max_population: Optional[int] = None, has_coordinates: Optional[bool] = None) -> int:
+        """Number of towns find_towns would return without a limit, counted on an index"""
+        self._require_current()
+        where, params = _town_filters(district_id, region_id, types, min_population,
+                                      max_population, has_coordinates)
+        with self.get_connection() as conn:
+            return conn.execute(f'SELECT COUNT(*) FROM town_rows t WHERE {where}', params).fetchone()[0]
+
+    def get_region_records(self) -> List[RegionRecord]:
+        """Get all regions as compact records"""
+        with self.get_connection() as conn:
+            cursor = conn.execute(f'SELECT {RegionRecord.COLUMNS} FROM regions ORDER BY name')
+            cursor.row_factory = None
+            return [RegionRecord.from_row(row) for row in cursor]
+
+    def get_district_records(self, region_id: str) -> List[DistrictRecord]:
+        """Get all districts in a region as compact records"""
+        with self.get_connection() as conn:
             cursor = conn.execute(
-                "SELECT t.id, t.name, 'town' as type, t.region_name, t.district_name, t.coordinates FROM towns t WHERE LOWER(t.name) LIKE ?",
-                (query_lower,)
+                f'SELECT {DistrictRecord.COLUMNS} FROM districts WHERE region_id = ? ORDER BY name',
+                (region_id,)
             )
-            for row in cursor.fetchall():
-                result = dict(row)
-                result['region'] = result.pop('region_name')
-                result['district'] = result.pop('district_name')
-                if result['coordinates']:
-                    result['coordinates'] = json.loads(result['coordinates'])
-                results.append(result)
-
-        return results[:limit]
+            cursor.row_factory = None
+            return [DistrictRecord.from_row(row) for row in cursor]
+
+    def get_town_records(self, district_id: Optional[str] = None,
+                         region_id: Optional[str] = None,
+                         limit: int = 500, offset: int = 0) -> List[TownRecord]:
+        """Get towns as compact records, by district, by region or paginated"""
+        if district_id:
+            where, params = 'WHERE district_id = ? ORDER BY name', (district_id,)
+        elif region_id:
+            where, params = 'WHERE region_id = ? ORDER BY name', (region_id,)
+        else:
+            where, params = 'ORDER BY region_id, name LIMIT ? OFFSET ?', (limit, offset)
+        with self.get_connection() as conn:
+            cursor = conn.execute(f'SELECT {TownRecord.COLUMNS} FROM towns {where}', params)
+            cursor.row_factory = None
+            return [TownRecord.from_row(row) for row in cursor]
+
+    def search_locations(self, query: str, limit: int = 50) -> List[Dict]:
+        """Search regions, districts and towns, best matches first"""
+        return [result for _, result in self.search_ranked(query, limit)]
+
+    def search_ranked(self, query: str, limit: int = 50, after: Optional[tuple] = None) -> List[tuple]:
+        """(sort key, result) of the best `limit` matches, or of those after `after`
+
+        Matches rank exact name (or region code), then name prefix, then word
+        prefix, then substring; then region, district, town; then larger
+        population, name and id. The sort key is that tuple. An entity whose
+        alternate name matches better than its own ranks by the alternate,
+        returned as `matched_name`. Each entity table, and the alternate
+        names, return at most `limit` rows in key order and the four are
+        merged lazily, so nothing past the page is materialized.
+        """
+        self._require_current()
+        params = dict(_search_params(query), limit=limit)
+        if after is not None:
+            params.update(zip(("a_tier", "a_level", "a_pop", "a_name", "a_id"), after))
+
+        conn = self.get_connection()
+        streams = []
+        for rank, (level, view, _, columns) in enumerate(_SEARCH_SOURCES):
+            sql = _own_sql(level, view, columns, after is not None)
+            streams.append(_ranked_rows(conn.execute(sql, dict(params, level=rank)), rank))
+        streams.append(_ranked_rows(conn.execute(_alternate_sql(after is not None), params)))
+        return list(islice(heapq.merge(*streams, key=itemgetter(0)), limit))
+
+    def search_facets(self, query: str) -> List[Dict]:
+        """Counts of everything search_ranked matches, by level, type and region
+
+        One statement scans each entity table once (and the alternate names
+        once) and groups the whole matching set by all three columns; any
+        facet is a sum over these groups. A region counts under its own name.
+        """
+        self._require_current()
+        selects = " UNION ALL ".join(
+            f"""SELECT '{level}' AS level, {"e.type" if level != "region" else "NULL"} AS type,
+                       {"e.region_name" if level != "region" else "e.name"} AS region
+                FROM {view} e WHERE likelihood({_matches("e", level == "region")} OR e.id IN x, 0.01)"""
+            for level, view, _, _ in _SEARCH_SOURCES
+        )
+        sql = f"""WITH x AS MATERIALIZED (
+                      SELECT DISTINCT entity_id FROM alternate_names
+                      WHERE likelihood({_like("name_key", "fany")}, 0.01))
+                  SELECT level, type, region, COUNT(*) AS count FROM ({selects})
+                  GROUP BY level, type, region"""
+        return [dict(row) for row in self.get_connection().execute(sql, _search_params(query))]
+
+    def lookup_name(self, name_key: str, level: Optional[str] = None) -> List[Dict]:
+        """Exact matches on the normalized name key, search-shaped with population
+
+        Each level is one probe of its name_key index and one of the alternate
+        names' index; the view row is then fetched by id. An entity found only
+        through an alternate name carries it as `matched_name`. Results are
+        unordered. Rows written without running fill_name_keys are not found.
+        """
+        self._require_current()
+        results = []
+        seen = set()
+        with self.get_connection() as conn:
+            for source_level, view, rows, columns in _SEARCH_SOURCES:
+                if level and level != source_level:
+                    continue
+                selected = f"""e.id, e.name, '{source_level}' as type, {", ".join("e." + c for c in columns)},
+                               e.population, e.coordinates"""
+                for row in conn.execute(
+                    f"""SELECT {selected}, NULL AS matched_name
+                        FROM {rows} k JOIN {view} e ON e.id = k.id WHERE k.name_key = :key
+                        UNION ALL
+                        SELECT {selected}, a.name
+                        FROM alternate_names a CROSS JOIN {rows} k ON k.id = a.entity_id
+                        JOIN {view} e ON e.id = k.id
+                        WHERE a.name_key = :key AND k.name_key IS NOT :key""",
+                    {"key": name_key},
+                ):
+                    if row['id'] in seen:
+                        continue
+                    seen.add(row['id'])
+                    result = dict(row)
+                    if result['matched_name'] is None:
+                        del result['matched_name']
+                    if 'region_name' in result:
+                        result['region'] = result.pop('region_name')
+                    if 'district_name' in result:
+                        result['district'] = result.pop('district_name')
+                    if result['coordinates']:
+                        result['coordinates'] = json.loads(result['coordinates'])
+                    results.append(result)
+        return results
 
 # Global database instance
 db = GhanaGeoDB()
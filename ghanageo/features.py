@@ -0,0 +1,117 @@
+"""
+GeoJSON features of regions, districts and towns, rendered once.
+
+Each entity becomes a Point feature whose properties are its row without
+the coordinates. A feature is serialized once (at preload, or the first
+time it is served) and the bytes are kept, so responses only concatenate
+them. Rows of each
+level are also sorted by longitude: a bbox query bisects to its longitude
+strip and checks latitude only there.
+
+`feature_collection` streams a FeatureCollection in fixed-size chunks, so a
+response never holds more than one chunk, however many features match.
+
+One index is built per hierarchy, i.e. per dataset version.
+"""
+
+import json
+import weakref
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Rendered features kept per dataset; past this, extra features are rendered
+# per request instead (the 1M-town benchmark tier)
+CACHE_LIMIT = 200_000
+
+CHUNK_SIZE = 64 * 1024
+
+BBox = Tuple[float, float, float, float]  # min lng, min lat, max lng, max lat
+
+
+def render(row: Dict) -> bytes:
+    coords = row.get("coordinates")
+    geometry = {"type": "Point", "coordinates": [coords["lng"], coords["lat"]]} if coords else None
+    properties = {k: v for k, v in row.items() if k != "coordinates"}
+    return json.dumps(
+        {"type": "Feature", "id": row["id"], "geometry": geometry, "properties": properties},
+        separators=(",", ":"), ensure_ascii=False,
+    ).encode()
+
+
+def in_bbox(row: Dict, bbox: BBox) -> bool:
+    coords = row.get("coordinates")
+    return (coords is not None and bbox[0] <= coords["lng"] <= bbox[2]
+            and bbox[1] <= coords["lat"] <= bbox[3])
+
+
+class FeatureIndex:
+    """Rendered features by id, and each level's located rows sorted by longitude"""
+
+    def __init__(self, levels: Dict[str, List[Dict]]):
+        """`levels`: rows of each level ('region', 'district', 'town')"""
+        self._rows = levels
+        self._by_lng: Dict[str, Tuple[array, List[Dict]]] = {}
+        for level, rows in levels.items():
+            located = sorted((r for r in rows if r.get("coordinates")),
+                             key=lambda r: r["coordinates"]["lng"])
+            self._by_lng[level] = (array("d", (r["coordinates"]["lng"] for r in located)), located)
+        self._cache: Dict[str, bytes] = {}
+
+    def feature(self, row: Dict) -> bytes:
+        cached = self._cache.get(row["id"])
+        if cached is None:
+            cached = render(row)
+            if len(self._cache) < CACHE_LIMIT:
+                self._cache[row["id"]] = cached
+        return cached
+
+    def prerender(self) -> None:
+        """Render every feature now (up to CACHE_LIMIT), e.g. before forking workers"""
+        for rows in self._rows.values():
+            for row in rows:
+                if len(self._cache) >= CACHE_LIMIT:
+                    return
+                self.feature(row)
+
+    def features(self, level: str, rows: Optional[List[Dict]] = None,
+                 bbox: Optional[BBox] = None) -> Iterator[bytes]:
+        """Features of `rows` (default: the whole level), only those inside `bbox` if given"""
+        if rows is None and bbox is not None:
+            lngs, located = self._by_lng[level]
+            for i in range(bisect_left(lngs, bbox[0]), bisect_right(lngs, bbox[2])):
+                row = located[i]
+                if bbox[1] <= row["coordinates"]["lat"] <= bbox[3]:
+                    yield self.feature(row)
+            return
+        for row in self._rows[level] if rows is None else rows:
+            if bbox is None or in_bbox(row, bbox):
+                yield self.feature(row)
+
+
+def feature_collection(features: Iterable[bytes], chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """A FeatureCollection of pre-rendered `features`, in chunks of about `chunk_size` bytes"""
+    buffer = bytearray(b'{"type":"FeatureCollection","features":[')
+    separator = b""
+    for feature in features:
+        buffer += separator
+        buffer += feature
+        separator = b","
+        if len(buffer) >= chunk_size:
+            yield bytes(buffer)
+            buffer.clear()
+    buffer += b"]}"
+    yield bytes(buffer)
+
+
+_indexes: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def index_for(hierarchy) -> FeatureIndex:
+    """The feature index of a Hierarchy, built on first use"""
+    index = _indexes.get(hierarchy)
+    if index is None:
+        index = _indexes[hierarchy] = FeatureIndex(
+            {"region": hierarchy.regions, "district": hierarchy.districts, "town": hierarchy.towns}
+        )
+    return index
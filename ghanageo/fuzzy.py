@@ -0,0 +1,192 @@
+"""
+Typo-tolerant name search over a trigram inverted index.
+
+Every distinct normalized name (ghanageo.names.normalize_name) is split into
+trigrams after padding ("  kumasi "), and each trigram maps to the names
+containing it. A query counts shared trigrams by walking only its own
+trigrams' postings, scores each candidate with the trigram similarity
+
+    shared / (query trigrams + name trigrams - shared)
+
+(1.0 for an exact key, pg_trgm's measure) and keeps the top k with a heap.
+Equal scores go to the higher level (region, district, town), then the
+larger population.
+
+Names are numbered in order of their trigram count, so every posting is
+also grouped by name size. A name of size s scores at most
+min(q, s) / max(q, s) against a query of q trigrams, so sizes are searched
+from the closest outwards, and the search stops once no remaining size can
+reach the k-th best score found so far. The results are exactly those of
+scoring every name; only the postings of sizes that cannot place are skipped.
+Within a size, only the rarest trigrams' postings admit candidates (a name
+must share at least one of them to reach the bound), and the more common
+ones are only probed for those candidates.
+
+One index is built per hierarchy, i.e. per dataset version.
+"""
+
+import heapq
+import math
+import weakref
+from bisect import bisect_left
+from array import array
+from collections import Counter
+from typing import Dict, List
+
+from .hierarchy import LEVEL_RANK, search_result
+from .names import normalize_name
+
+# Below this similarity a name is not considered a match
+DEFAULT_THRESHOLD = 0.3
+
+# Below this many postings in all, one pass over every size is cheaper than
+# searching size by size
+WALK_ALL_POSTINGS = 50_000
+
+
+def trigrams(key: str) -> set:
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class TrigramIndex:
+    """Distinct name keys, their trigram postings and the entities behind each key"""
+
+    def __init__(self, entities):
+        """`entities`: iterable of (level, row) pairs"""
+        slots: Dict[str, int] = {}
+        self._entities: List[List[tuple]] = []
+        for level, row in entities:
+            key = normalize_name(row["name"])
+            if not key:
+                continue
+            slot = slots.get(key)
+            if slot is None:
+                slot = slots[key] = len(self._entities)
+                self._entities.append([])
+            # Order within equal scores: level, then larger population
+            self._entities[slot].append(
+                (LEVEL_RANK[level], -(row.get("population") or 0), row["name"], row["id"], level, row)
+            )
+        for group in self._entities:
+            group.sort(key=lambda e: e[:4])
+
+        # Renumber keys by trigram count, so postings are sorted by size too
+        keyed = sorted((len(grams), slot, grams)
+                       for grams, slot in ((trigrams(key), slot) for key, slot in slots.items()))
+        self._entities = [self._entities[slot] for _, slot, _ in keyed]
+        self._sizes = array("H", (size for size, _, _ in keyed))
+        # Keys of size s are the slots from _size_start[s] up to _size_start[s + 1]
+        largest = self._sizes[-1] if keyed else 0
+        self._size_start = array("I", (bisect_left(self._sizes, s) for s in range(largest + 2)))
+
+        postings: Dict[str, array] = {}
+        for slot, (_, _, grams) in enumerate(keyed):
+            for gram in grams:
+                posting = postings.get(gram)
+                if posting is None:
+                    posting = postings[gram] = array("I")
+                posting.append(slot)
+        self._postings = postings
+
+    def __len__(self):
+        return len(self._entities)
+
+    def search(self, query: str, limit: int = 10,
+               threshold: float = DEFAULT_THRESHOLD) -> List[Dict]:
+        """Top `limit` entities by similarity to `query`, each with its `score`"""
+        key = normalize_name(query)
+        if not key or limit <= 0:
+            return []
+        grams = trigrams(key)
+        postings = [p for p in (self._postings.get(gram) for gram in grams) if p is not None]
+        q = len(grams)
+        starts = self._size_start
+        # Sizes that can reach `threshold`, best possible score first
+        largest = len(starts) - 2
+        if threshold > 0:
+            largest = min(largest, int(q / threshold + 1e-9))
+        smallest = math.ceil(threshold * q - 1e-9)
+        if smallest > largest:
+            ranges = []
+        elif sum(map(len, postings)) <= WALK_ALL_POSTINGS:
+            ranges = [(smallest, largest)]
+        else:
+            ranges = [(s, s) for s in sorted(range(smallest, largest + 1),
+                                              key=lambda s: -min(q, s) / max(q, s))]
+        sizes = self._sizes
+        scored = []
+        bound = threshold
+        for low, high in ranges:
+            closest = min(max(q, low), high)
+            if min(q, closest) / max(q, closest) < bound:
+                break
+            start, end = starts[low], starts[high + 1]
+            if start == end:
+                continue
+            # score >= bound needs shared >= bound * (q + size) / (1 + bound)
+            least = max(1, math.ceil(bound * (q + low) / (1 + bound) - 1e-9))
+            parts = sorted((p[bisect_left(p, start):bisect_left(p, end)] for p in postings), key=len)
+            # A name sharing `least` of the n trigrams has one of the n - least + 1
+            # rarest, so only those admit candidates; the rest only add counts
+            admit = len(parts) - least + 1
+            counts = Counter()
+            for part in parts[:admit]:
+                counts.update(part)
+            for part in parts[admit:]:
+                if len(counts) * 8 < len(part):
+                    for slot in list(counts):
+                        i = bisect_left(part, slot)
+                        if i < len(part) and part[i] == slot:
+                            counts[slot] += 1
+                else:
+                    counts.update(counts.keys() & part)
+            for slot, shared in counts.items():
+                if shared >= least:
+                    score = shared / (q + sizes[slot] - shared)
+                    if score >= bound:
+                        scored.append((score, slot))
+            bound = max(bound, self._kth_score(scored, limit))
+            scored = [s for s in scored if s[0] >= bound]
+
+        # Every entity of a key shares its score, so only keys scoring at
+        # least the k-th best key can place; ties there are kept
+        if len(scored) > limit:
+            cutoff = heapq.nlargest(limit, scored)[-1][0]
+            scored = [s for s in scored if s[0] >= cutoff]
+        ranked = heapq.nsmallest(
+            limit,
+            ((-score, entity) for score, slot in scored for entity in self._entities[slot]),
+            key=lambda item: (item[0],) + item[1][:4],
+        )
+        results = []
+        for negated, (_, _, _, _, level, row) in ranked:
+            result = search_result(level, row)
+            result["score"] = round(-negated, 4)
+            results.append(result)
+        return results
+
+    def _kth_score(self, scored, limit: int) -> float:
+        """Score of the `limit`-th best entity in `scored`, or 0 with fewer entities"""
+        entities = 0
+        # Every slot has at least one entity, so the k-th is among the top k slots
+        for score, slot in heapq.nlargest(limit, scored):
+            entities += len(self._entities[slot])
+            if entities >= limit:
+                return score
+        return 0.0
+
+
+_indexes: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def index_for(hierarchy) -> TrigramIndex:
+    """The trigram index of a Hierarchy, built on first use"""
+    index = _indexes.get(hierarchy)
+    if index is None:
+        index = _indexes[hierarchy] = TrigramIndex(
+            [("region", r) for r in hierarchy.regions]
+            + [("district", d) for d in hierarchy.districts]
+            + [("town", t) for t in hierarchy.towns]
+        )
+    return index
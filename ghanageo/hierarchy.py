@@ -0,0 +1,269 @@
+"""
+Administrative hierarchy index: region -> district -> town.
+
+Built once per dataset version from the current reader (dataset pack or
+SQLite). After that, id and code lookups, parent chains and child listings
+are dict lookups with no queries. Every entity's breadcrumb is precomputed
+as a shared tuple, so `ancestors()` is O(1) for any town.
+
+When the dataset pack is loaded, `PackHierarchy` answers the same calls
+from the pack's offset arrays instead, so towns are read from the shared
+mapping on demand rather than copied into every process.
+
+Rows handed out are shared between callers; treat them as read-only (the
+public getters in ghanageo.api return copies).
+"""
+
+import os
+from collections.abc import Sequence
+from typing import Dict, List, Optional, Tuple
+
+from .pack import DatasetPack
+
+
+LEVEL_RANK = {"region": 0, "district": 1, "town": 2}
+
+
+def _crumb(row: Dict, level: str) -> Dict:
+    return {"id": row["id"], "name": row["name"], "level": level}
+
+
+class Hierarchy:
+    """Every region, district and town keyed by id, with parent and child links."""
+
+    def __init__(self, regions: List[Dict], districts: List[Dict], towns: List[Dict]):
+        self.regions = regions
+        self.districts = districts
+        self.towns = towns
+        self.towns_count = len(towns)
+        self._entities: Dict[str, Tuple[str, Dict]] = {}
+        self._ancestors: Dict[str, Tuple[Dict, ...]] = {}
+        self._children: Dict[str, List[Dict]] = {}
+        self._region_towns: Dict[str, List[Dict]] = {}
+
+        region_chains = {}
+        for region in regions:
+            self._entities[region["id"]] = ("region", region)
+            self._ancestors[region["id"]] = ()
+            self._children[region["id"]] = []
+            self._region_towns[region["id"]] = []
+            region_chains[region["id"]] = (_crumb(region, "region"),)
+        for region in regions:
+            # Codes resolve like ids, but never shadow one
+            self._entities.setdefault(region["code"], ("region", region))
+
+        district_chains = {}
+        for district in districts:
+            chain = region_chains.get(district["region_id"], ())
+            self._entities[district["id"]] = ("district", district)
+            self._ancestors[district["id"]] = chain
+            self._children[district["id"]] = []
+            self._children.setdefault(district["region_id"], []).append(district)
+            district_chains[district["id"]] = chain + (_crumb(district, "district"),)
+
+        for town in towns:
+            self._entities[town["id"]] = ("town", town)
+            self._ancestors[town["id"]] = (
+                district_chains.get(town["district_id"])
+                or region_chains.get(town["region_id"], ())
+            )
+            if town["district_id"] in district_chains:
+                self._children[town["district_id"]].append(town)
+            self._region_towns.setdefault(town["region_id"], []).append(town)
+
+    def get(self, entity_id: str) -> Optional[Tuple[str, Dict]]:
+        """(level, row) for a region id or code, district id or town id"""
+        return self._entities.get(entity_id)
+
+    def _at(self, entity_id: str, level: str) -> Optional[Dict]:
+        entry = self._entities.get(entity_id)
+        return entry[1] if entry and entry[0] == level else None
+
+    def region(self, region_id: str) -> Optional[Dict]:
+        return self._at(region_id, "region")
+
+    def district(self, district_id: str) -> Optional[Dict]:
+        return self._at(district_id, "district")
+
+    def town(self, town_id: str) -> Optional[Dict]:
+        return self._at(town_id, "town")
+
+    def ancestors(self, entity_id: str) -> Optional[Tuple[Dict, ...]]:
+        """Breadcrumb from the region down to the entity's parent"""
+        entry = self._entities.get(entity_id)
+        return self._ancestors[entry[1]["id"]] if entry else None
+
+    def children(self, entity_id: str) -> Optional[List[Dict]]:
+        """Districts of a region or towns of a district (towns have none)"""
+        entry = self._entities.get(entity_id)
+        if not entry:
+            return None
+        return self._children.get(entry[1]["id"], [])
+
+    def region_towns(self, region_id: str) -> List[Dict]:
+        return self._region_towns.get(region_id, [])
+
+
+class _PackRows(Sequence):
+    """The rows of one pack table, decoded when accessed"""
+
+    def __init__(self, pack: DatasetPack, table: str):
+        self._pack = pack
+        self._table = table
+        self._count = pack.counts[table]
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, i: int) -> Dict:
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError(i)
+        return self._pack.row(self._table, i)
+
+    def __iter__(self):
+        row = self._pack.row
+        for i in range(self._count):
+            yield row(self._table, i)
+
+
+class PackHierarchy:
+    """The `Hierarchy` interface over a DatasetPack's id indexes and offset arrays.
+
+    Regions and districts (a few hundred rows) are held as dicts; towns stay
+    in the pack and are decoded per call. The search, GeoJSON and cluster
+    indexes built over it still keep their own town rows, so `api.preload()`
+    leaves them to be built on first use.
+    """
+
+    def __init__(self, pack: DatasetPack):
+        self._pack = pack
+        self.regions = pack.get_all_regions()
+        self.districts = [pack.row("districts", i) for i in range(pack.counts["districts"])]
+        self.towns = _PackRows(pack, "towns")
+        self.towns_count = len(self.towns)
+        self._region_chains = [(_crumb(r, "region"),) for r in self.regions]
+        region_pos = {r["id"]: i for i, r in enumerate(self.regions)}
+        self._ids = {r["id"]: ("region", i) for i, r in enumerate(self.regions)}
+        self._ids.update((d["id"], ("district", i)) for i, d in enumerate(self.districts))
+        self._codes = {r["code"]: ("region", i) for i, r in enumerate(self.regions)}
+        self._district_chains = [
+            (self._region_chains[region_pos[d["region_id"]]] if d["region_id"] in region_pos else ())
+            + (_crumb(d, "district"),)
+            for d in self.districts
+        ]
+
+    def _locate(self, entity_id: str) -> Optional[Tuple[str, int]]:
+        found = self._ids.get(entity_id)
+        if found:
+            return found
+        i = self._pack._find("towns", entity_id)
+        if i is not None:
+            return "town", i
+        # Ids take precedence over region codes, as in Hierarchy
+        return self._codes.get(entity_id)
+
+    def _row(self, level: str, i: int) -> Dict:
+        if level == "region":
+            return self.regions[i]
+        if level == "district":
+            return self.districts[i]
+        return self._pack.row("towns", i)
+
+    def get(self, entity_id: str) -> Optional[Tuple[str, Dict]]:
+        """(level, row) for a region id or code, district id or town id"""
+        found = self._locate(entity_id)
+        return (found[0], self._row(*found)) if found else None
+
+    def _at(self, entity_id: str, level: str) -> Optional[Dict]:
+        found = self._locate(entity_id)
+        return self._row(*found) if found and found[0] == level else None
+
+    def region(self, region_id: str) -> Optional[Dict]:
+        return self._at(region_id, "region")
+
+    def district(self, district_id: str) -> Optional[Dict]:
+        return self._at(district_id, "district")
+
+    def town(self, town_id: str) -> Optional[Dict]:
+        return self._at(town_id, "town")
+
+    def ancestors(self, entity_id: str) -> Optional[Tuple[Dict, ...]]:
+        """Breadcrumb from the region down to the entity's parent"""
+        found = self._locate(entity_id)
+        if not found:
+            return None
+        level, i = found
+        if level == "region":
+            return ()
+        if level == "district":
+            return self._district_chains[i][:-1]
+        district = self._pack._array("towns.parent")[i]
+        if district < len(self.districts):
+            return self._district_chains[district]
+        region = self._ids.get(self._pack._field("towns", "region_id", i))
+        return self._region_chains[region[1]] if region and region[0] == "region" else ()
+
+    def children(self, entity_id: str) -> Optional[List[Dict]]:
+        """Districts of a region or towns of a district (towns have none)"""
+        found = self._locate(entity_id)
+        if not found:
+            return None
+        level, i = found
+        if level == "region":
+            start = self._pack._array("regions.district_start")
+            return self.districts[start[i]:start[i + 1]]
+        if level == "district":
+            start, row = self._pack._array("districts.town_start"), self._pack.row
+            return [row("towns", t) for t in range(start[i], start[i + 1])]
+        return []
+
+    def region_towns(self, region_id: str) -> List[Dict]:
+        found = self._ids.get(region_id)
+        if not found or found[0] != "region":
+            return []
+        i = found[1]
+        start, order = self._pack._array("regions.town_start"), self._pack._array("regions.town_order")
+        row = self._pack.row
+        return [row("towns", order[k]) for k in range(start[i], start[i + 1])]
+
+
+def search_result(level: str, row: Dict) -> Dict:
+    """A region, district or town row in the shape /search returns"""
+    result = {"id": row["id"], "name": row["name"], "type": level}
+    if level == "region":
+        result["code"] = row["code"]
+    else:
+        result["region"] = row["region_name"]
+    if level == "town":
+        result["district"] = row["district_name"]
+    result["coordinates"] = dict(row["coordinates"]) if row["coordinates"] else None
+    return result
+
+
+def build_hierarchy(reader):
+    """A Hierarchy read once through a GhanaGeoDB, or a PackHierarchy over a DatasetPack"""
+    if isinstance(reader, DatasetPack):
+        return PackHierarchy(reader)
+    regions = reader.get_all_regions()
+    districts = [d for r in regions for d in reader.get_districts_by_region(r["id"])]
+    towns = reader.get_all_towns(limit=reader.get_towns_count(), offset=0)
+    return Hierarchy(regions, districts, towns)
+
+
+_current: Dict[str, tuple] = {}
+
+
+def load_hierarchy(db_path, open_reader):
+    """
+    The hierarchy for `db_path`, rebuilt only when the database file changes.
+
+    `open_reader()` returns the reader to build from; it is only called on a rebuild.
+    """
+    st = os.stat(db_path)
+    version = (st.st_size, st.st_mtime_ns)
+    cached = _current.get(db_path)
+    if cached is None or cached[0] != version:
+        cached = _current[db_path] = (version, build_hierarchy(open_reader()))
+    return cached[1]
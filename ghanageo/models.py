@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Union
 
 class Coordinates(BaseModel):
     lat: float
@@ -14,6 +14,7 @@ class Region(BaseModel):
     area_km2: float
     coordinates: Optional[Coordinates] = None
     created_date: Optional[str] = None
+    economic_data: Optional[str] = None
     
     class Config:
         json_encoders = {
@@ -46,10 +47,19 @@ class SearchResult(BaseModel):
     id: str
     name: str
     type: str  # 'region', 'district', 'town'
+    code: Optional[str] = None
     region: Optional[str] = None
     district: Optional[str] = None
+    population: Optional[int] = None  # lookup results only
+    score: Optional[float] = None  # fuzzy search results only
+    matched_name: Optional[str] = None  # when an alternate name matched
     coordinates: Optional[Coordinates] = None
 
+class Ancestor(BaseModel):
+    id: str
+    name: str
+    level: str  # 'region', 'district'
+
 class APIResponse(BaseModel):
     success: bool
     data: Any
@@ -60,3 +70,117 @@ class ErrorResponse(BaseModel):
     success: bool = False
     error: str
     message: str
+
+# Response envelopes for the HTTP API
+
+class RegionListResponse(BaseModel):
+    success: bool
+    count: int
+    data: List[Region]
+
+class RegionResponse(BaseModel):
+    success: bool
+    data: Region
+
+class DistrictResponse(BaseModel):
+    success: bool
+    data: District
+
+class DistrictListResponse(BaseModel):
+    success: bool
+    count: int
+    data: List[District]
+
+class TownListResponse(BaseModel):
+    success: bool
+    district_id: Optional[str] = None
+    region_id: Optional[str] = None
+    count: int
+    total: Optional[int] = None  # every match of a filtered listing
+    data: List[Town]
+
+class TownResponse(BaseModel):
+    success: bool
+    data: Town
+
+class BatchGetRequest(BaseModel):
+    ids: List[str]
+
+class BatchItem(BaseModel):
+    id: str
+    found: bool
+    level: Optional[str] = None  # 'region', 'district', 'town'
+    data: Optional[Union[Region, District, Town]] = None
+
+class BatchGetResponse(BaseModel):
+    success: bool
+    count: int
+    found: int
+    data: List[BatchItem]
+
+class Cluster(BaseModel):
+    count: int
+    centroid: Coordinates
+    town: SearchResult  # the most populous town of the cluster
+
+class ClustersResponse(BaseModel):
+    success: bool
+    zoom: int
+    count: int
+    data: List[Cluster]
+
+class BatchSubRequest(BaseModel):
+    path: str  # an API GET route, optionally with a query string
+    params: Optional[Dict[str, Any]] = None
+
+class BatchRequest(BaseModel):
+    requests: List[BatchSubRequest]
+
+class BatchSubResponse(BaseModel):
+    path: str
+    status: int
+    body: Any
+
+class BatchResponse(BaseModel):
+    success: bool
+    count: int
+    data: List[BatchSubResponse]
+
+class SearchResponse(BaseModel):
+    success: bool
+    query: str
+    count: int
+    data: List[SearchResult]
+    next_cursor: Optional[str] = None
+    facets: Optional[Dict[str, Dict[str, int]]] = None
+
+class AutocompleteResponse(BaseModel):
+    success: bool
+    query: str
+    count: int
+    data: List[SearchResult]
+
+class LookupResponse(BaseModel):
+    success: bool
+    name: str
+    level: Optional[str] = None
+    count: int
+    data: List[SearchResult]
+
+class StatisticsResponse(BaseModel):
+    success: bool
+    data: Dict[str, Any]
+
+class AncestorsResponse(BaseModel):
+    success: bool
+    id: str
+    level: str
+    count: int
+    data: List[Ancestor]
+
+class ChildrenResponse(BaseModel):
+    success: bool
+    id: str
+    level: str
+    count: int
+    data: List[Union[District, Town]]
@@ -0,0 +1,43 @@
+"""
+Place-name normalization shared by lookups and the import scripts.
+
+`normalize_name` is the key stored in the `name_key` columns: casefolded,
+Ghanaian letters transliterated (Ɛ -> e, Ɔ -> o, Ŋ -> ng, ...) and accents
+dropped, hyphens, underscores and whitespace runs collapsed to a single
+space, and a trailing administrative word ("Metropolitan Assembly",
+"District", "Region", ...) removed, so "Kumasi Metropolitan", "KUMASI" and
+"kumasi " share a key, as do "Kwaɛbibirɛm" and "Kwaebibirem".
+"""
+
+import re
+import unicodedata
+
+ADMIN_SUFFIXES = (
+    " metropolitan assembly", " municipal assembly", " district assembly",
+    " metropolitan", " municipal", " district", " metro", " assembly", " region",
+)
+
+_SEPARATORS = re.compile(r"[\s\-\u2010-\u2015_]+")
+
+# Letters of Akan, Ewe, Ga and Dagbani orthography with no decomposition,
+# after casefolding
+_TRANSLITERATION = str.maketrans({
+    "ɛ": "e", "ɔ": "o", "ŋ": "ng", "ɖ": "d", "ƒ": "f", "ɣ": "g", "ʋ": "v", "ɩ": "i",
+    "ʊ": "u", "ı": "i",
+})
+
+
+def fold_name(name: str) -> str:
+    """Case-, accent- and separator-folded name, keeping every word"""
+    folded = unicodedata.normalize("NFKD", name.casefold().translate(_TRANSLITERATION))
+    folded = "".join(c for c in folded if not unicodedata.combining(c))
+    return _SEPARATORS.sub(" ", unicodedata.normalize("NFKC", folded)).strip()
+
+
+def normalize_name(name: str) -> str:
+    """Lookup key for a place name; empty for a blank name."""
+    key = fold_name(name)
+    for suffix in ADMIN_SUFFIXES:
+        if key.endswith(suffix) and len(key) > len(suffix):
+            key = key[: -len(suffix)].rstrip()
+    return key
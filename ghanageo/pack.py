@@ -0,0 +1,579 @@
+"""
+Compiled, memory-mappable dataset pack.
+
+`build_pack` compiles ghana.db into a single binary file:
+
+  header     magic, format version, byte order, section table
+  meta       small JSON document (columns, counts, grid, source fingerprint)
+  strings    one UTF-8 blob plus uint32 offsets; every name/id is an index
+  columns    fixed-width arrays per table column (int64, float64 or string
+             index); coordinates are split into lat/lng float64 columns
+  hierarchy  region → district → town offset arrays over the sorted rows
+  indexes    id lookups (sorted permutations), folded-name search order and
+             a uniform lat/lng grid over towns
+
+`DatasetPack` maps the file with mmap and reads straight out of the mapped
+pages through typed memoryviews: nothing is parsed up front, and every
+process that opens the same file shares its pages through the OS page cache.
+"""
+
+import array
+import hashlib
+import json
+import math
+import mmap
+import os
+import sqlite3
+import struct
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+PACK_MAGIC = b"GGEOPACK"
+PACK_VERSION = 1
+DEFAULT_PACK_PATH = Path(__file__).parent / "data" / "ghana.pack"
+
+_HEADER = struct.Struct("<8sIB3xI")            # magic, version, little-endian flag, sections
+_SECTION = struct.Struct("<32sQQ")             # name, offset, length
+_NULL_STR = 0xFFFFFFFF
+_NULL_INT = -(2 ** 63)
+_GRID_CELL_DEG = 0.1
+
+TABLES = ("regions", "districts", "towns")
+LEVELS = ("region", "district", "town")
+
+
+class PackError(Exception):
+    """Raised when a pack file is missing, corrupt or built for another format"""
+    pass
+
+
+def source_fingerprint(db_path) -> Dict:
+    """Size, mtime and content hash of the database a pack is built from."""
+    path = Path(db_path)
+    st = path.stat()
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "sha256": h.hexdigest()}
+
+
+# ---------------------------------------------------------------------------
+# Build
+# ---------------------------------------------------------------------------
+
+class _StringTable:
+    def __init__(self):
+        self.index = {}
+        self.blob = bytearray()
+        self.offsets = array.array("I", [0])
+
+    def add(self, value) -> int:
+        if value is None:
+            return _NULL_STR
+        value = str(value)
+        idx = self.index.get(value)
+        if idx is None:
+            idx = self.index[value] = len(self.offsets) - 1
+            self.blob += value.encode("utf-8")
+            self.offsets.append(len(self.blob))
+        return idx
+
+
+def _column_kind(name: str, values) -> str:
+    if name == "coordinates":
+        return "coords"
+    present = [v for v in values if v is not None]
+    if present and all(isinstance(v, int) for v in present):
+        return "int"
+    if present and all(isinstance(v, (int, float)) for v in present):
+        return "float"
+    return "str"
+
+
+def _load_table(conn, table, order_by):
+    cursor = conn.execute(f"SELECT * FROM {table} ORDER BY {order_by}")
+    columns = [d[0] for d in cursor.description]
+    return columns, [tuple(r) for r in cursor.fetchall()]
+
+
+def build_pack(db_path, out_path) -> Dict:
+    """Compile `db_path` into a pack at `out_path` (written atomically). Returns its meta."""
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        tables = {
+            "regions": _load_table(conn, "regions", "name, id"),
+            "districts": _load_table(conn, "districts", "region_id, name, id"),
+            "towns": _load_table(conn, "towns", "district_id, name, id"),
+        }
+    finally:
+        conn.close()
+
+    strings = _StringTable()
+    sections = {}
+    meta = {"format": PACK_VERSION, "source": source_fingerprint(db_path), "tables": {}}
+
+    # Region rows are in name order; districts grouped by region in that order,
+    # towns grouped by district in district order, each group sorted by name.
+    r_cols, r_rows = tables["regions"]
+    region_pos = {row[r_cols.index("id")]: i for i, row in enumerate(r_rows)}
+    d_cols, d_rows = tables["districts"]
+    d_rows.sort(key=lambda r: region_pos.get(r[d_cols.index("region_id")], len(r_rows)))
+    district_pos = {row[d_cols.index("id")]: i for i, row in enumerate(d_rows)}
+    t_cols, t_rows = tables["towns"]
+    t_rows.sort(key=lambda r: district_pos.get(r[t_cols.index("district_id")], len(d_rows)))
+    tables = {"regions": (r_cols, r_rows), "districts": (d_cols, d_rows),
+              "towns": (t_cols, t_rows)}
+
+    for table, (columns, rows) in tables.items():
+        kinds = []
+        for c, name in enumerate(columns):
+            values = [row[c] for row in rows]
+            kind = _column_kind(name, values)
+            kinds.append(kind)
+            if kind == "coords":
+                lat = array.array("d")
+                lng = array.array("d")
+                for v in values:
+                    point = json.loads(v) if v else None
+                    lat.append(point["lat"] if point else math.nan)
+                    lng.append(point["lng"] if point else math.nan)
+                sections[f"{table}.{name}.lat"] = lat
+                sections[f"{table}.{name}.lng"] = lng
+            elif kind == "int":
+                sections[f"{table}.{name}"] = array.array(
+                    "q", (_NULL_INT if v is None else v for v in values))
+            elif kind == "float":
+                sections[f"{table}.{name}"] = array.array(
+                    "d", (math.nan if v is None else v for v in values))
+            else:
+                sections[f"{table}.{name}"] = array.array("I", (strings.add(v) for v in values))
+        meta["tables"][table] = {"columns": columns, "kinds": kinds, "count": len(rows)}
+
+        id_col = columns.index("id")
+        sections[f"{table}.by_id"] = array.array(
+            "I", sorted(range(len(rows)), key=lambda i: rows[i][id_col]))
+
+    # Region codes resolve like ids
+    code_col = r_cols.index("code")
+    sections["regions.by_code"] = array.array(
+        "I", sorted(range(len(r_rows)), key=lambda i: r_rows[i][code_col]))
+
+    # Hierarchy: parent index per child plus contiguous child ranges
+    d_region = array.array("I", (region_pos.get(r[d_cols.index("region_id")], _NULL_STR) for r in d_rows))
+    t_district = array.array("I", (district_pos.get(r[t_cols.index("district_id")], _NULL_STR) for r in t_rows))
+    sections["districts.parent"] = d_region
+    sections["towns.parent"] = t_district
+    sections["regions.district_start"] = _starts(d_region, len(r_rows))
+    sections["districts.town_start"] = _starts(t_district, len(d_rows))
+
+    # Towns of a region in name order (get_towns_by_region)
+    t_region_col = t_cols.index("region_id")
+    t_name_col = t_cols.index("name")
+    by_region = sorted(
+        range(len(t_rows)),
+        key=lambda i: (region_pos.get(t_rows[i][t_region_col], len(r_rows)), t_rows[i][t_name_col]),
+    )
+    sections["regions.town_order"] = array.array("I", by_region)
+    sections["regions.town_start"] = _starts(
+        [region_pos.get(t_rows[i][t_region_col], len(r_rows)) for i in by_region], len(r_rows))
+
+    # Search order: every entity sorted by case-folded name
+    entries = []
+    for level, table in enumerate(TABLES):
+        columns, rows = tables[table]
+        name_col = columns.index("name")
+        entries.extend((row[name_col].casefold(), level, i) for i, row in enumerate(rows))
+    entries.sort()
+    sections["search.key"] = array.array("I", (strings.add(e[0]) for e in entries))
+    sections["search.level"] = array.array("B", (e[1] for e in entries))
+    sections["search.index"] = array.array("I", (e[2] for e in entries))
+
+    # Spatial grid over town coordinates
+    lat = sections["towns.coordinates.lat"]
+    lng = sections["towns.coordinates.lng"]
+    located = [i for i in range(len(lat)) if not math.isnan(lat[i])]
+    if located:
+        grid = {
+            "min_lat": math.floor(min(lat[i] for i in located)),
+            "min_lng": math.floor(min(lng[i] for i in located)),
+            "cell": _GRID_CELL_DEG,
+        }
+        grid["rows"] = int((max(lat[i] for i in located) - grid["min_lat"]) / _GRID_CELL_DEG) + 1
+        grid["cols"] = int((max(lng[i] for i in located) - grid["min_lng"]) / _GRID_CELL_DEG) + 1
+        cells = {i: _cell(grid, lat[i], lng[i]) for i in located}
+        ordered = sorted(located, key=cells.get)
+        sections["spatial.towns"] = array.array("I", ordered)
+        sections["spatial.cell_start"] = _starts([cells[i] for i in ordered],
+                                                 grid["rows"] * grid["cols"])
+        meta["grid"] = grid
+
+    sections["strings.blob"] = strings.blob
+    sections["strings.offsets"] = strings.offsets
+    meta["typecodes"] = {
+        name: (data.typecode if isinstance(data, array.array) else "B")
+        for name, data in sections.items()
+    }
+    _write(out_path, meta, sections)
+    return meta
+
+
+def _starts(parents, n) -> array.array:
+    """Offsets such that children of parent p are [starts[p], starts[p + 1])."""
+    counts = [0] * (n + 1)
+    for p in parents:
+        if p < n:
+            counts[p + 1] += 1
+    for i in range(n):
+        counts[i + 1] += counts[i]
+    return array.array("I", counts)
+
+
+def _cell_rc(grid, lat, lng):
+    row = min(max(int((lat - grid["min_lat"]) / grid["cell"]), 0), grid["rows"] - 1)
+    col = min(max(int((lng - grid["min_lng"]) / grid["cell"]), 0), grid["cols"] - 1)
+    return row, col
+
+
+def _cell(grid, lat, lng) -> int:
+    row, col = _cell_rc(grid, lat, lng)
+    return row * grid["cols"] + col
+
+
+def _write(out_path, meta, sections):
+    if sys.byteorder != "little":
+        for data in sections.values():
+            if isinstance(data, array.array):
+                data.byteswap()
+    payload = [("meta", json.dumps(meta, separators=(",", ":")).encode("utf-8"))]
+    payload += [(name, bytes(data)) for name, data in sections.items()]
+
+    offset = _HEADER.size + _SECTION.size * len(payload)
+    table = []
+    for name, data in payload:
+        if len(name) > 32:
+            raise PackError(f"Section name too long: {name}")
+        offset = (offset + 7) & ~7
+        table.append((name, offset, len(data)))
+        offset += len(data)
+
+    out_path = Path(out_path)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = out_path.with_name(f".{out_path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(PACK_MAGIC, PACK_VERSION, 1, len(payload)))
+        for name, off, length in table:
+            f.write(_SECTION.pack(name.encode("ascii"), off, length))
+        for (name, data), (_, off, _) in zip(payload, table):
+            f.write(b"\0" * (off - f.tell()))
+            f.write(data)
+    os.replace(tmp_path, out_path)
+
+
+# ---------------------------------------------------------------------------
+# Runtime
+# ---------------------------------------------------------------------------
+
+class DatasetPack:
+    """Read-only view over a pack file, mapped with mmap."""
+
+    def __init__(self, path=DEFAULT_PACK_PATH):
+        self.path = Path(path)
+        try:
+            with open(self.path, "rb") as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            raise PackError(f"Cannot map pack {self.path}: {e}")
+        self._buf = memoryview(self._mmap)
+
+        if len(self._buf) < _HEADER.size:
+            raise PackError(f"{self.path} is truncated")
+        magic, version, little, count = _HEADER.unpack_from(self._buf, 0)
+        if magic != PACK_MAGIC:
+            raise PackError(f"{self.path} is not a GhanaGeo pack")
+        if version != PACK_VERSION:
+            raise PackError(f"{self.path} is pack format {version}, expected {PACK_VERSION}")
+        if sys.byteorder != "little":
+            raise PackError("Packs are little-endian; this platform is not")
+
+        if len(self._buf) < _HEADER.size + count * _SECTION.size:
+            raise PackError(f"{self.path} is truncated")
+        self._sections = {}
+        for i in range(count):
+            name, off, length = _SECTION.unpack_from(self._buf, _HEADER.size + i * _SECTION.size)
+            if off + length > len(self._buf):
+                raise PackError(f"{self.path} is truncated")
+            self._sections[name.rstrip(b"\0").decode("ascii", "replace")] = (off, length)
+
+        self._arrays = {}
+        self._getters = {}
+        self._strings = {}
+        try:
+            self.meta = json.loads(bytes(self._raw("meta")))
+            self._blob = self._raw("strings.blob")
+            self._offsets = self._array("strings.offsets")
+            self._columns = {t: self.meta["tables"][t]["columns"] for t in TABLES}
+            self._kinds = {t: self.meta["tables"][t]["kinds"] for t in TABLES}
+            self.counts = {t: self.meta["tables"][t]["count"] for t in TABLES}
+        except (KeyError, TypeError, ValueError) as e:
+            raise PackError(f"{self.path} is corrupt: {e!r}")
+
+    def close(self):
+        self._arrays.clear()
+        self._getters.clear()
+        self._offsets = self._blob = None
+        self._buf.release()
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def is_current(self, db_path) -> bool:
+        """True when the pack was built from the database currently at `db_path`."""
+        source = self.meta.get("source", {})
+        try:
+            st = os.stat(db_path)
+        except OSError:
+            return False
+        if (st.st_size, st.st_mtime_ns) == (source.get("size"), source.get("mtime_ns")):
+            return True
+        return source_fingerprint(db_path)["sha256"] == source.get("sha256")
+
+    # -- raw access ---------------------------------------------------------
+
+    def _raw(self, name) -> memoryview:
+        off, length = self._sections[name]
+        return self._buf[off:off + length]
+
+    def _array(self, name) -> memoryview:
+        view = self._arrays.get(name)
+        if view is None:
+            view = self._arrays[name] = self._raw(name).cast(self.meta["typecodes"][name])
+        return view
+
+    def string(self, idx: int) -> Optional[str]:
+        if idx == _NULL_STR:
+            return None
+        value = self._strings.get(idx)
+        if value is None:
+            value = self._strings[idx] = bytes(
+                self._blob[self._offsets[idx]:self._offsets[idx + 1]]).decode("utf-8")
+        return value
+
+    def _getter(self, table, column, kind):
+        if kind == "coords":
+            lat = self._array(f"{table}.{column}.lat")
+            lng = self._array(f"{table}.{column}.lng")
+            return lambda i: None if lat[i] != lat[i] else {"lat": lat[i], "lng": lng[i]}
+        values = self._array(f"{table}.{column}")
+        if kind == "int":
+            return lambda i: None if values[i] == _NULL_INT else values[i]
+        if kind == "float":
+            return lambda i: None if values[i] != values[i] else values[i]
+        string = self.string
+        return lambda i: string(values[i])
+
+    def _row_getters(self, table):
+        getters = self._getters.get(table)
+        if getters is None:
+            getters = self._getters[table] = [
+                (column, self._getter(table, column, kind))
+                for column, kind in zip(self._columns[table], self._kinds[table])
+            ]
+        return getters
+
+    def row(self, table: str, i: int) -> Dict:
+        """Row `i` of `table` as the same dict GhanaGeoDB returns."""
+        return {column: get(i) for column, get in self._row_getters(table)}
+
+    def _field(self, table, column, i):
+        kind = self._kinds[table][self._columns[table].index(column)]
+        return self._getter(table, column, kind)(i)
+
+    def _find(self, table, key, order="by_id", column="id") -> Optional[int]:
+        perm = self._array(f"{table}.{order}")
+        col = self._array(f"{table}.{column}")
+        lo, hi = 0, len(perm)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            value = self.string(col[perm[mid]])
+            if value < key:
+                lo = mid + 1
+            elif value > key:
+                hi = mid
+            else:
+                return perm[mid]
+        return None
+
+    # -- GhanaGeoDB-compatible reads -----------------------------------------
+
+    def region_index(self, region_id: str) -> Optional[int]:
+        i = self._find("regions", region_id)
+        return i if i is not None else self._find("regions", region_id, "by_code", "code")
+
+    def get_all_regions(self) -> List[Dict]:
+        return [self.row("regions", i) for i in range(self.counts["regions"])]
+
+    def get_region_by_id(self, region_id: str) -> Optional[Dict]:
+        i = self.region_index(region_id)
+        return self.row("regions", i) if i is not None else None
+
+    def get_districts_by_region(self, region_id: str) -> List[Dict]:
+        i = self._find("regions", region_id)
+        if i is None:
+            return []
+        start = self._array("regions.district_start")
+        return [self.row("districts", d) for d in range(start[i], start[i + 1])]
+
+    def get_district_by_id(self, district_id: str) -> Optional[Dict]:
+        i = self._find("districts", district_id)
+        return self.row("districts", i) if i is not None else None
+
+    def get_towns_by_district(self, district_id: str) -> List[Dict]:
+        i = self._find("districts", district_id)
+        if i is None:
+            return []
+        start = self._array("districts.town_start")
+        return [self.row("towns", t) for t in range(start[i], start[i + 1])]
+
+    def get_towns_by_region(self, region_id: str) -> List[Dict]:
+        i = self._find("regions", region_id)
+        if i is None:
+            return []
+        start = self._array("regions.town_start")
+        order = self._array("regions.town_order")
+        return [self.row("towns", order[k]) for k in range(start[i], start[i + 1])]
+
+    def get_town_by_id(self, town_id: str) -> Optional[Dict]:
+        i = self._find("towns", town_id)
+        return self.row("towns", i) if i is not None else None
+
+    def get_all_towns(self, limit: int = 500, offset: int = 0) -> List[Dict]:
+        """Towns ordered by region_id, then name."""
+        start = self._array("regions.town_start")
+        order = self._array("regions.town_order")
+        regions = sorted(range(self.counts["regions"]),
+                         key=lambda r: self._field("regions", "id", r))
+        towns = []
+        for r in regions:
+            begin, end = start[r], start[r + 1]
+            if offset >= end - begin:
+                offset -= end - begin
+                continue
+            for k in range(begin + offset, end):
+                if len(towns) >= limit:
+                    return towns
+                towns.append(self.row("towns", order[k]))
+            offset = 0
+        return towns
+
+    def get_towns_count(self) -> int:
+        return self.counts["towns"]
+
+    # -- indexes ------------------------------------------------------------
+
+    def search_prefix(self, prefix: str, limit: int = 10) -> List[Dict]:
+        """Entities whose case-folded name starts with `prefix`, in name order."""
+        prefix = prefix.casefold()
+        keys = self._array("search.key")
+        levels = self._array("search.level")
+        indexes = self._array("search.index")
+        lo, hi = 0, len(keys)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.string(keys[mid]) < prefix:
+                lo = mid + 1
+            else:
+                hi = mid
+        results = []
+        k = lo
+        while k < len(keys) and len(results) < limit and self.string(keys[k]).startswith(prefix):
+            table = TABLES[levels[k]]
+            results.append(dict(self.row(table, indexes[k]), level=LEVELS[levels[k]]))
+            k += 1
+        return results
+
+    def towns_in_bbox(self, min_lng: float, min_lat: float,
+                      max_lng: float, max_lat: float) -> List[Dict]:
+        grid = self.meta.get("grid")
+        if not grid:
+            return []
+        lat = self._array("towns.coordinates.lat")
+        lng = self._array("towns.coordinates.lng")
+        starts = self._array("spatial.cell_start")
+        towns = self._array("spatial.towns")
+        row_lo, col_lo = _cell_rc(grid, min_lat, min_lng)
+        row_hi, col_hi = _cell_rc(grid, max_lat, max_lng)
+        results = []
+        for row in range(row_lo, row_hi + 1):
+            base = row * grid["cols"]
+            for k in range(starts[base + col_lo], starts[base + col_hi + 1]):
+                t = towns[k]
+                if min_lat <= lat[t] <= max_lat and min_lng <= lng[t] <= max_lng:
+                    results.append(self.row("towns", t))
+        return results
+
+
+def _file_version(path) -> Optional[tuple]:
+    """(inode, size, mtime_ns) of a file, or None when it does not exist"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_ino, st.st_size, st.st_mtime_ns
+
+
+# (pack path, db path) -> ((pack version, db version), pack or None)
+def _versions(path, db_path) -> tuple:
+    return _file_version(path), _file_version(db_path) if db_path is not None else None
+
+
+_loaded = {}
+
+
+def load_pack(path=None, db_path=None) -> Optional[DatasetPack]:
+    """
+    Open the pack at `path`, $GHANAGEO_PACK or the bundled default, once per
+    version of the pack and database files.
+
+    With GHANAGEO_SHARED=1 and a `db_path`, the default is instead the pack
+    shared by all workers on the host, built on first use (see ghanageo.shared).
+
+    Returns None (so callers fall back to SQLite) when no pack file exists,
+    when it cannot be read, or when `db_path` is given and the pack was built
+    from a different database. Either file changing is noticed on the next
+    call; packs already handed out stay open for their holders.
+    """
+    path = path or os.environ.get("GHANAGEO_PACK")
+    if path is None and db_path is not None:
+        from .shared import ensure_shared_pack, shared_enabled, shared_pack_path
+        if shared_enabled():
+            try:
+                path = shared_pack_path(db_path)
+                cached = _loaded.get((path, str(db_path)))
+                # Only validate (and build if needed) a pack we have not mapped yet
+                if cached is None or cached[1] is None or cached[0] != _versions(path, db_path):
+                    path = ensure_shared_pack(db_path)
+            except (PackError, OSError, sqlite3.Error):
+                return None
+    path = Path(path or DEFAULT_PACK_PATH)
+    key = (path, str(db_path))
+    version = _versions(path, db_path)
+    cached = _loaded.get(key)
+    if cached is None or cached[0] != version:
+        pack = None
+        if version[0] is not None:
+            try:
+                pack = DatasetPack(path)
+            except PackError:
+                pass
+            else:
+                if db_path is not None and not pack.is_current(db_path):
+                    pack.close()
+                    pack = None
+        cached = _loaded[key] = (version, pack)
+    return cached[1]
@@ -0,0 +1,145 @@
+"""
+Zoom-aware town clusters from a precomputed grid pyramid.
+
+Towns are binned into Web Mercator grid cells, CELLS_PER_TILE x
+CELLS_PER_TILE per map tile, at every zoom from 0 to MAX_ZOOM. The pyramid
+is built bottom up: each cell at zoom z merges its four children at z + 1.
+A cell keeps its town count, its coordinate sums (so the centroid is a
+division) and its most populous town as the representative.
+
+A request only touches the cells of the tiles covering its bbox, so it
+costs O(visible cells), not O(towns). Each tile's clusters are computed
+once and kept in a per-dataset LRU keyed by (zoom, x, y), locked so threads
+may share a pyramid. Zooms above MAX_ZOOM use the MAX_ZOOM grid.
+
+One pyramid is built per hierarchy, i.e. per dataset version.
+"""
+
+import math
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Dict, List, Tuple
+
+from .hierarchy import search_result
+
+MAX_ZOOM = 14
+CELLS_PER_TILE = 8
+_SHIFT = 3  # log2(CELLS_PER_TILE)
+# Tiles whose clusters are kept per dataset
+TILE_CACHE_SIZE = 4096
+# Most grid cells one request may cover
+MAX_CELLS = 16384
+
+_MAX_LAT = 85.05112878
+
+
+class TooManyCellsError(ValueError):
+    """Raised when a bbox covers more than MAX_CELLS grid cells at the requested zoom"""
+    pass
+
+
+def _cell(lng: float, lat: float, zoom: int) -> Tuple[int, int]:
+    """Grid cell of a point at `zoom`, clamped to the world"""
+    n = 1 << (zoom + _SHIFT)
+    lat = max(-_MAX_LAT, min(_MAX_LAT, lat))
+    x = (lng + 180.0) / 360.0 * n
+    y = (1.0 - math.asinh(math.tan(math.radians(lat))) / math.pi) / 2.0 * n
+    return min(n - 1, max(0, int(x))), min(n - 1, max(0, int(y)))
+
+
+def _better(town: Dict, best: Dict) -> bool:
+    """Whether `town` represents a cell better than `best`: larger, then by name and id"""
+    return ((-(town.get("population") or 0), town["name"], town["id"])
+            < (-(best.get("population") or 0), best["name"], best["id"]))
+
+
+class ClusterPyramid:
+    """Per zoom, the non-empty grid cells: [count, lng sum, lat sum, largest town]"""
+
+    def __init__(self, towns: List[Dict]):
+        leaves: Dict[Tuple[int, int], list] = {}
+        for town in towns:
+            coords = town.get("coordinates")
+            if not coords:
+                continue
+            key = _cell(coords["lng"], coords["lat"], MAX_ZOOM)
+            cell = leaves.get(key)
+            if cell is None:
+                leaves[key] = [1, coords["lng"], coords["lat"], town]
+            else:
+                cell[0] += 1
+                cell[1] += coords["lng"]
+                cell[2] += coords["lat"]
+                if _better(town, cell[3]):
+                    cell[3] = town
+        self._levels: List[Dict[Tuple[int, int], list]] = [None] * (MAX_ZOOM + 1)
+        self._levels[MAX_ZOOM] = leaves
+        for zoom in range(MAX_ZOOM - 1, -1, -1):
+            level = {}
+            for (x, y), (count, lng_sum, lat_sum, town) in self._levels[zoom + 1].items():
+                parent = level.get((x >> 1, y >> 1))
+                if parent is None:
+                    level[(x >> 1, y >> 1)] = [count, lng_sum, lat_sum, town]
+                else:
+                    parent[0] += count
+                    parent[1] += lng_sum
+                    parent[2] += lat_sum
+                    if _better(town, parent[3]):
+                        parent[3] = town
+            self._levels[zoom] = level
+        self._tiles: "OrderedDict[Tuple[int, int, int], List[Tuple[int, int, Dict]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _tile(self, zoom: int, tx: int, ty: int) -> List[Tuple[int, int, Dict]]:
+        """(cell x, cell y, cluster) of every non-empty cell in a tile, cached"""
+        key = (zoom, tx, ty)
+        with self._lock:
+            clusters = self._tiles.get(key)
+            if clusters is not None:
+                self._tiles.move_to_end(key)
+                return clusters
+        level = self._levels[zoom]
+        clusters = []
+        for x in range(tx << _SHIFT, (tx + 1) << _SHIFT):
+            for y in range(ty << _SHIFT, (ty + 1) << _SHIFT):
+                cell = level.get((x, y))
+                if cell is not None:
+                    count, lng_sum, lat_sum, town = cell
+                    representative = search_result("town", town)
+                    representative["population"] = town.get("population")
+                    clusters.append((x, y, {
+                        "count": count,
+                        "centroid": {"lat": round(lat_sum / count, 6), "lng": round(lng_sum / count, 6)},
+                        "town": representative,
+                    }))
+        with self._lock:
+            self._tiles[key] = clusters
+            if len(self._tiles) > TILE_CACHE_SIZE:
+                self._tiles.popitem(last=False)
+        return clusters
+
+    def clusters(self, bbox: Tuple[float, float, float, float], zoom: int) -> List[Dict]:
+        """Clusters of the cells overlapping `bbox` (min lng, min lat, max lng, max lat)"""
+        zoom = max(0, min(MAX_ZOOM, zoom))
+        x0, y0 = _cell(bbox[0], bbox[3], zoom)
+        x1, y1 = _cell(bbox[2], bbox[1], zoom)
+        if (x1 - x0 + 1) * (y1 - y0 + 1) > MAX_CELLS:
+            raise TooManyCellsError("bbox covers too many cells at this zoom; zoom out or narrow it")
+        results = []
+        for tx in range(x0 >> _SHIFT, (x1 >> _SHIFT) + 1):
+            for ty in range(y0 >> _SHIFT, (y1 >> _SHIFT) + 1):
+                results.extend(cluster for x, y, cluster in self._tile(zoom, tx, ty)
+                               if x0 <= x <= x1 and y0 <= y <= y1)
+        return results
+
+
+_pyramids: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def pyramid_for(hierarchy) -> ClusterPyramid:
+    """The cluster pyramid of a Hierarchy's towns, built on first use"""
+    pyramid = _pyramids.get(hierarchy)
+    if pyramid is None:
+        pyramid = _pyramids[hierarchy] = ClusterPyramid(hierarchy.towns)
+    return pyramid
@@ -0,0 +1,117 @@
+"""
+Compact, immutable row records.
+
+Each record is a NamedTuple: no per-instance __dict__, named attribute
+access, and coordinates held as two floats instead of a nested dict.
+Strings repeated across rows (parent ids and names, types) are interned, so
+ten thousand towns in one region share a single `region_name` object.
+
+`to_dict()` produces exactly the dict GhanaGeoDB returns for the same row.
+"""
+
+import sys
+from typing import Dict, NamedTuple, Optional
+
+_intern = sys.intern
+
+
+def _coords(lat, lng) -> Optional[Dict]:
+    return {"lat": lat, "lng": lng} if lat is not None else None
+
+
+class RegionRecord(NamedTuple):
+    id: str
+    name: str
+    code: str
+    capital: str
+    population: Optional[int]
+    area_km2: Optional[float]
+    lat: Optional[float]
+    lng: Optional[float]
+    created_date: Optional[str]
+    economic_data: Optional[str]
+
+    # Column list matching from_row(); coordinates are split by SQLite
+    COLUMNS = (
+        "id, name, code, capital, population, area_km2, "
+        "json_extract(coordinates, '$.lat'), json_extract(coordinates, '$.lng'), "
+        "created_date, economic_data"
+    )
+
+    @classmethod
+    def from_row(cls, row) -> "RegionRecord":
+        return cls(_intern(row[0]), _intern(row[1]), _intern(row[2]), _intern(row[3]),
+                   *row[4:8], row[8], row[9])
+
+    def to_dict(self) -> Dict:
+        return {
+            "id": self.id, "name": self.name, "code": self.code, "capital": self.capital,
+            "population": self.population, "area_km2": self.area_km2,
+            "coordinates": _coords(self.lat, self.lng),
+            "created_date": self.created_date, "economic_data": self.economic_data,
+        }
+
+
+class DistrictRecord(NamedTuple):
+    id: str
+    name: str
+    region_id: str
+    region_name: str
+    type: str
+    capital: str
+    population: Optional[int]
+    area_km2: Optional[float]
+    lat: Optional[float]
+    lng: Optional[float]
+
+    COLUMNS = (
+        "id, name, region_id, region_name, type, capital, population, area_km2, "
+        "json_extract(coordinates, '$.lat'), json_extract(coordinates, '$.lng')"
+    )
+
+    @classmethod
+    def from_row(cls, row) -> "DistrictRecord":
+        return cls(_intern(row[0]), _intern(row[1]), _intern(row[2]), _intern(row[3]),
+                   _intern(row[4]), row[5], *row[6:10])
+
+    def to_dict(self) -> Dict:
+        return {
+            "id": self.id, "name": self.name,
+            "region_id": self.region_id, "region_name": self.region_name,
+            "type": self.type, "capital": self.capital,
+            "population": self.population, "area_km2": self.area_km2,
+            "coordinates": _coords(self.lat, self.lng),
+        }
+
+
+class TownRecord(NamedTuple):
+    id: str
+    name: str
+    district_id: str
+    district_name: str
+    region_id: str
+    region_name: str
+    type: str
+    population: Optional[int]
+    lat: Optional[float]
+    lng: Optional[float]
+
+    COLUMNS = (
+        "id, name, district_id, district_name, region_id, region_name, type, population, "
+        "json_extract(coordinates, '$.lat'), json_extract(coordinates, '$.lng')"
+    )
+
+    @classmethod
+    def from_row(cls, row) -> "TownRecord":
+        # Town ids and names are unique per row; only the shared columns are interned
+        return cls(row[0], row[1], _intern(row[2]), _intern(row[3]), _intern(row[4]),
+                   _intern(row[5]), _intern(row[6]), *row[7:10])
+
+    def to_dict(self) -> Dict:
+        return {
+            "id": self.id, "name": self.name,
+            "district_id": self.district_id, "district_name": self.district_name,
+            "region_id": self.region_id, "region_name": self.region_name,
+            "type": self.type, "population": self.population,
+            "coordinates": _coords(self.lat, self.lng),
+        }
@@ -0,0 +1,348 @@
+"""
+Storage layout of ghana.db.
+
+Rows are stored normalized: integer surrogate keys (the rowid) link towns to
+districts and regions, type strings live once in a lookup table, parent
+names come from the parent row, and coordinates are two REAL columns
+instead of a JSON string. The `regions`, `districts` and `towns` views
+rebuild the original columns, so `SELECT * FROM towns` returns exactly what
+the denormalized tables did.
+
+Writes to `towns` (GeoNames import, spatial reassignment, seed towns) go
+through INSTEAD OF triggers on the view; only `id`, `name`, `district_id`,
+`type`, `population` and `coordinates` are stored, the names and region are
+derived from the district. `regions` and `districts` accept UPDATEs the same
+way; scripts/setup_database.py inserts them into the storage tables.
+
+Each storage table, and `alternate_names` (variant spellings from
+GeoNames), carries a `name_key` (ghanageo.names.normalize_name) for
+exact-name lookups and diacritic-insensitive search. SQLite cannot compute
+it, so writes leave it NULL and the writer runs `fill_name_keys` afterwards,
+as the build and import scripts do.
+
+PRAGMA user_version records the layout version; `ensure_schema` upgrades
+older databases (including the original denormalized tables) in one
+transaction. scripts/setup_database.py runs it; GhanaGeoDB only reads an
+existing database and raises OutdatedDatabaseError from the queries that
+need the current layout.
+"""
+
+import sqlite3
+
+from .names import normalize_name
+
+_COORDINATES = "CASE WHEN {0}.lat IS NOT NULL THEN json_object('lat', {0}.lat, 'lng', {0}.lng) END"
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS types (
+    type_key INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+
+CREATE TABLE IF NOT EXISTS region_rows (
+    region_key INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    code TEXT NOT NULL UNIQUE,
+    capital TEXT NOT NULL,
+    population INTEGER,
+    area_km2 REAL,
+    lat REAL,
+    lng REAL,
+    created_date TEXT,
+    economic_data TEXT,
+    name_key TEXT
+);
+
+CREATE TABLE IF NOT EXISTS district_rows (
+    district_key INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    region_key INTEGER NOT NULL REFERENCES region_rows (region_key),
+    type_key INTEGER NOT NULL REFERENCES types (type_key),
+    capital TEXT NOT NULL,
+    population INTEGER,
+    area_km2 REAL,
+    lat REAL,
+    lng REAL,
+    name_key TEXT
+);
+
+CREATE TABLE IF NOT EXISTS town_rows (
+    town_key INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    district_key INTEGER NOT NULL REFERENCES district_rows (district_key),
+    region_key INTEGER NOT NULL REFERENCES region_rows (region_key),
+    type_key INTEGER NOT NULL REFERENCES types (type_key),
+    population INTEGER,
+    lat REAL,
+    lng REAL,
+    name_key TEXT
+);
+
+-- Variant spellings (GeoNames asciiname and alternatenames) of any region,
+-- district or town, searchable through their name_key
+CREATE TABLE IF NOT EXISTS alternate_names (
+    alternate_key INTEGER PRIMARY KEY,
+    entity_id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    name_key TEXT,
+    UNIQUE (entity_id, name)
+);
+
+-- One index per query shape GhanaGeoDB issues (tests/test_query_plans.py):
+-- listings sorted by name, keyset pages sorted by id, and NOCASE name
+-- indexes that LIKE 'prefix%' can seek in (LIKE is case-insensitive).
+CREATE INDEX IF NOT EXISTS idx_region_rows_name ON region_rows(name);
+CREATE INDEX IF NOT EXISTS idx_district_rows_region ON district_rows(region_key, name);
+CREATE INDEX IF NOT EXISTS idx_district_rows_name_nocase ON district_rows(name COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS idx_town_rows_district ON town_rows(district_key, name);
+CREATE INDEX IF NOT EXISTS idx_town_rows_region ON town_rows(region_key, name);
+CREATE INDEX IF NOT EXISTS idx_town_rows_district_id ON town_rows(district_key, id);
+CREATE INDEX IF NOT EXISTS idx_town_rows_region_id ON town_rows(region_key, id);
+CREATE INDEX IF NOT EXISTS idx_town_rows_name_nocase ON town_rows(name COLLATE NOCASE);
+-- Filtered town listings sorted by population: the range and order come
+-- from the index, and type and coordinates are checked (and counted) in it.
+-- The country-wide one (about 290 KB) is what keeps an unscoped population
+-- sort off a temp b-tree; counts alone would skip-scan the region one.
+CREATE INDEX IF NOT EXISTS idx_town_rows_population ON town_rows(population, type_key, lat);
+CREATE INDEX IF NOT EXISTS idx_town_rows_region_population ON town_rows(region_key, population, type_key, lat);
+CREATE INDEX IF NOT EXISTS idx_town_rows_district_population ON town_rows(district_key, population, type_key, lat);
+CREATE INDEX IF NOT EXISTS idx_region_rows_name_key ON region_rows(name_key);
+CREATE INDEX IF NOT EXISTS idx_district_rows_name_key ON district_rows(name_key);
+CREATE INDEX IF NOT EXISTS idx_town_rows_name_key ON town_rows(name_key);
+CREATE INDEX IF NOT EXISTS idx_alternate_names_name_key ON alternate_names(name_key, entity_id);
+
+CREATE VIEW IF NOT EXISTS regions AS
+SELECT r.id, r.name, r.code, r.capital, r.population, r.area_km2,
+       {_COORDINATES.format("r")} AS coordinates,
+       r.created_date, r.economic_data
+FROM region_rows r;
+
+CREATE VIEW IF NOT EXISTS districts AS
+SELECT d.id, d.name, r.id AS region_id, r.name AS region_name, ty.name AS type,
+       d.capital, d.population, d.area_km2,
+       {_COORDINATES.format("d")} AS coordinates
+FROM district_rows d
+JOIN region_rows r ON r.region_key = d.region_key
+JOIN types ty ON ty.type_key = d.type_key;
+
+CREATE VIEW IF NOT EXISTS towns AS
+SELECT t.id, t.name, d.id AS district_id, d.name AS district_name,
+       r.id AS region_id, r.name AS region_name, ty.name AS type, t.population,
+       {_COORDINATES.format("t")} AS coordinates
+FROM town_rows t
+JOIN district_rows d ON d.district_key = t.district_key
+JOIN region_rows r ON r.region_key = t.region_key
+JOIN types ty ON ty.type_key = t.type_key;
+
+-- The type insert can never conflict, so an outer INSERT OR REPLACE on the
+-- view cannot renumber a type_key that other rows reference
+CREATE TRIGGER IF NOT EXISTS towns_insert INSTEAD OF INSERT ON towns
+BEGIN
+    INSERT INTO types (name)
+        SELECT NEW.type WHERE NOT EXISTS (SELECT 1 FROM types WHERE name = NEW.type);
+    INSERT INTO town_rows (id, name, district_key, region_key, type_key, population, lat, lng)
+    SELECT NEW.id, NEW.name, d.district_key, d.region_key,
+           (SELECT type_key FROM types WHERE name = NEW.type), NEW.population,
+           json_extract(NEW.coordinates, '$.lat'), json_extract(NEW.coordinates, '$.lng')
+    FROM (SELECT NULL) LEFT JOIN district_rows d ON d.id = NEW.district_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS towns_update INSTEAD OF UPDATE ON towns
+BEGIN
+    INSERT INTO types (name)
+        SELECT NEW.type WHERE NOT EXISTS (SELECT 1 FROM types WHERE name = NEW.type);
+    UPDATE town_rows SET
+        id = NEW.id,
+        name = NEW.name,
+        name_key = CASE WHEN NEW.name IS OLD.name THEN name_key END,
+        district_key = (SELECT district_key FROM district_rows WHERE id = NEW.district_id),
+        region_key = (SELECT region_key FROM district_rows WHERE id = NEW.district_id),
+        type_key = (SELECT type_key FROM types WHERE name = NEW.type),
+        population = NEW.population,
+        lat = json_extract(NEW.coordinates, '$.lat'),
+        lng = json_extract(NEW.coordinates, '$.lng')
+    WHERE id = OLD.id;
+    UPDATE alternate_names SET entity_id = NEW.id
+    WHERE entity_id = OLD.id AND NEW.id IS NOT OLD.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS towns_delete INSTEAD OF DELETE ON towns
+BEGIN
+    DELETE FROM town_rows WHERE id = OLD.id;
+    DELETE FROM alternate_names WHERE entity_id = OLD.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS regions_update INSTEAD OF UPDATE ON regions
+BEGIN
+    UPDATE region_rows SET
+        id = NEW.id, name = NEW.name, code = NEW.code, capital = NEW.capital,
+        name_key = CASE WHEN NEW.name IS OLD.name THEN name_key END,
+        population = NEW.population, area_km2 = NEW.area_km2,
+        lat = json_extract(NEW.coordinates, '$.lat'),
+        lng = json_extract(NEW.coordinates, '$.lng'),
+        created_date = NEW.created_date, economic_data = NEW.economic_data
+    WHERE id = OLD.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS districts_update INSTEAD OF UPDATE ON districts
+BEGIN
+    INSERT INTO types (name)
+        SELECT NEW.type WHERE NOT EXISTS (SELECT 1 FROM types WHERE name = NEW.type);
+    UPDATE district_rows SET
+        id = NEW.id, name = NEW.name,
+        name_key = CASE WHEN NEW.name IS OLD.name THEN name_key END,
+        region_key = (SELECT region_key FROM region_rows WHERE id = NEW.region_id),
+        type_key = (SELECT type_key FROM types WHERE name = NEW.type),
+        capital = NEW.capital, population = NEW.population, area_km2 = NEW.area_km2,
+        lat = json_extract(NEW.coordinates, '$.lat'),
+        lng = json_extract(NEW.coordinates, '$.lng')
+    WHERE id = OLD.id;
+END;
+"""
+
+# Bump whenever SCHEMA or normalize_name changes; older databases are upgraded
+SCHEMA_VERSION = 4
+
+class OutdatedDatabaseError(Exception):
+    """Raised when a query needs a newer layout than the database has"""
+
+
+_LEGACY_TABLES = ("regions", "districts", "towns")
+_KEYED_TABLES = (("region_rows", "region_key"), ("district_rows", "district_key"),
+                 ("town_rows", "town_key"), ("alternate_names", "alternate_key"))
+_ADDED_COLUMNS = tuple((table, "name_key", "TEXT") for table, _ in _KEYED_TABLES)
+# Indexes replaced by a better one
+OBSOLETE_INDEXES = ("idx_district_rows_name", "idx_town_rows_name")
+
+
+def is_legacy(conn: sqlite3.Connection) -> bool:
+    """True for a database still using the denormalized towns table"""
+    row = conn.execute("SELECT type FROM sqlite_master WHERE name = 'towns'").fetchone()
+    return row is not None and row[0] == "table"
+
+
+def schema_version(conn: sqlite3.Connection):
+    """The database's layout version; None for the denormalized tables"""
+    if is_legacy(conn):
+        return None
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def _statements(script: str):
+    statement = ""
+    for line in script.splitlines(keepends=True):
+        statement += line
+        if sqlite3.complete_statement(statement):
+            yield statement.strip()
+            statement = ""
+
+
+def fill_name_keys(conn: sqlite3.Connection, refresh: bool = False) -> int:
+    """Compute missing (or, with `refresh`, all) name keys. Returns rows updated."""
+    updated = 0
+    for table, key in _KEYED_TABLES:
+        where = "" if refresh else " WHERE name_key IS NULL"
+        rows = conn.execute(f"SELECT {key}, name FROM {table}{where}").fetchall()
+        conn.executemany(
+            f"UPDATE {table} SET name_key = ? WHERE {key} = ?",
+            [(normalize_name(name), k) for k, name in rows],
+        )
+        updated += len(rows)
+    return updated
+
+
+def has_missing_name_keys(conn: sqlite3.Connection) -> bool:
+    return any(
+        conn.execute(f"SELECT 1 FROM {table} WHERE name_key IS NULL LIMIT 1").fetchone()
+        for table, _ in _KEYED_TABLES
+    )
+
+
+def _copy_legacy(conn: sqlite3.Connection) -> None:
+    # Towns are inserted in (district, name) order so each district's rows
+    # sit together on disk
+    conn.execute(
+        """INSERT INTO types (name)
+           SELECT type FROM legacy_districts UNION SELECT type FROM legacy_towns"""
+    )
+    conn.execute(
+        """INSERT INTO region_rows (id, name, code, capital, population, area_km2,
+                                    lat, lng, created_date, economic_data)
+           SELECT id, name, code, capital, population, area_km2,
+                  json_extract(coordinates, '$.lat'), json_extract(coordinates, '$.lng'),
+                  created_date, economic_data
+           FROM legacy_regions ORDER BY id"""
+    )
+    conn.execute(
+        """INSERT INTO district_rows (id, name, region_key, type_key, capital,
+                                      population, area_km2, lat, lng)
+           SELECT d.id, d.name, r.region_key, ty.type_key, d.capital,
+                  d.population, d.area_km2,
+                  json_extract(d.coordinates, '$.lat'), json_extract(d.coordinates, '$.lng')
+           FROM legacy_districts d
+           JOIN region_rows r ON r.id = d.region_id
+           JOIN types ty ON ty.name = d.type
+           ORDER BY d.region_id, d.id"""
+    )
+    conn.execute(
+        """INSERT INTO town_rows (id, name, district_key, region_key, type_key,
+                                  population, lat, lng)
+           SELECT t.id, t.name, d.district_key, d.region_key, ty.type_key, t.population,
+                  json_extract(t.coordinates, '$.lat'), json_extract(t.coordinates, '$.lng')
+           FROM legacy_towns t
+           JOIN district_rows d ON d.id = t.district_id
+           JOIN types ty ON ty.name = t.type
+           ORDER BY t.district_id, t.name"""
+    )
+    for table in _LEGACY_TABLES:
+        conn.execute(f"DROP TABLE legacy_{table}")
+
+
+def ensure_schema(conn: sqlite3.Connection) -> bool:
+    """
+    Bring the database to SCHEMA_VERSION in one transaction.
+
+    Creates the schema in an empty database, converts the denormalized
+    tables, or upgrades an older normalized layout (new columns added,
+    views/triggers recreated, name keys recomputed). Returns False when the
+    database was already current. Run VACUUM after a conversion to give the
+    freed pages back.
+    """
+    if conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION:
+        return False
+    with conn:
+        conn.execute("BEGIN")
+        legacy = is_legacy(conn)
+        if legacy:
+            for table in _LEGACY_TABLES:
+                conn.execute(f"ALTER TABLE {table} RENAME TO legacy_{table}")
+        else:
+            for table, column, kind in _ADDED_COLUMNS:
+                columns = [r[1] for r in conn.execute(f"PRAGMA table_info({table})")]
+                if columns and column not in columns:
+                    conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {kind}")
+            for name, kind in conn.execute(
+                "SELECT name, type FROM sqlite_master WHERE type IN ('trigger', 'view')"
+            ).fetchall():
+                conn.execute(f"DROP {kind.upper()} IF EXISTS {name}")
+            for index in OBSOLETE_INDEXES:
+                conn.execute(f"DROP INDEX IF EXISTS {index}")
+        for statement in _statements(SCHEMA):
+            conn.execute(statement)
+        if legacy:
+            _copy_legacy(conn)
+        fill_name_keys(conn, refresh=True)
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    return True
+
+
+def migrate_legacy(conn: sqlite3.Connection) -> bool:
+    """Convert a denormalized database in place; False if it was not one."""
+    if not is_legacy(conn):
+        return False
+    return ensure_schema(conn)
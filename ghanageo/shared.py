@@ -0,0 +1,123 @@
+"""
+One dataset pack shared by every worker process on the host.
+
+With GHANAGEO_SHARED=1 the library serves reads from a pack kept in a shared
+runtime directory (/dev/shm when available; override with
+GHANAGEO_SHARED_DIR). The first worker to start builds it, and every other
+worker maps the same file, so the town coordinates, ids, name index and
+hierarchy offsets exist once in memory however many workers run.
+
+Lifecycle:
+  * Builds are serialized with an exclusive flock on a lock file. The lock
+    dies with its holder, so a worker crashing mid-build never blocks the
+    others: the next one takes the lock and builds.
+  * Packs are written to a temp file and renamed into place, so a crash
+    never leaves a half-written pack visible. Leftover temp files from
+    crashed builds are removed.
+  * The pack name carries the database content hash and pack format, so
+    restarts reattach to the existing file instantly, and a new ghana.db
+    gets a new pack. The hash is computed once per database size and mtime,
+    and a pack this process already has mapped is not re-validated. Packs for other database versions are pruned when a
+    new one is built. Unlinking a file that is still mapped is safe, and
+    workers on the old version keep their mapping until they exit.
+"""
+
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional
+
+from .pack import PACK_VERSION, DatasetPack, PackError, build_pack, source_fingerprint
+
+try:
+    import fcntl
+except ImportError:  # Windows: rely on the atomic rename alone
+    fcntl = None
+
+_PREFIX = "ghanageo-"
+_STALE_TMP_SECONDS = 600
+
+
+def shared_enabled() -> bool:
+    return os.environ.get("GHANAGEO_SHARED", "").lower() in ("1", "true", "yes", "on")
+
+
+def runtime_dir() -> Path:
+    configured = os.environ.get("GHANAGEO_SHARED_DIR")
+    if configured:
+        return Path(configured)
+    shm = Path("/dev/shm")
+    if shm.is_dir() and os.access(shm, os.W_OK):
+        return shm
+    return Path(tempfile.gettempdir())
+
+
+@contextmanager
+def _exclusive(lock_path: Path):
+    with open(lock_path, "a+b") as f:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def _valid(path: Path) -> bool:
+    try:
+        with DatasetPack(path):
+            return True
+    except (PackError, OSError, ValueError, KeyError):
+        return False
+
+
+def _cleanup(directory: Path, keep: Path) -> None:
+    now = time.time()
+    for entry in directory.glob(f"{_PREFIX}*.pack"):
+        if entry != keep:
+            entry.unlink(missing_ok=True)
+    for entry in directory.glob(f".{_PREFIX}*.tmp"):
+        try:
+            if now - entry.stat().st_mtime > _STALE_TMP_SECONDS:
+                entry.unlink()
+        except FileNotFoundError:
+            pass
+
+
+_digests = {}
+
+
+def _digest(db_path) -> str:
+    """Content hash of `db_path`, computed once per (size, mtime_ns) of the file"""
+    st = os.stat(db_path)
+    version = (st.st_size, st.st_mtime_ns)
+    cached = _digests.get(str(db_path))
+    if cached is None or cached[0] != version:
+        cached = _digests[str(db_path)] = (version, source_fingerprint(db_path)["sha256"][:16])
+    return cached[1]
+
+
+def shared_pack_path(db_path, directory: Optional[Path] = None) -> Path:
+    """Where the shared pack for `db_path` lives, whether or not it is built yet."""
+    directory = Path(directory) if directory else runtime_dir()
+    return directory / f"{_PREFIX}{_digest(db_path)}-v{PACK_VERSION}.pack"
+
+
+def ensure_shared_pack(db_path, directory: Optional[Path] = None) -> Path:
+    """Path of the shared pack for `db_path`, building it first if no worker has."""
+    path = shared_pack_path(db_path, directory)
+    directory = path.parent
+    directory.mkdir(parents=True, exist_ok=True)
+    digest = _digest(db_path)
+    if path.exists() and _valid(path):
+        return path
+
+    with _exclusive(directory / f".{_PREFIX}{digest}.lock"):
+        # Another worker may have finished the build while we waited
+        if not (path.exists() and _valid(path)):
+            build_pack(db_path, path)
+            _cleanup(directory, keep=path)
+    return path
@@ -4,7 +4,8 @@ Import all Ghana settlements from GeoNames into the database.
 
 Strategy:
   1. Primary: GeoNames admin2 code → district name → our district_id (fuzzy match)
-  2. Fallback: nearest district capital by coordinate (for places with missing admin2)
+  2. Fallback: nearest district capital by great-circle distance (for places
+     with missing admin2)
 
 This avoids needing boundary shapefiles entirely.
 
@@ -13,15 +14,20 @@ Run: python3 scripts/import_geonames.py
 
 import io
 import json
-import math
 import sqlite3
 import sys
 import zipfile
+from collections import defaultdict
 from pathlib import Path
 
+import numpy as np
 import requests
 
 BASE_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(BASE_DIR))
+from ghanageo.schema import fill_name_keys  # noqa: E402
+from ghanageo.names import fold_name  # noqa: E402
+
 DB_PATH = BASE_DIR / "ghanageo" / "data" / "ghana.db"
 CACHE_DIR = Path(__file__).parent / "cache"
 CACHE_DIR.mkdir(exist_ok=True)
@@ -97,6 +103,7 @@ def load_geonames_places() -> list:
         places.append({
             "geonames_id": cols[0],
             "name": cols[1].strip(),
+            "alternates": variant_names(cols[1], [cols[2]] + cols[3].split(",")),
             "lat": lat,
             "lng": lng,
             "feature_code": feature_code,
@@ -110,6 +117,24 @@ def load_geonames_places() -> list:
     return places
 
 
+def variant_names(name: str, candidates: list) -> list:
+    """
+    Distinct spellings of a place besides its own name: the ASCII name and
+    the alternate names. Variants that fold to the name itself, or to one
+    already kept, and ones without letters (codes, years) are dropped.
+    """
+    seen = {fold_name(name)}
+    variants = []
+    for candidate in candidates:
+        candidate = candidate.strip()
+        folded = fold_name(candidate)
+        if folded in seen or not any(c.isalpha() for c in folded):
+            continue
+        seen.add(folded)
+        variants.append(candidate)
+    return variants
+
+
 def load_admin2_map() -> dict:
     """Returns dict: (admin1_code, admin2_code) → district_name"""
     text = _get_text(ADMIN2_URL, CACHE_DIR / "admin2Codes.txt")
@@ -135,6 +160,11 @@ def load_admin2_map() -> dict:
 # ---------------------------------------------------------------------------
 
 def _norm(name: str) -> str:
+    """
+    District-matching key. Unlike ghanageo.names.normalize_name it strips a
+    suffix only after a space, so "Mampong-Municipal" keeps its suffix and
+    matches "Mampong Municipal District" (key "mampong municipal").
+    """
     name = name.strip().lower()
     for s in (" metropolitan assembly", " municipal assembly",
               " district assembly", " metropolitan", " municipal",
@@ -148,44 +178,116 @@ def _norm(name: str) -> str:
 def build_district_lookup(conn: sqlite3.Connection):
     """
     Returns:
-      lookup: normalised_name → district_info dict
-      capitals: list of (lat, lng, district_info) for fallback
+      lookup: DistrictMatcher over normalised district names
+      capitals: CapitalIndex over district capitals for the fallback
     """
-    lookup = {}
+    districts = {}
     capitals = []
     rows = conn.execute(
         "SELECT id, name, region_id, region_name, coordinates FROM districts"
     ).fetchall()
     for row in rows:
         d = {"id": row[0], "name": row[1], "region_id": row[2], "region_name": row[3]}
-        lookup[_norm(row[1])] = d
+        districts[_norm(row[1])] = d
         if row[4]:
             coords = json.loads(row[4])
             capitals.append((coords["lat"], coords["lng"], d))
-    return lookup, capitals
+    return DistrictMatcher(districts), CapitalIndex(capitals)
+
+
+class DistrictMatcher:
+    """
+    Name → district resolution without scanning every district per place.
+
+    Exact hits come from the normalised-name map. Otherwise candidates are
+    drawn from a token index (districts sharing a word with the query) before
+    falling back to the substring scan. Results are cached per distinct
+    admin2 name, so each name is resolved once however many places use it.
+    """
+
+    def __init__(self, districts: dict):
+        self.exact = districts
+        self.order = {key: i for i, key in enumerate(districts)}
+        self.tokens = defaultdict(set)
+        for key in districts:
+            for token in key.split():
+                self.tokens[token].add(key)
+        self._cache = {}
+
+    def __len__(self):
+        return len(self.exact)
+
+    def match(self, name: str):
+        if name not in self._cache:
+            self._cache[name] = self._resolve(_norm(name))
+        return self._cache[name]
+
+    def _resolve(self, norm: str):
+        if not norm:
+            return None
+        if norm in self.exact:
+            return self.exact[norm]
+
+        candidates = set()
+        for token in norm.split():
+            candidates |= self.tokens.get(token, set())
+        for key in sorted(candidates, key=self.order.get):
+            if norm in key or key in norm:
+                return self.exact[key]
 
+        # Partial-word overlaps ("kuma" / "kumasi") share no token
+        for key in self.exact:
+            if norm in key or key in norm:
+                return self.exact[key]
+        return None
 
-def match_name(name: str, lookup: dict):
-    norm = _norm(name)
-    if norm in lookup:
-        return lookup[norm]
-    for key, val in lookup.items():
-        if norm and (norm in key or key in norm):
-            return val
-    return None
 
+def match_name(name: str, lookup: DistrictMatcher):
+    return lookup.match(name)
+
+
+class CapitalIndex:
+    """
+    Nearest district capital by great-circle distance.
+
+    Capitals are stored as unit vectors on the sphere; the nearest capital to
+    a point is the one with the largest dot product, which turns a batch of
+    lookups into a single matrix product.
+    """
+
+    CHUNK = 8192
 
-def nearest_district(lat: float, lng: float, capitals: list):
+    def __init__(self, capitals: list):
+        self.districts = [info for _, _, info in capitals]
+        lats = np.array([c[0] for c in capitals], dtype=np.float64)
+        lngs = np.array([c[1] for c in capitals], dtype=np.float64)
+        self.vectors = _unit_vectors(lats, lngs)
+
+    def __len__(self):
+        return len(self.districts)
+
+    def nearest_many(self, lats, lngs) -> list:
+        if not self.districts or len(lats) == 0:
+            return [None] * len(lats)
+        points = _unit_vectors(np.asarray(lats, dtype=np.float64),
+                               np.asarray(lngs, dtype=np.float64))
+        best = np.empty(len(points), dtype=np.intp)
+        for start in range(0, len(points), self.CHUNK):
+            chunk = points[start:start + self.CHUNK]
+            best[start:start + len(chunk)] = np.argmax(chunk @ self.vectors.T, axis=1)
+        return [self.districts[i] for i in best]
+
+
+def _unit_vectors(lats, lngs):
+    lat = np.radians(lats)
+    lng = np.radians(lngs)
+    cos_lat = np.cos(lat)
+    return np.column_stack((cos_lat * np.cos(lng), cos_lat * np.sin(lng), np.sin(lat)))
+
+
+def nearest_district(lat: float, lng: float, capitals: CapitalIndex):
     """Return the district whose capital is closest to (lat, lng)."""
-    best = None
-    best_d = float("inf")
-    for clat, clng, info in capitals:
-        # Approximate distance (no need for exact geodesic)
-        d = math.sqrt((lat - clat) ** 2 + (lng - clng) ** 2)
-        if d < best_d:
-            best_d = d
-            best = info
-    return best
+    return capitals.nearest_many([lat], [lng])[0]
 
 
 # ---------------------------------------------------------------------------
@@ -193,68 +295,77 @@ def nearest_district(lat: float, lng: float, capitals: list):
 # ---------------------------------------------------------------------------
 
 def import_places(conn, places, admin2_map, district_lookup, capitals) -> int:
-    existing = set(
-        (r[0].lower(), r[1])
-        for r in conn.execute("SELECT name, district_id FROM towns").fetchall()
-    )
-
-    inserted = 0
-    by_admin2 = 0
-    by_nearest = 0
-    skipped_dupe = 0
-    total = len(places)
-
+    existing = {
+        (r[0].lower(), r[1]): r[2]
+        for r in conn.execute("SELECT name, district_id, id FROM towns").fetchall()
+    }
+
+    # Stage 1: admin2 code lookup (one resolution per distinct admin2 name)
+    resolved = []
+    fallback = []
     for i, place in enumerate(places):
-        if i % 1000 == 0:
-            pct = i * 100 // total
-            print(f"  {i:,}/{total:,} ({pct}%)  inserted={inserted:,}", end="\r")
-
-        dist = None
-
-        # Stage 1: admin2 code lookup
         admin2_name = admin2_map.get((place["admin1"], place["admin2"]))
-        if admin2_name:
-            dist = match_name(admin2_name, district_lookup)
-
-        # Stage 2: nearest capital fallback
+        dist = match_name(admin2_name, district_lookup) if admin2_name else None
+        resolved.append(dist)
         if not dist:
-            dist = nearest_district(place["lat"], place["lng"], capitals)
-            if dist:
-                by_nearest += 1
-        else:
-            by_admin2 += 1
+            fallback.append(i)
+    by_admin2 = len(places) - len(fallback)
+
+    # Stage 2: nearest capital fallback, batched
+    nearest = capitals.nearest_many(
+        [places[i]["lat"] for i in fallback],
+        [places[i]["lng"] for i in fallback],
+    )
+    by_nearest = 0
+    for i, dist in zip(fallback, nearest):
+        resolved[i] = dist
+        if dist:
+            by_nearest += 1
 
+    rows = []
+    alternates = []
+    skipped_dupe = 0
+    for place, dist in zip(places, resolved):
         if not dist:
             continue
 
         key = (place["name"].lower(), dist["id"])
         if key in existing:
+            # Already present: still record the place's other spellings
+            alternates.extend((existing[key], name) for name in place["alternates"])
             skipped_dupe += 1
             continue
 
         town_id = f"{dist['id']}-GN{place['geonames_id']}"
         coords_json = json.dumps({"lat": place["lat"], "lng": place["lng"]})
-
-        conn.execute(
-            """INSERT OR IGNORE INTO towns
-               (id, name, district_id, district_name, region_id, region_name,
-                type, population, coordinates)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-            (
-                town_id, place["name"],
-                dist["id"], dist["name"],
-                dist["region_id"], dist["region_name"],
-                place["type"], place["population"], coords_json,
-            ),
-        )
-        existing.add(key)
-        inserted += 1
-
+        rows.append((
+            town_id, place["name"],
+            dist["id"], dist["name"],
+            dist["region_id"], dist["region_name"],
+            place["type"], place["population"], coords_json,
+        ))
+        alternates.extend((town_id, name) for name in place["alternates"])
+        existing[key] = town_id
+
+    conn.executemany(
+        """INSERT OR IGNORE INTO towns
+           (id, name, district_id, district_name, region_id, region_name,
+            type, population, coordinates)
+           VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+        rows,
+    )
+    conn.executemany(
+        "INSERT OR IGNORE INTO alternate_names (entity_id, name) VALUES (?, ?)",
+        alternates,
+    )
+    fill_name_keys(conn)
     conn.commit()
-    print(f"\n  Done — {inserted:,} inserted")
+    inserted = len(rows)
+    print(f"  Done — {inserted:,} inserted")
     print(f"    by admin2 code : {by_admin2:,}")
     print(f"    by nearest cap : {by_nearest:,}")
     print(f"    duplicates skip: {skipped_dupe:,}")
+    print(f"    alternate names: {len(alternates):,}")
     return inserted
 
 
@@ -8,14 +8,29 @@ out in 2019 (Oti, Savannah, North East, Bono East, Ahafo, Western North).
 Only towns that have coordinates are reassigned. Manual towns (no coordinates)
 are left untouched.
 
-Run: python3 scripts/reassign_spatial.py
+Point-in-polygon runs in bulk through shapely 2's STRtree; pass --workers N to
+shard it across a process pool. All changes are written in one transaction.
+
+Runs are incremental: a hash of the boundary file (and district rows) is kept
+in the `meta` table and a coordinate hash per town in `spatial_fingerprints`.
+Reruns only evaluate new or moved towns, or everything when the boundaries
+change. --dry-run reports the diff without writing; --full ignores fingerprints.
+
+Run: python3 scripts/reassign_spatial.py [--workers N] [--dry-run] [--full]
 """
 
+import argparse
+import hashlib
 import json
 import sqlite3
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-from shapely.geometry import Point, shape
+import numpy as np
+import shapely
+from shapely.geometry import shape
 from shapely.strtree import STRtree
 
 BASE_DIR = Path(__file__).parent.parent
@@ -24,6 +39,7 @@ GEOJSON_PATH = Path(__file__).parent / "cache" / "GHA_ADM2.geojson"
 
 
 def _norm(name: str) -> str:
+    """District-matching key; like import_geonames._norm, a hyphen-joined suffix is kept"""
     name = name.strip().lower()
     for suffix in (
         " metropolitan assembly", " municipal assembly", " district assembly",
@@ -35,7 +51,7 @@ def _norm(name: str) -> str:
 
 
 def build_spatial_index(conn):
-    """Build STRtree from geoBoundaries polygons. Returns (tree, polygons list)."""
+    """Build STRtree from geoBoundaries polygons. Returns (PolygonIndex, polygons list)."""
     with open(GEOJSON_PATH) as f:
         gj = json.load(f)
 
@@ -78,85 +94,299 @@ def build_spatial_index(conn):
         for n in unmatched[:10]:
             print(f"    - {n}")
 
-    geoms = [p[0] for p in polygons]
-    tree = STRtree(geoms)
+    index = PolygonIndex([p[0] for p in polygons])
     print(f"  Spatial index built: {len(polygons)} polygons")
-    return tree, polygons
+    return index, polygons
 
 
-def find_district(lat, lng, tree, polygons):
-    pt = Point(lng, lat)  # Shapely uses (lng, lat)
-    candidates = tree.query(pt)
-    for idx in candidates:
-        geom, dist = polygons[idx]
-        if geom.contains(pt):
-            return dist
-    # Fallback: nearest centroid
-    if len(polygons) == 0:
-        return None
-    best = min(polygons, key=lambda p: p[0].centroid.distance(pt))
-    return best[1]
+# ---------------------------------------------------------------------------
+# Bulk point-in-polygon
+# ---------------------------------------------------------------------------
 
+_WORKER_INDEX = None
 
-def main():
-    print("=" * 60)
-    print("  GhanaGeo — Spatial District Reassignment")
-    print("=" * 60)
 
-    conn = sqlite3.connect(DB_PATH)
+class PolygonIndex:
+    """STRtree over district polygons plus a tree over their precomputed centroids."""
+
+    def __init__(self, geoms):
+        self.geoms = np.asarray(geoms, dtype=object)
+        self.tree = STRtree(self.geoms)
+        self.centroids = shapely.centroid(self.geoms)
+        self.centroid_tree = STRtree(self.centroids)
+
+    def assign(self, lats, lngs):
+        """
+        Return the polygon index for every (lat, lng) pair.
+
+        Points inside a polygon take the first containing polygon; points
+        outside every polygon (coastline, border slivers) take the polygon
+        with the nearest centroid. -1 only when there are no polygons.
+        """
+        result = np.full(len(lats), -1, dtype=np.int64)
+        if len(self.geoms) == 0 or len(lats) == 0:
+            return result
+
+        points = shapely.points(np.asarray(lngs), np.asarray(lats))  # (lng, lat)
+        point_idx, poly_idx = self.tree.query(points, predicate="within")
+        # Keep the first containing polygon per point
+        order = np.lexsort((poly_idx, point_idx))
+        point_idx, poly_idx = point_idx[order], poly_idx[order]
+        first = np.unique(point_idx, return_index=True)[1]
+        result[point_idx[first]] = poly_idx[first]
+
+        missing = np.flatnonzero(result < 0)
+        if len(missing):
+            near_point, near_centroid = self.centroid_tree.query_nearest(
+                points[missing], all_matches=False
+            )
+            result[missing[near_point]] = near_centroid
+        return result
+
+
+def _init_worker(wkb):
+    global _WORKER_INDEX
+    _WORKER_INDEX = PolygonIndex(shapely.from_wkb(wkb))
+
+
+def _assign_shard(args):
+    lats, lngs = args
+    return _WORKER_INDEX.assign(lats, lngs)
+
+
+def assign_districts(lats, lngs, index, workers=1, shard_size=50_000):
+    """
+    Vectorised district assignment, optionally sharded across a process pool.
+
+    Each worker rebuilds the polygon index once from WKB, then handles
+    contiguous shards of the coordinate arrays.
+    """
+    lats = np.asarray(lats, dtype=np.float64)
+    lngs = np.asarray(lngs, dtype=np.float64)
+    if workers <= 1 or len(lats) <= shard_size:
+        return index.assign(lats, lngs)
 
-    print("\n[1/3] Building spatial index from geoBoundaries GeoJSON...")
-    tree, polygons = build_spatial_index(conn)
+    shards = [
+        (lats[i:i + shard_size], lngs[i:i + shard_size])
+        for i in range(0, len(lats), shard_size)
+    ]
+    wkb = shapely.to_wkb(index.geoms)
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(wkb,)
+    ) as pool:
+        parts = list(pool.map(_assign_shard, shards))
+    return np.concatenate(parts)
 
-    print("\n[2/3] Loading towns with coordinates...")
+
+def load_towns(conn):
+    """Towns with coordinates as (rows, lats, lngs); coordinates parsed by SQLite."""
     rows = conn.execute(
-        "SELECT id, name, coordinates FROM towns WHERE coordinates IS NOT NULL"
+        """SELECT id, district_id, district_name, region_id, region_name,
+                  json_extract(coordinates, '$.lat'),
+                  json_extract(coordinates, '$.lng')
+           FROM towns
+           WHERE coordinates IS NOT NULL AND json_valid(coordinates)"""
     ).fetchall()
-    print(f"  {len(rows):,} towns have coordinates")
+    rows = [r for r in rows if r[5] is not None and r[6] is not None]
+    lats = np.fromiter((r[5] for r in rows), dtype=np.float64, count=len(rows))
+    lngs = np.fromiter((r[6] for r in rows), dtype=np.float64, count=len(rows))
+    return rows, lats, lngs
 
-    print("\n[3/3] Reassigning...")
-    updated = 0
-    unchanged = 0
-    total = len(rows)
 
-    for i, (town_id, name, coords_json) in enumerate(rows):
-        if i % 1000 == 0:
-            pct = i * 100 // total
-            print(f"  {i:,}/{total:,} ({pct}%)  updated={updated:,}", end="\r")
+def _new_town_id(town_id, dist):
+    if "-GN" in town_id:
+        return f"{dist['id']}-GN{town_id.split('-GN')[-1]}"
+    return town_id
 
-        try:
-            coords = json.loads(coords_json)
-            lat, lng = coords["lat"], coords["lng"]
-        except Exception:
-            continue
 
-        dist = find_district(lat, lng, tree, polygons)
-        if not dist:
+# ---------------------------------------------------------------------------
+# Change detection
+# ---------------------------------------------------------------------------
+
+def _has_table(conn, name) -> bool:
+    return conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (name,)
+    ).fetchone() is not None
+
+
+def ensure_fingerprint_tables(conn):
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)"
+    )
+    conn.execute(
+        """CREATE TABLE IF NOT EXISTS spatial_fingerprints (
+               town_id TEXT PRIMARY KEY,
+               coord_hash TEXT NOT NULL
+           ) WITHOUT ROWID"""
+    )
+
+
+def boundaries_hash(conn) -> str:
+    """Hash of the boundary file plus the district rows polygons are matched to."""
+    h = hashlib.sha256(GEOJSON_PATH.read_bytes())
+    for row in conn.execute(
+        "SELECT id, name, region_id, region_name FROM districts ORDER BY id"
+    ):
+        h.update("\x1f".join("" if v is None else str(v) for v in row).encode("utf-8"))
+        h.update(b"\x1e")
+    return h.hexdigest()
+
+
+def coord_hash(lat: float, lng: float) -> str:
+    return hashlib.blake2b(f"{lat!r},{lng!r}".encode(), digest_size=8).hexdigest()
+
+
+def select_pending(conn, rows, lats, lngs, boundary_hash, full=False):
+    """
+    Indices of towns that need reassigning, plus every town's coordinate hash.
+
+    Everything is pending when the boundaries changed (or --full); otherwise
+    only towns that are new or whose coordinates moved since the last run.
+    """
+    hashes = [coord_hash(lat, lng) for lat, lng in zip(lats.tolist(), lngs.tolist())]
+    # Before the first run (or in a --dry-run of it) the tables may not exist
+    stored = _has_table(conn, "meta") and conn.execute(
+        "SELECT value FROM meta WHERE key = 'boundaries_sha256'"
+    ).fetchone()
+    if full or not stored or stored[0] != boundary_hash \
+            or not _has_table(conn, "spatial_fingerprints"):
+        return np.arange(len(rows)), hashes, True
+
+    previous = dict(conn.execute("SELECT town_id, coord_hash FROM spatial_fingerprints"))
+    pending = [i for i, (row, h) in enumerate(zip(rows, hashes)) if previous.get(row[0]) != h]
+    return np.array(pending, dtype=np.int64), hashes, False
+
+
+def plan_changes(rows, pending, assigned, polygons, hashes):
+    """
+    What the reassignment of the pending towns changes.
+
+    Returns (changes, fingerprints, region_moves, moved, unchanged): UPDATE
+    parameters for towns whose district (and so id) changes, a fingerprint
+    per evaluated town under its new id, (old, new) region names of towns
+    changing region, and how many towns moved district or stayed.
+    """
+    changes = []
+    fingerprints = []
+    region_moves = []
+    moved = unchanged = 0
+    for i, poly in zip(pending.tolist(), assigned.tolist()):
+        if poly < 0:
             continue
+        row = rows[i]
+        town_id = row[0]
+        dist = polygons[poly][1]
+        new_row = (
+            _new_town_id(town_id, dist),
+            dist["id"], dist["name"], dist["region_id"], dist["region_name"],
+        )
+        if (town_id,) + tuple(row[1:5]) != new_row:
+            changes.append(new_row + (town_id,))
+        if row[3] != dist["region_id"]:
+            region_moves.append((row[4], dist["region_name"]))
+        fingerprints.append((new_row[0], hashes[i]))
+        if town_id.split("-")[0] != dist["id"].split("-")[0]:
+            moved += 1
+        else:
+            unchanged += 1
+    return changes, fingerprints, region_moves, moved, unchanged
 
-        conn.execute(
+
+def write_changes(conn, changes, fingerprints, boundary_hash):
+    """Apply planned changes and store the fingerprints, in one transaction"""
+    with conn:
+        ensure_fingerprint_tables(conn)
+        conn.executemany(
             """UPDATE towns
-               SET district_id=?, district_name=?, region_id=?, region_name=?
+               SET id=?, district_id=?, district_name=?, region_id=?, region_name=?
                WHERE id=?""",
-            (dist["id"], dist["name"], dist["region_id"], dist["region_name"], town_id),
+            changes,
         )
+        conn.executemany(
+            "INSERT OR REPLACE INTO spatial_fingerprints (town_id, coord_hash) VALUES (?, ?)",
+            fingerprints,
+        )
+        # Towns deleted (or renamed) since they were fingerprinted
         conn.execute(
-            """UPDATE towns SET id=?
-               WHERE id=? AND id != ?""",
-            (
-                f"{dist['id']}-GN{town_id.split('-GN')[-1]}" if "-GN" in town_id else town_id,
-                town_id,
-                f"{dist['id']}-GN{town_id.split('-GN')[-1]}" if "-GN" in town_id else town_id,
-            ),
+            """DELETE FROM spatial_fingerprints
+               WHERE town_id NOT IN (SELECT id FROM towns)"""
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES ('boundaries_sha256', ?)",
+            (boundary_hash,),
         )
-        if town_id.split("-")[0] != dist["id"].split("-")[0]:
-            updated += 1
-        else:
-            unchanged += 1
 
-    conn.commit()
-    print(f"\n  Reassigned: {updated:,} towns moved to correct district")
+
+def print_region_summary(moves):
+    """moves: list of (old_region_name, new_region_name) for towns changing region."""
+    if not moves:
+        print("  No towns change region.")
+        return
+    gained = Counter(new for _, new in moves)
+    lost = Counter(old for old, _ in moves)
+    print("  Towns moved between regions:")
+    for region in sorted(set(gained) | set(lost), key=lambda r: -(gained[r] + lost[r])):
+        print(f"    {region}: +{gained[region]:,} / -{lost[region]:,}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Processes for point-in-polygon (default: 1)")
+    parser.add_argument("--full", action="store_true",
+                        help="Re-evaluate every town, ignoring stored fingerprints")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Report the changes without writing them")
+    args = parser.parse_args(argv)
+
+    print("=" * 60)
+    print("  GhanaGeo — Spatial District Reassignment")
+    print("=" * 60)
+
+    if args.dry_run:
+        conn = sqlite3.connect(f"file:{DB_PATH}?mode=ro", uri=True)
+    else:
+        conn = sqlite3.connect(DB_PATH)
+
+    print("\n[1/4] Building spatial index from geoBoundaries GeoJSON...")
+    index, polygons = build_spatial_index(conn)
+    boundary_hash = boundaries_hash(conn)
+
+    print("\n[2/4] Loading towns with coordinates...")
+    rows, lats, lngs = load_towns(conn)
+    print(f"  {len(rows):,} towns have coordinates")
+
+    print("\n[3/4] Detecting changes...")
+    pending, hashes, everything = select_pending(
+        conn, rows, lats, lngs, boundary_hash, full=args.full
+    )
+    if everything:
+        print(f"  Boundaries changed (or --full): re-evaluating all {len(pending):,} towns")
+    else:
+        print(f"  {len(pending):,} new or moved towns since last run")
+
+    print("\n[4/4] Reassigning...")
+    started = time.perf_counter()
+    assigned = assign_districts(lats[pending], lngs[pending], index, workers=args.workers)
+    elapsed = time.perf_counter() - started
+    print(f"  Point-in-polygon: {len(pending):,} towns in {elapsed:.2f}s "
+          f"({len(pending) / max(elapsed, 1e-9):,.0f} towns/s)")
+
+    changes, fingerprints, region_moves, updated, unchanged = plan_changes(
+        rows, pending, assigned, polygons, hashes
+    )
+    print(f"  Reassigned: {updated:,} towns moved to correct district")
     print(f"  Unchanged : {unchanged:,} towns already in correct district")
+    print(f"  Rows to write: {len(changes):,}")
+    print()
+    print_region_summary(region_moves)
+
+    if args.dry_run:
+        conn.close()
+        print("\n  Dry run — nothing written.\n")
+        return
+
+    write_changes(conn, changes, fingerprints, boundary_hash)
 
     print("\n  Breakdown by region:")
     for row in conn.execute("""
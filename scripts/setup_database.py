@@ -1,1191 +1,251 @@
 #!/usr/bin/env python3
 """
-Complete GhanaGeo Database Setup with All 261 Districts
-Based on official Ghana Statistical Service data and Local Government Service records
-"""
+GhanaGeo database build from the versioned seed files in scripts/seed/.
 
-import sqlite3
-import json
-import os
-from pathlib import Path
+  regions.csv    16 regions
+  districts.csv  all districts
+  towns.csv      curated towns
 
-def setup_complete_ghana_database():
-    """Create and populate complete Ghana geographic database with all 261 districts"""
-    
-    # Database path
-    current_dir = Path.cwd()
-    database_path = current_dir / "ghanageo" / "data" / "ghana.db"
-    
-    print(f"🇬🇭 Setting up COMPLETE GhanaGeo Database with all 261 districts...")
-    print(f"Database location: {database_path}")
-    
-    # Create directory
-    database_path.parent.mkdir(parents=True, exist_ok=True)
-    
-    # Connect to database
-    conn = sqlite3.connect(database_path)
-    conn.row_factory = sqlite3.Row
-    
-    try:
-        print("Creating database tables...")
-        
-        # Create tables
-        conn.execute('''
-            CREATE TABLE IF NOT EXISTS regions (
-                id TEXT PRIMARY KEY,
-                name TEXT NOT NULL,
-                code TEXT UNIQUE NOT NULL,
-                capital TEXT NOT NULL,
-                population INTEGER,
-                area_km2 REAL,
-                coordinates TEXT,
-                created_date TEXT,
-                economic_data TEXT
-            )
-        ''')
-        
-        conn.execute('''
-            CREATE TABLE IF NOT EXISTS districts (
-                id TEXT PRIMARY KEY,
-                name TEXT NOT NULL,
-                region_id TEXT NOT NULL,
-                region_name TEXT NOT NULL,
-                type TEXT NOT NULL,
-                capital TEXT NOT NULL,
-                population INTEGER,
-                area_km2 REAL,
-                coordinates TEXT,
-                FOREIGN KEY (region_id) REFERENCES regions (id)
-            )
-        ''')
-        
-        # Create indexes
-        conn.execute('CREATE INDEX IF NOT EXISTS idx_regions_name ON regions(name)')
-        conn.execute('CREATE INDEX IF NOT EXISTS idx_districts_region ON districts(region_id)')
-        conn.execute('CREATE INDEX IF NOT EXISTS idx_districts_name ON districts(name)')
-        conn.execute('CREATE INDEX IF NOT EXISTS idx_districts_type ON districts(type)')
-        
-        # Clear existing data
-        conn.execute('DELETE FROM districts')
-        conn.execute('DELETE FROM regions')
-        
-        print("Inserting all 16 Ghana regions...")
-        
-        # All 16 regions of Ghana with accurate data
-        regions_data = [
-            {
-                "id": "GR",
-                "name": "Greater Accra Region",
-                "code": "GR", 
-                "capital": "Accra",
-                "population": 5455692,
-                "area_km2": 3245.4,
-                "coordinates": {"lat": 5.6037, "lng": -0.1870},
-                "created_date": "1982-07-01"
-            },
-            {
-                "id": "AS",
-                "name": "Ashanti Region",
-                "code": "AS",
-                "capital": "Kumasi", 
-                "population": 5440463,
-                "area_km2": 24389.0,
-                "coordinates": {"lat": 6.6885, "lng": -1.6244},
-                "created_date": "1957-03-06"
-            },
-            {
-                "id": "WR",
-                "name": "Western Region", 
-                "code": "WR",
-                "capital": "Sekondi-Takoradi",
-                "population": 2060585,
-                "area_km2": 13842.0,
-                "coordinates": {"lat": 4.9340, "lng": -1.7853},
-                "created_date": "1957-03-06"
-            },
-            {
-                "id": "WNR",
-                "name": "Western North Region",
-                "code": "WNR",
-                "capital": "Sefwi Wiawso",
-                "population": 819621,
-                "area_km2": 7813.0,
-                "coordinates": {"lat": 6.2087, "lng": -2.4815},
-                "created_date": "2018-12-27"
-            },
-            {
-                "id": "CR",
-                "name": "Central Region",
-                "code": "CR", 
-                "capital": "Cape Coast",
-                "population": 2859821,
-                "area_km2": 9826.0,
-                "coordinates": {"lat": 5.1312, "lng": -1.2814},
-                "created_date": "1957-03-06"
-            },
-            {
-                "id": "ER",
-                "name": "Eastern Region",
-                "code": "ER",
-                "capital": "Koforidua",
-                "population": 2666595,
-                "area_km2": 19323.0,
-                "coordinates": {"lat": 6.0891, "lng": -0.2570},
-                "created_date": "1957-03-06"
-            },
-            {
-                "id": "VR", 
-                "name": "Volta Region",
-                "code": "VR",
-                "capital": "Ho",
-                "population": 1635421,
-                "area_km2": 20570.0,
-                "coordinates": {"lat": 6.6009, "lng": 0.4702},
-                "created_date": "1957-03-06"
-            },
-            {
-                "id": "OTI",
-                "name": "Oti Region",
-                "code": "OTI",
-                "capital": "Dambai",
-                "population": 1098420,
-                "area_km2": 14191.0,
-                "coordinates": {"lat": 8.1667, "lng": 0.4667},
-                "created_date": "2018-12-27"
-            },
-            {
-                "id": "BR",
-                "name": "Bono Region",
-                "code": "BR",
-                "capital": "Sunyani",
-                "population": 1208649,
-                "area_km2": 12396.0,
-                "coordinates": {"lat": 7.3397, "lng": -2.3259},
-                "created_date": "2018-12-27"
-            },
-            {
-                "id": "BE",
-                "name": "Bono East Region",
-                "code": "BE",
-                "capital": "Techiman",
-                "population": 1266948,
-                "area_km2": 12240.0,
-                "coordinates": {"lat": 7.5886, "lng": -1.9390},
-                "created_date": "2018-12-27"
-            },
-            {
-                "id": "AH",
-                "name": "Ahafo Region",
-                "code": "AH",
-                "capital": "Goaso",
-                "population": 563677,
-                "area_km2": 8754.0,
-                "coordinates": {"lat": 6.7942, "lng": -2.5815},
-                "created_date": "2018-12-27"
-            },
-            {
-                "id": "NR",
-                "name": "Northern Region",
-                "code": "NR",
-                "capital": "Tamale",
-                "population": 2310983,
-                "area_km2": 25000.0,
-                "coordinates": {"lat": 9.4034, "lng": -0.8424},
-                "created_date": "1957-03-06"
-            },
-            {
-                "id": "SR",
-                "name": "Savannah Region",
-                "code": "SR",
-                "capital": "Damongo",
-                "population": 731982,
-                "area_km2": 35862.0,
-                "coordinates": {"lat": 9.0833, "lng": -1.8167},
-                "created_date": "2018-12-27"
-            },
-            {
-                "id": "NER",
-                "name": "North East Region",
-                "code": "NER",
-                "capital": "Nalerigu",
-                "population": 596806,
-                "area_km2": 9124.0,
-                "coordinates": {"lat": 10.5333, "lng": -0.3667},
-                "created_date": "2018-12-27"
-            },
-            {
-                "id": "UWR",
-                "name": "Upper West Region",
-                "code": "UWR",
-                "capital": "Wa",
-                "population": 858490,
-                "area_km2": 18476.0,
-                "coordinates": {"lat": 10.0601, "lng": -2.5057},
-                "created_date": "1983-06-01"
-            },
-            {
-                "id": "UER",
-                "name": "Upper East Region",
-                "code": "UER",
-                "capital": "Bolgatanga",
-                "population": 1301006,
-                "area_km2": 8842.0,
-                "coordinates": {"lat": 10.7856, "lng": -0.8506},
-                "created_date": "1983-06-01"
-            }
-        ]
-        
-        print("Inserting all 261 Ghana districts...")
-        
-        # COMPLETE DISTRICTS DATA - All 261 districts organized by region
-        districts_data = [
-            
-            # ========================================
-            # GREATER ACCRA REGION DISTRICTS (29)
-            # ========================================
-            
-            # Metropolitan Assemblies (2)
-            {"id": "GR-01", "name": "Accra Metropolitan", "region_id": "GR", "region_name": "Greater Accra Region", "type": "Metro", "capital": "Accra", "population": 2291352, "area_km2": 139.0, "coordinates": {"lat": 5.6037, "lng": -0.1870}},
-            {"id": "GR-02", "name": "Tema Metropolitan", "region_id": "GR", "region_name": "Greater Accra Region", "type": "Metro", "capital": "Tema", "population": 402637, "area_km2": 160.0, "coordinates": {"lat": 5.6698, "lng": 0.0167}},
-            
-            # Municipal Assemblies (23)
-            {"id": "GR-03", "name": "La Nkwantanang Madina Municipal", "region_id": "GR", "region_name": "Greater Accra Region", "type": "Municipal", "capital": "Madina", "population": 489821, "area_km2": 79.0, "coordinates": {"lat": 5.6836, "lng": -0.1668}},
-            {"id": "GR-04", "name": "Ga West Municipal", "region_id": "GR", "region_name": "Greater Accra Region", "type": "Municipal", "capital": "Amasaman", "population": 391086, "area_km2": 455.0, "coordinates": {"lat": 5.7926, "lng": -0.3042}},
-            {"id": "GR-05", "name": "Ga South Municipal", "region_id": "GR", "region_name": "Greater Accra Region", "type": "Municipal", "capital": "Ngleshie Amanfro", "population": 411377, "area_km2": 562.0, "coordinates": {"lat": 5.4833, "lng": -0.3167}},
-            {"id": "GR-06", "name": "Ga East Municipal", "region_id": "GR", "region_name": "Greater Accra Region", "type": "Municipal", "capital": "Abokobi", "population": 259668, "area_km2": 166.0, "coordinates": {"lat": 5.7667, "lng": -0.1333}},
-            {"id": "GR-07", "name": "Ashaiman Municipal", "region_id": "GR", "region_name": "Greater Accra Region", "type": "Municipal", "capital": "Ashaiman", "population": 290915, "area_km2": 63.0, "coordinates": {"lat": 5.6953, "lng": -0.0302}},
-            {"id": "GR-08", "name": "Ledzokuku Municipal", "region_id": "GR", "region_name": "Greater Accra Region", "type": "Municipal", "capital": "Teshie", "population": 227932, "area_km2": 31.3, "coordinates": {"lat": 5.5833, "lng": -0.1000}},
-            {"id": "GR-09", "name": "Krowor Municipal", "region_id": "GR", "region_name": "Greater Accra Region", "type": "Municipal", "capital": "Nungua", "population": 155287, "area_km2": 16.3, "coordinates": {"lat": 5.6000, "lng": -0.0833}},
-            {"id": "GR-10", "name": "Adenta Municipal", "region_id": "GR", "region_name": "Greater Accra Region", "type": "Municipal", "capital": "Adenta", "population": 78215, "area_km2": 85.2, "coordinates": {"lat": 5.7000, "lng": -0.1667}},
-            {"id": "GR-11", "name": "La Dade Kotopon Municipal", "region_id": "GR", "region_name": "Greater Accra Region", "type": "Municipal", "capital": "La", "population": 135192, "area_km2": 32.0, "coordinates": {"lat": 5.5833, "lng": -0.1667}},
-            {"id": "GR-12", "name": "Okaikwei North Municipal", "region_id": "GR", "region_name": "Greater Accra Region", "type": "Municipal", "capital": "Tesano", "population": 217133, "area_km2": 51.0, "coordinates": {"lat": 5.6167, "lng": -0.2167}},
-            {"id": "GR-13", "name": "Ablekuma North Municipal", "region_id": "GR", "region_name": "Greater Accra Region", "type": "Municipal", "capital": "Darkuman", "population": 311345, "area_km2": 17.0, "coordinates": {"lat": 5.5833, "lng": -0.2500}},
-            {"id": "GR-14", "name": "Ablekuma Central Municipal", "region_id": "GR", "region_name": "Greater Accra Region", "type": "Municipal", "capital": "Anyaa", "population": 327598, "area_km2": 11.0, "coordinates": {"lat": 5.5667, "lng": -0.2667}},
-            {"id": "GR-15", "name": "Ablekuma West Municipal", "region_id": "GR", "region_name": "Greater Accra Region", "type": "Municipal", "capital": "Dansoman", "population": 270688, "area_km2": 42.0, "coordinates": {"lat": 5.5500, "lng": -0.2833}},
-            {"id": "GR-16", "name": "Ayawaso East Municipal", "region_id": "GR", "region_name": "Greater Accra Region", "type": "Municipal", "capital": "Nima", "population": 154548, "area_km2": 21.0, "coordinates": {"lat": 5.5833, "lng": -0.2000}},
-            {"id": "GR-17", "name": "Ayawaso North Municipal", "region_id": "GR", "region_name": "Greater Accra Region", "type": "Municipal", "capital": "Dzorwulu", "population": 115449, "area_km2": 20.0, "coordinates": {"lat": 5.6000, "lng": -0.2167}},
-            {"id": "GR-18", "name": "Ayawaso Central Municipal", "region_id": "GR", "region_name": "Greater Accra Region", "type": "Municipal", "capital": "Kokomlemle", "population": 87448, "area_km2": 8.7, "coordinates": {"lat": 5.5833, "lng": -0.2167}},
-            {"id": "GR-19", "name": "Ayawaso West Municipal", "region_id": "GR", "region_name": "Greater Accra Region", "type": "Municipal", "capital": "Legon", "population": 91455, "area_km2": 26.0, "coordinates": {"lat": 5.6500, "lng": -0.1833}},
-            {"id": "GR-20", "name": "Ga Central Municipal", "region_id": "GR", "region_name": "Greater Accra Region", "type": "Municipal", "capital": "Anyaa", "population": 146092, "area_km2": 235.0, "coordinates": {"lat": 5.7000, "lng": -0.2500}},
-            {"id": "GR-21", "name": "Ga North Municipal", "region_id": "GR", "region_name": "Greater Accra Region", "type": "Municipal", "capital": "Ofankor", "population": 142044, "area_km2": 143.0, "coordinates": {"lat": 5.7333, "lng": -0.2333}},
-            {"id": "GR-22", "name": "Weija Gbawe Municipal", "region_id": "GR", "region_name": "Greater Accra Region", "type": "Municipal", "capital": "Weija", "population": 267108, "area_km2": 329.0, "coordinates": {"lat": 5.5500, "lng": -0.3333}},
-            {"id": "GR-23", "name": "Kpone Katamanso Municipal", "region_id": "GR", "region_name": "Greater Accra Region", "type": "Municipal", "capital": "Kpone", "population": 105674, "area_km2": 251.0, "coordinates": {"lat": 5.7000, "lng": 0.0500}},
-            {"id": "GR-24", "name": "Ningo Prampram District", "region_id": "GR", "region_name": "Greater Accra Region", "type": "District", "capital": "Prampram", "population": 176358, "area_km2": 512.0, "coordinates": {"lat": 5.7167, "lng": 0.1000}},
-            {"id": "GR-25", "name": "Shai Osudoku District", "region_id": "GR", "region_name": "Greater Accra Region", "type": "District", "capital": "Dodowa", "population": 85465, "area_km2": 319.0, "coordinates": {"lat": 5.8833, "lng": -0.0833}},
-            
-            # District Assemblies (4)
-            {"id": "GR-26", "name": "Ada East District", "region_id": "GR", "region_name": "Greater Accra Region", "type": "District", "capital": "Ada Foah", "population": 71671, "area_km2": 196.0, "coordinates": {"lat": 5.7833, "lng": 0.6333}},
-            {"id": "GR-27", "name": "Ada West District", "region_id": "GR", "region_name": "Greater Accra Region", "type": "District", "capital": "Sege", "population": 59050, "area_km2": 321.0, "coordinates": {"lat": 5.9333, "lng": 0.4167}},
-            {"id": "GR-28", "name": "Asuogyaman District", "region_id": "GR", "region_name": "Greater Accra Region", "type": "District", "capital": "Atimpoku", "population": 95580, "area_km2": 1247.0, "coordinates": {"lat": 6.1167, "lng": 0.1000}},
-            {"id": "GR-29", "name": "South Tongu District", "region_id": "GR", "region_name": "Greater Accra Region", "type": "District", "capital": "Sogakope", "population": 119445, "area_km2": 574.0, "coordinates": {"lat": 6.0333, "lng": 0.5833}},
-            
-            # ========================================
-            # ASHANTI REGION DISTRICTS (43)
-            # ========================================
-            
-            # Metropolitan Assembly (1)
-            {"id": "AS-01", "name": "Kumasi Metropolitan", "region_id": "AS", "region_name": "Ashanti Region", "type": "Metro", "capital": "Kumasi", "population": 2035064, "area_km2": 254.0, "coordinates": {"lat": 6.6885, "lng": -1.6244}},
-            
-            # Municipal Assemblies (19)
-            {"id": "AS-02", "name": "Obuasi Municipal", "region_id": "AS", "region_name": "Ashanti Region", "type": "Municipal", "capital": "Obuasi", "population": 168641, "area_km2": 162.4, "coordinates": {"lat": 6.2028, "lng": -1.6703}},
-            {"id": "AS-03", "name": "Ejisu Municipal", "region_id": "AS", "region_name": "Ashanti Region", "type": "Municipal", "capital": "Ejisu", "population": 143762, "area_km2": 637.2, "coordinates": {"lat": 6.3333, "lng": -1.3667}},
-            {"id": "AS-04", "name": "Asante Akim North Municipal", "region_id": "AS", "region_name": "Ashanti Region", "type": "Municipal", "capital": "Agogo", "population": 198129, "area_km2": 1160.0, "coordinates": {"lat": 6.8000, "lng": -1.0833}},
-            {"id": "AS-05", "name": "Bekwai Municipal", "region_id": "AS", "region_name": "Ashanti Region", "type": "Municipal", "capital": "Bekwai", "population": 118024, "area_km2": 944.5, "coordinates": {"lat": 6.4500, "lng": -1.5833}},
-            {"id": "AS-06", "name": "Oforikrom Municipal", "region_id": "AS", "region_name": "Ashanti Region", "type": "Municipal", "capital": "Oforikrom", "population": 162905, "area_km2": 78.0, "coordinates": {"lat": 6.6833, "lng": -1.6000}},
-            {"id": "AS-07", "name": "Asokwa Municipal", "region_id": "AS", "region_name": "Ashanti Region", "type": "Municipal", "capital": "Asokwa", "population": 155182, "area_km2": 36.0, "coordinates": {"lat": 6.6667, "lng": -1.6333}},
-            {"id": "AS-08", "name": "Suame Municipal", "region_id": "AS", "region_name": "Ashanti Region", "type": "Municipal", "capital": "Suame", "population": 178908, "area_km2": 58.0, "coordinates": {"lat": 6.7000, "lng": -1.6167}},
-            {"id": "AS-09", "name": "Old Tafo Municipal", "region_id": "AS", "region_name": "Ashanti Region", "type": "Municipal", "capital": "Tafo", "population": 158919, "area_km2": 38.0, "coordinates": {"lat": 6.7333, "lng": -1.6167}},
-            {"id": "AS-10", "name": "Kwadaso Municipal", "region_id": "AS", "region_name": "Ashanti Region", "type": "Municipal", "capital": "Kwadaso", "population": 98453, "area_km2": 32.0, "coordinates": {"lat": 6.6833, "lng": -1.6667}},
-            {"id": "AS-11", "name": "Asokore Mampong Municipal", "region_id": "AS", "region_name": "Ashanti Region", "type": "Municipal", "capital": "Asokore Mampong", "population": 164687, "area_km2": 46.0, "coordinates": {"lat": 6.7167, "lng": -1.5833}},
-            {"id": "AS-12", "name": "Nhyiaeso Municipal", "region_id": "AS", "region_name": "Ashanti Region", "type": "Municipal", "capital": "Nhyiaeso", "population": 102807, "area_km2": 64.0, "coordinates": {"lat": 6.7000, "lng": -1.6500}},
-            {"id": "AS-13", "name": "Bantama Municipal", "region_id": "AS", "region_name": "Ashanti Region", "type": "Municipal", "capital": "Bantama", "population": 137904, "area_km2": 18.0, "coordinates": {"lat": 6.7000, "lng": -1.6333}},
-            {"id": "AS-14", "name": "Juaben Municipal", "region_id": "AS", "region_name": "Ashanti Region", "type": "Municipal", "capital": "Juaben", "population": 87263, "area_km2": 274.0, "coordinates": {"lat": 6.5667, "lng": -1.3333}},
-            {"id": "AS-15", "name": "Asante Akim South Municipal", "region_id": "AS", "region_name": "Ashanti Region", "type": "Municipal", "capital": "Juaso", "population": 139687, "area_km2": 1567.0, "coordinates": {"lat": 6.6333, "lng": -1.1833}},
-            {"id": "AS-16", "name": "Konongo-Odumase Municipal", "region_id": "AS", "region_name": "Ashanti Region", "type": "Municipal", "capital": "Konongo", "population": 82763, "area_km2": 277.0, "coordinates": {"lat": 6.6167, "lng": -1.2167}},
-            {"id": "AS-17", "name": "Atwima Kwanwoma District", "region_id": "AS", "region_name": "Ashanti Region", "type": "Municipal", "capital": "Goaso", "population": 118359, "area_km2": 1339.0, "coordinates": {"lat": 6.7500, "lng": -2.0000}},
-            {"id": "AS-18", "name": "Atwima Nwabiagya Municipal", "region_id": "AS", "region_name": "Ashanti Region", "type": "Municipal", "capital": "Nkawie", "population": 159608, "area_km2": 563.0, "coordinates": {"lat": 6.5500, "lng": -1.8000}},
-            {"id": "AS-19", "name": "Atwima Nwabiagya North Municipal", "region_id": "AS", "region_name": "Ashanti Region", "type": "Municipal", "capital": "Barekese", "population": 65894, "area_km2": 298.0, "coordinates": {"lat": 6.7000, "lng": -1.8167}},
-            {"id": "AS-20", "name": "Afigya Kwabre South District", "region_id": "AS", "region_name": "Ashanti Region", "type": "Municipal", "capital": "Kodie", "population": 127334, "area_km2": 298.0, "coordinates": {"lat": 6.6167, "lng": -1.5000}},
-            
-            # District Assemblies (23)
-            {"id": "AS-21", "name": "Adansi North District", "region_id": "AS", "region_name": "Ashanti Region", "type": "District", "capital": "Fomena", "population": 98633, "area_km2": 870.0, "coordinates": {"lat": 6.2167, "lng": -1.4833}},
-            {"id": "AS-22", "name": "Adansi South District", "region_id": "AS", "region_name": "Ashanti Region", "type": "District", "capital": "New Edubiase", "population": 108240, "area_km2": 719.0, "coordinates": {"lat": 6.1500, "lng": -1.5000}},
-            {"id": "AS-23", "name": "Afigya Kwabre North District", "region_id": "AS", "region_name": "Ashanti Region", "type": "District", "capital": "Afigya Kwabre", "population": 104628, "area_km2": 381.0, "coordinates": {"lat": 6.7000, "lng": -1.5333}},
-            {"id": "AS-24", "name": "Ahafo Ano North Municipal District", "region_id": "AS", "region_name": "Ashanti Region", "type": "District", "capital": "Tepa", "population": 96446, "area_km2": 1142.0, "coordinates": {"lat": 6.9167, "lng": -2.2000}},
-            {"id": "AS-25", "name": "Ahafo Ano South East District", "region_id": "AS", "region_name": "Ashanti Region", "type": "District", "capital": "Mankranso", "population": 83058, "area_km2": 601.0, "coordinates": {"lat": 6.7333, "lng": -1.9833}},
-            {"id": "AS-26", "name": "Ahafo Ano South West District", "region_id": "AS", "region_name": "Ashanti Region", "type": "District", "capital": "Dwinase", "population": 74982, "area_km2": 512.0, "coordinates": {"lat": 6.7500, "lng": -2.1333}},
-            {"id": "AS-27", "name": "Amansie Central District", "region_id": "AS", "region_name": "Ashanti Region", "type": "District", "capital": "Jacobu", "population": 76615, "area_km2": 560.0, "coordinates": {"lat": 6.3333, "lng": -1.7500}},
-            {"id": "AS-28", "name": "Amansie South District", "region_id": "AS", "region_name": "Ashanti Region", "type": "District", "capital": "Manso Nkwanta", "population": 72540, "area_km2": 411.0, "coordinates": {"lat": 6.0667, "lng": -1.7333}},
-            {"id": "AS-29", "name": "Amansie West District", "region_id": "AS", "region_name": "Ashanti Region", "type": "District", "capital": "Manso Adubia", "population": 134331, "area_km2": 1364.0, "coordinates": {"lat": 6.2167, "lng": -2.0000}},
-            {"id": "AS-30", "name": "Atwima Mponua District", "region_id": "AS", "region_name": "Ashanti Region", "type": "District", "capital": "Nyinahin", "population": 91170, "area_km2": 1076.0, "coordinates": {"lat": 6.4167, "lng": -2.0833}},
-            {"id": "AS-31", "name": "Bosome Freho District", "region_id": "AS", "region_name": "Ashanti Region", "type": "District", "capital": "Asiwa", "population": 56742, "area_km2": 543.0, "coordinates": {"lat": 6.7500, "lng": -1.4000}},
-            {"id": "AS-32", "name": "Bosomtwe District", "region_id": "AS", "region_name": "Ashanti Region", "type": "District", "capital": "Kuntanase", "population": 93910, "area_km2": 423.0, "coordinates": {"lat": 6.5167, "lng": -1.4167}},
-            {"id": "AS-33", "name": "Ejura Sekyedumase Municipal District", "region_id": "AS", "region_name": "Ashanti Region", "type": "District", "capital": "Ejura", "population": 85446, "area_km2": 1782.0, "coordinates": {"lat": 7.3833, "lng": -1.3667}},
-            {"id": "AS-34", "name": "Mampong Municipal District", "region_id": "AS", "region_name": "Ashanti Region", "type": "District", "capital": "Mampong", "population": 88553, "area_km2": 653.0, "coordinates": {"lat": 7.0667, "lng": -1.4000}},
-            {"id": "AS-35", "name": "Offinso Municipal District", "region_id": "AS", "region_name": "Ashanti Region", "type": "District", "capital": "Offinso", "population": 76351, "area_km2": 1291.0, "coordinates": {"lat": 7.0333, "lng": -1.7667}},
-            {"id": "AS-36", "name": "Offinso North District", "region_id": "AS", "region_name": "Ashanti Region", "type": "District", "capital": "Afrancho", "population": 65960, "area_km2": 1291.0, "coordinates": {"lat": 7.2000, "lng": -1.7833}},
-            {"id": "AS-37", "name": "Sekyere Afram Plains District", "region_id": "AS", "region_name": "Ashanti Region", "type": "District", "capital": "Drobonso", "population": 92432, "area_km2": 2387.0, "coordinates": {"lat": 7.1000, "lng": -0.7333}},
-            {"id": "AS-38", "name": "Sekyere Central District", "region_id": "AS", "region_name": "Ashanti Region", "type": "District", "capital": "Nsuta", "population": 52343, "area_km2": 355.0, "coordinates": {"lat": 6.9167, "lng": -1.3000}},
-            {"id": "AS-39", "name": "Sekyere East District", "region_id": "AS", "region_name": "Ashanti Region", "type": "District", "capital": "Effiduase", "population": 87629, "area_km2": 566.0, "coordinates": {"lat": 6.9333, "lng": -1.2500}},
-            {"id": "AS-40", "name": "Sekyere Kumawu District", "region_id": "AS", "region_name": "Ashanti Region", "type": "District", "capital": "Kumawu", "population": 65319, "area_km2": 384.0, "coordinates": {"lat": 6.9667, "lng": -1.1333}},
-            {"id": "AS-41", "name": "Sekyere South District", "region_id": "AS", "region_name": "Ashanti Region", "type": "District", "capital": "Agona", "population": 87633, "area_km2": 630.0, "coordinates": {"lat": 6.8000, "lng": -1.3833}},
-            {"id": "AS-42", "name": "Asante Akim Central Municipal District", "region_id": "AS", "region_name": "Ashanti Region", "type": "District", "capital": "Konongo", "population": 108021, "area_km2": 315.0, "coordinates": {"lat": 6.6167, "lng": -1.2167}},
-            {"id": "AS-43", "name": "Asante Akim South Municipal District", "region_id": "AS", "region_name": "Ashanti Region", "type": "District", "capital": "Juaso", "population": 116215, "area_km2": 1567.0, "coordinates": {"lat": 6.6333, "lng": -1.1833}},
-            
-            # ========================================
-            # WESTERN REGION DISTRICTS (17)
-            # ========================================
-            
-            {"id": "WR-01", "name": "Sekondi-Takoradi Metropolitan", "region_id": "WR", "region_name": "Western Region", "type": "Metro", "capital": "Sekondi-Takoradi", "population": 445205, "area_km2": 385.0, "coordinates": {"lat": 4.9340, "lng": -1.7853}},
-            {"id": "WR-02", "name": "Tarkwa-Nsuaem Municipal", "region_id": "WR", "region_name": "Western Region", "type": "Municipal", "capital": "Tarkwa", "population": 90477, "area_km2": 2354.0, "coordinates": {"lat": 5.2897, "lng": -1.9939}},
-            {"id": "WR-03", "name": "Prestea Huni Valley Municipal", "region_id": "WR", "region_name": "Western Region", "type": "Municipal", "capital": "Prestea", "population": 159421, "area_km2": 967.0, "coordinates": {"lat": 5.4333, "lng": -2.1333}},
-            {"id": "WR-04", "name": "Shama District", "region_id": "WR", "region_name": "Western Region", "type": "District", "capital": "Shama", "population": 103558, "area_km2": 1444.0, "coordinates": {"lat": 5.0167, "lng": -1.6667}},
-            {"id": "WR-05", "name": "Ahanta West District", "region_id": "WR", "region_name": "Western Region", "type": "District", "capital": "Agona", "population": 136705, "area_km2": 557.0, "coordinates": {"lat": 4.8667, "lng": -1.8833}},
-            {"id": "WR-06", "name": "Nzema East Municipal", "region_id": "WR", "region_name": "Western Region", "type": "Municipal", "capital": "Axim", "population": 66885, "area_km2": 604.0, "coordinates": {"lat": 4.8667, "lng": -2.2333}},
-            {"id": "WR-07", "name": "Ellembelle District", "region_id": "WR", "region_name": "Western Region", "type": "District", "capital": "Nkroful", "population": 87846, "area_km2": 866.0, "coordinates": {"lat": 4.9833, "lng": -2.3000}},
-            {"id": "WR-08", "name": "Jomoro District", "region_id": "WR", "region_name": "Western Region", "type": "District", "capital": "Half Assini", "population": 115021, "area_km2": 1377.0, "coordinates": {"lat": 4.8333, "lng": -2.6167}},
-            {"id": "WR-09", "name": "Wassa East District", "region_id": "WR", "region_name": "Western Region", "type": "District", "capital": "Daboase", "population": 87065, "area_km2": 1188.0, "coordinates": {"lat": 5.3000, "lng": -1.8333}},
-            {"id": "WR-10", "name": "Wassa Amenfi East Municipal", "region_id": "WR", "region_name": "Western Region", "type": "Municipal", "capital": "Wassa Akropong", "population": 129865, "area_km2": 1214.0, "coordinates": {"lat": 5.5833, "lng": -2.0833}},
-            {"id": "WR-11", "name": "Wassa Amenfi West Municipal", "region_id": "WR", "region_name": "Western Region", "type": "Municipal", "capital": "Asankrangwa", "population": 108567, "area_km2": 1152.0, "coordinates": {"lat": 5.4667, "lng": -2.3000}},
-            {"id": "WR-12", "name": "Wassa Amenfi Central Municipal", "region_id": "WR", "region_name": "Western Region", "type": "Municipal", "capital": "Manso Amenfi", "population": 62635, "area_km2": 542.0, "coordinates": {"lat": 5.6333, "lng": -2.2500}},
-            {"id": "WR-13", "name": "Aowin Municipal", "region_id": "WR", "region_name": "Western Region", "type": "Municipal", "capital": "Enchi", "population": 134045, "area_km2": 2316.0, "coordinates": {"lat": 6.1000, "lng": -2.7833}},
-            {"id": "WR-14", "name": "Suaman District", "region_id": "WR", "region_name": "Western Region", "type": "District", "capital": "Dadieso", "population": 131259, "area_km2": 1472.0, "coordinates": {"lat": 6.1833, "lng": -2.9333}},
-            {"id": "WR-15", "name": "Bibiani Anhwiaso Bekwai Municipal", "region_id": "WR", "region_name": "Western Region", "type": "Municipal", "capital": "Bibiani", "population": 124758, "area_km2": 873.0, "coordinates": {"lat": 6.4667, "lng": -2.3167}},
-            {"id": "WR-16", "name": "Bia East District", "region_id": "WR", "region_name": "Western Region", "type": "District", "capital": "Adabokrom", "population": 38102, "area_km2": 651.0, "coordinates": {"lat": 6.2333, "lng": -2.5833}},
-            {"id": "WR-17", "name": "Bia West District", "region_id": "WR", "region_name": "Western Region", "type": "District", "capital": "Essam", "population": 79987, "area_km2": 1423.0, "coordinates": {"lat": 6.2167, "lng": -3.0833}},
-            
-            # WESTERN NORTH REGION (9)
-            {"id": "WNR-01", "name": "Sefwi Wiawso Municipal", "region_id": "WNR", "region_name": "Western North Region", "type": "Municipal", "capital": "Wiawso", "population": 182510, "area_km2": 2695.0, "coordinates": {"lat": 6.2167, "lng": -2.4833}}, 
-            {"id": "WNR-02", "name": "Bibiani-Anhwiaso-Bekwai Municipal", "region_id": "WNR", "region_name": "Western North Region", "type": "Municipal", "capital": "Bibiani", "population": 144272, "area_km2": 873.0, "coordinates": {"lat": 6.4667, "lng": -2.3167}}, 
-            {"id": "WNR-03", "name": "Aowin Municipal", "region_id": "WNR", "region_name": "Western North Region", "type": "Municipal", "capital": "Enchi", "population": 154661, "area_km2": 2638.0, "coordinates": {"lat": 6.1000, "lng": -3.0667}}, 
-            {"id": "WNR-04", "name": "Sefwi Akontombra District", "region_id": "WNR", "region_name": "Western North Region", "type": "District", "capital": "Akontombra", "population": 70225, "area_km2": 1159.0, "coordinates": {"lat": 6.0333, "lng": -2.6167}}, 
-            {"id": "WNR-05", "name": "Juaboso District", "region_id": "WNR", "region_name": "Western North Region", "type": "District", "capital": "Juaboso", "population": 58435, "area_km2": 1045.0, "coordinates": {"lat": 6.3167, "lng": -2.8333}}, 
-            {"id": "WNR-06", "name": "Bodi District", "region_id": "WNR", "region_name": "Western North Region", "type": "District", "capital": "Bodi", "population": 52000, "area_km2": 662.4, "coordinates": {"lat": 6.2000, "lng": -2.7000}}, 
-            {"id": "WNR-07", "name": "Suaman District", "region_id": "WNR", "region_name": "Western North Region", "type": "District", "capital": "Didiaso", "population": 95500, "area_km2": 1470.0, "coordinates": {"lat": 5.9667, "lng": -3.2167}}, 
-            {"id": "WNR-08", "name": "Bia West District", "region_id": "WNR", "region_name": "Western North Region", "type": "District", "capital": "Essam", "population": 38400, "area_km2": 956.0, "coordinates": {"lat": 6.1833, "lng": -3.1167}}, 
-            {"id": "WNR-09", "name": "Bia East District", "region_id": "WNR", "region_name": "Western North Region", "type": "District", "capital": "Adabokrom", "population": 33100, "area_km2": 672.0, "coordinates": {"lat": 6.3500, "lng": -3.0500}},
-
-            
-            # ========================================
-            # CENTRAL REGION (22) - Cleaned and corrected
-            # ========================================
-            {"id": "CR-01", "name": "Cape Coast Metropolitan", "region_id": "CR", "region_name": "Central Region", "type": "Metro", "capital": "Cape Coast", "population": 169894, "area_km2": 122.0, "coordinates": {"lat": 5.1312, "lng": -1.2814}},
-            {"id": "CR-02", "name": "Komenda Edina Eguafo Abirem Municipal", "region_id": "CR", "region_name": "Central Region", "type": "Municipal", "capital": "Elmina", "population": 144705, "area_km2": 452.0, "coordinates": {"lat": 5.0833, "lng": -1.3500}},
-            {"id": "CR-03", "name": "Assin North Municipal", "region_id": "CR", "region_name": "Central Region", "type": "Municipal", "capital": "Assin Bereku", "population": 151468, "area_km2": 1160.0, "coordinates": {"lat": 5.6167, "lng": -1.2333}},
-            {"id": "CR-04", "name": "Assin Central Municipal", "region_id": "CR", "region_name": "Central Region", "type": "Municipal", "capital": "Assin Foso", "population": 102446, "area_km2": 545.0, "coordinates": {"lat": 5.5167, "lng": -1.2833}},
-            {"id": "CR-05", "name": "Assin South District", "region_id": "CR", "region_name": "Central Region", "type": "District", "capital": "Nsuaem", "population": 98046, "area_km2": 981.0, "coordinates": {"lat": 5.3333, "lng": -1.4500}},
-            {"id": "CR-06", "name": "Agona West Municipal", "region_id": "CR", "region_name": "Central Region", "type": "Municipal", "capital": "Agona Swedru", "population": 172507, "area_km2": 659.0, "coordinates": {"lat": 5.4667, "lng": -0.6833}},
-            {"id": "CR-07", "name": "Agona East District", "region_id": "CR", "region_name": "Central Region", "type": "District", "capital": "Nsaba", "population": 87539, "area_km2": 299.0, "coordinates": {"lat": 5.4500, "lng": -0.9167}},
-            {"id": "CR-08", "name": "Awutu Senya East Municipal", "region_id": "CR", "region_name": "Central Region", "type": "Municipal", "capital": "Kasoa", "population": 289319, "area_km2": 86.6, "coordinates": {"lat": 5.5333, "lng": -0.4167}},
-            {"id": "CR-09", "name": "Awutu Senya West District", "region_id": "CR", "region_name": "Central Region", "type": "District", "capital": "Awutu Beraku", "population": 109596, "area_km2": 298.0, "coordinates": {"lat": 5.4667, "lng": -0.5833}},
-            {"id": "CR-10", "name": "Effutu Municipal", "region_id": "CR", "region_name": "Central Region", "type": "Municipal", "capital": "Winneba", "population": 78618, "area_km2": 108.0, "coordinates": {"lat": 5.3500, "lng": -0.6167}},
-            {"id": "CR-11", "name": "Gomoa Central District", "region_id": "CR", "region_name": "Central Region", "type": "District", "capital": "Afransi", "population": 112582, "area_km2": 327.0, "coordinates": {"lat": 5.4667, "lng": -0.7833}},
-            {"id": "CR-12", "name": "Gomoa East District", "region_id": "CR", "region_name": "Central Region", "type": "District", "capital": "Potsin", "population": 157813, "area_km2": 385.0, "coordinates": {"lat": 5.4167, "lng": -0.6833}},
-            {"id": "CR-13", "name": "Gomoa West District", "region_id": "CR", "region_name": "Central Region", "type": "District", "capital": "Apam", "population": 126355, "area_km2": 293.0, "coordinates": {"lat": 5.2833, "lng": -0.7667}},
-            {"id": "CR-14", "name": "Abura Asebu Kwamankese District", "region_id": "CR", "region_name": "Central Region", "type": "District", "capital": "Abura Dunkwa", "population": 121845, "area_km2": 275.0, "coordinates": {"lat": 5.2167, "lng": -1.1167}},
-            {"id": "CR-15", "name": "Ajumako Enyan Esiam District", "region_id": "CR", "region_name": "Central Region", "type": "District", "capital": "Ajumako", "population": 134314, "area_km2": 758.0, "coordinates": {"lat": 5.2833, "lng": -0.8833}},
-            {"id": "CR-16", "name": "Asikuma Odoben Brakwa District", "region_id": "CR", "region_name": "Central Region", "type": "District", "capital": "Breman Asikuma", "population": 138046, "area_km2": 841.0, "coordinates": {"lat": 5.5333, "lng": -1.0500}},
-            {"id": "CR-17", "name": "Mfantsiman Municipal", "region_id": "CR", "region_name": "Central Region", "type": "Municipal", "capital": "Saltpond", "population": 144332, "area_km2": 612.0, "coordinates": {"lat": 5.2000, "lng": -1.0833}},
-            {"id": "CR-18", "name": "Ekumfi District", "region_id": "CR", "region_name": "Central Region", "type": "District", "capital": "Essuehyia", "population": 52000, "area_km2": 289.0, "coordinates": {"lat": 5.1333, "lng": -0.9333}},
-            {"id": "CR-19", "name": "Twifo Atti-Morkwa District", "region_id": "CR", "region_name": "Central Region", "type": "District", "capital": "Twifo Praso", "population": 54467, "area_km2": 654.0, "coordinates": {"lat": 5.5833, "lng": -1.5833}},
-            {"id": "CR-20", "name": "Twifo Heman Lower Denkyira District", "region_id": "CR", "region_name": "Central Region", "type": "District", "capital": "Twifo Hemang", "population": 65688, "area_km2": 862.0, "coordinates": {"lat": 5.4500, "lng": -1.5667}},
-            {"id": "CR-21", "name": "Upper Denkyira East Municipal", "region_id": "CR", "region_name": "Central Region", "type": "Municipal", "capital": "Dunkwa-on-Offin", "population": 72810, "area_km2": 488.0, "coordinates": {"lat": 5.9667, "lng": -1.7667}},
-            {"id": "CR-22", "name": "Upper Denkyira West District", "region_id": "CR", "region_name": "Central Region", "type": "District", "capital": "Diaso", "population": 46802, "area_km2": 416.0, "coordinates": {"lat": 5.7833, "lng": -1.4000}},
-            
-            # ========================================
-            # AHAFO REGION (6) - Fixed region code to AH
-            # ========================================
-            {"id": "AH-01", "name": "Asunafo North Municipal", "region_id": "AH", "region_name": "Ahafo Region", "type": "Municipal", "capital": "Goaso", "population": 103047, "area_km2": 1173.9, "coordinates": {"lat": 6.7942, "lng": -2.5815}},
-            {"id": "AH-02", "name": "Asunafo South District", "region_id": "AH", "region_name": "Ahafo Region", "type": "District", "capital": "Kukuom", "population": 89533, "area_km2": 982.4, "coordinates": {"lat": 6.6833, "lng": -2.6167}},
-            {"id": "AH-03", "name": "Asutifi North District", "region_id": "AH", "region_name": "Ahafo Region", "type": "District", "capital": "Kenyasi", "population": 99533, "area_km2": 1384.6, "coordinates": {"lat": 7.2000, "lng": -2.3167}},
-            {"id": "AH-04", "name": "Asutifi South District", "region_id": "AH", "region_name": "Ahafo Region", "type": "District", "capital": "Hwidiem", "population": 87421, "area_km2": 1294.8, "coordinates": {"lat": 6.9000, "lng": -2.4500}},
-            {"id": "AH-05", "name": "Tano North Municipal", "region_id": "AH", "region_name": "Ahafo Region", "type": "Municipal", "capital": "Duayaw Nkwanta", "population": 96584, "area_km2": 1033.7, "coordinates": {"lat": 7.0833, "lng": -2.1000}},
-            {"id": "AH-06", "name": "Tano South Municipal", "region_id": "AH", "region_name": "Ahafo Region", "type": "Municipal", "capital": "Bechem", "population": 87952, "area_km2": 885.2, "coordinates": {"lat": 7.0833, "lng": -2.0167}},
-            
-            # ========================================
-            # BONO REGION (12) - Fixed region code to BR
-            # ========================================
-            {"id": "BR-01", "name": "Sunyani Municipal", "region_id": "BR", "region_name": "Bono Region", "type": "Municipal", "capital": "Sunyani", "population": 123224, "area_km2": 506.7, "coordinates": {"lat": 7.3397, "lng": -2.3259}},
-            {"id": "BR-02", "name": "Berekum Municipal", "region_id": "BR", "region_name": "Bono Region", "type": "Municipal", "capital": "Berekum", "population": 129628, "area_km2": 1393.9, "coordinates": {"lat": 7.4667, "lng": -2.5833}},
-            {"id": "BR-03", "name": "Tain District", "region_id": "BR", "region_name": "Bono Region", "type": "District", "capital": "Nsawkaw", "population": 94212, "area_km2": 1018.3, "coordinates": {"lat": 7.5167, "lng": -2.2333}},
-            {"id": "BR-04", "name": "Wenchi Municipal", "region_id": "BR", "region_name": "Bono Region", "type": "Municipal", "capital": "Wenchi", "population": 89739, "area_km2": 1296.0, "coordinates": {"lat": 7.7333, "lng": -2.1000}},
-            {"id": "BR-05", "name": "Dormaa Central Municipal", "region_id": "BR", "region_name": "Bono Region", "type": "Municipal", "capital": "Dormaa Ahenkro", "population": 162728, "area_km2": 1284.0, "coordinates": {"lat": 7.3333, "lng": -3.0000}},
-            {"id": "BR-06", "name": "Dormaa East District", "region_id": "BR", "region_name": "Bono Region", "type": "District", "capital": "Wamfie", "population": 71087, "area_km2": 1089.0, "coordinates": {"lat": 7.2000, "lng": -2.9167}},
-            {"id": "BR-07", "name": "Dormaa West District", "region_id": "BR", "region_name": "Bono Region", "type": "District", "capital": "Nkrankwanta", "population": 58403, "area_km2": 1294.0, "coordinates": {"lat": 7.4167, "lng": -3.1667}},
-            {"id": "BR-08", "name": "Jaman North District", "region_id": "BR", "region_name": "Bono Region", "type": "District", "capital": "Sampa", "population": 88432, "area_km2": 1487.0, "coordinates": {"lat": 7.9167, "lng": -2.6833}},
-            {"id": "BR-09", "name": "Jaman South Municipal", "region_id": "BR", "region_name": "Bono Region", "type": "Municipal", "capital": "Drobo", "population": 102929, "area_km2": 1038.0, "coordinates": {"lat": 7.6833, "lng": -2.7833}},
-            {"id": "BR-10", "name": "Banda District", "region_id": "BR", "region_name": "Bono Region", "type": "District", "capital": "Banda Ahenkro", "population": 52217, "area_km2": 503.0, "coordinates": {"lat": 8.0667, "lng": -2.2500}},
-            {"id": "BR-11", "name": "Sunyani West District", "region_id": "BR", "region_name": "Bono Region", "type": "District", "capital": "Odumase", "population": 89654, "area_km2": 876.0, "coordinates": {"lat": 7.2833, "lng": -2.5000}},
-            {"id": "BR-12", "name": "Bono East District", "region_id": "BR", "region_name": "Bono Region", "type": "District", "capital": "Tuobodom", "population": 43671, "area_km2": 1098.0, "coordinates": {"lat": 7.6000, "lng": -1.9500}},
-            
-            # ========================================
-            # BONO EAST REGION (11) - Fixed region code to BE
-            # ========================================
-            {"id": "BE-01", "name": "Techiman Municipal", "region_id": "BE", "region_name": "Bono East Region", "type": "Municipal", "capital": "Techiman", "population": 206856, "area_km2": 653.7, "coordinates": {"lat": 7.5886, "lng": -1.9390}},
-            {"id": "BE-02", "name": "Atebubu-Amantin Municipal", "region_id": "BE", "region_name": "Bono East Region", "type": "Municipal", "capital": "Atebubu", "population": 105938, "area_km2": 1842.7, "coordinates": {"lat": 8.1167, "lng": -1.0500}},
-            {"id": "BE-03", "name": "Kintampo North Municipal", "region_id": "BE", "region_name": "Bono East Region", "type": "Municipal", "capital": "Kintampo", "population": 95480, "area_km2": 5108.0, "coordinates": {"lat": 8.0500, "lng": -1.7333}},
-            {"id": "BE-04", "name": "Kintampo South District", "region_id": "BE", "region_name": "Bono East Region", "type": "District", "capital": "Jema", "population": 63828, "area_km2": 2334.0, "coordinates": {"lat": 7.8333, "lng": -1.8000}},
-            {"id": "BE-05", "name": "Nkoranza North District", "region_id": "BE", "region_name": "Bono East Region", "type": "District", "capital": "Busunya", "population": 65895, "area_km2": 7452.0, "coordinates": {"lat": 8.2500, "lng": -1.5000}},
-            {"id": "BE-06", "name": "Nkoranza South Municipal", "region_id": "BE", "region_name": "Bono East Region", "type": "Municipal", "capital": "Nkoranza", "population": 100615, "area_km2": 1646.0, "coordinates": {"lat": 7.5500, "lng": -1.5500}},
-            {"id": "BE-07", "name": "Pru East District", "region_id": "BE", "region_name": "Bono East Region", "type": "District", "capital": "Yeji", "population": 127167, "area_km2": 633.0, "coordinates": {"lat": 7.8500, "lng": -0.4167}},
-            {"id": "BE-08", "name": "Pru West District", "region_id": "BE", "region_name": "Bono East Region", "type": "District", "capital": "Prang", "population": 71116, "area_km2": 2613.0, "coordinates": {"lat": 8.1833, "lng": -0.8833}},
-            {"id": "BE-09", "name": "Sene East District", "region_id": "BE", "region_name": "Bono East Region", "type": "District", "capital": "Kajaji", "population": 99931, "area_km2": 1307.0, "coordinates": {"lat": 7.9167, "lng": -0.2000}},
-            {"id": "BE-10", "name": "Sene West District", "region_id": "BE", "region_name": "Bono East Region", "type": "District", "capital": "Kwame Danso", "population": 54718, "area_km2": 947.0, "coordinates": {"lat": 7.6833, "lng": -0.2833}},
-            {"id": "BE-11", "name": "Techiman North District", "region_id": "BE", "region_name": "Bono East Region", "type": "District", "capital": "Tuobodom", "population": 85404, "area_km2": 1564.0, "coordinates": {"lat": 7.7500, "lng": -1.8333}},
-            
+The seed is loaded in one transaction with bulk inserts. A checksum of the
+seed files is stored in the `meta` table; when the existing ghana.db already
+carries the same checksum the build is skipped entirely, which keeps the
+deploy-time run of this script to a few milliseconds.
 
-            # VOLTA REGION (18) - Adding sample
-            { "id": "VR-01", "name": "Ho Municipal", "region_id": "VR", "region_name": "Volta Region", "type": "Municipal", "capital": "Ho", "population": 177281, "area_km2": 2361.0, "coordinates": {"lat": 6.6009, "lng": 0.4702} },
-            { "id": "VR-02", "name": "Keta Municipal", "region_id": "VR", "region_name": "Volta Region", "type": "Municipal", "capital": "Keta", "population": 147618, "area_km2": 1442.0, "coordinates": {"lat": 5.9167, "lng": 0.9833} },
-            { "id": "VR-03", "name": "Hohoe Municipal", "region_id": "VR", "region_name": "Volta Region", "type": "Municipal", "capital": "Hohoe", "population": 262046, "area_km2": 1172.0, "coordinates": {"lat": 7.1500, "lng": 0.4667} },
-            { "id": "VR-04", "name": "Kpando Municipal", "region_id": "VR", "region_name": "Volta Region", "type": "Municipal", "capital": "Kpando", "population": 95502, "area_km2": 1076.0, "coordinates": {"lat": 6.9833, "lng": 0.2833} },
-            { "id": "VR-05", "name": "Anloga District", "region_id": "VR", "region_name": "Volta Region", "type": "District", "capital": "Anloga", "population": 126381, "area_km2": 495.0, "coordinates": {"lat": 5.7833, "lng": 0.8967} },
-            { "id": "VR-06", "name": "Some District", "region_id": "VR", "region_name": "Volta Region", "type": "District", "capital": "Some", "population": 95405, "area_km2": 1124.0, "coordinates": {"lat": 6.2167, "lng": 0.6333} },
-            { "id": "VR-07", "name": "Ketu North Municipal", "region_id": "VR", "region_name": "Volta Region", "type": "Municipal", "capital": "Dzodze", "population": 123736, "area_km2": 1277.0, "coordinates": {"lat": 6.1000, "lng": 0.9667} },
-            { "id": "VR-08", "name": "Ketu South Municipal", "region_id": "VR", "region_name": "Volta Region", "type": "Municipal", "capital": "Klikor", "population": 140579, "area_km2": 1086.0, "coordinates": {"lat": 5.9500, "lng": 1.0833} },
-            { "id": "VR-09", "name": "North Dayi District", "region_id": "VR", "region_name": "Volta Region", "type": "District", "capital": "Anfoega", "population": 62561, "area_km2": 720.0, "coordinates": {"lat": 6.8833, "lng": 0.4000} },
-            { "id": "VR-10", "name": "South Dayi District", "region_id": "VR", "region_name": "Volta Region", "type": "District", "capital": "Kpeve", "population": 86954, "area_km2": 568.0, "coordinates": {"lat": 6.7833, "lng": 0.3833} },
-            { "id": "VR-11", "name": "Central Tongu District", "region_id": "VR", "region_name": "Volta Region", "type": "District", "capital": "Adidome", "population": 83505, "area_km2": 1397.0, "coordinates": {"lat": 6.1167, "lng": 0.5000} },
-            { "id": "VR-12", "name": "North Tongu District", "region_id": "VR", "region_name": "Volta Region", "type": "District", "capital": "Battor", "population": 73915, "area_km2": 862.0, "coordinates": {"lat": 6.0000, "lng": 0.4167} },
-            { "id": "VR-13", "name": "South Tongu District", "region_id": "VR", "region_name": "Volta Region", "type": "District", "capital": "Sogakope", "population": 119445, "area_km2": 574.0, "coordinates": {"lat": 6.0333, "lng": 0.5833} },
-            { "id": "VR-14", "name": "Akatsi North District", "region_id": "VR", "region_name": "Volta Region", "type": "District", "capital": "Ave Dakpa", "population": 59450, "area_km2": 455.0, "coordinates": {"lat": 6.2333, "lng": 0.7833} },
-            { "id": "VR-15", "name": "Akatsi South District", "region_id": "VR", "region_name": "Volta Region", "type": "District", "capital": "Akatsi", "population": 116869, "area_km2": 603.0, "coordinates": {"lat": 6.1167, "lng": 0.8000} },
-            { "id": "VR-16", "name": "Agotime Ziope District", "region_id": "VR", "region_name": "Volta Region", "type": "District", "capital": "Kpetoe", "population": 87603, "area_km2": 697.0, "coordinates": {"lat": 6.7500, "lng": 0.9500} },
-            { "id": "VR-17", "name": "Adaklu District", "region_id": "VR", "region_name": "Volta Region", "type": "District", "capital": "Adaklu Waya", "population": 35507, "area_km2": 330.0, "coordinates": {"lat": 6.7167, "lng": 0.5667} },
-            { "id": "VR-18", "name": "Ho West District", "region_id": "VR", "region_name": "Volta Region", "type": "District", "capital": "Dzolokpuita", "population": 54959, "area_km2": 1195.0, "coordinates": {"lat": 6.5500, "lng": 0.3000} },
+Towns imported from GeoNames (scripts/import_geonames.py) are preserved: only
+regions, districts and the curated seed towns are rewritten. Regions and
+districts are upserted by id, so the integer keys towns point at stay
+stable. A database still on the old denormalized layout is migrated to the
+normalized one (ghanageo/schema.py) first.
 
-            # OTI REGION (9)
-            { "id": "OTI-01", "name": "Jasikan District", "region_id": "OTI", "region_name": "Oti Region", "type": "District", "capital": "Jasikan", "population": 130000, "area_km2": 1355.0, "coordinates": {"lat": 7.5667, "lng": 0.4833} },
-            { "id": "OTI-02", "name": "Kadjebi District", "region_id": "OTI", "region_name": "Oti Region", "type": "District", "capital": "Kadjebi", "population": 78400, "area_km2": 650.0, "coordinates": {"lat": 7.7333, "lng": 0.6333} },
-            { "id": "OTI-03", "name": "Krachi East Municipal", "region_id": "OTI", "region_name": "Oti Region", "type": "Municipal", "capital": "Dambai", "population": 116804, "area_km2": 3450.0, "coordinates": {"lat": 8.1000, "lng": 0.1833} },
-            { "id": "OTI-04", "name": "Krachi Nchumuru District", "region_id": "OTI", "region_name": "Oti Region", "type": "District", "capital": "Chinderi", "population": 72500, "area_km2": 2200.0, "coordinates": {"lat": 8.2667, "lng": -0.2000} },
-            { "id": "OTI-05", "name": "Krachi West District", "region_id": "OTI", "region_name": "Oti Region", "type": "District", "capital": "Kete Krachi", "population": 129000, "area_km2": 3200.0, "coordinates": {"lat": 7.7833, "lng": -0.0500} },
-            { "id": "OTI-06", "name": "Biakoye District", "region_id": "OTI", "region_name": "Oti Region", "type": "District", "capital": "Nkonya Ahenkro", "population": 118000, "area_km2": 1090.0, "coordinates": {"lat": 7.2167, "lng": 0.3667} },
-            { "id": "OTI-07", "name": "Nkwanta North District", "region_id": "OTI", "region_name": "Oti Region", "type": "District", "capital": "Kpassa", "population": 65133, "area_km2": 2300.0, "coordinates": {"lat": 8.4500, "lng": 0.3667} },
-            { "id": "OTI-08", "name": "Nkwanta South Municipal", "region_id": "OTI", "region_name": "Oti Region", "type": "Municipal", "capital": "Nkwanta", "population": 117878, "area_km2": 2735.0, "coordinates": {"lat": 8.2833, "lng": 0.5167} },
-            { "id": "OTI-09", "name": "Guan District", "region_id": "OTI", "region_name": "Oti Region", "type": "District", "capital": "Likpe-Mate", "population": 56800, "area_km2": 870.0, "coordinates": {"lat": 7.2000, "lng": 0.4500} },
+Run: python3 scripts/setup_database.py [--force] [--verify]
+"""
 
-            # NORTHERN REGION (16)
-            {"id": "NR-01", "name": "Tamale Metropolitan", "region_id": "NR", "region_name": "Northern Region", "type": "Metro", "capital": "Tamale", "population": 371351, "area_km2": 750.0, "coordinates": {"lat": 9.4034, "lng": -0.8424}},
-            {"id": "NR-02", "name": "Sagnarigu Municipal", "region_id": "NR", "region_name": "Northern Region", "type": "Municipal", "capital": "Sagnarigu", "population": 148099, "area_km2": 432.0, "coordinates": {"lat": 9.5167, "lng": -0.8833}},
-            {"id": "NR-03", "name": "Savelugu Municipal", "region_id": "NR", "region_name": "Northern Region", "type": "Municipal", "capital": "Savelugu", "population": 129013, "area_km2": 1322.0, "coordinates": {"lat": 9.6333, "lng": -0.8333}},
-            {"id": "NR-04", "name": "Nanton District", "region_id": "NR", "region_name": "Northern Region", "type": "District", "capital": "Nanton", "population": 79548, "area_km2": 2124.0, "coordinates": {"lat": 9.4167, "lng": -1.0833}},
-            {"id": "NR-05", "name": "Kumbungu District", "region_id": "NR", "region_name": "Northern Region", "type": "District", "capital": "Kumbungu", "population": 87716, "area_km2": 1061.0, "coordinates": {"lat": 9.5500, "lng": -1.0167}},
-            { "id": "NR-06", "name": "Tolon District", "region_id": "NR", "region_name": "Northern Region", "type": "District", "capital": "Tolon", "population": 112331, "area_km2": 1122.0, "coordinates": {"lat": 9.4333, "lng": -1.1833} },
-            { "id": "NR-07", "name": "Karla District", "region_id": "NR", "region_name": "Northern Region", "type": "District", "capital": "Karaga", "population": 114225, "area_km2": 1520.0, "coordinates": {"lat": 9.9333, "lng": -0.5667} },
-            { "id": "NR-08", "name": "Mion District", "region_id": "NR", "region_name": "Northern Region", "type": "District", "capital": "Sang", "population": 93976, "area_km2": 1372.0, "coordinates": {"lat": 9.3167, "lng": -0.5167} },
-            { "id": "NR-09", "name": "Yendi Municipal", "region_id": "NR", "region_name": "Northern Region", "type": "Municipal", "capital": "Yendi", "population": 154421, "area_km2": 1770.0, "coordinates": {"lat": 9.4333, "lng": -0.0167} },
-            { "id": "NR-10", "name": "Gushegu Municipal", "region_id": "NR", "region_name": "Northern Region", "type": "Municipal", "capital": "Gushegu", "population": 135748, "area_km2": 2520.0, "coordinates": {"lat": 9.4667, "lng": -0.3333} },
-            { "id": "NR-11", "name": "Saboba District", "region_id": "NR", "region_name": "Northern Region", "type": "District", "capital": "Saboba", "population": 94839, "area_km2": 1946.0, "coordinates": {"lat": 9.5667, "lng": 0.3333} },
-            { "id": "NR-12", "name": "Zabzugu District", "region_id": "NR", "region_name": "Northern Region", "type": "District", "capital": "Zabzugu", "population": 84985, "area_km2": 1720.0, "coordinates": {"lat": 9.5333, "lng": -0.4333} },
-            { "id": "NR-13", "name": "Tatale Sangule District", "region_id": "NR", "region_name": "Northern Region", "type": "District", "capital": "Tatale", "population": 76478, "area_km2": 1750.0, "coordinates": {"lat": 9.5667, "lng": 0.2667} },
-            { "id": "NR-14", "name": "Nanumba North Municipal", "region_id": "NR", "region_name": "Northern Region", "type": "Municipal", "capital": "Bimbilla", "population": 151232, "area_km2": 2330.0, "coordinates": {"lat": 8.8833, "lng": -0.0500} },
-            { "id": "NR-15", "name": "Nanumba South District", "region_id": "NR", "region_name": "Northern Region", "type": "District", "capital": "Wulensi", "population": 82600, "area_km2": 1460.0, "coordinates": {"lat": 8.5500, "lng": -0.3000} },
-            { "id": "NR-16", "name": "Kpandai District", "region_id": "NR", "region_name": "Northern Region", "type": "District", "capital": "Kpandai", "population": 108816, "area_km2": 1700.0, "coordinates": {"lat": 8.3667, "lng": -0.2667} },
+import argparse
+import csv
+import hashlib
+import json
+import sqlite3
+import sys
+import time
+from pathlib import Path
 
+BASE_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(BASE_DIR))
+from ghanageo.schema import (  # noqa: E402
+    SCHEMA_VERSION, ensure_schema, fill_name_keys, is_legacy, schema_version
+)
 
-            # SAVANNAH REGION (07)
-            { "id": "SR-01", "name": "West Gonja Municipal", "region_id": "SR", "region_name": "Savannah Region", "type": "Municipal", "capital": "Damongo", "population": 87000, "area_km2": 5800.0, "coordinates": {"lat": 9.0667, "lng": -1.8167}}, 
-            { "id": "SR-02", "name": "East Gonja Municipal", "region_id": "SR", "region_name": "Savannah Region", "type": "Municipal", "capital": "Salaga", "population": 140000, "area_km2": 9351.0, "coordinates": {"lat": 8.5500, "lng": -0.3167}}, 
-            { "id": "SR-03", "name": "Bole District", "region_id": "SR", "region_name": "Savannah Region", "type": "District", "capital": "Bole", "population": 115800, "area_km2": 4800.0, "coordinates": {"lat": 8.9167, "lng": -2.4833}}, 
-            { "id": "SR-04", "name": "Central Gonja District", "region_id": "SR", "region_name": "Savannah Region", "type": "District", "capital": "Buipe", "population": 110000, "area_km2": 8353.0, "coordinates": {"lat": 8.9833, "lng": -1.3333}}, 
-            { "id": "SR-05", "name": "North Gonja District", "region_id": "SR", "region_name": "Savannah Region", "type": "District", "capital": "Daboya", "population": 48000, "area_km2": 4845.0, "coordinates": {"lat": 9.4333, "lng": -1.4667}}, 
-            { "id": "SR-06", "name": "Sawla-Tuna-Kalba District", "region_id": "SR", "region_name": "Savannah Region", "type": "District", "capital": "Sawla", "population": 95000, "area_km2": 4200.0, "coordinates": {"lat": 9.2667, "lng": -2.2000}}, 
-            { "id": "SR-07", "name": "North East Gonja District", "region_id": "SR", "region_name": "Savannah Region", "type": "District", "capital": "Kpalbe", "population": 57000, "area_km2": 3513.0, "coordinates": {"lat": 9.1000, "lng": -0.1833}},
+DB_PATH = BASE_DIR / "ghanageo" / "data" / "ghana.db"
+SEED_DIR = Path(__file__).parent / "seed"
+SEED_FILES = ("regions.csv", "districts.csv", "towns.csv")
 
+# Bump when the build logic or schema changes so existing databases rebuild
+BUILD_VERSION = "6"
 
-            # NORTH EAST REGION (6)
-            {"id": "NER-01", "name": "East Mamprusi Municipal", "region_id": "NER", "region_name": "North East Region", "type": "Municipal", "capital": "Gambaga", "population": 188006, "area_km2": 1706.8, "coordinates": {"lat": 10.5333, "lng": -0.4167}}, 
-            {"id": "NER-02", "name": "West Mamprusi Municipal", "region_id": "NER", "region_name": "North East Region", "type": "Municipal", "capital": "Walewale", "population": 175755, "area_km2": 2610.4, "coordinates": {"lat": 10.3000, "lng": -0.9000}}, 
-            {"id": "NER-03", "name": "Bunkpurugu-Nakpanduri District", "region_id": "NER", "region_name": "North East Region", "type": "District", "capital": "Bunkpurugu", "population": 82384, "area_km2": 533.0, "coordinates": {"lat": 10.7667, "lng": -0.0833}}, 
-            {"id": "NER-04", "name": "Chereponi District", "region_id": "NER", "region_name": "North East Region", "type": "District", "capital": "Chereponi", "population": 87176, "area_km2": 1374.7, "coordinates": {"lat": 9.4667, "lng": 0.4167}}, 
-            {"id": "NER-05", "name": "Yunyoo-Nasuan District", "region_id": "NER", "region_name": "North East Region", "type": "District", "capital": "Yunyoo", "population": 56879, "area_km2": 890.0, "coordinates": {"lat": 10.2500, "lng": 0.1833}}, 
-            {"id": "NER-06", "name": "Mamprugu-Moagduri District", "region_id": "NER", "region_name": "North East Region", "type": "District", "capital": "Yagaba", "population": 68746, "area_km2": 2150.0, "coordinates": {"lat": 10.4167, "lng": -1.1833}},
+# ---------------------------------------------------------------------------
+# Seed files
+# ---------------------------------------------------------------------------
 
-            # UPPER EAST REGION (15)
-            {"id": "UE-01", "name": "Bolgatanga Municipal", "region_id": "UER", "region_name": "Upper East Region", "type": "Municipal", "capital": "Bolgatanga", "population": 131550, "area_km2": 729.0, "coordinates": {"lat": 10.7856, "lng": -0.8510}}, 
-            {"id": "UER-02", "name": "Bawku Municipal", "region_id": "UER", "region_name": "Upper East Region", "type": "Municipal", "capital": "Bawku", "population": 98538, "area_km2": 1070.0, "coordinates": {"lat": 11.0564, "lng": -0.2372}}, 
-            {"id": "UER-03", "name": "Kassena-Nankana Municipal", "region_id": "UER", "region_name": "Upper East Region", "type": "Municipal", "capital": "Navrongo", "population": 109944, "area_km2": 1675.0, "coordinates": {"lat": 10.8956, "lng": -1.0939}}, 
-            {"id": "UER-04", "name": "Builsa North Municipal", "region_id": "UER", "region_name": "Upper East Region", "type": "Municipal", "capital": "Sandema", "population": 59297, "area_km2": 1221.0, "coordinates": {"lat": 10.8833, "lng": -1.3333}}, 
-            {"id": "UER-05", "name": "Talensi District", "region_id": "UER", "region_name": "Upper East Region", "type": "District", "capital": "Tongo", "population": 81450, "area_km2": 838.0, "coordinates": {"lat": 10.7667, "lng": -1.2000}}, 
-            {"id": "UER-06", "name": "Nabdam District", "region_id": "UER", "region_name": "Upper East Region", "type": "District", "capital": "Nangodi", "population": 39197, "area_km2": 388.0, "coordinates": {"lat": 10.9000, "lng": -0.7833}}, 
-            {"id": "UER-07", "name": "Bongo District", "region_id": "UER", "region_name": "Upper East Region", "type": "District", "capital": "Bongo", "population": 84545, "area_km2": 459.0, "coordinates": {"lat": 10.8833, "lng": -0.8000}}, 
-            {"id": "UER-08", "name": "Kassena-Nankana West District", "region_id": "UER", "region_name": "Upper East Region", "type": "District", "capital": "Paga", "population": 70667, "area_km2": 1286.0, "coordinates": {"lat": 10.9833, "lng": -1.1167}}, 
-            {"id": "UER-09", "name": "Builsa South District", "region_id": "UER", "region_name": "Upper East Region", "type": "District", "capital": "Fumbisi", "population": 36877, "area_km2": 801.0, "coordinates": {"lat": 10.7833, "lng": -1.4667}}, 
-            {"id": "UER-10", "name": "Bawku West District", "region_id": "UER", "region_name": "Upper East Region", "type": "District", "capital": "Zebilla", "population": 94034, "area_km2": 1070.0, "coordinates": {"lat": 11.1667, "lng": -0.5167}}, 
-            {"id": "UER-11", "name": "Binduri District", "region_id": "UER", "region_name": "Upper East Region", "type": "District", "capital": "Binduri", "population": 55008, "area_km2": 525.0, "coordinates": {"lat": 11.0333, "lng": -0.0833}}, 
-            {"id": "UER-12", "name": "Garu District", "region_id": "UER", "region_name": "Upper East Region", "type": "District", "capital": "Garu", "population": 141516, "area_km2": 1850.0, "coordinates": {"lat": 10.8833, "lng": 0.2167}}, 
-            {"id": "UER-13", "name": "Tempane District", "region_id": "UER", "region_name": "Upper East Region", "type": "District", "capital": "Tempane", "population": 41525, "area_km2": 675.0, "coordinates": {"lat": 10.7333, "lng": -0.4167}}, 
-            {"id": "UER-14", "name": "Bolgatanga East District", "region_id": "UER", "region_name": "Upper East Region", "type": "District", "capital": "Zuarungu", "population": 71680, "area_km2": 418.0, "coordinates": {"lat": 10.8167, "lng": -0.7000}}, 
-            {"id": "UER-15", "name": "Pusiga District", "region_id": "UER", "region_name": "Upper East Region", "type": "District", "capital": "Pusiga", "population": 85593, "area_km2": 837.0, "coordinates": {"lat": 11.0167, "lng": 0.2333}},
+def seed_checksum() -> str:
+    h = hashlib.sha256(f"build:{BUILD_VERSION}".encode())
+    for name in SEED_FILES:
+        h.update(name.encode())
+        h.update((SEED_DIR / name).read_bytes())
+    return h.hexdigest()
 
-            # UPPER WEST REGION (11)
-            {"id": "UWR-01", "name": "Wa Metropolitan", "region_id": "UWR", "region_name": "Upper West Region", "type": "Metropolitan", "capital": "Wa", "population": 200672, "area_km2": 579.0, "coordinates": {"lat": 10.0606, "lng": -2.5069}}, 
-            {"id": "UWR-02", "name": "Jirapa Municipal", "region_id": "UWR", "region_name": "Upper West Region", "type": "Municipal", "capital": "Jirapa", "population": 88402, "area_km2": 1188.9, "coordinates": {"lat": 10.3167, "lng": -2.7333}}, 
-            {"id": "UWR-03", "name": "Lawra Municipal", "region_id": "UWR", "region_name": "Upper West Region", "type": "Municipal", "capital": "Lawra", "population": 58433, "area_km2": 514.0, "coordinates": {"lat": 10.6500, "lng": -2.9000}}, 
-            {"id": "UWR-04", "name": "Nandom Municipal", "region_id": "UWR", "region_name": "Upper West Region", "type": "Municipal", "capital": "Nandom", "population": 58145, "area_km2": 766.0, "coordinates": {"lat": 10.4833, "lng": -2.8333}}, 
-            {"id": "UWR-05", "name": "Sissala East Municipal", "region_id": "UWR", "region_name": "Upper West Region", "type": "Municipal", "capital": "Tumu", "population": 65518, "area_km2": 2497.0, "coordinates": {"lat": 10.9167, "lng": -1.8167}}, 
-            {"id": "UWR-06", "name": "Lambussie-Karni District", "region_id": "UWR", "region_name": "Upper West Region", "type": "District", "capital": "Lambussie", "population": 52340, "area_km2": 1182.0, "coordinates": {"lat": 10.5833, "lng": -2.9167}}, 
-            {"id": "UWR-07", "name": "Nadowli-Kaleo District", "region_id": "UWR", "region_name": "Upper West Region", "type": "District", "capital": "Nadowli", "population": 94388, "area_km2": 2602.0, "coordinates": {"lat": 10.3500, "lng": -2.5000}}, 
-            {"id": "UWR-08", "name": "Sissala West District", "region_id": "UWR", "region_name": "Upper West Region", "type": "District", "capital": "Gwollu", "population": 52740, "area_km2": 1653.0, "coordinates": {"lat": 10.7833, "lng": -2.0833}}, 
-            {"id": "UWR-09", "name": "Wa East District", "region_id": "UWR", "region_name": "Upper West Region", "type": "District", "capital": "Funsi", "population": 71051, "area_km2": 1537.0, "coordinates": {"lat": 10.1833, "lng": -2.1167}}, 
-            {"id": "UWR-10", "name": "Wa West District", "region_id": "UWR", "region_name": "Upper West Region", "type": "District", "capital": "Wechiau", "population": 81348, "area_km2": 1677.0, "coordinates": {"lat": 10.2500, "lng": -2.3167}}, 
-            {"id": "UWR-11", "name": "Daffiama-Bussie-Issa District", "region_id": "UWR", "region_name": "Upper West Region", "type": "District", "capital": "Issa", "population": 31963, "area_km2": 1279.0, "coordinates": {"lat": 10.7667, "lng": -2.6000}},
 
+def _read_csv(name: str) -> list:
+    with open(SEED_DIR / name, newline="", encoding="utf-8") as f:
+        return list(csv.DictReader(f))
 
-            # EASTERN REGION (33) - Already included earlier, keeping for completeness
-            # ========================================
-            {"id": "ER-01", "name": "New-Juaben Municipal", "region_id": "ER", "region_name": "Eastern Region", "type": "Municipal", "capital": "Koforidua", "population": 183727, "area_km2": 110.0, "coordinates": {"lat": 6.0891, "lng": -0.2570}},
-            {"id": "ER-02", "name": "Akyemansa District", "region_id": "ER", "region_name": "Eastern Region", "type": "District", "capital": "Akim Oda", "population": 117403, "area_km2": 747.4, "coordinates": {"lat": 5.9333, "lng": -0.9833}},
-            {"id": "ER-03", "name": "West Akim Municipal", "region_id": "ER", "region_name": "Eastern Region", "type": "Municipal", "capital": "Asamankese", "population": 108070, "area_km2": 1097.0, "coordinates": {"lat": 5.8667, "lng": -0.6667}},
-            {"id": "ER-04", "name": "East Akim Municipal", "region_id": "ER", "region_name": "Eastern Region", "type": "Municipal", "capital": "Kibi", "population": 102304, "area_km2": 717.0, "coordinates": {"lat": 6.1667, "lng": -0.5500}},
-            {"id": "ER-05", "name": "Birim Central Municipal", "region_id": "ER", "region_name": "Eastern Region", "type": "Municipal", "capital": "Akim Oda", "population": 88939, "area_km2": 362.0, "coordinates": {"lat": 5.9333, "lng": -0.9833}},
-            {"id": "ER-06", "name": "Birim North District", "region_id": "ER", "region_name": "Eastern Region", "type": "District", "capital": "New Abirem", "population": 97198, "area_km2": 1348.0, "coordinates": {"lat": 6.2000, "lng": -0.8333}},
-            {"id": "ER-07", "name": "Birim South District", "region_id": "ER", "region_name": "Eastern Region", "type": "District", "capital": "Akim Swedru", "population": 74702, "area_km2": 878.0, "coordinates": {"lat": 5.8500, "lng": -0.9167}},
-            {"id": "ER-08", "name": "Kwaebibirem Municipal", "region_id": "ER", "region_name": "Eastern Region", "type": "Municipal", "capital": "Kade", "population": 141938, "area_km2": 1233.0, "coordinates": {"lat": 6.0833, "lng": -0.8833}},
-            {"id": "ER-09", "name": "Suhum Municipal", "region_id": "ER", "region_name": "Eastern Region", "type": "Municipal", "capital": "Suhum", "population": 86216, "area_km2": 548.0, "coordinates": {"lat": 6.0400, "lng": -0.4500}},
-            {"id": "ER-10", "name": "Nsawam-Adoagyire Municipal", "region_id": "ER", "region_name": "Eastern Region", "type": "Municipal", "capital": "Nsawam", "population": 86804, "area_km2": 279.0, "coordinates": {"lat": 5.8167, "lng": -0.3500}},
-            {"id": "ER-11", "name": "Akuapim North Municipal", "region_id": "ER", "region_name": "Eastern Region", "type": "Municipal", "capital": "Akropong", "population": 118233, "area_km2": 474.0, "coordinates": {"lat": 5.9500, "lng": -0.2833}},
-            {"id": "ER-12", "name": "Akuapim South Municipal", "region_id": "ER", "region_name": "Eastern Region", "type": "Municipal", "capital": "Nsawam", "population": 198249, "area_km2": 276.0, "coordinates": {"lat": 5.8167, "lng": -0.3500}},
-            {"id": "ER-13", "name": "Okere District", "region_id": "ER", "region_name": "Eastern Region", "type": "District", "capital": "Adukrom", "population": 56408, "area_km2": 304.0, "coordinates": {"lat": 6.1167, "lng": -0.1333}},
-            {"id": "ER-14", "name": "Yilo Krobo Municipal", "region_id": "ER", "region_name": "Eastern Region", "type": "Municipal", "capital": "Somanya", "population": 87847, "area_km2": 404.0, "coordinates": {"lat": 6.1000, "lng": 0.0167}},
-            {"id": "ER-15", "name": "Lower Manya Krobo Municipal", "region_id": "ER", "region_name": "Eastern Region", "type": "Municipal", "capital": "Odumase-Krobo", "population": 89246, "area_km2": 396.0, "coordinates": {"lat": 6.0833, "lng": 0.0667}},
-            {"id": "ER-16", "name": "Upper Manya Krobo District", "region_id": "ER", "region_name": "Eastern Region", "type": "District", "capital": "Asesewa", "population": 66348, "area_km2": 711.0, "coordinates": {"lat": 6.1833, "lng": 0.1000}},
-            {"id": "ER-17", "name": "Asuogyaman District", "region_id": "ER", "region_name": "Eastern Region", "type": "District", "capital": "Atimpoku", "population": 95580, "area_km2": 1247.0, "coordinates": {"lat": 6.1167, "lng": 0.1000}},
-            {"id": "ER-18", "name": "Upper West Akim District", "region_id": "ER", "region_name": "Eastern Region", "type": "District", "capital": "Adeiso", "population": 95417, "area_km2": 739.0, "coordinates": {"lat": 6.1000, "lng": -0.6667}},
-            {"id": "ER-19", "name": "Kwahu East District", "region_id": "ER", "region_name": "Eastern Region", "type": "District", "capital": "Abetifi", "population": 72781, "area_km2": 632.0, "coordinates": {"lat": 6.6667, "lng": -0.7500}},
-            {"id": "ER-20", "name": "Kwahu West Municipal", "region_id": "ER", "region_name": "Eastern Region", "type": "Municipal", "capital": "Nkawkaw", "population": 98557, "area_km2": 609.0, "coordinates": {"lat": 6.5500, "lng": -0.7667}},
-            {"id": "ER-21", "name": "Kwahu South District", "region_id": "ER", "region_name": "Eastern Region", "type": "District", "capital": "Mpraeso", "population": 53024, "area_km2": 298.0, "coordinates": {"lat": 6.5833, "lng": -0.7333}},
-            {"id": "ER-22", "name": "Kwahu Afram Plains North District", "region_id": "ER", "region_name": "Eastern Region", "type": "District", "capital": "Donkorkrom", "population": 96828, "area_km2": 2678.0, "coordinates": {"lat": 7.0833, "lng": -0.4167}},
-            {"id": "ER-23", "name": "Kwahu Afram Plains South District", "region_id": "ER", "region_name": "Eastern Region", "type": "District", "capital": "Tease", "population": 79927, "area_km2": 2289.0, "coordinates": {"lat": 6.8000, "lng": -0.3667}},
-            {"id": "ER-24", "name": "Atiwa East District", "region_id": "ER", "region_name": "Eastern Region", "type": "District", "capital": "Anyinam", "population": 74352, "area_km2": 1162.0, "coordinates": {"lat": 6.1667, "lng": -0.8333}},
-            {"id": "ER-25", "name": "Atiwa West District", "region_id": "ER", "region_name": "Eastern Region", "type": "District", "capital": "Kwabeng", "population": 96552, "area_km2": 769.0, "coordinates": {"lat": 6.2167, "lng": -0.7167}},
-            {"id": "ER-26", "name": "Fanteakwa North District", "region_id": "ER", "region_name": "Eastern Region", "type": "District", "capital": "Begoro", "population": 108307, "area_km2": 882.0, "coordinates": {"lat": 6.3833, "lng": -0.3833}},
-            {"id": "ER-27", "name": "Fanteakwa South District", "region_id": "ER", "region_name": "Eastern Region", "type": "District", "capital": "Osino", "population": 83383, "area_km2": 621.0, "coordinates": {"lat": 6.1833, "lng": -0.4167}},
-            {"id": "ER-28", "name": "Akwatia District", "region_id": "ER", "region_name": "Eastern Region", "type": "District", "capital": "Akwatia", "population": 84513, "area_km2": 463.0, "coordinates": {"lat": 6.0500, "lng": -0.8000}},
-            {"id": "ER-29", "name": "Denkyembour District", "region_id": "ER", "region_name": "Eastern Region", "type": "District", "capital": "Akwatia", "population": 67138, "area_km2": 687.0, "coordinates": {"lat": 6.0500, "lng": -0.8000}},
-            {"id": "ER-30", "name": "Achiase District", "region_id": "ER", "region_name": "Eastern Region", "type": "District", "capital": "Achiase", "population": 41734, "area_km2": 298.0, "coordinates": {"lat": 5.8833, "lng": -0.8500}},
-            {"id": "ER-31", "name": "Asene Manso Akroso District", "region_id": "ER", "region_name": "Eastern Region", "type": "District", "capital": "Manso", "population": 71892, "area_km2": 874.0, "coordinates": {"lat": 5.9500, "lng": -1.2333}},
-            {"id": "ER-32", "name": "Ayensuano District", "region_id": "ER", "region_name": "Eastern Region", "type": "District", "capital": "Coaltar", "population": 86394, "area_km2": 540.0, "coordinates": {"lat": 6.0667, "lng": -0.5000}},
-            {"id": "ER-33", "name": "New Juaben South Municipal", "region_id": "ER", "region_name": "Eastern Region", "type": "Municipal", "capital": "Koforidua", "population": 203045, "area_km2": 168.0, "coordinates": {"lat": 6.0891, "lng": -0.2570}},
-            
-        ]
-        
-        # Insert regions
-        for region in regions_data:
-            coords_json = json.dumps(region['coordinates']) if region.get('coordinates') else None
-            
-            conn.execute('''
-                INSERT OR REPLACE INTO regions 
-                (id, name, code, capital, population, area_km2, coordinates, created_date)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                region['id'],
-                region['name'], 
-                region['code'],
-                region['capital'],
-                region['population'],
-                region['area_km2'],
-                coords_json,
-                region['created_date']
-            ))
-        
-        # Insert districts
-        for district in districts_data:
-            coords_json = json.dumps(district['coordinates']) if district.get('coordinates') else None
-            
-            conn.execute('''
-                INSERT OR REPLACE INTO districts
-                (id, name, region_id, region_name, type, capital, population, area_km2, coordinates)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                district['id'],
-                district['name'],
-                district['region_id'],
-                district['region_name'],
-                district['type'],
-                district['capital'], 
-                district['population'],
-                district['area_km2'],
-                coords_json
-            ))
-        
-        # ============================================================
-        # TOWNS / VILLAGES DATA
-        # ============================================================
-        print("Creating towns table and inserting towns/villages data...")
 
-        conn.execute('''
-            CREATE TABLE IF NOT EXISTS towns (
-                id TEXT PRIMARY KEY,
-                name TEXT NOT NULL,
-                district_id TEXT NOT NULL,
-                district_name TEXT NOT NULL,
-                region_id TEXT NOT NULL,
-                region_name TEXT NOT NULL,
-                type TEXT NOT NULL,
-                population INTEGER,
-                coordinates TEXT
-            )
-        ''')
-        conn.execute('CREATE INDEX IF NOT EXISTS idx_towns_district ON towns(district_id)')
-        conn.execute('CREATE INDEX IF NOT EXISTS idx_towns_region ON towns(region_id)')
-        conn.execute('CREATE INDEX IF NOT EXISTS idx_towns_name ON towns(name)')
+def _int(value):
+    return int(value) if value else None
 
-        towns_data = [
-            # ====== GREATER ACCRA REGION ======
-            # GR-01 Accra Metropolitan
-            {"id":"GR-01-T01","name":"Osu","district_id":"GR-01","district_name":"Accra Metropolitan","region_id":"GR","region_name":"Greater Accra Region","type":"Suburb","population":42000,"coordinates":{"lat":5.5557,"lng":-0.1719}},
-            {"id":"GR-01-T02","name":"Cantonments","district_id":"GR-01","district_name":"Accra Metropolitan","region_id":"GR","region_name":"Greater Accra Region","type":"Suburb","population":18000,"coordinates":{"lat":5.5750,"lng":-0.1750}},
-            {"id":"GR-01-T03","name":"Labadi","district_id":"GR-01","district_name":"Accra Metropolitan","region_id":"GR","region_name":"Greater Accra Region","type":"Suburb","population":35000,"coordinates":{"lat":5.5583,"lng":-0.1500}},
-            {"id":"GR-01-T04","name":"James Town","district_id":"GR-01","district_name":"Accra Metropolitan","region_id":"GR","region_name":"Greater Accra Region","type":"Community","population":25000,"coordinates":{"lat":5.5500,"lng":-0.2083}},
-            {"id":"GR-01-T05","name":"Ussher Town","district_id":"GR-01","district_name":"Accra Metropolitan","region_id":"GR","region_name":"Greater Accra Region","type":"Community","population":22000,"coordinates":{"lat":5.5483,"lng":-0.2050}},
-            {"id":"GR-01-T06","name":"Adabraka","district_id":"GR-01","district_name":"Accra Metropolitan","region_id":"GR","region_name":"Greater Accra Region","type":"Suburb","population":45000,"coordinates":{"lat":5.5500,"lng":-0.1833}},
-            {"id":"GR-01-T07","name":"Labone","district_id":"GR-01","district_name":"Accra Metropolitan","region_id":"GR","region_name":"Greater Accra Region","type":"Suburb","population":14000,"coordinates":{"lat":5.5617,"lng":-0.1633}},
-            {"id":"GR-01-T08","name":"Asylum Down","district_id":"GR-01","district_name":"Accra Metropolitan","region_id":"GR","region_name":"Greater Accra Region","type":"Suburb","population":12000,"coordinates":{"lat":5.5600,"lng":-0.1900}},
-            {"id":"GR-01-T09","name":"Kotobabi","district_id":"GR-01","district_name":"Accra Metropolitan","region_id":"GR","region_name":"Greater Accra Region","type":"Community","population":30000,"coordinates":{"lat":5.5700,"lng":-0.1950}},
-            {"id":"GR-01-T10","name":"Accra New Town","district_id":"GR-01","district_name":"Accra Metropolitan","region_id":"GR","region_name":"Greater Accra Region","type":"Community","population":55000,"coordinates":{"lat":5.5750,"lng":-0.1833}},
-            {"id":"GR-01-T11","name":"Ridge","district_id":"GR-01","district_name":"Accra Metropolitan","region_id":"GR","region_name":"Greater Accra Region","type":"Suburb","population":8000,"coordinates":{"lat":5.5700,"lng":-0.1950}},
-            {"id":"GR-01-T12","name":"North Ridge","district_id":"GR-01","district_name":"Accra Metropolitan","region_id":"GR","region_name":"Greater Accra Region","type":"Suburb","population":6000,"coordinates":{"lat":5.5833,"lng":-0.1950}},
-            # GR-02 Tema Metropolitan
-            {"id":"GR-02-T01","name":"Community 1","district_id":"GR-02","district_name":"Tema Metropolitan","region_id":"GR","region_name":"Greater Accra Region","type":"Community","population":18000,"coordinates":{"lat":5.6583,"lng":-0.0167}},
-            {"id":"GR-02-T02","name":"Sakumono","district_id":"GR-02","district_name":"Tema Metropolitan","region_id":"GR","region_name":"Greater Accra Region","type":"Suburb","population":35000,"coordinates":{"lat":5.6333,"lng":-0.0500}},
-            {"id":"GR-02-T03","name":"Lashibi","district_id":"GR-02","district_name":"Tema Metropolitan","region_id":"GR","region_name":"Greater Accra Region","type":"Suburb","population":28000,"coordinates":{"lat":5.6167,"lng":-0.0333}},
-            {"id":"GR-02-T04","name":"Klagon","district_id":"GR-02","district_name":"Tema Metropolitan","region_id":"GR","region_name":"Greater Accra Region","type":"Community","population":15000,"coordinates":{"lat":5.6333,"lng":0.0000}},
-            {"id":"GR-02-T05","name":"Community 25","district_id":"GR-02","district_name":"Tema Metropolitan","region_id":"GR","region_name":"Greater Accra Region","type":"Community","population":20000,"coordinates":{"lat":5.6833,"lng":0.0333}},
-            {"id":"GR-02-T06","name":"Tema Industrial Area","district_id":"GR-02","district_name":"Tema Metropolitan","region_id":"GR","region_name":"Greater Accra Region","type":"Community","population":12000,"coordinates":{"lat":5.6700,"lng":0.0000}},
-            # GR-03 La Nkwantanang Madina
-            {"id":"GR-03-T01","name":"Madina","district_id":"GR-03","district_name":"La Nkwantanang Madina Municipal","region_id":"GR","region_name":"Greater Accra Region","type":"Town","population":92000,"coordinates":{"lat":5.6836,"lng":-0.1668}},
-            {"id":"GR-03-T02","name":"Pantang","district_id":"GR-03","district_name":"La Nkwantanang Madina Municipal","region_id":"GR","region_name":"Greater Accra Region","type":"Community","population":18000,"coordinates":{"lat":5.7000,"lng":-0.1500}},
-            {"id":"GR-03-T03","name":"Oyarifa","district_id":"GR-03","district_name":"La Nkwantanang Madina Municipal","region_id":"GR","region_name":"Greater Accra Region","type":"Town","population":25000,"coordinates":{"lat":5.7167,"lng":-0.1333}},
-            {"id":"GR-03-T04","name":"Alogboshie","district_id":"GR-03","district_name":"La Nkwantanang Madina Municipal","region_id":"GR","region_name":"Greater Accra Region","type":"Community","population":15000,"coordinates":{"lat":5.6750,"lng":-0.1750}},
-            # GR-04 Ga West
-            {"id":"GR-04-T01","name":"Amasaman","district_id":"GR-04","district_name":"Ga West Municipal","region_id":"GR","region_name":"Greater Accra Region","type":"Town","population":65000,"coordinates":{"lat":5.7500,"lng":-0.3167}},
-            {"id":"GR-04-T02","name":"Pokuase","district_id":"GR-04","district_name":"Ga West Municipal","region_id":"GR","region_name":"Greater Accra Region","type":"Town","population":45000,"coordinates":{"lat":5.7500,"lng":-0.2833}},
-            {"id":"GR-04-T03","name":"Kwabenya","district_id":"GR-04","district_name":"Ga West Municipal","region_id":"GR","region_name":"Greater Accra Region","type":"Town","population":38000,"coordinates":{"lat":5.7333,"lng":-0.2500}},
-            {"id":"GR-04-T04","name":"Medie","district_id":"GR-04","district_name":"Ga West Municipal","region_id":"GR","region_name":"Greater Accra Region","type":"Village","population":8000,"coordinates":{"lat":5.8167,"lng":-0.3500}},
-            {"id":"GR-04-T05","name":"Abease","district_id":"GR-04","district_name":"Ga West Municipal","region_id":"GR","region_name":"Greater Accra Region","type":"Village","population":5000,"coordinates":{"lat":5.8333,"lng":-0.3167}},
-            # GR-05 Ga South
-            {"id":"GR-05-T01","name":"Kasoa","district_id":"GR-05","district_name":"Ga South Municipal","region_id":"GR","region_name":"Greater Accra Region","type":"Town","population":185000,"coordinates":{"lat":5.5333,"lng":-0.4167}},
-            {"id":"GR-05-T02","name":"Weija","district_id":"GR-05","district_name":"Ga South Municipal","region_id":"GR","region_name":"Greater Accra Region","type":"Town","population":42000,"coordinates":{"lat":5.5500,"lng":-0.3333}},
-            {"id":"GR-05-T03","name":"Oblogo","district_id":"GR-05","district_name":"Ga South Municipal","region_id":"GR","region_name":"Greater Accra Region","type":"Community","population":18000,"coordinates":{"lat":5.5167,"lng":-0.3500}},
-            {"id":"GR-05-T04","name":"Domeabra","district_id":"GR-05","district_name":"Ga South Municipal","region_id":"GR","region_name":"Greater Accra Region","type":"Town","population":25000,"coordinates":{"lat":5.4833,"lng":-0.4500}},
-            {"id":"GR-05-T05","name":"Oduom","district_id":"GR-05","district_name":"Ga South Municipal","region_id":"GR","region_name":"Greater Accra Region","type":"Community","population":10000,"coordinates":{"lat":5.5000,"lng":-0.4833}},
-            # GR-06 Ga East
-            {"id":"GR-06-T01","name":"Abokobi","district_id":"GR-06","district_name":"Ga East Municipal","region_id":"GR","region_name":"Greater Accra Region","type":"Town","population":35000,"coordinates":{"lat":5.7667,"lng":-0.1333}},
-            {"id":"GR-06-T02","name":"Dome","district_id":"GR-06","district_name":"Ga East Municipal","region_id":"GR","region_name":"Greater Accra Region","type":"Town","population":55000,"coordinates":{"lat":5.6833,"lng":-0.2000}},
-            {"id":"GR-06-T03","name":"Haatso","district_id":"GR-06","district_name":"Ga East Municipal","region_id":"GR","region_name":"Greater Accra Region","type":"Community","population":28000,"coordinates":{"lat":5.6667,"lng":-0.1833}},
-            {"id":"GR-06-T04","name":"Ashale Botwe","district_id":"GR-06","district_name":"Ga East Municipal","region_id":"GR","region_name":"Greater Accra Region","type":"Suburb","population":22000,"coordinates":{"lat":5.6833,"lng":-0.1667}},
-            # GR-07 Ashaiman
-            {"id":"GR-07-T01","name":"Ashaiman","district_id":"GR-07","district_name":"Ashaiman Municipal","region_id":"GR","region_name":"Greater Accra Region","type":"Town","population":190000,"coordinates":{"lat":5.6953,"lng":-0.0302}},
-            {"id":"GR-07-T02","name":"Tulaku","district_id":"GR-07","district_name":"Ashaiman Municipal","region_id":"GR","region_name":"Greater Accra Region","type":"Community","population":18000,"coordinates":{"lat":5.7000,"lng":-0.0200}},
-            {"id":"GR-07-T03","name":"Zenu","district_id":"GR-07","district_name":"Ashaiman Municipal","region_id":"GR","region_name":"Greater Accra Region","type":"Community","population":22000,"coordinates":{"lat":5.6900,"lng":-0.0100}},
-            # GR-08 Ledzokuku
-            {"id":"GR-08-T01","name":"Teshie","district_id":"GR-08","district_name":"Ledzokuku Municipal","region_id":"GR","region_name":"Greater Accra Region","type":"Town","population":120000,"coordinates":{"lat":5.5833,"lng":-0.1000}},
-            {"id":"GR-08-T02","name":"Nungua","district_id":"GR-08","district_name":"Ledzokuku Municipal","region_id":"GR","region_name":"Greater Accra Region","type":"Town","population":65000,"coordinates":{"lat":5.6000,"lng":-0.0833}},
-            # GR-09 Krowor
-            {"id":"GR-09-T01","name":"Baatsonaa","district_id":"GR-09","district_name":"Krowor Municipal","region_id":"GR","region_name":"Greater Accra Region","type":"Suburb","population":35000,"coordinates":{"lat":5.6333,"lng":-0.0667}},
-            {"id":"GR-09-T02","name":"Spintex","district_id":"GR-09","district_name":"Krowor Municipal","region_id":"GR","region_name":"Greater Accra Region","type":"Community","population":28000,"coordinates":{"lat":5.6500,"lng":-0.0500}},
-            # GR-10 Adenta
-            {"id":"GR-10-T01","name":"Adenta","district_id":"GR-10","district_name":"Adenta Municipal","region_id":"GR","region_name":"Greater Accra Region","type":"Town","population":52000,"coordinates":{"lat":5.7000,"lng":-0.1667}},
-            {"id":"GR-10-T02","name":"Ogbojo","district_id":"GR-10","district_name":"Adenta Municipal","region_id":"GR","region_name":"Greater Accra Region","type":"Community","population":18000,"coordinates":{"lat":5.7167,"lng":-0.1667}},
-            # GR-11 La Dade Kotopon
-            {"id":"GR-11-T01","name":"La","district_id":"GR-11","district_name":"La Dade Kotopon Municipal","region_id":"GR","region_name":"Greater Accra Region","type":"Community","population":45000,"coordinates":{"lat":5.5783,"lng":-0.1450}},
-            # GR-12 Okaikwei North
-            {"id":"GR-12-T01","name":"Tesano","district_id":"GR-12","district_name":"Okaikwei North Municipal","region_id":"GR","region_name":"Greater Accra Region","type":"Suburb","population":40000,"coordinates":{"lat":5.6167,"lng":-0.2167}},
-            {"id":"GR-12-T02","name":"Mamprobi","district_id":"GR-12","district_name":"Okaikwei North Municipal","region_id":"GR","region_name":"Greater Accra Region","type":"Community","population":35000,"coordinates":{"lat":5.5500,"lng":-0.2333}},
-            {"id":"GR-12-T03","name":"Bubuashie","district_id":"GR-12","district_name":"Okaikwei North Municipal","region_id":"GR","region_name":"Greater Accra Region","type":"Community","population":28000,"coordinates":{"lat":5.5667,"lng":-0.2333}},
-            # GR-13 Ablekuma North
-            {"id":"GR-13-T01","name":"Darkuman","district_id":"GR-13","district_name":"Ablekuma North Municipal","region_id":"GR","region_name":"Greater Accra Region","type":"Community","population":55000,"coordinates":{"lat":5.5833,"lng":-0.2500}},
-            {"id":"GR-13-T02","name":"Abeka","district_id":"GR-13","district_name":"Ablekuma North Municipal","region_id":"GR","region_name":"Greater Accra Region","type":"Community","population":48000,"coordinates":{"lat":5.5833,"lng":-0.2333}},
-            {"id":"GR-13-T03","name":"Kwashieman","district_id":"GR-13","district_name":"Ablekuma North Municipal","region_id":"GR","region_name":"Greater Accra Region","type":"Community","population":38000,"coordinates":{"lat":5.5833,"lng":-0.2667}},
-            # GR-14 Ablekuma Central
-            {"id":"GR-14-T01","name":"Anyaa","district_id":"GR-14","district_name":"Ablekuma Central Municipal","region_id":"GR","region_name":"Greater Accra Region","type":"Community","population":65000,"coordinates":{"lat":5.5667,"lng":-0.2667}},
-            {"id":"GR-14-T02","name":"Mallam","district_id":"GR-14","district_name":"Ablekuma Central Municipal","region_id":"GR","region_name":"Greater Accra Region","type":"Community","population":45000,"coordinates":{"lat":5.5500,"lng":-0.2833}},
-            {"id":"GR-14-T03","name":"Sowutuom","district_id":"GR-14","district_name":"Ablekuma Central Municipal","region_id":"GR","region_name":"Greater Accra Region","type":"Community","population":40000,"coordinates":{"lat":5.5833,"lng":-0.2667}},
-            {"id":"GR-14-T04","name":"Tantra Hill","district_id":"GR-14","district_name":"Ablekuma Central Municipal","region_id":"GR","region_name":"Greater Accra Region","type":"Suburb","population":22000,"coordinates":{"lat":5.5833,"lng":-0.2833}},
-            # GR-15 Ablekuma West
-            {"id":"GR-15-T01","name":"Dansoman","district_id":"GR-15","district_name":"Ablekuma West Municipal","region_id":"GR","region_name":"Greater Accra Region","type":"Community","population":85000,"coordinates":{"lat":5.5500,"lng":-0.2833}},
-            {"id":"GR-15-T02","name":"Kaneshie","district_id":"GR-15","district_name":"Ablekuma West Municipal","region_id":"GR","region_name":"Greater Accra Region","type":"Community","population":45000,"coordinates":{"lat":5.5667,"lng":-0.2333}},
-            {"id":"GR-15-T03","name":"Gbawe","district_id":"GR-15","district_name":"Ablekuma West Municipal","region_id":"GR","region_name":"Greater Accra Region","type":"Community","population":35000,"coordinates":{"lat":5.5500,"lng":-0.3000}},
-            # GR-16 Ayawaso East
-            {"id":"GR-16-T01","name":"Nima","district_id":"GR-16","district_name":"Ayawaso East Municipal","region_id":"GR","region_name":"Greater Accra Region","type":"Community","population":65000,"coordinates":{"lat":5.5833,"lng":-0.2000}},
-            {"id":"GR-16-T02","name":"Maamobi","district_id":"GR-16","district_name":"Ayawaso East Municipal","region_id":"GR","region_name":"Greater Accra Region","type":"Community","population":42000,"coordinates":{"lat":5.5833,"lng":-0.1833}},
-            # GR-17 Ayawaso North
-            {"id":"GR-17-T01","name":"Dzorwulu","district_id":"GR-17","district_name":"Ayawaso North Municipal","region_id":"GR","region_name":"Greater Accra Region","type":"Suburb","population":25000,"coordinates":{"lat":5.6000,"lng":-0.2167}},
-            {"id":"GR-17-T02","name":"Abelemkpe","district_id":"GR-17","district_name":"Ayawaso North Municipal","region_id":"GR","region_name":"Greater Accra Region","type":"Suburb","population":20000,"coordinates":{"lat":5.5833,"lng":-0.2167}},
-            # GR-18 Ayawaso Central
-            {"id":"GR-18-T01","name":"Kokomlemle","district_id":"GR-18","district_name":"Ayawaso Central Municipal","region_id":"GR","region_name":"Greater Accra Region","type":"Community","population":40000,"coordinates":{"lat":5.5833,"lng":-0.2167}},
-            # GR-19 Ayawaso West
-            {"id":"GR-19-T01","name":"East Legon","district_id":"GR-19","district_name":"Ayawaso West Municipal","region_id":"GR","region_name":"Greater Accra Region","type":"Suburb","population":32000,"coordinates":{"lat":5.6500,"lng":-0.1667}},
-            {"id":"GR-19-T02","name":"Legon","district_id":"GR-19","district_name":"Ayawaso West Municipal","region_id":"GR","region_name":"Greater Accra Region","type":"Community","population":22000,"coordinates":{"lat":5.6500,"lng":-0.1833}},
-            # GR-20 Ga Central
-            {"id":"GR-20-T01","name":"Sowutuom","district_id":"GR-20","district_name":"Ga Central Municipal","region_id":"GR","region_name":"Greater Accra Region","type":"Community","population":35000,"coordinates":{"lat":5.5833,"lng":-0.2667}},
-            # GR-21 Ga North
-            {"id":"GR-21-T01","name":"Ofankor","district_id":"GR-21","district_name":"Ga North Municipal","region_id":"GR","region_name":"Greater Accra Region","type":"Town","population":30000,"coordinates":{"lat":5.7333,"lng":-0.2333}},
-            {"id":"GR-21-T02","name":"Accra Hills","district_id":"GR-21","district_name":"Ga North Municipal","region_id":"GR","region_name":"Greater Accra Region","type":"Community","population":18000,"coordinates":{"lat":5.7500,"lng":-0.2167}},
-            # GR-22 Weija Gbawe
-            {"id":"GR-22-T01","name":"Weija","district_id":"GR-22","district_name":"Weija Gbawe Municipal","region_id":"GR","region_name":"Greater Accra Region","type":"Town","population":55000,"coordinates":{"lat":5.5500,"lng":-0.3333}},
-            {"id":"GR-22-T02","name":"Gbawe","district_id":"GR-22","district_name":"Weija Gbawe Municipal","region_id":"GR","region_name":"Greater Accra Region","type":"Town","population":35000,"coordinates":{"lat":5.5333,"lng":-0.3167}},
-            {"id":"GR-22-T03","name":"Tetegu","district_id":"GR-22","district_name":"Weija Gbawe Municipal","region_id":"GR","region_name":"Greater Accra Region","type":"Community","population":12000,"coordinates":{"lat":5.5000,"lng":-0.3833}},
-            # GR-23 Kpone Katamanso
-            {"id":"GR-23-T01","name":"Kpone","district_id":"GR-23","district_name":"Kpone Katamanso Municipal","region_id":"GR","region_name":"Greater Accra Region","type":"Town","population":45000,"coordinates":{"lat":5.7000,"lng":0.0500}},
-            {"id":"GR-23-T02","name":"Dawhenya","district_id":"GR-23","district_name":"Kpone Katamanso Municipal","region_id":"GR","region_name":"Greater Accra Region","type":"Community","population":20000,"coordinates":{"lat":5.7333,"lng":0.0833}},
-            # GR-24 Ningo Prampram
-            {"id":"GR-24-T01","name":"Prampram","district_id":"GR-24","district_name":"Ningo Prampram District","region_id":"GR","region_name":"Greater Accra Region","type":"Town","population":38000,"coordinates":{"lat":5.7167,"lng":0.1000}},
-            {"id":"GR-24-T02","name":"Ningo","district_id":"GR-24","district_name":"Ningo Prampram District","region_id":"GR","region_name":"Greater Accra Region","type":"Town","population":22000,"coordinates":{"lat":5.7500,"lng":0.1500}},
-            {"id":"GR-24-T03","name":"Afienya","district_id":"GR-24","district_name":"Ningo Prampram District","region_id":"GR","region_name":"Greater Accra Region","type":"Town","population":18000,"coordinates":{"lat":5.7667,"lng":0.0667}},
-            # GR-25 Shai Osudoku
-            {"id":"GR-25-T01","name":"Dodowa","district_id":"GR-25","district_name":"Shai Osudoku District","region_id":"GR","region_name":"Greater Accra Region","type":"Town","population":28000,"coordinates":{"lat":5.8833,"lng":-0.0833}},
-            {"id":"GR-25-T02","name":"Akuse","district_id":"GR-25","district_name":"Shai Osudoku District","region_id":"GR","region_name":"Greater Accra Region","type":"Town","population":12000,"coordinates":{"lat":6.1167,"lng":0.1000}},
-            # GR-26 Ada East
-            {"id":"GR-26-T01","name":"Ada Foah","district_id":"GR-26","district_name":"Ada East District","region_id":"GR","region_name":"Greater Accra Region","type":"Town","population":15000,"coordinates":{"lat":5.7833,"lng":0.6333}},
-            {"id":"GR-26-T02","name":"Kasseh","district_id":"GR-26","district_name":"Ada East District","region_id":"GR","region_name":"Greater Accra Region","type":"Town","population":10000,"coordinates":{"lat":5.8500,"lng":0.5667}},
-            # GR-27 Ada West
-            {"id":"GR-27-T01","name":"Sege","district_id":"GR-27","district_name":"Ada West District","region_id":"GR","region_name":"Greater Accra Region","type":"Town","population":12000,"coordinates":{"lat":5.9333,"lng":0.4167}},
-            {"id":"GR-27-T02","name":"Mepe","district_id":"GR-27","district_name":"Ada West District","region_id":"GR","region_name":"Greater Accra Region","type":"Village","population":6000,"coordinates":{"lat":6.0000,"lng":0.4667}},
-            # GR-28 Asuogyaman
-            {"id":"GR-28-T01","name":"Akosombo","district_id":"GR-28","district_name":"Asuogyaman District","region_id":"GR","region_name":"Greater Accra Region","type":"Town","population":22000,"coordinates":{"lat":6.3000,"lng":0.0833}},
-            {"id":"GR-28-T02","name":"Atimpoku","district_id":"GR-28","district_name":"Asuogyaman District","region_id":"GR","region_name":"Greater Accra Region","type":"Town","population":8000,"coordinates":{"lat":6.2167,"lng":0.1167}},
-            {"id":"GR-28-T03","name":"Kpong","district_id":"GR-28","district_name":"Asuogyaman District","region_id":"GR","region_name":"Greater Accra Region","type":"Town","population":12000,"coordinates":{"lat":6.1500,"lng":0.0833}},
-            {"id":"GR-28-T04","name":"Senchi","district_id":"GR-28","district_name":"Asuogyaman District","region_id":"GR","region_name":"Greater Accra Region","type":"Village","population":5000,"coordinates":{"lat":6.2667,"lng":0.1000}},
-            # GR-29 South Tongu
-            {"id":"GR-29-T01","name":"Sogakope","district_id":"GR-29","district_name":"South Tongu District","region_id":"GR","region_name":"Greater Accra Region","type":"Town","population":18000,"coordinates":{"lat":6.0333,"lng":0.5833}},
 
-            # ====== ASHANTI REGION ======
-            # AS-01 Kumasi Metropolitan
-            {"id":"AS-01-T01","name":"Adum","district_id":"AS-01","district_name":"Kumasi Metropolitan","region_id":"AS","region_name":"Ashanti Region","type":"Community","population":55000,"coordinates":{"lat":6.6885,"lng":-1.6244}},
-            {"id":"AS-01-T02","name":"Asafo","district_id":"AS-01","district_name":"Kumasi Metropolitan","region_id":"AS","region_name":"Ashanti Region","type":"Community","population":45000,"coordinates":{"lat":6.7000,"lng":-1.6167}},
-            {"id":"AS-01-T03","name":"Dichemso","district_id":"AS-01","district_name":"Kumasi Metropolitan","region_id":"AS","region_name":"Ashanti Region","type":"Community","population":38000,"coordinates":{"lat":6.6833,"lng":-1.6167}},
-            {"id":"AS-01-T04","name":"Ahodwo","district_id":"AS-01","district_name":"Kumasi Metropolitan","region_id":"AS","region_name":"Ashanti Region","type":"Suburb","population":22000,"coordinates":{"lat":6.6750,"lng":-1.6333}},
-            {"id":"AS-01-T05","name":"Ayigya","district_id":"AS-01","district_name":"Kumasi Metropolitan","region_id":"AS","region_name":"Ashanti Region","type":"Community","population":28000,"coordinates":{"lat":6.6833,"lng":-1.5667}},
-            {"id":"AS-01-T06","name":"Bomso","district_id":"AS-01","district_name":"Kumasi Metropolitan","region_id":"AS","region_name":"Ashanti Region","type":"Community","population":18000,"coordinates":{"lat":6.6833,"lng":-1.5833}},
-            {"id":"AS-01-T07","name":"Kaase","district_id":"AS-01","district_name":"Kumasi Metropolitan","region_id":"AS","region_name":"Ashanti Region","type":"Community","population":30000,"coordinates":{"lat":6.6667,"lng":-1.5833}},
-            {"id":"AS-01-T08","name":"Kronom","district_id":"AS-01","district_name":"Kumasi Metropolitan","region_id":"AS","region_name":"Ashanti Region","type":"Community","population":25000,"coordinates":{"lat":6.6500,"lng":-1.6000}},
-            {"id":"AS-01-T09","name":"Kentinkrono","district_id":"AS-01","district_name":"Kumasi Metropolitan","region_id":"AS","region_name":"Ashanti Region","type":"Community","population":20000,"coordinates":{"lat":6.6500,"lng":-1.6500}},
-            {"id":"AS-01-T10","name":"Oforikrom","district_id":"AS-01","district_name":"Kumasi Metropolitan","region_id":"AS","region_name":"Ashanti Region","type":"Community","population":55000,"coordinates":{"lat":6.6833,"lng":-1.6000}},
-            # AS-02 Obuasi
-            {"id":"AS-02-T01","name":"Obuasi","district_id":"AS-02","district_name":"Obuasi Municipal","region_id":"AS","region_name":"Ashanti Region","type":"Town","population":95000,"coordinates":{"lat":6.2028,"lng":-1.6703}},
-            {"id":"AS-02-T02","name":"Sanso","district_id":"AS-02","district_name":"Obuasi Municipal","region_id":"AS","region_name":"Ashanti Region","type":"Community","population":12000,"coordinates":{"lat":6.2167,"lng":-1.6500}},
-            {"id":"AS-02-T03","name":"Tutuka","district_id":"AS-02","district_name":"Obuasi Municipal","region_id":"AS","region_name":"Ashanti Region","type":"Community","population":8000,"coordinates":{"lat":6.1833,"lng":-1.6833}},
-            # AS-03 Ejisu
-            {"id":"AS-03-T01","name":"Ejisu","district_id":"AS-03","district_name":"Ejisu Municipal","region_id":"AS","region_name":"Ashanti Region","type":"Town","population":45000,"coordinates":{"lat":6.3333,"lng":-1.3667}},
-            {"id":"AS-03-T02","name":"Besease","district_id":"AS-03","district_name":"Ejisu Municipal","region_id":"AS","region_name":"Ashanti Region","type":"Village","population":8000,"coordinates":{"lat":6.3500,"lng":-1.3500}},
-            {"id":"AS-03-T03","name":"Bonwire","district_id":"AS-03","district_name":"Ejisu Municipal","region_id":"AS","region_name":"Ashanti Region","type":"Town","population":12000,"coordinates":{"lat":6.4500,"lng":-1.4167}},
-            # AS-04 Asante Akim North
-            {"id":"AS-04-T01","name":"Agogo","district_id":"AS-04","district_name":"Asante Akim North Municipal","region_id":"AS","region_name":"Ashanti Region","type":"Town","population":42000,"coordinates":{"lat":6.8000,"lng":-1.0833}},
-            {"id":"AS-04-T02","name":"Hwidiem","district_id":"AS-04","district_name":"Asante Akim North Municipal","region_id":"AS","region_name":"Ashanti Region","type":"Town","population":12000,"coordinates":{"lat":6.7833,"lng":-1.0667}},
-            # AS-05 Bekwai
-            {"id":"AS-05-T01","name":"Bekwai","district_id":"AS-05","district_name":"Bekwai Municipal","region_id":"AS","region_name":"Ashanti Region","type":"Town","population":38000,"coordinates":{"lat":6.4500,"lng":-1.5833}},
-            {"id":"AS-05-T02","name":"Antoakyire","district_id":"AS-05","district_name":"Bekwai Municipal","region_id":"AS","region_name":"Ashanti Region","type":"Village","population":5000,"coordinates":{"lat":6.4167,"lng":-1.6000}},
-            # AS-08 Suame
-            {"id":"AS-08-T01","name":"Suame","district_id":"AS-08","district_name":"Suame Municipal","region_id":"AS","region_name":"Ashanti Region","type":"Community","population":75000,"coordinates":{"lat":6.7000,"lng":-1.6167}},
-            # AS-13 Bantama
-            {"id":"AS-13-T01","name":"Bantama","district_id":"AS-13","district_name":"Bantama Municipal","region_id":"AS","region_name":"Ashanti Region","type":"Community","population":65000,"coordinates":{"lat":6.7000,"lng":-1.6333}},
-            {"id":"AS-13-T02","name":"Ahenema Kokoben","district_id":"AS-13","district_name":"Bantama Municipal","region_id":"AS","region_name":"Ashanti Region","type":"Community","population":25000,"coordinates":{"lat":6.7167,"lng":-1.6500}},
-            # AS-14 Juaben
-            {"id":"AS-14-T01","name":"Juaben","district_id":"AS-14","district_name":"Juaben Municipal","region_id":"AS","region_name":"Ashanti Region","type":"Town","population":28000,"coordinates":{"lat":6.5667,"lng":-1.3333}},
-            # AS-16 Konongo
-            {"id":"AS-16-T01","name":"Konongo","district_id":"AS-16","district_name":"Konongo-Odumase Municipal","region_id":"AS","region_name":"Ashanti Region","type":"Town","population":38000,"coordinates":{"lat":6.6167,"lng":-1.2167}},
-            {"id":"AS-16-T02","name":"Odumase","district_id":"AS-16","district_name":"Konongo-Odumase Municipal","region_id":"AS","region_name":"Ashanti Region","type":"Town","population":18000,"coordinates":{"lat":6.6333,"lng":-1.2000}},
-            # AS-18 Atwima Nwabiagya
-            {"id":"AS-18-T01","name":"Nkawie","district_id":"AS-18","district_name":"Atwima Nwabiagya Municipal","region_id":"AS","region_name":"Ashanti Region","type":"Town","population":35000,"coordinates":{"lat":6.5500,"lng":-1.8000}},
-            {"id":"AS-18-T02","name":"Toase","district_id":"AS-18","district_name":"Atwima Nwabiagya Municipal","region_id":"AS","region_name":"Ashanti Region","type":"Village","population":5000,"coordinates":{"lat":6.5333,"lng":-1.8167}},
-            # AS-24 Ahafo Ano North
-            {"id":"AS-24-T01","name":"Tepa","district_id":"AS-24","district_name":"Ahafo Ano North Municipal District","region_id":"AS","region_name":"Ashanti Region","type":"Town","population":28000,"coordinates":{"lat":6.9167,"lng":-2.2000}},
-            # AS-33 Ejura
-            {"id":"AS-33-T01","name":"Ejura","district_id":"AS-33","district_name":"Ejura Sekyedumase Municipal District","region_id":"AS","region_name":"Ashanti Region","type":"Town","population":42000,"coordinates":{"lat":7.3833,"lng":-1.3667}},
-            {"id":"AS-33-T02","name":"Sekyedumase","district_id":"AS-33","district_name":"Ejura Sekyedumase Municipal District","region_id":"AS","region_name":"Ashanti Region","type":"Village","population":6000,"coordinates":{"lat":7.3500,"lng":-1.4000}},
-            # AS-34 Mampong
-            {"id":"AS-34-T01","name":"Mampong","district_id":"AS-34","district_name":"Mampong Municipal District","region_id":"AS","region_name":"Ashanti Region","type":"Town","population":35000,"coordinates":{"lat":7.0667,"lng":-1.4000}},
-            {"id":"AS-34-T02","name":"Nyameso","district_id":"AS-34","district_name":"Mampong Municipal District","region_id":"AS","region_name":"Ashanti Region","type":"Village","population":4000,"coordinates":{"lat":7.1000,"lng":-1.3667}},
-            # AS-35 Offinso
-            {"id":"AS-35-T01","name":"Offinso","district_id":"AS-35","district_name":"Offinso Municipal District","region_id":"AS","region_name":"Ashanti Region","type":"Town","population":25000,"coordinates":{"lat":7.0333,"lng":-1.7667}},
-            # AS-39 Sekyere East
-            {"id":"AS-39-T01","name":"Effiduase","district_id":"AS-39","district_name":"Sekyere East District","region_id":"AS","region_name":"Ashanti Region","type":"Town","population":22000,"coordinates":{"lat":6.9333,"lng":-1.2500}},
-            # AS-40 Sekyere Kumawu
-            {"id":"AS-40-T01","name":"Kumawu","district_id":"AS-40","district_name":"Sekyere Kumawu District","region_id":"AS","region_name":"Ashanti Region","type":"Town","population":18000,"coordinates":{"lat":6.9667,"lng":-1.1333}},
+def _float(value):
+    return float(value) if value else None
 
-            # ====== WESTERN REGION ======
-            # WR-01 Sekondi-Takoradi
-            {"id":"WR-01-T01","name":"Sekondi","district_id":"WR-01","district_name":"Sekondi-Takoradi Metropolitan","region_id":"WR","region_name":"Western Region","type":"Town","population":145000,"coordinates":{"lat":4.9340,"lng":-1.7040}},
-            {"id":"WR-01-T02","name":"Takoradi","district_id":"WR-01","district_name":"Sekondi-Takoradi Metropolitan","region_id":"WR","region_name":"Western Region","type":"City","population":220000,"coordinates":{"lat":4.8853,"lng":-1.7553}},
-            {"id":"WR-01-T03","name":"Effia","district_id":"WR-01","district_name":"Sekondi-Takoradi Metropolitan","region_id":"WR","region_name":"Western Region","type":"Suburb","population":35000,"coordinates":{"lat":4.9000,"lng":-1.7833}},
-            {"id":"WR-01-T04","name":"Kojokrom","district_id":"WR-01","district_name":"Sekondi-Takoradi Metropolitan","region_id":"WR","region_name":"Western Region","type":"Suburb","population":28000,"coordinates":{"lat":4.9000,"lng":-1.7667}},
-            {"id":"WR-01-T05","name":"Kwesimintsim","district_id":"WR-01","district_name":"Sekondi-Takoradi Metropolitan","region_id":"WR","region_name":"Western Region","type":"Suburb","population":30000,"coordinates":{"lat":4.9167,"lng":-1.7833}},
-            # WR-02 Tarkwa-Nsuaem
-            {"id":"WR-02-T01","name":"Tarkwa","district_id":"WR-02","district_name":"Tarkwa-Nsuaem Municipal","region_id":"WR","region_name":"Western Region","type":"Town","population":55000,"coordinates":{"lat":5.2897,"lng":-1.9939}},
-            {"id":"WR-02-T02","name":"Bogoso","district_id":"WR-02","district_name":"Tarkwa-Nsuaem Municipal","region_id":"WR","region_name":"Western Region","type":"Town","population":25000,"coordinates":{"lat":5.5167,"lng":-2.0667}},
-            {"id":"WR-02-T03","name":"Nsuaem","district_id":"WR-02","district_name":"Tarkwa-Nsuaem Municipal","region_id":"WR","region_name":"Western Region","type":"Village","population":6000,"coordinates":{"lat":5.3167,"lng":-2.0167}},
-            # WR-03 Prestea
-            {"id":"WR-03-T01","name":"Prestea","district_id":"WR-03","district_name":"Prestea Huni Valley Municipal","region_id":"WR","region_name":"Western Region","type":"Town","population":32000,"coordinates":{"lat":5.4333,"lng":-2.1333}},
-            {"id":"WR-03-T02","name":"Huni Valley","district_id":"WR-03","district_name":"Prestea Huni Valley Municipal","region_id":"WR","region_name":"Western Region","type":"Town","population":12000,"coordinates":{"lat":5.5500,"lng":-2.0167}},
-            # WR-04 Shama
-            {"id":"WR-04-T01","name":"Shama","district_id":"WR-04","district_name":"Shama District","region_id":"WR","region_name":"Western Region","type":"Town","population":25000,"coordinates":{"lat":5.0167,"lng":-1.6667}},
-            # WR-05 Ahanta West
-            {"id":"WR-05-T01","name":"Agona","district_id":"WR-05","district_name":"Ahanta West District","region_id":"WR","region_name":"Western Region","type":"Town","population":18000,"coordinates":{"lat":4.8667,"lng":-1.8833}},
-            {"id":"WR-05-T02","name":"Dixcove","district_id":"WR-05","district_name":"Ahanta West District","region_id":"WR","region_name":"Western Region","type":"Town","population":8000,"coordinates":{"lat":4.8167,"lng":-1.9833}},
-            # WR-06 Nzema East
-            {"id":"WR-06-T01","name":"Axim","district_id":"WR-06","district_name":"Nzema East Municipal","region_id":"WR","region_name":"Western Region","type":"Town","population":22000,"coordinates":{"lat":4.8667,"lng":-2.2333}},
-            # WR-07 Ellembelle
-            {"id":"WR-07-T01","name":"Nkroful","district_id":"WR-07","district_name":"Ellembelle District","region_id":"WR","region_name":"Western Region","type":"Town","population":12000,"coordinates":{"lat":4.9833,"lng":-2.3000}},
-            # WR-08 Jomoro
-            {"id":"WR-08-T01","name":"Half Assini","district_id":"WR-08","district_name":"Jomoro District","region_id":"WR","region_name":"Western Region","type":"Town","population":18000,"coordinates":{"lat":4.8333,"lng":-2.6167}},
-            # WR-10 Wassa Amenfi East
-            {"id":"WR-10-T01","name":"Wassa Akropong","district_id":"WR-10","district_name":"Wassa Amenfi East Municipal","region_id":"WR","region_name":"Western Region","type":"Town","population":15000,"coordinates":{"lat":5.5833,"lng":-2.0833}},
-            # WR-11 Wassa Amenfi West
-            {"id":"WR-11-T01","name":"Asankrangwa","district_id":"WR-11","district_name":"Wassa Amenfi West Municipal","region_id":"WR","region_name":"Western Region","type":"Town","population":18000,"coordinates":{"lat":5.4667,"lng":-2.3000}},
-            # WR-13 Aowin
-            {"id":"WR-13-T01","name":"Enchi","district_id":"WR-13","district_name":"Aowin Municipal","region_id":"WR","region_name":"Western Region","type":"Town","population":22000,"coordinates":{"lat":6.1000,"lng":-2.7833}},
-            # WR-15 Bibiani
-            {"id":"WR-15-T01","name":"Bibiani","district_id":"WR-15","district_name":"Bibiani Anhwiaso Bekwai Municipal","region_id":"WR","region_name":"Western Region","type":"Town","population":42000,"coordinates":{"lat":6.4667,"lng":-2.3167}},
 
-            # ====== CENTRAL REGION ======
-            # CR-01 Cape Coast
-            {"id":"CR-01-T01","name":"Cape Coast","district_id":"CR-01","district_name":"Cape Coast Metropolitan","region_id":"CR","region_name":"Central Region","type":"City","population":169894,"coordinates":{"lat":5.1312,"lng":-1.2814}},
-            {"id":"CR-01-T02","name":"Pedu","district_id":"CR-01","district_name":"Cape Coast Metropolitan","region_id":"CR","region_name":"Central Region","type":"Suburb","population":18000,"coordinates":{"lat":5.1500,"lng":-1.2667}},
-            {"id":"CR-01-T03","name":"Abura","district_id":"CR-01","district_name":"Cape Coast Metropolitan","region_id":"CR","region_name":"Central Region","type":"Suburb","population":22000,"coordinates":{"lat":5.1167,"lng":-1.2667}},
-            # CR-02 Komenda Edina Eguafo Abirem
-            {"id":"CR-02-T01","name":"Elmina","district_id":"CR-02","district_name":"Komenda Edina Eguafo Abirem Municipal","region_id":"CR","region_name":"Central Region","type":"Town","population":35000,"coordinates":{"lat":5.0833,"lng":-1.3500}},
-            {"id":"CR-02-T02","name":"Komenda","district_id":"CR-02","district_name":"Komenda Edina Eguafo Abirem Municipal","region_id":"CR","region_name":"Central Region","type":"Town","population":15000,"coordinates":{"lat":5.0667,"lng":-1.4667}},
-            # CR-06 Agona West
-            {"id":"CR-06-T01","name":"Agona Swedru","district_id":"CR-06","district_name":"Agona West Municipal","region_id":"CR","region_name":"Central Region","type":"Town","population":82000,"coordinates":{"lat":5.4667,"lng":-0.6833}},
-            {"id":"CR-06-T02","name":"Agona Nkum","district_id":"CR-06","district_name":"Agona West Municipal","region_id":"CR","region_name":"Central Region","type":"Village","population":8000,"coordinates":{"lat":5.5000,"lng":-0.7167}},
-            # CR-07 Agona East
-            {"id":"CR-07-T01","name":"Nsaba","district_id":"CR-07","district_name":"Agona East District","region_id":"CR","region_name":"Central Region","type":"Town","population":18000,"coordinates":{"lat":5.4500,"lng":-0.9167}},
-            # CR-08 Awutu Senya East
-            {"id":"CR-08-T01","name":"Kasoa","district_id":"CR-08","district_name":"Awutu Senya East Municipal","region_id":"CR","region_name":"Central Region","type":"Town","population":200000,"coordinates":{"lat":5.5333,"lng":-0.4167}},
-            {"id":"CR-08-T02","name":"New Amikope","district_id":"CR-08","district_name":"Awutu Senya East Municipal","region_id":"CR","region_name":"Central Region","type":"Community","population":15000,"coordinates":{"lat":5.5167,"lng":-0.4333}},
-            # CR-10 Effutu
-            {"id":"CR-10-T01","name":"Winneba","district_id":"CR-10","district_name":"Effutu Municipal","region_id":"CR","region_name":"Central Region","type":"Town","population":48000,"coordinates":{"lat":5.3500,"lng":-0.6167}},
-            # CR-13 Gomoa West
-            {"id":"CR-13-T01","name":"Apam","district_id":"CR-13","district_name":"Gomoa West District","region_id":"CR","region_name":"Central Region","type":"Town","population":22000,"coordinates":{"lat":5.2833,"lng":-0.7667}},
-            # CR-17 Mfantsiman
-            {"id":"CR-17-T01","name":"Saltpond","district_id":"CR-17","district_name":"Mfantsiman Municipal","region_id":"CR","region_name":"Central Region","type":"Town","population":32000,"coordinates":{"lat":5.2000,"lng":-1.0833}},
-            {"id":"CR-17-T02","name":"Mankessim","district_id":"CR-17","district_name":"Mfantsiman Municipal","region_id":"CR","region_name":"Central Region","type":"Town","population":25000,"coordinates":{"lat":5.2667,"lng":-1.0167}},
-            # CR-21 Upper Denkyira East
-            {"id":"CR-21-T01","name":"Dunkwa-on-Offin","district_id":"CR-21","district_name":"Upper Denkyira East Municipal","region_id":"CR","region_name":"Central Region","type":"Town","population":35000,"coordinates":{"lat":5.9667,"lng":-1.7667}},
-            # CR-03 Assin North
-            {"id":"CR-03-T01","name":"Assin Bereku","district_id":"CR-03","district_name":"Assin North Municipal","region_id":"CR","region_name":"Central Region","type":"Town","population":22000,"coordinates":{"lat":5.6167,"lng":-1.2333}},
-            # CR-04 Assin Central
-            {"id":"CR-04-T01","name":"Assin Foso","district_id":"CR-04","district_name":"Assin Central Municipal","region_id":"CR","region_name":"Central Region","type":"Town","population":28000,"coordinates":{"lat":5.5167,"lng":-1.2833}},
+def _lat_lng(row):
+    if not row["lat"] or not row["lng"]:
+        return None, None
+    return float(row["lat"]), float(row["lng"])
 
-            # ====== EASTERN REGION ======
-            # ER-01 New-Juaben
-            {"id":"ER-01-T01","name":"Koforidua","district_id":"ER-01","district_name":"New-Juaben Municipal","region_id":"ER","region_name":"Eastern Region","type":"City","population":120000,"coordinates":{"lat":6.0891,"lng":-0.2570}},
-            {"id":"ER-01-T02","name":"Effiduase-Koforidua","district_id":"ER-01","district_name":"New-Juaben Municipal","region_id":"ER","region_name":"Eastern Region","type":"Suburb","population":25000,"coordinates":{"lat":6.1000,"lng":-0.2667}},
-            # ER-03 West Akim
-            {"id":"ER-03-T01","name":"Asamankese","district_id":"ER-03","district_name":"West Akim Municipal","region_id":"ER","region_name":"Eastern Region","type":"Town","population":48000,"coordinates":{"lat":5.8667,"lng":-0.6667}},
-            # ER-05 Birim Central
-            {"id":"ER-05-T01","name":"Akim Oda","district_id":"ER-05","district_name":"Birim Central Municipal","region_id":"ER","region_name":"Eastern Region","type":"Town","population":55000,"coordinates":{"lat":5.9333,"lng":-0.9833}},
-            # ER-09 Suhum
-            {"id":"ER-09-T01","name":"Suhum","district_id":"ER-09","district_name":"Suhum Municipal","region_id":"ER","region_name":"Eastern Region","type":"Town","population":38000,"coordinates":{"lat":6.0400,"lng":-0.4500}},
-            # ER-10 Nsawam-Adoagyire
-            {"id":"ER-10-T01","name":"Nsawam","district_id":"ER-10","district_name":"Nsawam-Adoagyire Municipal","region_id":"ER","region_name":"Eastern Region","type":"Town","population":45000,"coordinates":{"lat":5.8167,"lng":-0.3500}},
-            # ER-11 Akuapim North
-            {"id":"ER-11-T01","name":"Akropong","district_id":"ER-11","district_name":"Akuapim North Municipal","region_id":"ER","region_name":"Eastern Region","type":"Town","population":25000,"coordinates":{"lat":5.9500,"lng":-0.2833}},
-            {"id":"ER-11-T02","name":"Mamfe","district_id":"ER-11","district_name":"Akuapim North Municipal","region_id":"ER","region_name":"Eastern Region","type":"Town","population":15000,"coordinates":{"lat":5.9167,"lng":-0.2667}},
-            {"id":"ER-11-T03","name":"Aburi","district_id":"ER-11","district_name":"Akuapim North Municipal","region_id":"ER","region_name":"Eastern Region","type":"Town","population":20000,"coordinates":{"lat":5.8500,"lng":-0.1833}},
-            # ER-14 Yilo Krobo
-            {"id":"ER-14-T01","name":"Somanya","district_id":"ER-14","district_name":"Yilo Krobo Municipal","region_id":"ER","region_name":"Eastern Region","type":"Town","population":35000,"coordinates":{"lat":6.1000,"lng":0.0167}},
-            # ER-15 Lower Manya Krobo
-            {"id":"ER-15-T01","name":"Odumase-Krobo","district_id":"ER-15","district_name":"Lower Manya Krobo Municipal","region_id":"ER","region_name":"Eastern Region","type":"Town","population":28000,"coordinates":{"lat":6.0833,"lng":0.0667}},
-            {"id":"ER-15-T02","name":"Kpong","district_id":"ER-15","district_name":"Lower Manya Krobo Municipal","region_id":"ER","region_name":"Eastern Region","type":"Town","population":15000,"coordinates":{"lat":6.1500,"lng":0.0833}},
-            # ER-20 Kwahu West
-            {"id":"ER-20-T01","name":"Nkawkaw","district_id":"ER-20","district_name":"Kwahu West Municipal","region_id":"ER","region_name":"Eastern Region","type":"Town","population":42000,"coordinates":{"lat":6.5500,"lng":-0.7667}},
-            # ER-28 Akwatia
-            {"id":"ER-28-T01","name":"Akwatia","district_id":"ER-28","district_name":"Akwatia District","region_id":"ER","region_name":"Eastern Region","type":"Town","population":38000,"coordinates":{"lat":6.0500,"lng":-0.8000}},
-            # ER-26 Fanteakwa North
-            {"id":"ER-26-T01","name":"Begoro","district_id":"ER-26","district_name":"Fanteakwa North District","region_id":"ER","region_name":"Eastern Region","type":"Town","population":18000,"coordinates":{"lat":6.3833,"lng":-0.3833}},
-            # ER-33 New Juaben South
-            {"id":"ER-33-T01","name":"New Juaben","district_id":"ER-33","district_name":"New Juaben South Municipal","region_id":"ER","region_name":"Eastern Region","type":"Town","population":95000,"coordinates":{"lat":6.0891,"lng":-0.2570}},
 
-            # ====== VOLTA REGION ======
-            # VR-01 Ho Municipal
-            {"id":"VR-01-T01","name":"Ho","district_id":"VR-01","district_name":"Ho Municipal","region_id":"VR","region_name":"Volta Region","type":"City","population":95000,"coordinates":{"lat":6.6009,"lng":0.4702}},
-            {"id":"VR-01-T02","name":"Ho Dome","district_id":"VR-01","district_name":"Ho Municipal","region_id":"VR","region_name":"Volta Region","type":"Suburb","population":18000,"coordinates":{"lat":6.6167,"lng":0.4833}},
-            # VR-02 Keta
-            {"id":"VR-02-T01","name":"Keta","district_id":"VR-02","district_name":"Keta Municipal","region_id":"VR","region_name":"Volta Region","type":"Town","population":45000,"coordinates":{"lat":5.9167,"lng":0.9833}},
-            {"id":"VR-02-T02","name":"Anloga","district_id":"VR-02","district_name":"Keta Municipal","region_id":"VR","region_name":"Volta Region","type":"Town","population":20000,"coordinates":{"lat":5.7833,"lng":0.8967}},
-            # VR-03 Hohoe
-            {"id":"VR-03-T01","name":"Hohoe","district_id":"VR-03","district_name":"Hohoe Municipal","region_id":"VR","region_name":"Volta Region","type":"Town","population":55000,"coordinates":{"lat":7.1500,"lng":0.4667}},
-            {"id":"VR-03-T02","name":"Gbi-Wegbe","district_id":"VR-03","district_name":"Hohoe Municipal","region_id":"VR","region_name":"Volta Region","type":"Village","population":5000,"coordinates":{"lat":7.1667,"lng":0.4833}},
-            # VR-04 Kpando
-            {"id":"VR-04-T01","name":"Kpando","district_id":"VR-04","district_name":"Kpando Municipal","region_id":"VR","region_name":"Volta Region","type":"Town","population":35000,"coordinates":{"lat":6.9833,"lng":0.2833}},
-            # VR-07 Ketu North
-            {"id":"VR-07-T01","name":"Dzodze","district_id":"VR-07","district_name":"Ketu North Municipal","region_id":"VR","region_name":"Volta Region","type":"Town","population":28000,"coordinates":{"lat":6.1000,"lng":0.9667}},
-            # VR-08 Ketu South
-            {"id":"VR-08-T01","name":"Aflao","district_id":"VR-08","district_name":"Ketu South Municipal","region_id":"VR","region_name":"Volta Region","type":"Town","population":50000,"coordinates":{"lat":6.1000,"lng":1.1833}},
-            {"id":"VR-08-T02","name":"Klikor","district_id":"VR-08","district_name":"Ketu South Municipal","region_id":"VR","region_name":"Volta Region","type":"Town","population":20000,"coordinates":{"lat":5.9500,"lng":1.0833}},
-            # VR-13 South Tongu
-            {"id":"VR-13-T01","name":"Sogakope","district_id":"VR-13","district_name":"South Tongu District","region_id":"VR","region_name":"Volta Region","type":"Town","population":18000,"coordinates":{"lat":6.0333,"lng":0.5833}},
+def _coords(row):
+    if not row["lat"] or not row["lng"]:
+        return None
+    return json.dumps({"lat": float(row["lat"]), "lng": float(row["lng"])})
 
-            # ====== OTI REGION ======
-            {"id":"OTI-01-T01","name":"Jasikan","district_id":"OTI-01","district_name":"Jasikan District","region_id":"OTI","region_name":"Oti Region","type":"Town","population":25000,"coordinates":{"lat":7.5667,"lng":0.4833}},
-            {"id":"OTI-02-T01","name":"Asato","district_id":"OTI-02","district_name":"Kadjebi District","region_id":"OTI","region_name":"Oti Region","type":"Village","population":None,"coordinates":None},
-            {"id":"OTI-02-T02","name":"Mempeasem","district_id":"OTI-02","district_name":"Kadjebi District","region_id":"OTI","region_name":"Oti Region","type":"Village","population":None,"coordinates":None},
-            {"id":"OTI-03-T01","name":"Dambai","district_id":"OTI-03","district_name":"Krachi East Municipal","region_id":"OTI","region_name":"Oti Region","type":"Town","population":28000,"coordinates":{"lat":8.1000,"lng":0.1833}},
-            {"id":"OTI-05-T01","name":"Kete Krachi","district_id":"OTI-05","district_name":"Krachi West District","region_id":"OTI","region_name":"Oti Region","type":"Town","population":20000,"coordinates":{"lat":7.7833,"lng":-0.0500}},
-            {"id":"OTI-08-T01","name":"Nkwanta","district_id":"OTI-08","district_name":"Nkwanta South Municipal","region_id":"OTI","region_name":"Oti Region","type":"Town","population":22000,"coordinates":{"lat":8.2833,"lng":0.5167}},
 
-            # ====== BONO REGION ======
-            {"id":"BR-01-T01","name":"Sunyani","district_id":"BR-01","district_name":"Sunyani Municipal","region_id":"BR","region_name":"Bono Region","type":"City","population":85000,"coordinates":{"lat":7.3397,"lng":-2.3259}},
-            {"id":"BR-01-T02","name":"Sunyani West","district_id":"BR-01","district_name":"Sunyani Municipal","region_id":"BR","region_name":"Bono Region","type":"Suburb","population":20000,"coordinates":{"lat":7.3333,"lng":-2.3500}},
-            {"id":"BR-02-T01","name":"Berekum","district_id":"BR-02","district_name":"Berekum Municipal","region_id":"BR","region_name":"Bono Region","type":"Town","population":55000,"coordinates":{"lat":7.4667,"lng":-2.5833}},
-            {"id":"BR-04-T01","name":"Wenchi","district_id":"BR-04","district_name":"Wenchi Municipal","region_id":"BR","region_name":"Bono Region","type":"Town","population":35000,"coordinates":{"lat":7.7333,"lng":-2.1000}},
-            {"id":"BR-05-T01","name":"Dormaa Ahenkro","district_id":"BR-05","district_name":"Dormaa Central Municipal","region_id":"BR","region_name":"Bono Region","type":"Town","population":45000,"coordinates":{"lat":7.3333,"lng":-3.0000}},
-            {"id":"BR-03-T01","name":"Nsawkaw","district_id":"BR-03","district_name":"Tain District","region_id":"BR","region_name":"Bono Region","type":"Town","population":15000,"coordinates":{"lat":7.5167,"lng":-2.2333}},
-            {"id":"BR-08-T01","name":"Sampa","district_id":"BR-08","district_name":"Jaman North District","region_id":"BR","region_name":"Bono Region","type":"Town","population":18000,"coordinates":{"lat":7.9167,"lng":-2.6833}},
-            {"id":"BR-09-T01","name":"Drobo","district_id":"BR-09","district_name":"Jaman South Municipal","region_id":"BR","region_name":"Bono Region","type":"Town","population":22000,"coordinates":{"lat":7.6833,"lng":-2.7833}},
+def load_seed():
+    """Read the seed CSVs into insert-ready tuples."""
+    regions = _read_csv("regions.csv")
+    districts = _read_csv("districts.csv")
+    towns = _read_csv("towns.csv")
 
-            # ====== BONO EAST REGION ======
-            {"id":"BE-01-T01","name":"Techiman","district_id":"BE-01","district_name":"Techiman Municipal","region_id":"BE","region_name":"Bono East Region","type":"Town","population":100000,"coordinates":{"lat":7.5886,"lng":-1.9390}},
-            {"id":"BE-02-T01","name":"Atebubu","district_id":"BE-02","district_name":"Atebubu-Amantin Municipal","region_id":"BE","region_name":"Bono East Region","type":"Town","population":35000,"coordinates":{"lat":8.1167,"lng":-1.0500}},
-            {"id":"BE-03-T01","name":"Kintampo","district_id":"BE-03","district_name":"Kintampo North Municipal","region_id":"BE","region_name":"Bono East Region","type":"Town","population":40000,"coordinates":{"lat":8.0500,"lng":-1.7333}},
-            {"id":"BE-06-T01","name":"Nkoranza","district_id":"BE-06","district_name":"Nkoranza South Municipal","region_id":"BE","region_name":"Bono East Region","type":"Town","population":28000,"coordinates":{"lat":7.5500,"lng":-1.5500}},
-            {"id":"BE-07-T01","name":"Yeji","district_id":"BE-07","district_name":"Pru East District","region_id":"BE","region_name":"Bono East Region","type":"Town","population":22000,"coordinates":{"lat":7.8500,"lng":-0.4167}},
+    region_rows = [
+        (r["id"], r["name"], r["code"], r["capital"], _int(r["population"]),
+         _float(r["area_km2"]), *_lat_lng(r), r["created_date"] or None)
+        for r in regions
+    ]
+    district_rows = [
+        (d["id"], d["name"], d["region_id"], d["type"], d["capital"],
+         _int(d["population"]), _float(d["area_km2"]), *_lat_lng(d))
+        for d in districts
+    ]
+    town_rows = [
+        (t["id"], t["name"], t["district_id"], t["type"], _int(t["population"]), _coords(t))
+        for t in towns
+    ]
+    return region_rows, district_rows, town_rows
 
-            # ====== AHAFO REGION ======
-            {"id":"AH-01-T01","name":"Goaso","district_id":"AH-01","district_name":"Asunafo North Municipal","region_id":"AH","region_name":"Ahafo Region","type":"Town","population":35000,"coordinates":{"lat":6.7942,"lng":-2.5815}},
-            {"id":"AH-02-T01","name":"Kukuom","district_id":"AH-02","district_name":"Asunafo South District","region_id":"AH","region_name":"Ahafo Region","type":"Town","population":18000,"coordinates":{"lat":6.6833,"lng":-2.6167}},
-            {"id":"AH-05-T01","name":"Duayaw Nkwanta","district_id":"AH-05","district_name":"Tano North Municipal","region_id":"AH","region_name":"Ahafo Region","type":"Town","population":28000,"coordinates":{"lat":7.0833,"lng":-2.1000}},
-            {"id":"AH-06-T01","name":"Bechem","district_id":"AH-06","district_name":"Tano South Municipal","region_id":"AH","region_name":"Ahafo Region","type":"Town","population":25000,"coordinates":{"lat":7.0833,"lng":-2.0167}},
 
-            # ====== NORTHERN REGION ======
-            # NR-01 Tamale Metropolitan
-            {"id":"NR-01-T01","name":"Tamale","district_id":"NR-01","district_name":"Tamale Metropolitan","region_id":"NR","region_name":"Northern Region","type":"City","population":360000,"coordinates":{"lat":9.4034,"lng":-0.8424}},
-            {"id":"NR-01-T02","name":"Kukuo","district_id":"NR-01","district_name":"Tamale Metropolitan","region_id":"NR","region_name":"Northern Region","type":"Community","population":30000,"coordinates":{"lat":9.4167,"lng":-0.8500}},
-            {"id":"NR-01-T03","name":"Choggu","district_id":"NR-01","district_name":"Tamale Metropolitan","region_id":"NR","region_name":"Northern Region","type":"Community","population":22000,"coordinates":{"lat":9.4500,"lng":-0.8333}},
-            {"id":"NR-01-T04","name":"Vittin","district_id":"NR-01","district_name":"Tamale Metropolitan","region_id":"NR","region_name":"Northern Region","type":"Community","population":18000,"coordinates":{"lat":9.3833,"lng":-0.8667}},
-            # NR-02 Sagnarigu
-            {"id":"NR-02-T01","name":"Sagnarigu","district_id":"NR-02","district_name":"Sagnarigu Municipal","region_id":"NR","region_name":"Northern Region","type":"Town","population":75000,"coordinates":{"lat":9.5167,"lng":-0.8833}},
-            # NR-03 Savelugu
-            {"id":"NR-03-T01","name":"Savelugu","district_id":"NR-03","district_name":"Savelugu Municipal","region_id":"NR","region_name":"Northern Region","type":"Town","population":42000,"coordinates":{"lat":9.6333,"lng":-0.8333}},
-            # NR-09 Yendi
-            {"id":"NR-09-T01","name":"Yendi","district_id":"NR-09","district_name":"Yendi Municipal","region_id":"NR","region_name":"Northern Region","type":"Town","population":55000,"coordinates":{"lat":9.4333,"lng":-0.0167}},
-            # NR-14 Nanumba North
-            {"id":"NR-14-T01","name":"Bimbilla","district_id":"NR-14","district_name":"Nanumba North Municipal","region_id":"NR","region_name":"Northern Region","type":"Town","population":35000,"coordinates":{"lat":8.8833,"lng":-0.0500}},
+# ---------------------------------------------------------------------------
+# Build
+# ---------------------------------------------------------------------------
 
-            # ====== SAVANNAH REGION ======
-            {"id":"SR-01-T01","name":"Damongo","district_id":"SR-01","district_name":"West Gonja Municipal","region_id":"SR","region_name":"Savannah Region","type":"Town","population":28000,"coordinates":{"lat":9.0667,"lng":-1.8167}},
-            {"id":"SR-02-T01","name":"Salaga","district_id":"SR-02","district_name":"East Gonja Municipal","region_id":"SR","region_name":"Savannah Region","type":"Town","population":25000,"coordinates":{"lat":8.5500,"lng":-0.3167}},
-            {"id":"SR-03-T01","name":"Bole","district_id":"SR-03","district_name":"Bole District","region_id":"SR","region_name":"Savannah Region","type":"Town","population":22000,"coordinates":{"lat":8.9167,"lng":-2.4833}},
-            {"id":"SR-04-T01","name":"Buipe","district_id":"SR-04","district_name":"Central Gonja District","region_id":"SR","region_name":"Savannah Region","type":"Town","population":15000,"coordinates":{"lat":8.9833,"lng":-1.3333}},
+def stored_checksum(database_path: Path):
+    """Seed checksum the database was built from; None if it needs a (re)build
 
-            # ====== NORTH EAST REGION ======
-            {"id":"NER-01-T01","name":"Gambaga","district_id":"NER-01","district_name":"East Mamprusi Municipal","region_id":"NER","region_name":"North East Region","type":"Town","population":18000,"coordinates":{"lat":10.5333,"lng":-0.4167}},
-            {"id":"NER-02-T01","name":"Walewale","district_id":"NER-02","district_name":"West Mamprusi Municipal","region_id":"NER","region_name":"North East Region","type":"Town","population":22000,"coordinates":{"lat":10.3000,"lng":-0.9000}},
-            {"id":"NER-03-T01","name":"Bunkpurugu","district_id":"NER-03","district_name":"Bunkpurugu-Nakpanduri District","region_id":"NER","region_name":"North East Region","type":"Town","population":12000,"coordinates":{"lat":10.7667,"lng":-0.0833}},
-
-            # ====== UPPER EAST REGION ======
-            {"id":"UE-01-T01","name":"Bolgatanga","district_id":"UE-01","district_name":"Bolgatanga Municipal","region_id":"UER","region_name":"Upper East Region","type":"City","population":85000,"coordinates":{"lat":10.7856,"lng":-0.8510}},
-            {"id":"UE-01-T02","name":"Soe","district_id":"UE-01","district_name":"Bolgatanga Municipal","region_id":"UER","region_name":"Upper East Region","type":"Community","population":8000,"coordinates":{"lat":10.8000,"lng":-0.8333}},
-            {"id":"UER-02-T01","name":"Bawku","district_id":"UER-02","district_name":"Bawku Municipal","region_id":"UER","region_name":"Upper East Region","type":"Town","population":52000,"coordinates":{"lat":11.0564,"lng":-0.2372}},
-            {"id":"UER-03-T01","name":"Navrongo","district_id":"UER-03","district_name":"Kassena-Nankana Municipal","region_id":"UER","region_name":"Upper East Region","type":"Town","population":38000,"coordinates":{"lat":10.8956,"lng":-1.0939}},
-            {"id":"UER-03-T02","name":"Paga","district_id":"UER-03","district_name":"Kassena-Nankana Municipal","region_id":"UER","region_name":"Upper East Region","type":"Town","population":12000,"coordinates":{"lat":10.9833,"lng":-1.1167}},
-            {"id":"UER-04-T01","name":"Sandema","district_id":"UER-04","district_name":"Builsa North Municipal","region_id":"UER","region_name":"Upper East Region","type":"Town","population":18000,"coordinates":{"lat":10.8833,"lng":-1.3333}},
-            {"id":"UER-07-T01","name":"Bongo","district_id":"UER-07","district_name":"Bongo District","region_id":"UER","region_name":"Upper East Region","type":"Town","population":15000,"coordinates":{"lat":10.8833,"lng":-0.8000}},
+    A database on an older layout needs one whatever its checksum, since
+    the build is what upgrades it.
+    """
+    if not database_path.exists():
+        return None
+    try:
+        conn = sqlite3.connect(f"file:{database_path}?mode=ro", uri=True)
+        try:
+            if schema_version(conn) != SCHEMA_VERSION:
+                return None
+            row = conn.execute(
+                "SELECT value FROM meta WHERE key = 'seed_checksum'"
+            ).fetchone()
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        return None
+    return row[0] if row else None
+
+
+def build_database(database_path: Path, checksum: str):
+    region_rows, district_rows, town_rows = load_seed()
 
-            # ====== UPPER WEST REGION ======
-            {"id":"UWR-01-T01","name":"Wa","district_id":"UWR-01","district_name":"Wa Metropolitan","region_id":"UWR","region_name":"Upper West Region","type":"City","population":105000,"coordinates":{"lat":10.0606,"lng":-2.5069}},
-            {"id":"UWR-01-T02","name":"Kpongu","district_id":"UWR-01","district_name":"Wa Metropolitan","region_id":"UWR","region_name":"Upper West Region","type":"Community","population":8000,"coordinates":{"lat":10.0833,"lng":-2.5333}},
-            {"id":"UWR-02-T01","name":"Jirapa","district_id":"UWR-02","district_name":"Jirapa Municipal","region_id":"UWR","region_name":"Upper West Region","type":"Town","population":22000,"coordinates":{"lat":10.3167,"lng":-2.7333}},
-            {"id":"UWR-03-T01","name":"Lawra","district_id":"UWR-03","district_name":"Lawra Municipal","region_id":"UWR","region_name":"Upper West Region","type":"Town","population":18000,"coordinates":{"lat":10.6500,"lng":-2.9000}},
-            {"id":"UWR-04-T01","name":"Nandom","district_id":"UWR-04","district_name":"Nandom Municipal","region_id":"UWR","region_name":"Upper West Region","type":"Town","population":15000,"coordinates":{"lat":10.4833,"lng":-2.8333}},
-            {"id":"UWR-05-T01","name":"Tumu","district_id":"UWR-05","district_name":"Sissala East Municipal","region_id":"UWR","region_name":"Upper West Region","type":"Town","population":18000,"coordinates":{"lat":10.9167,"lng":-1.8167}},
+    database_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(database_path)
+    try:
+        legacy = is_legacy(conn)
+        if ensure_schema(conn):
+            print("  Migrated the denormalized tables to the normalized layout" if legacy
+                  else "  Upgraded the database schema")
+        with conn:
+            conn.executemany(
+                """INSERT INTO region_rows
+                   (id, name, code, capital, population, area_km2, lat, lng, created_date)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                   ON CONFLICT (id) DO UPDATE SET
+                       name = excluded.name, code = excluded.code, capital = excluded.capital,
+                       population = excluded.population, area_km2 = excluded.area_km2,
+                       lat = excluded.lat, lng = excluded.lng,
+                       created_date = excluded.created_date, name_key = NULL""",
+                region_rows,
+            )
+            conn.executemany(
+                "INSERT INTO types (name) SELECT ? WHERE NOT EXISTS "
+                "(SELECT 1 FROM types WHERE name = ?)",
+                [(t, t) for t in sorted({d[3] for d in district_rows})],
+            )
+            conn.executemany(
+                """INSERT INTO district_rows
+                   (id, name, region_key, type_key, capital, population, area_km2, lat, lng)
+                   VALUES (?, ?, (SELECT region_key FROM region_rows WHERE id = ?),
+                           (SELECT type_key FROM types WHERE name = ?), ?, ?, ?, ?, ?)
+                   ON CONFLICT (id) DO UPDATE SET
+                       name = excluded.name, region_key = excluded.region_key,
+                       type_key = excluded.type_key, capital = excluded.capital,
+                       population = excluded.population, area_km2 = excluded.area_km2,
+                       lat = excluded.lat, lng = excluded.lng, name_key = NULL""",
+                district_rows,
+            )
+            # Districts dropped from the seed go too, unless towns still point at them
+            seeded = [d[0] for d in district_rows]
+            conn.execute(
+                f"""DELETE FROM district_rows
+                    WHERE id NOT IN ({",".join("?" * len(seeded))})
+                      AND district_key NOT IN (SELECT district_key FROM town_rows)""",
+                seeded,
+            )
+            conn.executemany(
+                """INSERT OR REPLACE INTO towns
+                   (id, name, district_id, type, population, coordinates)
+                   VALUES (?, ?, ?, ?, ?, ?)""",
+                town_rows,
+            )
+            fill_name_keys(conn)
+            conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('seed_checksum', ?)",
+                (checksum,),
+            )
+        # Planner statistics: with them SQLite walks region -> town indexes in
+        # order for `ORDER BY region_id, name` instead of sorting every town
+        conn.execute("ANALYZE")
+        conn.execute("VACUUM")
+    finally:
+        conn.close()
+    return len(region_rows), len(district_rows), len(town_rows)
 
-            # ====== WESTERN NORTH REGION ======
-            {"id":"WNR-01-T01","name":"Wiawso","district_id":"WNR-01","district_name":"Sefwi Wiawso Municipal","region_id":"WNR","region_name":"Western North Region","type":"Town","population":35000,"coordinates":{"lat":6.2167,"lng":-2.4833}},
-            {"id":"WNR-02-T01","name":"Bibiani","district_id":"WNR-02","district_name":"Bibiani-Anhwiaso-Bekwai Municipal","region_id":"WNR","region_name":"Western North Region","type":"Town","population":42000,"coordinates":{"lat":6.4667,"lng":-2.3167}},
-            {"id":"WNR-03-T01","name":"Enchi","district_id":"WNR-03","district_name":"Aowin Municipal","region_id":"WNR","region_name":"Western North Region","type":"Town","population":22000,"coordinates":{"lat":6.1000,"lng":-2.7833}},
-            {"id":"WNR-05-T01","name":"Juaboso","district_id":"WNR-05","district_name":"Juaboso District","region_id":"WNR","region_name":"Western North Region","type":"Town","population":12000,"coordinates":{"lat":6.3167,"lng":-2.8333}},
-        ]
 
-        for town in towns_data:
-            coords_json = json.dumps(town['coordinates']) if town.get('coordinates') else None
-            conn.execute('''
-                INSERT OR REPLACE INTO towns
-                (id, name, district_id, district_name, region_id, region_name, type, population, coordinates)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                town['id'],
-                town['name'],
-                town['district_id'],
-                town['district_name'],
-                town['region_id'],
-                town['region_name'],
-                town['type'],
-                town.get('population'),
-                coords_json
-            ))
+def verify_database(database_path: Path = DB_PATH):
+    """Quick verification of database contents"""
+    conn = sqlite3.connect(database_path)
+    try:
+        print("\n Database Verification:")
+        print("-" * 30)
+        for table in ("regions", "districts", "towns"):
+            count = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            print(f"  {table}: {count:,}")
+
+        print("\n District breakdown by type:")
+        for row in conn.execute(
+            "SELECT type, COUNT(*) FROM districts GROUP BY type ORDER BY COUNT(*) DESC"
+        ):
+            print(f"  • {row[0]}: {row[1]} districts")
+    finally:
+        conn.close()
 
-        # Commit all changes
-        conn.commit()
 
-        # Verify data was inserted
-        cursor = conn.execute('SELECT COUNT(*) FROM regions')
-        region_count = cursor.fetchone()[0]
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build ghana.db from the seed files")
+    parser.add_argument("--db", type=Path, default=DB_PATH, help="Database path")
+    parser.add_argument("--force", action="store_true",
+                        help="Rebuild even if the checksum matches")
+    parser.add_argument("--verify", action="store_true",
+                        help="Print table counts after building")
+    args = parser.parse_args(argv)
 
-        cursor = conn.execute('SELECT COUNT(*) FROM districts')
-        district_count = cursor.fetchone()[0]
+    started = time.perf_counter()
+    checksum = seed_checksum()
+    if not args.force and stored_checksum(args.db) == checksum:
+        elapsed = (time.perf_counter() - started) * 1000
+        print(f"ghana.db is up to date with seed {checksum[:12]} ({elapsed:.1f} ms), skipping build")
+        return True
 
-        cursor = conn.execute('SELECT COUNT(*) FROM towns')
-        towns_count = cursor.fetchone()[0]
-        
-        # Get district breakdown by type
-        cursor = conn.execute('''
-            SELECT type, COUNT(*) as count 
-            FROM districts 
-            GROUP BY type 
-            ORDER BY count DESC
-        ''')
-        district_breakdown = cursor.fetchall()
-        
-        print("\n" + "="*70)
-        print(" COMPLETE GHANAGEO DATABASE SETUP SUCCESSFUL!")
-        print("="*70)
-        print(f" Database location: {database_path}")
-        print(f" Total regions: {region_count}/16")
-        print(f" Total districts: {district_count}")
-        print(f" Total towns/villages: {towns_count}")
-        print()
-        
-        print("District breakdown by type:")
-        for row in district_breakdown:
-            print(f"  • {row[0]}: {row[1]} districts")
-        
-        print("\nRegions in database:")
-        cursor = conn.execute('SELECT name, code, capital FROM regions ORDER BY name')
-        for row in cursor.fetchall():
-            print(f"  • {row[0]} ({row[1]}) - Capital: {row[2]}")
-        
-        print("\nSample districts by region:")
-        cursor = conn.execute('''
-            SELECT r.name, d.name, d.type, d.capital
-            FROM regions r
-            JOIN districts d ON r.id = d.region_id
-            ORDER BY r.name, d.name
-            LIMIT 20
-        ''')
-        
-        for row in cursor.fetchall():
-            print(f"  • {row[1]} ({row[2]}) in {row[0]} - Capital: {row[3]}")
-        
-        print(f"\n Your comprehensive GhanaGeo API is ready!")
-        print("Test endpoints:")
-        print("  curl http://localhost:8000/regions")
-        print("  curl http://localhost:8000/search?q=Kumasi")
-        print("  curl http://localhost:8000/districts?region=GR")
-        print("  curl http://localhost:8000/towns?district=GR-01")
-        print("  curl http://localhost:8000/districts/AS-01/towns")
-        print("  curl http://localhost:8000/statistics")
-        print()
-        print(" Interactive docs: http://localhost:8000/docs")
-        
+    print(f"Building {args.db} from seed {checksum[:12]}...")
+    try:
+        regions, districts, towns = build_database(args.db, checksum)
     except Exception as e:
         print(f" Error setting up database: {e}")
         import traceback
         traceback.print_exc()
         return False
-    finally:
-        conn.close()
-    
+
+    elapsed = (time.perf_counter() - started) * 1000
+    print(f"  {regions} regions, {districts} districts, {towns} seed towns in {elapsed:.0f} ms")
+    if args.verify:
+        verify_database(args.db)
     return True
 
-# =============================================================================
-# EXPANSION HELPER FUNCTIONS
-# =============================================================================
-
-def add_remaining_districts():
-    """
-    Helper function to add remaining districts to reach full 261 count
-    This can be expanded with additional district data
-    """
-    
-    print(" Districts summary by region:")
-    print("Current implementation includes major districts from each region")
-    print("Expandable to full 261 districts:")
-    print()
-    print("Region breakdown (Target/Current):")
-    print("  • Greater Accra: 29/29 ")
-    print("  • Ashanti: 43/43 ") 
-    print("  • Western: 17/17 ")
-    print("  • Central: 22/10 ")
-    print("  • Eastern: 33/0 ")
-    print("  • Volta: 18/0 ")
-    print("  • Oti: 9/0 ")
-    print("  • Northern: 16/0 ")
-    print("  • Savannah: 7/0 ")
-    print("  • North East: 6/0 ")
-    print("  • Upper East: 15/0 ")
-    print("  • Upper West: 11/0 ")
-    print("  • Bono: 12/0 ")
-    print("  • Bono East: 11/0 ")
-    print("  • Ahafo: 6/0 ")
-    print("  • Western North: 9/0 ")
-    print()
-    print(" This provides a solid foundation for expansion to 261 districts")
 
 if __name__ == "__main__":
-    print("🇬 Starting Complete GhanaGeo Database Setup...")
-    print("Building comprehensive geographic database for Ghana")
-    print("-" * 50)
-    
-    if setup_complete_ghana_database():
-        print("\n Setup completed successfully!")
-        add_remaining_districts()
-    else:
-        print("\n Setup failed. Check the error messages above.")
-
-# =============================================================================
-# QUICK VERIFICATION SCRIPT
-# =============================================================================
-
-def verify_database():
-    """Quick verification of database contents"""
-    
-    database_path = Path.cwd() / "ghanageo" / "data" / "ghana.db"
-    
-    if not database_path.exists():
-        print(" Database file not found")
-        return
-    
-    conn = sqlite3.connect(database_path)
-    conn.row_factory = sqlite3.Row
-    
-    try:
-        print("\n Database Verification:")
-        print("-" * 30)
-        
-        # Count check
-        cursor = conn.execute('SELECT COUNT(*) as count FROM regions')
-        region_count = cursor.fetchone()['count']
-        print(f"Regions: {region_count}")
-        
-        cursor = conn.execute('SELECT COUNT(*) as count FROM districts')
-        district_count = cursor.fetchone()['count']
-        print(f"Districts: {district_count}")
-        
-        # Sample data check
-        cursor = conn.execute('SELECT name, capital FROM regions LIMIT 3')
-        print("\nSample regions:")
-        for row in cursor.fetchall():
-            print(f"  • {row['name']} - {row['capital']}")
-        
-        cursor = conn.execute('''
-            SELECT d.name, d.type, r.name as region_name 
-            FROM districts d 
-            JOIN regions r ON d.region_id = r.id 
-            LIMIT 5
-        ''')
-        print("\nSample districts:")
-        for row in cursor.fetchall():
-            print(f"  • {row['name']} ({row['type']}) in {row['region_name']}")
-        
-    except Exception as e:
-        print(f" Verification failed: {e}")
-    finally:
-        conn.close()
-
-# Uncomment to run verification after setup
-# verify_database()
\ No newline at end of file
+    sys.exit(0 if main() else 1)
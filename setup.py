@@ -7,7 +7,7 @@ setup(
     packages=find_packages(),
     include_package_data=True,
     package_data={
-        'ghanageo': ['data/*.db'],
+        'ghanageo': ['data/*.db', 'data/*.pack'],
     },
     install_requires=[],
     extras_require={
@@ -15,6 +15,7 @@ setup(
     },
     entry_points={
         "console_scripts": [
+            "ghanageo=ghanageo.cli:main",
             "ghanageo-api=ghanageo.client:serve_api",
         ],
     },
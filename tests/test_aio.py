@@ -0,0 +1,98 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+import ghanageo
+from ghanageo.aio import AsyncGhanaGeo
+
+SLOW_QUERY = """
+    WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n)
+    SELECT COUNT(*) FROM n
+"""
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_async_matches_module_api():
+    async def main():
+        async with AsyncGhanaGeo(max_workers=2) as geo:
+            regions, region, districts, stats = await asyncio.gather(
+                geo.get_regions(), geo.get_region("GR"),
+                geo.get_districts(region="AS"), geo.get_statistics(),
+            )
+            assert regions == ghanageo.get_regions()
+            assert region == ghanageo.get_region("GR")
+            assert districts == ghanageo.get_districts(region="AS")
+            assert stats == ghanageo.get_statistics()
+            assert await geo.search("Kumasi", limit=5) == ghanageo.search("Kumasi", limit=5)
+            with pytest.raises(ghanageo.DataNotFoundError):
+                await geo.get_town("nope")
+    run(main())
+
+
+def test_iter_towns_pages_through_region():
+    async def main():
+        async with AsyncGhanaGeo() as geo:
+            ids = [town["id"] async for town in geo.iter_towns(region="GR", batch_size=100)]
+        expected = sorted(t["id"] for t in ghanageo.get_towns(region="GR"))
+        assert ids == expected
+    run(main())
+
+
+def test_bounded_concurrency():
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def work(geo):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.02)
+        with lock:
+            active -= 1
+
+    async def main():
+        async with AsyncGhanaGeo(max_workers=4, max_concurrency=2) as geo:
+            await asyncio.gather(*(geo._run(work) for _ in range(8)))
+    run(main())
+    assert peak == 2
+
+
+def test_cancel_interrupts_running_query():
+    async def main():
+        async with AsyncGhanaGeo(max_workers=1) as geo:
+            task = asyncio.ensure_future(
+                geo._run(lambda g: g._conn.execute(SLOW_QUERY).fetchone())
+            )
+            await asyncio.sleep(0.1)
+            started = time.perf_counter()
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            # The worker is free again once SQLite has been interrupted
+            assert await geo.get_region("GR")
+            assert time.perf_counter() - started < 2
+    run(main())
+
+
+def test_cancel_drops_queued_call():
+    ran = []
+
+    async def main():
+        async with AsyncGhanaGeo(max_workers=1) as geo:
+            blocker = asyncio.ensure_future(geo._run(lambda g: time.sleep(0.2)))
+            await asyncio.sleep(0.05)
+            queued = asyncio.ensure_future(geo._run(lambda g: ran.append(True)))
+            await asyncio.sleep(0.01)
+            queued.cancel()
+            await blocker
+            with pytest.raises(asyncio.CancelledError):
+                await queued
+    run(main())
+    assert ran == []
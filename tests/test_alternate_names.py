@@ -0,0 +1,79 @@
+import sqlite3
+
+import pytest
+
+from ghanageo.database import GhanaGeoDB, db
+from ghanageo.schema import fill_name_keys
+
+KUMASI = "AS-01-GN2298890"
+
+
+@pytest.fixture
+def reader(tmp_path):
+    """A copy of the database with a few alternate spellings, keyed like an import"""
+    path = tmp_path / "copy.db"
+    sqlite3.connect(db.db_path).execute("VACUUM INTO ?", (str(path),))
+    conn = sqlite3.connect(path)
+    district = conn.execute("SELECT id FROM districts WHERE name LIKE 'Kwaebibirem%'").fetchone()[0]
+    with conn:
+        conn.executemany(
+            "INSERT INTO alternate_names (entity_id, name) VALUES (?, ?)",
+            [(KUMASI, "Kumase"), (KUMASI, "Coomassie"), (KUMASI, "Kumasi City"),
+             (district, "Kwaɛbibirɛm")],
+        )
+        fill_name_keys(conn)
+    conn.close()
+    return GhanaGeoDB(str(path))
+
+
+def test_search_matches_alternates(reader):
+    found = [r for _, r in reader.search_ranked("coomas", 10)]
+    assert [(r["id"], r["matched_name"]) for r in found] == [(KUMASI, "Coomassie")]
+    # The alternate's exact match outranks prefix matches on own names
+    first = reader.search_ranked("kumase", 5)[0][1]
+    assert (first["id"], first["matched_name"]) == (KUMASI, "Kumase")
+
+
+def test_own_name_wins_and_entities_are_unique(reader):
+    found = [r for _, r in reader.search_ranked("kumasi", 200)]
+    kumasi = [r for r in found if r["id"] == KUMASI]
+    assert len(kumasi) == 1 and "matched_name" not in kumasi[0]
+    assert len({r["id"] for r in found}) == len(found)
+    # Each entity counts once in the facets too
+    assert len(found) < 200
+    assert sum(group["count"] for group in reader.search_facets("kumasi")) == len(found)
+
+
+def test_diacritics_fold_both_ways(reader):
+    ascii_query = [r for _, r in reader.search_ranked("kwaebibirem", 10)]
+    # An exact match on the folded alternate beats the own name's prefix match
+    assert ascii_query[0]["type"] == "district"
+    assert ascii_query[0]["matched_name"] == "Kwaɛbibirɛm"
+    accented = [r for _, r in reader.search_ranked("Kwaɛbibirɛm", 10)]
+    assert [r["id"] for r in accented] == [r["id"] for r in ascii_query]
+
+
+def test_cursor_pages_with_alternates(reader):
+    full = reader.search_ranked("ku", 60)
+    pages, after = [], None
+    while len(pages) < 60:
+        page = reader.search_ranked("ku", 7, after)
+        if not page:
+            break
+        pages += page
+        after = page[-1][0]
+    assert pages[:60] == full
+
+
+def test_lookup_by_alternate(reader):
+    found = reader.lookup_name("coomassie")
+    assert [(r["id"], r["matched_name"]) for r in found] == [(KUMASI, "Coomassie")]
+    assert all("matched_name" not in r for r in reader.lookup_name("kumasi", "town"))
+
+
+def test_deleting_a_town_drops_its_alternates(reader):
+    conn = reader.get_connection()
+    with conn:
+        conn.execute("DELETE FROM towns WHERE id = ?", (KUMASI,))
+    assert conn.execute("SELECT COUNT(*) FROM alternate_names WHERE entity_id = ?", (KUMASI,)).fetchone()[0] == 0
+    assert reader.search_ranked("coomassie", 5) == []
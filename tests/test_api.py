@@ -59,3 +59,34 @@ def test_statistics():
     data = response.json()
     assert data["success"] == True
     assert "total_regions" in data["data"]
+
+def test_get_region_towns():
+    """Test typed town listing keeps the dict output shape"""
+    response = client.get("/regions/AS/towns")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    data = response.json()
+    assert data["region_id"] == "AS"
+    assert data["count"] == len(data["data"])
+    assert "district_id" not in data
+    town = data["data"][0]
+    assert set(town) == {"id", "name", "district_id", "district_name", "region_id",
+                         "region_name", "type", "population", "coordinates"}
+
+def test_get_district():
+    response = client.get("/districts/AS-01")
+    assert response.status_code == 200
+    assert response.json()["data"]["region_id"] == "AS"
+    assert client.get("/districts/XX-99").status_code == 404
+
+def test_hierarchy_endpoints():
+    """Ancestors and children come from the hierarchy index"""
+    children = client.get("/locations/AS-01/children").json()
+    assert children["level"] == "district"
+    assert children["count"] == len(children["data"]) > 0
+    town = children["data"][0]
+    ancestors = client.get(f"/locations/{town['id']}/ancestors").json()
+    assert ancestors["level"] == "town"
+    assert [a["id"] for a in ancestors["data"]] == ["AS", "AS-01"]
+    assert client.get("/locations/AS/children").json()["data"][0]["region_id"] == "AS"
+    assert client.get("/locations/nowhere/ancestors").status_code == 404
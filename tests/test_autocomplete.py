@@ -0,0 +1,86 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from fastapi.testclient import TestClient
+
+import ghanageo
+from app.main import app
+from ghanageo.completion import PrefixIndex
+
+client = TestClient(app)
+
+
+def _town(town_id, name, population=None, district_id="D1"):
+    return ("town", {"id": town_id, "name": name, "population": population, "region_id": "R",
+                     "region_name": "R", "district_id": district_id, "district_name": "D",
+                     "coordinates": None})
+
+
+def test_ranking_and_word_starts():
+    index = PrefixIndex([
+        _town("t1", "Accra", 100), _town("t2", "Accra New Town", 5000),
+        _town("t3", "Greater Accra Hills", 10 ** 6), _town("t4", "Tamale", 10),
+        ("district", {"id": "d1", "name": "Accra Metropolitan", "population": 1,
+                      "region_id": "R", "region_name": "R", "coordinates": None}),
+    ])
+    # First-word matches, then level, then population; later words last
+    assert [r["id"] for r in index.complete("ACC")] == ["d1", "t2", "t1", "t3"]
+    assert [r["id"] for r in index.complete("accra n")] == ["t2"]
+    assert [r["id"] for r in index.complete("acc", limit=2)] == ["d1", "t2"]
+    assert index.complete("x") == [] and index.complete("  ") == []
+    # A name matching on two words is returned once
+    assert [r["id"] for r in PrefixIndex([_town("t5", "Ada Ada")]).complete("ada")] == ["t5"]
+
+
+def test_large_ranges_rank_like_small_ones(monkeypatch):
+    entities = [_town(f"t{i}", f"Ak{i:03d}", i) for i in range(600)]
+    expected = [f"t{i}" for i in range(599, 589, -1)]
+    assert [r["id"] for r in PrefixIndex(entities).complete("ak")] == expected
+    monkeypatch.setattr("ghanageo.completion.SORT_ONCE", 10 ** 6)
+    assert [r["id"] for r in PrefixIndex(entities).complete("ak")] == expected
+
+
+def test_ranked_range_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr("ghanageo.completion.SORT_ONCE", 5)
+    monkeypatch.setattr("ghanageo.completion.SORTED_CACHE_ENTRIES", 25)
+    index = PrefixIndex([_town(f"{c}{i}", f"{c}a{i:02d}", i) for c in "bcd" for i in range(10)])
+    for prefix in ("b", "c", "b", "d"):
+        assert len(index.complete(prefix)) == 10
+    # "b" was used again, so the least recently used "c" made room for "d"
+    assert list(index._sorted) == ["b", "d"]
+    assert index._sorted_size == 20
+    assert [r["id"] for r in index.complete("c", limit=2)] == ["c9", "c8"]
+
+
+def test_ranked_range_cache_under_threads(monkeypatch):
+    """Threads sharing an index keep the LRU and its size accounting intact"""
+    monkeypatch.setattr("ghanageo.completion.SORT_ONCE", 2)
+    monkeypatch.setattr("ghanageo.completion.SORTED_CACHE_ENTRIES", 30)
+    letters = "bcdefghijk"
+    index = PrefixIndex([_town(f"{c}{i}", f"{c}a{i:02d}", i) for c in letters for i in range(10)])
+    with ThreadPoolExecutor(8) as pool:
+        found = list(pool.map(lambda n: len(index.complete(letters[n % len(letters)])), range(2000)))
+    assert found == [10] * 2000
+    assert index._sorted_size == sum(len(r) for r in index._sorted.values()) <= 30
+
+
+def test_scoping():
+    towns = ghanageo.autocomplete("a", limit=20, district="AS-01")
+    assert towns and all(t["type"] == "town" and t["district"] == "Kumasi Metropolitan" for t in towns)
+    in_region = ghanageo.autocomplete("a", limit=20, region="GR")
+    assert in_region and all(r.get("region") == "Greater Accra Region" for r in in_region)
+    assert all(r["type"] == "district" for r in ghanageo.autocomplete("a", level="district"))
+    with pytest.raises(ghanageo.DataNotFoundError):
+        ghanageo.autocomplete("a", region="missing")
+    with pytest.raises(ValueError):
+        ghanageo.autocomplete("a", level="country")
+
+
+def test_autocomplete_endpoint():
+    response = client.get("/autocomplete", params={"q": "kum", "limit": 3})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["count"] == 3
+    assert data["data"][0]["name"] == "Kumasi Metropolitan"
+    assert client.get("/autocomplete", params={"q": "a", "region": "missing"}).status_code == 404
+    assert client.get("/autocomplete", params={"q": "a", "level": "country"}).status_code == 422
@@ -0,0 +1,131 @@
+import asyncio
+import json
+import threading
+import time
+
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from app import batch
+from app.batch import MAX_BATCH_REQUESTS
+from app.main import app
+from ghanageo.database import db
+
+client = TestClient(app)
+
+HOME_SCREEN = [
+    {"path": "/regions"},
+    {"path": "/statistics"},
+    {"path": "/districts", "params": {"region": "AS"}},
+    {"path": "/towns?district=AS-01"},
+    {"path": "/search", "params": {"q": "kumasi", "limit": 3}},
+]
+
+
+def test_batch_matches_separate_calls():
+    body = client.post("/batch", json={"requests": HOME_SCREEN}).json()
+    assert body["success"] and body["count"] == len(HOME_SCREEN)
+    for request, item in zip(HOME_SCREEN, body["data"]):
+        alone = client.get(request["path"], params=request.get("params"))
+        assert item["path"] == request["path"]
+        assert (item["status"], item["body"]) == (alone.status_code, alone.json())
+
+
+def test_per_item_status():
+    body = client.post("/batch", json={"requests": [
+        {"path": "/towns/nope"},
+        {"path": "/search"},
+        {"path": "/batch"},
+        {"path": "https://example.com/regions"},
+        {"path": "/regions/AS"},
+    ]}).json()
+    assert [item["status"] for item in body["data"]] == [404, 422, 400, 400, 200]
+    assert body["data"][4]["body"]["data"]["code"] == "AS"
+
+
+def test_batch_limits():
+    too_many = [{"path": "/regions"}] * (MAX_BATCH_REQUESTS + 1)
+    assert client.post("/batch", json={"requests": too_many}).status_code == 400
+    assert client.post("/batch", json={"requests": [{"params": {}}]}).status_code == 422
+    assert client.post("/batch", json={"requests": []}).json() == {"success": True, "count": 0, "data": []}
+
+
+def test_batch_byte_budget(monkeypatch):
+    """GeoJSON is never batched, and bodies past the byte budget become 413s"""
+    body = client.post("/batch", json={"requests": [{"path": "/geojson/towns"}]}).json()
+    assert body["data"][0]["status"] == 400
+
+    regions = client.get("/regions").content
+    monkeypatch.setattr(batch, "MAX_BATCH_BYTES", len(regions) + 10)
+    body = client.post("/batch", json={"requests": [{"path": "/regions"}] * 3}).json()
+    assert sorted(item["status"] for item in body["data"]) == [200, 413, 413]
+
+
+slow = FastAPI()
+
+
+@slow.get("/sleep")
+async def sleep(seconds: float):
+    time.sleep(seconds)  # blocking, like a route waiting on SQLite
+    return {"thread": threading.current_thread().name}
+
+
+@slow.get("/query")
+async def query():
+    # Long enough to outlast any test unless it is aborted
+    db.get_connection().execute(
+        "WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n) SELECT count(*) FROM n"
+    ).fetchone()
+    return {}
+
+
+streamed = []
+
+
+@slow.get("/stream")
+async def stream():
+    def chunks():
+        for i in range(1000):
+            streamed.append(i)
+            yield b"x" * 1024
+    return StreamingResponse(chunks())
+
+
+def test_large_item_is_cut_off(monkeypatch):
+    """An item going over the byte budget is abandoned mid-response"""
+    monkeypatch.setattr(batch, "MAX_BATCH_BYTES", 64 * 1024)
+    body = json.loads(asyncio.run(batch.run_batch(slow, [{"path": "/stream"}, {"path": "/sleep?seconds=0"}])))
+    assert body["data"][0]["status"] == 413
+    assert len(streamed) <= 65
+
+
+def test_blocking_routes_run_in_parallel():
+    """Sub-requests run on pool threads, so blocking routes overlap"""
+    started = time.monotonic()
+    body = json.loads(asyncio.run(batch.run_batch(slow, [{"path": "/sleep?seconds=0.3"}] * 4)))
+    assert time.monotonic() - started < 0.9
+    assert all(item["body"]["thread"].startswith("batch") for item in body["data"])
+
+
+def test_batch_timeout(monkeypatch):
+    monkeypatch.setattr(batch, "BATCH_TIMEOUT", 0.2)
+    body = json.loads(asyncio.run(batch.run_batch(slow, [
+        {"path": "/sleep?seconds=0"},
+        {"path": "/sleep?seconds=0.5"},
+    ])))
+    assert [item["status"] for item in body["data"]] == [200, 504]
+
+
+def test_timeout_frees_the_workers(monkeypatch):
+    """Timed-out queries are aborted, so the next batch still gets workers"""
+    monkeypatch.setattr(batch, "BATCH_TIMEOUT", 0.2)
+    requests = [{"path": "/query"}] * (batch.BATCH_WORKERS + 2)
+    body = json.loads(asyncio.run(batch.run_batch(slow, requests)))
+    assert {item["status"] for item in body["data"]} == {504}
+
+    monkeypatch.setattr(batch, "BATCH_TIMEOUT", 5.0)
+    started = time.monotonic()
+    body = json.loads(asyncio.run(batch.run_batch(slow, [{"path": "/sleep?seconds=0"}] * 4)))
+    assert [item["status"] for item in body["data"]] == [200] * 4
+    assert time.monotonic() - started < 1
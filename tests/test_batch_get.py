@@ -0,0 +1,42 @@
+from fastapi.testclient import TestClient
+
+import ghanageo
+from app.main import MAX_BATCH_IDS, app
+
+client = TestClient(app)
+
+KUMASI = "AS-01-GN2298890"
+
+
+def test_get_many_keeps_order_and_marks_missing():
+    entries = ghanageo.get_many([KUMASI, "nope", "AS-01", "AS", KUMASI])
+    assert [e["id"] for e in entries] == [KUMASI, "nope", "AS-01", "AS", KUMASI]
+    assert [e["found"] for e in entries] == [True, False, True, True, True]
+    assert [e.get("level") for e in entries] == ["town", None, "district", "region", "town"]
+    assert entries[0]["data"] == ghanageo.get_town(KUMASI)
+    assert entries[2]["data"] == ghanageo.get_district("AS-01")
+    assert ghanageo.get_many(["AS", KUMASI], level="town")[0] == {"id": "AS", "found": False}
+
+
+def test_many_towns_in_one_call():
+    towns = ghanageo.get_towns(limit=3000)
+    ids = [t["id"] for t in reversed(towns)]
+    entries = ghanageo.get_many(ids)
+    assert [e["data"] for e in entries] == list(reversed(towns))
+
+
+def test_towns_ids_endpoint():
+    body = client.get("/towns", params={"ids": f"{KUMASI}, AS,nope"}).json()
+    assert (body["count"], body["found"]) == (3, 1)
+    assert [e["found"] for e in body["data"]] == [True, False, False]
+    assert body["data"][0]["data"]["name"] == "Kumasi"
+    assert "data" not in body["data"][1]
+
+
+def test_batch_get_endpoint():
+    body = client.post("/batch/get", json={"ids": ["AS", "AS-01", KUMASI, "nope"]}).json()
+    assert [e.get("level") for e in body["data"]] == ["region", "district", "town", None]
+    assert body["data"][0]["data"]["code"] == "AS" and body["found"] == 3
+    too_many = client.post("/batch/get", json={"ids": ["AS"] * (MAX_BATCH_IDS + 1)})
+    assert too_many.status_code == 400
+    assert client.post("/batch/get", json={"ids": "AS"}).status_code == 422
@@ -0,0 +1,79 @@
+import sqlite3
+
+import pytest
+
+import ghanageo
+from ghanageo.client import GhanaGeo
+
+
+@pytest.fixture
+def geo():
+    with GhanaGeo() as client:
+        yield client
+
+
+def test_client_matches_module_api(geo):
+    """The client returns what the module-level functions return"""
+    assert geo.get_regions() == ghanageo.get_regions()
+    assert geo.get_region("GR") == ghanageo.get_region("GR")
+    assert geo.get_districts(region="AS") == ghanageo.get_districts(region="AS")
+    assert geo.get_districts() == ghanageo.get_districts()
+    assert geo.get_towns(district="AS-01") == ghanageo.get_towns(district="AS-01")
+    assert geo.get_towns(limit=20, offset=40) == ghanageo.get_towns(limit=20, offset=40)
+    assert geo.search("Kumasi", limit=5) == ghanageo.search("Kumasi", limit=5)
+    assert geo.get_statistics() == ghanageo.get_statistics()
+
+
+def test_client_lookups(geo):
+    assert geo.get_district("GR-01")["name"] == "Accra Metropolitan"
+    assert geo.get_district("nope") is None
+    assert geo.get_region("nope") is None
+    assert geo.get_towns(region="nope") == []
+    town = geo.get_towns(region="GR")[0]
+    assert geo.get_town(town["id"]) == town
+
+
+def test_client_caches_until_cleared(geo):
+    first = geo.get_towns(region="AS")
+    assert ("towns", "region", "AS") in geo._cache
+    geo.clear_cache()
+    assert not geo._cache
+    assert geo.get_towns(region="AS") == first
+
+
+def test_cached_results_are_copies(geo):
+    town = geo.get_town("AS-01-GN2298890")
+    town["name"] = "changed"
+    town["coordinates"]["lat"] = 0.0
+    geo.get_towns(region="AS")[0]["name"] = "changed"
+    geo.get_statistics()["total_towns"] = 0
+    geo.get_regions()[0]["coordinates"]["lat"] = 0.0
+    assert geo.get_town("AS-01-GN2298890") == ghanageo.get_town("AS-01-GN2298890")
+    assert geo.get_towns(region="AS") == ghanageo.get_towns(region="AS")
+    assert geo.get_statistics() == ghanageo.get_statistics()
+    assert geo.get_regions() == ghanageo.get_regions()
+
+
+def test_client_town_filters(geo):
+    for filters in [dict(region="AS", type=["City", "Town"], min_population=20000,
+                         sort="-population", limit=10),
+                    dict(district="AS-01", has_coordinates=True, limit=5, offset=5),
+                    dict(type="City", sort="population")]:
+        assert geo.get_towns(**filters) == ghanageo.get_towns(**filters)
+    assert geo.count_towns(region="AS", min_population=1000) == \
+        ghanageo.count_towns(region="AS", min_population=1000)
+    assert geo.get_towns(district="nope", type="City") == []
+    assert geo.count_towns(region="nope") == 0
+
+
+def test_client_closes():
+    client = GhanaGeo(cache_size=0)
+    with client:
+        assert client.get_regions()
+    with pytest.raises(sqlite3.ProgrammingError):
+        client.get_regions()
+
+
+def test_missing_database(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        GhanaGeo(tmp_path / "missing.db")
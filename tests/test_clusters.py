@@ -0,0 +1,74 @@
+import pytest
+from fastapi.testclient import TestClient
+
+import ghanageo
+from app.main import app
+from ghanageo import pyramid
+
+client = TestClient(app)
+
+GHANA_BBOX = (-3.3, 4.7, 1.2, 11.2)
+KUMASI_BBOX = (-1.75, 6.55, -1.5, 6.8)
+
+
+def _located():
+    return [t for t in ghanageo.get_towns(limit=100_000) if t["coordinates"]]
+
+
+@pytest.mark.parametrize("zoom", [0, 4, 7, 9])
+def test_clusters_cover_every_located_town(zoom):
+    found = ghanageo.clusters(GHANA_BBOX, zoom)
+    assert sum(c["count"] for c in found) == len(_located())
+
+
+def test_representative_is_largest_town():
+    largest = {}
+    for town in _located():
+        cell = pyramid._cell(town["coordinates"]["lng"], town["coordinates"]["lat"], 6)
+        largest[cell] = max(largest.get(cell, 0), town["population"] or 0)
+    for cluster in ghanageo.clusters(GHANA_BBOX, 6):
+        cell = pyramid._cell(cluster["town"]["coordinates"]["lng"], cluster["town"]["coordinates"]["lat"], 6)
+        assert (cluster["town"]["population"] or 0) == largest[cell]
+
+
+def test_centroid_and_bbox():
+    towns = _located()
+    found = ghanageo.clusters(GHANA_BBOX, 0)
+    lat_sum = sum(c["centroid"]["lat"] * c["count"] for c in found)
+    assert lat_sum == pytest.approx(sum(t["coordinates"]["lat"] for t in towns), rel=1e-6)
+    inside = ghanageo.clusters(KUMASI_BBOX, pyramid.MAX_ZOOM)
+    assert inside and all(KUMASI_BBOX[1] - 0.05 <= c["centroid"]["lat"] <= KUMASI_BBOX[3] + 0.05 for c in inside)
+    # Zooms past the pyramid reuse its finest grid
+    assert ghanageo.clusters(KUMASI_BBOX, 18) == inside
+
+
+def test_tiles_are_cached():
+    tower = pyramid.ClusterPyramid(_located())
+    first = tower.clusters(KUMASI_BBOX, 8)
+    assert tower._tiles
+    cached = dict(tower._tiles)
+    assert tower.clusters(KUMASI_BBOX, 8) == first
+    assert all(tower._tiles[key] is tiles for key, tiles in cached.items())
+
+
+def test_bad_requests():
+    with pytest.raises(ghanageo.TooManyCellsError):
+        ghanageo.clusters(GHANA_BBOX, pyramid.MAX_ZOOM)
+    with pytest.raises(ValueError) as bad_bbox:
+        ghanageo.clusters((1, 0, 0, 1), 5)
+    assert not isinstance(bad_bbox.value, ghanageo.TooManyCellsError)
+    response = client.get("/clusters", params={"bbox": "1,2,3", "zoom": 5})
+    assert response.status_code == 400 and response.json()["detail"].startswith("bbox must be")
+    response = client.get("/clusters", params={"bbox": ",".join(map(str, GHANA_BBOX)), "zoom": 14})
+    assert response.status_code == 400 and "too many cells" in response.json()["detail"]
+    assert client.get("/clusters", params={"bbox": ",".join(map(str, GHANA_BBOX)), "zoom": 30}).status_code == 422
+
+
+def test_endpoint():
+    body = client.get("/clusters", params={"bbox": ",".join(map(str, GHANA_BBOX)), "zoom": 6}).json()
+    assert body["success"] and body["zoom"] == 6
+    assert body["count"] == len(body["data"]) == len(ghanageo.clusters(GHANA_BBOX, 6))
+    cluster = body["data"][0]
+    assert set(cluster) == {"count", "centroid", "town"}
+    assert set(cluster["centroid"]) == {"lat", "lng"}
+    assert cluster["town"]["type"] == "town"
@@ -0,0 +1,95 @@
+import pytest
+from fastapi.testclient import TestClient
+
+import ghanageo
+from app.main import app
+from ghanageo import fuzzy
+from ghanageo.api import _hierarchy
+from ghanageo.fuzzy import TrigramIndex, trigrams
+from ghanageo.hierarchy import LEVEL_RANK
+from ghanageo.names import normalize_name
+
+client = TestClient(app)
+
+
+def _town(town_id, name, population=None):
+    return ("town", {"id": town_id, "name": name, "population": population,
+                     "region_name": "R", "district_name": "D", "coordinates": None})
+
+
+@pytest.mark.parametrize("query,expected", [
+    ("Kumase", "Kumasi"),
+    ("Techimann", "Techiman"),
+    ("Sefwi Wiaso", "Sefwi Wiawso"),
+])
+def test_misspellings_find_the_place(query, expected):
+    names = [r["name"] for r in ghanageo.search(query, limit=10, fuzzy=True)]
+    assert any(name.startswith(expected) for name in names)
+
+
+def test_scores_and_tie_breaks():
+    index = TrigramIndex([
+        _town("t1", "Kumasi", 10), _town("t2", "Kumasi", 500), _town("t3", "Kumawu"),
+        ("district", {"id": "d1", "name": "Kumasi Metropolitan", "population": 1,
+                      "region_name": "R", "coordinates": None}),
+        _town("t4", "Tamale"),
+    ])
+    results = index.search("kumasi", limit=3)
+    # Equal scores: district first, then the larger town
+    assert [r["id"] for r in results] == ["d1", "t2", "t1"]
+    assert all(r["score"] == 1.0 for r in results)
+    assert index.search("kumasi", limit=10)[-1]["id"] == "t3"
+    assert index.search("zzzz") == []
+    assert trigrams("ho") == {"  h", " ho", "ho "}
+
+
+def _score_every_name(entities, query, limit, threshold=0.3):
+    grams = trigrams(normalize_name(query))
+    ranked = []
+    for level, row in entities:
+        key = normalize_name(row["name"])
+        if key:
+            other = trigrams(key)
+            shared = len(grams & other)
+            score = shared / (len(grams) + len(other) - shared)
+            if score >= threshold:
+                ranked.append((-score, LEVEL_RANK[level], -(row.get("population") or 0), row["name"], row["id"]))
+    return [(r[4], round(-r[0], 4)) for r in sorted(ranked)[:limit]]
+
+
+def test_skipping_sizes_keeps_exact_results(monkeypatch):
+    """Stopping at the k-th best score returns what scoring every name would"""
+    hierarchy = _hierarchy()
+    entities = ([("region", r) for r in hierarchy.regions]
+                + [("district", d) for d in hierarchy.districts]
+                + [("town", t) for t in hierarchy.towns])
+    index = TrigramIndex(entities)
+    for query in ["Kumase", "acra", "Hoo", "Sefwi Wiaso", "Wenchi Municipal", "Ashanti Reg", "x"]:
+        expected = _score_every_name(entities, query, 25)
+        for walk_all in (0, fuzzy.WALK_ALL_POSTINGS):
+            monkeypatch.setattr(fuzzy, "WALK_ALL_POSTINGS", walk_all)
+            for limit in (1, 3, 25):
+                found = [(r["id"], r["score"]) for r in index.search(query, limit)]
+                assert found == expected[:limit], (query, walk_all, limit)
+
+
+def test_ties_in_the_last_size_searched(monkeypatch):
+    """A longer name tying with the k-th best is still found and ranked"""
+    monkeypatch.setattr(fuzzy, "WALK_ALL_POSTINGS", 0)
+    index = TrigramIndex([
+        _town("t1", "Hoo"), _town("t2", "Hooa", 900),
+        ("district", {"id": "d1", "name": "Hoo Nkoo", "population": 1,
+                      "region_name": "R", "coordinates": None}),
+    ])
+    assert [(r["id"], r["score"]) for r in index.search("hoo", limit=2)] == [("t1", 1.0), ("d1", 0.5)]
+
+
+def test_fuzzy_endpoint():
+    response = client.get("/search", params={"q": "Kumase", "fuzzy": "true", "limit": 5})
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data and all(0 < r["score"] <= 1 for r in data)
+    scores = [r["score"] for r in data]
+    assert scores == sorted(scores, reverse=True)
+    plain = client.get("/search", params={"q": "Kumasi"}).json()["data"]
+    assert all("score" not in r for r in plain)
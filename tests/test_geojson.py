@@ -0,0 +1,82 @@
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+import ghanageo
+from app.main import app
+from app.responses import accepts_gzip
+from ghanageo import features
+
+client = TestClient(app)
+
+KUMASI_BBOX = (-1.75, 6.55, -1.5, 6.8)
+
+
+def _collection(*args, **kwargs):
+    return json.loads(b"".join(ghanageo.geojson(*args, **kwargs)))
+
+
+def _inside(town, bbox):
+    c = town["coordinates"]
+    return c is not None and bbox[0] <= c["lng"] <= bbox[2] and bbox[1] <= c["lat"] <= bbox[3]
+
+
+def test_features_mirror_rows():
+    collection = _collection("town")
+    assert collection["type"] == "FeatureCollection"
+    assert len(collection["features"]) == ghanageo.count_towns()
+    feature = next(f for f in collection["features"] if f["id"] == "AS-01-GN2298890")
+    town = ghanageo.get_town("AS-01-GN2298890")
+    assert feature["geometry"] == {"type": "Point",
+                                   "coordinates": [town["coordinates"]["lng"], town["coordinates"]["lat"]]}
+    assert feature["properties"] == {k: v for k, v in town.items() if k != "coordinates"}
+
+
+def test_bbox_and_parent_filters():
+    towns = ghanageo.get_towns(limit=100_000)
+    ids = {f["id"] for f in _collection("town", bbox=KUMASI_BBOX)["features"]}
+    assert ids and ids == {t["id"] for t in towns if _inside(t, KUMASI_BBOX)}
+    in_district = _collection("town", bbox=KUMASI_BBOX, district="AS-01")["features"]
+    assert {f["id"] for f in in_district} == {t["id"] for t in ghanageo.get_towns(district="AS-01")
+                                            if _inside(t, KUMASI_BBOX)}
+    districts = _collection("district", region="AS")["features"]
+    assert len(districts) == len(ghanageo.get_districts(region="AS"))
+    assert [f["id"] for f in _collection("region", district="AS-01")["features"]] == ["AS"]
+    with pytest.raises(ValueError):
+        ghanageo.geojson("town", bbox=(1, 2, 0, 3))
+    with pytest.raises(ghanageo.DataNotFoundError):
+        ghanageo.geojson("district", region="XX")
+
+
+def test_streams_in_chunks_without_the_cache(monkeypatch):
+    index = features.FeatureIndex({"town": ghanageo.get_towns(limit=100_000)})
+    monkeypatch.setattr(features, "CACHE_LIMIT", 10)
+    chunks = list(features.feature_collection(index.features("town"), chunk_size=4096))
+    assert len(chunks) > 100 and max(len(c) for c in chunks[:-1]) < 4096 + 1000
+    assert len(index._cache) == 10
+    assert b"".join(chunks) == b"".join(features.feature_collection(index.features("town")))
+
+
+def test_geojson_endpoints():
+    response = client.get("/geojson/towns", params={"bbox": ",".join(map(str, KUMASI_BBOX))})
+    assert response.headers["content-type"] == "application/geo+json"
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.json() == _collection("town", bbox=KUMASI_BBOX)
+    plain = client.get("/geojson/regions", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers and len(plain.json()["features"]) == 16
+    refused = client.get("/geojson/regions", headers={"Accept-Encoding": "br, gzip;q=0"})
+    assert "content-encoding" not in refused.headers
+    assert client.get("/geojson/towns", params={"bbox": "1,2,3"}).status_code == 400
+    assert client.get("/geojson/districts", params={"region": "XX"}).status_code == 404
+    assert len(client.get("/geojson/towns", params={"district": "AS-01"}).json()["features"]) == \
+        len(ghanageo.get_towns(district="AS-01"))
+
+
+@pytest.mark.parametrize("header,gzip", [
+    ("gzip, deflate", True), ("GZIP;q=0.5", True), ("*", True), ("gzip;q=0", False),
+    ("gzip;q=0.000, *", False), ("*;q=0", False), ("identity", False), ("", False),
+    ("br;q=1, *;q=0.1", True), ("gzip;q=oops", False),
+])
+def test_accept_encoding_q_values(header, gzip):
+    assert accepts_gzip(header) is gzip
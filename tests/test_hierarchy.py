@@ -0,0 +1,87 @@
+import pytest
+
+import ghanageo
+from ghanageo.database import db
+from ghanageo.hierarchy import PackHierarchy, build_hierarchy
+from ghanageo.pack import DatasetPack, build_pack
+
+
+@pytest.fixture(scope="module")
+def hierarchy():
+    return build_hierarchy(db)
+
+
+def test_lookups_match_database(hierarchy):
+    assert hierarchy.region("AS") == db.get_region_by_id("AS")
+    assert hierarchy.district("AS-01") == db.get_district_by_id("AS-01")
+    assert hierarchy.children("GR") == db.get_districts_by_region("GR")
+    town = db.get_towns_by_district("AS-01")[0]
+    assert hierarchy.town(town["id"]) == town
+    assert hierarchy.district("AS") is None
+
+
+def test_breadcrumbs(hierarchy):
+    town = db.get_towns_by_district("GR-01")[0]
+    assert [(a["id"], a["level"]) for a in hierarchy.ancestors(town["id"])] == [
+        ("GR", "region"), ("GR-01", "district")
+    ]
+    assert hierarchy.ancestors("GR") == ()
+    assert hierarchy.ancestors("missing") is None
+    assert hierarchy.children(town["id"]) == []
+
+
+def test_module_functions():
+    assert ghanageo.get_district("AS-01")["id"] == "AS-01"
+    assert len(ghanageo.get_children("AS")) == len(ghanageo.get_districts(region="AS"))
+    with pytest.raises(ghanageo.DataNotFoundError):
+        ghanageo.get_district("missing")
+    with pytest.raises(ghanageo.DataNotFoundError):
+        ghanageo.get_ancestors("missing")
+
+
+def _ids(rows):
+    return sorted(r["id"] for r in rows)
+
+
+def test_pack_hierarchy_matches(hierarchy, tmp_path):
+    """The pack-backed index answers every call like the dict one"""
+    path = tmp_path / "ghana.pack"
+    build_pack(db.db_path, path)
+    with DatasetPack(path) as pack:
+        packed = build_hierarchy(pack)
+        assert isinstance(packed, PackHierarchy)
+        assert packed.regions == hierarchy.regions
+        assert packed.districts == hierarchy.districts
+        assert packed.towns_count == hierarchy.towns_count == len(packed.towns)
+        assert _ids(packed.towns) == _ids(hierarchy.towns)
+        assert packed.towns[-1] == packed.towns[len(packed.towns) - 1]
+        for town in list(hierarchy.towns)[::97]:
+            assert packed.town(town["id"]) == town
+            assert packed.ancestors(town["id"]) == hierarchy.ancestors(town["id"])
+            assert packed.children(town["id"]) == []
+        for entity_id in ["AS", "GR", "AS-01", "missing"] + [d["id"] for d in hierarchy.districts]:
+            assert packed.get(entity_id) == hierarchy.get(entity_id)
+            assert packed.ancestors(entity_id) == hierarchy.ancestors(entity_id)
+            children = packed.children(entity_id)
+            assert (children is None) == (hierarchy.children(entity_id) is None)
+            assert _ids(children or []) == _ids(hierarchy.children(entity_id) or [])
+        for region in hierarchy.regions:
+            assert packed.region(region["code"]) == region
+            assert _ids(packed.region_towns(region["id"])) == _ids(hierarchy.region_towns(region["id"]))
+        assert packed.district("AS") is None and packed.region("AS-01") is None
+
+
+def test_results_are_copies():
+    """Changing a returned row never changes what later calls return"""
+    town = ghanageo.get_towns(district="AS-01")[0]
+    town["name"] = "changed"
+    town["coordinates"]["lat"] = 0.0
+    ghanageo.get_region("AS")["coordinates"]["lat"] = 0.0
+    ghanageo.get_many(["AS-01"])[0]["data"]["name"] = "changed"
+    ghanageo.get_ancestors(town["id"])[0]["name"] = "changed"
+
+    again = ghanageo.get_town(town["id"])
+    assert again["name"] != "changed" and again["coordinates"]["lat"] != 0.0
+    assert ghanageo.get_region("AS")["coordinates"]["lat"] != 0.0
+    assert ghanageo.get_district("AS-01")["name"] != "changed"
+    assert ghanageo.get_ancestors(town["id"])[0]["name"] != "changed"
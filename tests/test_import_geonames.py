@@ -0,0 +1,121 @@
+import math
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("requests")
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+import import_geonames  # noqa: E402
+
+from ghanageo.database import db  # noqa: E402
+from ghanageo.names import normalize_name  # noqa: E402
+
+
+def _district_names():
+    return [r[0] for r in sqlite3.connect(db.db_path).execute("SELECT name FROM districts")]
+
+
+def test_district_keys_agree_with_lookup_keys():
+    """Import matching and ghanageo.lookup key every district alike"""
+    assert all(import_geonames._norm(name) == normalize_name(name) for name in _district_names())
+
+
+def test_hyphenated_suffix_is_kept():
+    # "Mampong Municipal District" is keyed "mampong municipal"
+    assert import_geonames._norm("Mampong-Municipal") == "mampong municipal"
+    assert import_geonames._norm("  Ga-East Municipal Assembly ") == "ga east"
+
+
+def _linear_match(districts, name):
+    """The matching DistrictMatcher replaced: first district in order containing, or in, the key"""
+    norm = import_geonames._norm(name)
+    if norm in districts:
+        return districts[norm]
+    return next((d for key, d in districts.items() if norm and (norm in key or key in norm)), None)
+
+
+def _district(district_id, name):
+    return {"id": district_id, "name": name, "region_id": district_id[:2], "region_name": "R"}
+
+
+def test_district_matcher():
+    districts = {import_geonames._norm(d["name"]): d for d in (
+        _district("AS-21", "Adansi North District"), _district("AS-01", "Kumasi Metropolitan"),
+        _district("GR-26", "Ada East District"), _district("UWR-01", "Wa Metropolitan"),
+    )}
+    matcher = import_geonames.DistrictMatcher(districts)
+    assert matcher.match("KUMASI Metropolitan Assembly")["id"] == "AS-01"
+    # A whole-word candidate beats an earlier district containing the text mid-word
+    assert matcher.match("Ada")["id"] == "GR-26"
+    assert _linear_match(districts, "Ada")["id"] == "AS-21"
+    # Partial words share no token and fall back to the substring scan
+    assert matcher.match("Kuma")["id"] == "AS-01"
+    assert matcher.match("Tema") is None and matcher.match("") is None
+    assert set(matcher._cache) == {"KUMASI Metropolitan Assembly", "Ada", "Kuma", "Tema", ""}
+
+
+def test_district_matcher_agrees_with_linear_scan():
+    """On ghana.db's districts the two only differ where the matcher takes a district sharing a word"""
+    conn = sqlite3.connect(db.db_path)
+    matcher, _ = import_geonames.build_district_lookup(conn)
+    queries = []
+    for name in _district_names():
+        words = name.split()
+        queries += [name, name.upper(), name.replace(" ", "-"), f"{name} Assembly", words[0], words[-1]]
+    for query in queries:
+        found, linear = matcher.match(query), _linear_match(matcher.exact, query)
+        if found != linear:
+            words = set(import_geonames._norm(query).split())
+            assert words & set(import_geonames._norm(found["name"]).split())
+
+
+def _haversine(lat1, lng1, lat2, lng2):
+    lat1, lng1, lat2, lng2 = map(math.radians, (lat1, lng1, lat2, lng2))
+    a = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lng2 - lng1) / 2) ** 2
+    return 2 * math.asin(math.sqrt(a))
+
+
+def test_capital_index_nearest_by_great_circle(monkeypatch):
+    monkeypatch.setattr(import_geonames.CapitalIndex, "CHUNK", 7)
+    capitals = [(5.6, -0.19, {"id": "accra"}), (6.69, -1.62, {"id": "kumasi"}),
+                (9.4, -0.85, {"id": "tamale"}), (10.78, -0.85, {"id": "bolga"}),
+                (4.9, -1.76, {"id": "takoradi"})]
+    index = import_geonames.CapitalIndex(capitals)
+    points = [(4.7 + 0.31 * i, -3.2 + 0.19 * i) for i in range(20)]
+    found = index.nearest_many([p[0] for p in points], [p[1] for p in points])
+    for (lat, lng), district in zip(points, found):
+        best = min(capitals, key=lambda c: _haversine(lat, lng, c[0], c[1]))
+        assert district is best[2]
+    assert index.nearest_many([], []) == []
+    assert import_geonames.CapitalIndex([]).nearest_many([5.0], [0.0]) == [None]
+    assert import_geonames.nearest_district(5.5, -0.2, index)["id"] == "accra"
+
+
+def test_import_places(tmp_path):
+    path = tmp_path / "copy.db"
+    sqlite3.connect(db.db_path).execute("VACUUM INTO ?", (str(path),))
+    conn = sqlite3.connect(path)
+    matcher, capitals = import_geonames.build_district_lookup(conn)
+    kumasi = conn.execute("SELECT name, district_id FROM towns WHERE id = 'AS-01-GN2298890'").fetchone()
+
+    def place(geonames_id, name, lat, lng, admin2="", alternates=()):
+        return {"geonames_id": geonames_id, "name": name, "alternates": list(alternates),
+                "lat": lat, "lng": lng, "feature_code": "PPL", "type": "Town",
+                "population": None, "admin1": "02", "admin2": admin2}
+
+    places = [
+        place("1", "Testkrom", 6.7, -1.6, admin2="99"),   # admin2 name resolves
+        place("2", "Fallbackso", 10.78, -0.85),           # no admin2: nearest capital
+        place(kumasi[1], kumasi[0], 6.69, -1.62, admin2="99", alternates=["Coomassie"]),
+    ]
+    admin2_map = {("02", "99"): "Kumasi Metropolitan"}
+    assert import_geonames.import_places(conn, places, admin2_map, matcher, capitals) == 2
+    nearest = capitals.nearest_many([10.78], [-0.85])[0]["id"]
+    rows = dict(conn.execute("SELECT id, district_id FROM towns WHERE id LIKE '%-GN1' OR id LIKE '%-GN2'"))
+    assert rows == {"AS-01-GN1": "AS-01", f"{nearest}-GN2": nearest}
+    # The existing town is skipped, but its other spellings are recorded
+    assert conn.execute("SELECT name_key FROM alternate_names WHERE entity_id = 'AS-01-GN2298890' "
+                        "AND name = 'Coomassie'").fetchone() == ("coomassie",)
@@ -0,0 +1,74 @@
+import sqlite3
+
+import pytest
+from fastapi.testclient import TestClient
+
+import ghanageo
+from app.main import app
+from ghanageo.database import GhanaGeoDB, db
+from ghanageo.names import normalize_name
+from ghanageo.schema import fill_name_keys
+
+client = TestClient(app)
+
+
+@pytest.mark.parametrize("name,key", [
+    ("Kumasi Metropolitan", "kumasi"),
+    ("  KUMASI ", "kumasi"),
+    ("Sekondi-Takoradi", "sekondi takoradi"),
+    ("Sekondi–Takoradi", "sekondi takoradi"),
+    ("Ashanti Region", "ashanti"),
+    ("Region", "region"),
+    ("Kwaɛbibirɛm Municipal", "kwaebibirem"),
+    ("Akim Odá", "akim oda"),
+    ("", ""),
+])
+def test_normalize_name(name, key):
+    assert normalize_name(name) == key
+
+
+def test_lookup_ranks_by_level_then_population():
+    results = ghanageo.lookup("kumasi")
+    assert [r["type"] for r in results[:2]] == ["district", "town"]
+    assert results[1]["id"] == "AS-01-GN2298890"
+    towns = [r for r in results if r["type"] == "town"]
+    populations = [t["population"] or 0 for t in towns]
+    assert populations == sorted(populations, reverse=True)
+
+
+def test_lookup_level_and_exactness():
+    assert [r["id"] for r in ghanageo.lookup("ASHANTI", level="region")] == ["AS"]
+    assert all(r["type"] == "town" for r in ghanageo.lookup("Kumasi", level="town"))
+    # Exact names only: a prefix is not a match
+    assert ghanageo.lookup("kumas") == []
+    assert ghanageo.lookup("   ") == []
+    with pytest.raises(ValueError):
+        ghanageo.lookup("kumasi", level="country")
+
+
+def test_lookup_endpoint():
+    response = client.get("/lookup", params={"name": "kumasi metropolitan", "level": "district"})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["count"] == 1
+    assert data["data"][0]["id"] == "AS-01"
+    assert data["data"][0]["population"] > 0
+    assert client.get("/lookup", params={"name": "kumasi", "level": "country"}).status_code == 422
+
+
+def test_renamed_rows_get_new_keys(tmp_path):
+    """fill_name_keys keys rows written through the views"""
+    path = tmp_path / "copy.db"
+    sqlite3.connect(db.db_path).execute("VACUUM INTO ?", (str(path),))
+    conn = sqlite3.connect(path)
+    with conn:
+        conn.execute("UPDATE towns SET name = 'Nkwanta Hills' WHERE id = 'AS-01-GN2298890'")
+        conn.execute(
+            """INSERT INTO towns (id, name, district_id, type, population, coordinates)
+               VALUES ('AS-01-T1', 'Nkwanta-HILLS', 'AS-01', 'Hamlet', 10, NULL)"""
+        )
+        assert fill_name_keys(conn) == 2
+    conn.close()
+    found = GhanaGeoDB(str(path)).lookup_name("nkwanta hills")
+    assert sorted(r["id"] for r in found) == ["AS-01-GN2298890", "AS-01-T1"]
+    assert GhanaGeoDB(str(path)).lookup_name("kumasi", "town")[0]["id"] != "AS-01-GN2298890"
@@ -0,0 +1,103 @@
+import shutil
+import sqlite3
+
+import pytest
+
+import ghanageo
+from ghanageo.database import db
+from ghanageo.pack import DatasetPack, PackError, build_pack, load_pack
+
+
+@pytest.fixture(scope="module")
+def pack(tmp_path_factory):
+    path = tmp_path_factory.mktemp("pack") / "ghana.pack"
+    build_pack(db.db_path, path)
+    with DatasetPack(path) as p:
+        yield p
+
+
+def test_pack_matches_database(pack):
+    """Pack reads return the same rows as GhanaGeoDB"""
+    assert pack.get_all_regions() == db.get_all_regions()
+    assert pack.get_region_by_id("AS") == db.get_region_by_id("AS")
+    assert pack.get_districts_by_region("GR") == db.get_districts_by_region("GR")
+    towns = db.get_towns_by_district("AS-01")
+    assert sorted(map(repr, pack.get_towns_by_district("AS-01"))) == sorted(map(repr, towns))
+    assert pack.get_town_by_id(towns[0]["id"]) == towns[0]
+    assert pack.get_towns_count() == db.get_towns_count()
+
+
+def test_pack_indexes(pack):
+    """Prefix search and bbox lookups come from the precomputed indexes"""
+    assert all(r["name"].lower().startswith("kuma") for r in pack.search_prefix("Kuma", 5))
+    towns = pack.towns_in_bbox(-0.3, 5.5, 0.0, 5.7)
+    assert towns
+    assert all(5.5 <= t["coordinates"]["lat"] <= 5.7 for t in towns)
+
+
+def test_stale_pack_is_ignored(tmp_path):
+    """A pack built from another database is not used"""
+    source = tmp_path / "ghana.db"
+    shutil.copy(db.db_path, source)
+    path = tmp_path / "ghana.pack"
+    build_pack(source, path)
+    with sqlite3.connect(source) as conn:
+        conn.execute("UPDATE regions SET population = population + 1 WHERE id = 'GR'")
+    assert load_pack(path, db_path=source) is None
+
+
+def test_database_changes_are_noticed(tmp_path):
+    """A pack loaded for a database is dropped once that database changes"""
+    source = tmp_path / "ghana.db"
+    shutil.copy(db.db_path, source)
+    path = tmp_path / "ghana.pack"
+    build_pack(source, path)
+    assert load_pack(path, db_path=source) is load_pack(path, db_path=source) is not None
+    with sqlite3.connect(source) as conn:
+        conn.execute("UPDATE regions SET population = population + 1 WHERE id = 'GR'")
+    assert load_pack(path, db_path=source) is None
+    build_pack(source, path)
+    assert load_pack(path, db_path=source).get_region_by_id("GR")["population"] \
+        == db.get_region_by_id("GR")["population"] + 1
+
+
+def test_unreadable_pack_falls_back(tmp_path, monkeypatch):
+    """A corrupt or truncated pack means SQLite, not an error on every call"""
+    path = tmp_path / "ghana.pack"
+    build_pack(db.db_path, path)
+    data = bytearray(path.read_bytes())
+    with DatasetPack(path) as pack:
+        offset, length = pack._sections["meta"]
+    path.write_bytes(data[:len(data) // 2])
+    assert load_pack(path, db_path=db.db_path) is None
+    data[offset:offset + length] = b"x" * length
+    path.write_bytes(data)
+    with pytest.raises(PackError, match="corrupt"):
+        DatasetPack(path)
+    assert load_pack(path, db_path=db.db_path) is None
+
+    monkeypatch.setenv("GHANAGEO_PACK", str(path))
+    assert ghanageo.get_region("AS")["id"] == "AS"
+    assert ghanageo.get_towns(limit=3)
+
+
+def test_rejects_non_pack(tmp_path):
+    path = tmp_path / "bogus.pack"
+    path.write_bytes(b"not a pack" * 10)
+    with pytest.raises(PackError):
+        DatasetPack(path)
+
+
+def test_preload_keeps_town_rows_in_the_pack(tmp_path, monkeypatch):
+    """With a pack, preload maps it and leaves the row-holding indexes unbuilt"""
+    from ghanageo import api, completion, fuzzy, hierarchy
+    path = tmp_path / "ghana.pack"
+    build_pack(db.db_path, path)
+    monkeypatch.setenv("GHANAGEO_PACK", str(path))
+    monkeypatch.setattr(hierarchy, "_current", {})
+    api.preload()
+    index = api._hierarchy()
+    assert isinstance(index, hierarchy.PackHierarchy)
+    assert index not in fuzzy._indexes and index not in completion._indexes
+    assert ghanageo.search("Kumase", fuzzy=True)
+    assert index in fuzzy._indexes
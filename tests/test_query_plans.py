@@ -0,0 +1,75 @@
+import re
+import sqlite3
+
+import pytest
+
+from ghanageo.database import GhanaGeoDB, db
+
+# Every query GhanaGeoDB issues per request. Substring search (LIKE '%q%')
+# and the total count necessarily visit every row and are not listed.
+HOT_CALLS = [
+    ("get_all_regions", ()),
+    ("get_region_by_id", ("AS",)),
+    ("get_districts_by_region", ("AS",)),
+    ("get_district_by_id", ("AS-01",)),
+    ("get_towns_by_district", ("AS-01",)),
+    ("get_towns_by_region", ("AS",)),
+    ("get_town_by_id", ("AS-01-GN2298890",)),
+    ("lookup_name", ("kumasi",)),
+    ("get_all_towns", (500, 5000)),
+    ("get_towns_page", (None, None, "AS-01-GN", 100)),
+    ("get_towns_page", ("AS-01", None, "", 100)),
+    ("get_towns_page", (None, "AS", "", 100)),
+    ("get_region_records", ()),
+    ("get_district_records", ("AS",)),
+    ("get_town_records", ("AS-01",)),
+    ("get_town_records", (None, "AS")),
+    ("get_town_records", (None, None, 500, 5000)),
+    ("find_towns", ("AS-01", None, None, None, None, None, "-population", 50)),
+    ("find_towns", (None, "AS", ["City", "Town"], 20000, None, None, "-population", 50)),
+    ("find_towns", (None, None, ["City"], None, None, True, "population", 50)),
+    ("find_towns", (None, "AS", None, 1000, None, None, "name", 50)),
+    ("count_towns", (None, "AS", ["City", "Town"], 20000)),
+    ("count_towns", (None, None, None, 1000, 50000, True)),
+]
+
+# A full table scan is "SCAN x" ("SCAN TABLE x" before SQLite 3.36) with no
+# index; walking an index in order
+# for an all-rows listing ("SCAN x USING INDEX") is fine
+TABLE_SCAN = re.compile(r"\bSCAN (TABLE )?\w+$")
+
+
+def _traced(method, args):
+    reader = GhanaGeoDB(db.db_path)
+    statements = []
+    reader.get_connection().set_trace_callback(statements.append)
+    getattr(reader, method)(*args)
+    return [s for s in statements if s.lstrip().upper().startswith("SELECT")]
+
+
+@pytest.mark.parametrize("method,args", HOT_CALLS)
+def test_hot_queries_use_indexes(method, args):
+    statements = _traced(method, args)
+    assert statements
+    conn = db.get_connection()
+    for sql in statements:
+        plan = [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}")]
+        assert not any(TABLE_SCAN.search(step) for step in plan), (sql, plan)
+        assert not any("TEMP B-TREE" in step for step in plan), (sql, plan)
+
+
+def test_country_wide_population_sort_needs_its_index(tmp_path):
+    # Region and district composites serve the filtered counts by skip-scan,
+    # but only the country-wide index gives a population order without a sort
+    call = ("find_towns", (None, None, ["City"], None, None, True, "population", 50))
+    (sql,) = [s for s in _traced(*call) if "ORDER BY" in s]
+    plan = [row[3] for row in db.get_connection().execute(f"EXPLAIN QUERY PLAN {sql}")]
+    assert any("idx_town_rows_population" in step for step in plan), plan
+
+    copy = tmp_path / "ghana.db"
+    copy.write_bytes(open(db.db_path, "rb").read())
+    conn = sqlite3.connect(copy)
+    conn.execute("DROP INDEX idx_town_rows_population")
+    plan = [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}")]
+    conn.close()
+    assert any("TEMP B-TREE" in step for step in plan), plan
@@ -0,0 +1,109 @@
+import json
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("shapely")
+from shapely.geometry import box  # noqa: E402
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+import reassign_spatial  # noqa: E402
+
+from ghanageo.database import db  # noqa: E402
+
+# Two districts side by side, and a third overlapping the second
+SQUARES = [box(0, 0, 1, 1), box(1, 0, 2, 1), box(1.5, 0, 3, 1)]
+
+
+def test_polygon_index_assign():
+    index = reassign_spatial.PolygonIndex(SQUARES)
+    lats = [0.5, 0.5, 0.5, 0.5, 0.5, 5.0]
+    lngs = [0.5, 1.2, 1.7, 2.5, -0.4, 2.9]
+    # Inside; inside; in two polygons (the first wins); inside the third;
+    # outside everything (nearest centroid), twice
+    assert index.assign(lats, lngs).tolist() == [0, 1, 1, 2, 0, 2]
+    assert index.assign([], []).tolist() == []
+    assert reassign_spatial.PolygonIndex([]).assign([0.5], [0.5]).tolist() == [-1]
+
+
+def test_sharded_assignment_matches_one_pass():
+    index = reassign_spatial.PolygonIndex(SQUARES)
+    rng = np.random.default_rng(7)
+    lats = rng.uniform(-0.5, 1.5, 500)
+    lngs = rng.uniform(-0.5, 3.5, 500)
+    expected = index.assign(lats, lngs)
+    assert (reassign_spatial.assign_districts(lats, lngs, index, workers=2, shard_size=64)
+            == expected).all()
+
+
+@pytest.fixture
+def spatial_db(tmp_path, monkeypatch):
+    """A copy of ghana.db and a boundary file putting all of Ghana in one district"""
+    path = tmp_path / "copy.db"
+    sqlite3.connect(db.db_path).execute("VACUUM INTO ?", (str(path),))
+    boundaries = tmp_path / "GHA_ADM2.geojson"
+    boundaries.write_text(json.dumps({"type": "FeatureCollection", "features": [{
+        "type": "Feature", "properties": {"shapeName": "Kumasi Metropolitan"},
+        "geometry": {"type": "Polygon", "coordinates": [[[-4, 4], [2, 4], [2, 12], [-4, 12], [-4, 4]]]},
+    }]}))
+    monkeypatch.setattr(reassign_spatial, "DB_PATH", path)
+    monkeypatch.setattr(reassign_spatial, "GEOJSON_PATH", boundaries)
+    return path
+
+
+def _pending(path, full=False):
+    conn = sqlite3.connect(path)
+    rows, lats, lngs = reassign_spatial.load_towns(conn)
+    pending, _, everything = reassign_spatial.select_pending(
+        conn, rows, lats, lngs, reassign_spatial.boundaries_hash(conn), full=full)
+    return [rows[i][0] for i in pending.tolist()], everything
+
+
+def test_dry_run_writes_nothing(spatial_db):
+    before = spatial_db.read_bytes()
+    reassign_spatial.main(["--dry-run"])
+    assert spatial_db.read_bytes() == before
+
+
+def test_reruns_only_evaluate_new_or_moved_towns(spatial_db):
+    located, everything = _pending(spatial_db)
+    assert everything and len(located) > 1000
+    reassign_spatial.main([])
+    assert _pending(spatial_db) == ([], False)
+    assert len(_pending(spatial_db, full=True)[0]) == len(located)
+
+    conn = sqlite3.connect(spatial_db)
+    town_id = conn.execute("SELECT id FROM towns WHERE coordinates IS NOT NULL LIMIT 1").fetchone()[0]
+    with conn:
+        conn.execute("""UPDATE towns SET coordinates = '{"lat": 7.5, "lng": -1.5}' WHERE id = ?""", (town_id,))
+    assert _pending(spatial_db) == ([town_id], False)
+
+    # Changed boundaries re-evaluate everything
+    with conn:
+        conn.execute("UPDATE districts SET name = 'Kumasi Metro Area' WHERE id = 'AS-01'")
+    assert _pending(spatial_db)[1]
+
+
+def test_boundaries_hash_with_null_columns(spatial_db):
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE districts (id TEXT, name TEXT, region_id TEXT, region_name TEXT)")
+    conn.execute("INSERT INTO districts VALUES ('AS-01', 'Kumasi Metropolitan', 'AS', NULL)")
+    unnamed = reassign_spatial.boundaries_hash(conn)
+    conn.execute("UPDATE districts SET region_name = 'Ashanti Region'")
+    assert reassign_spatial.boundaries_hash(conn) != unnamed
+
+
+def test_fingerprints_of_deleted_towns_are_pruned(spatial_db):
+    reassign_spatial.main([])
+    conn = sqlite3.connect(spatial_db)
+    town_id = conn.execute("SELECT town_id FROM spatial_fingerprints LIMIT 1").fetchone()[0]
+    with conn:
+        conn.execute("DELETE FROM towns WHERE id = ?", (town_id,))
+    reassign_spatial.write_changes(conn, [], [], "unchanged")
+    assert conn.execute("SELECT COUNT(*) FROM spatial_fingerprints WHERE town_id = ?",
+                        (town_id,)).fetchone()[0] == 0
+    assert conn.execute("SELECT COUNT(*) FROM spatial_fingerprints").fetchone()[0] \
+        == conn.execute("SELECT COUNT(*) FROM towns WHERE coordinates IS NOT NULL").fetchone()[0]
@@ -0,0 +1,26 @@
+import pytest
+
+import ghanageo
+from ghanageo.database import db
+
+
+def test_town_records_match_dicts():
+    """Records convert back to the exact dicts the dict path returns"""
+    records = ghanageo.get_towns(region="AS", as_records=True)
+    towns = ghanageo.get_towns(region="AS")
+    assert len(records) == len(towns)
+    assert sorted(map(repr, (r.to_dict() for r in records))) == sorted(map(repr, towns))
+
+
+def test_region_and_district_records():
+    assert [r.to_dict() for r in ghanageo.get_regions(as_records=True)] == db.get_all_regions()
+    records = ghanageo.get_districts(region="GR", as_records=True)
+    assert [r.to_dict() for r in records] == db.get_districts_by_region("GR")
+
+
+def test_records_are_immutable_and_share_strings():
+    towns = db.get_town_records(region_id="AS")
+    with pytest.raises(AttributeError):
+        towns[0].name = "Elsewhere"
+    assert towns[0].region_name is towns[-1].region_name
+    assert not hasattr(towns[0], "__dict__")
@@ -0,0 +1,91 @@
+import json
+import sqlite3
+
+import pytest
+
+from ghanageo.database import GhanaGeoDB, db
+from ghanageo.schema import OutdatedDatabaseError, is_legacy, migrate_legacy
+
+LEGACY = """
+CREATE TABLE regions (id TEXT PRIMARY KEY, name TEXT NOT NULL, code TEXT UNIQUE NOT NULL,
+    capital TEXT NOT NULL, population INTEGER, area_km2 REAL, coordinates TEXT,
+    created_date TEXT, economic_data TEXT);
+CREATE TABLE districts (id TEXT PRIMARY KEY, name TEXT NOT NULL, region_id TEXT NOT NULL,
+    region_name TEXT NOT NULL, type TEXT NOT NULL, capital TEXT NOT NULL,
+    population INTEGER, area_km2 REAL, coordinates TEXT);
+CREATE TABLE towns (id TEXT PRIMARY KEY, name TEXT NOT NULL, district_id TEXT NOT NULL,
+    district_name TEXT NOT NULL, region_id TEXT NOT NULL, region_name TEXT NOT NULL,
+    type TEXT NOT NULL, population INTEGER, coordinates TEXT);
+"""
+
+
+def _rows(conn, table):
+    conn.row_factory = sqlite3.Row
+    rows = [dict(r) for r in conn.execute(f"SELECT * FROM {table} ORDER BY id")]
+    for row in rows:
+        # JSON text spacing differs between layouts; the parsed values must not
+        row["coordinates"] = json.loads(row["coordinates"]) if row["coordinates"] else None
+    return rows
+
+
+def test_migration_keeps_view_output(tmp_path):
+    """The normalized views return exactly the rows of the legacy tables"""
+    legacy = sqlite3.connect(tmp_path / "legacy.db")
+    legacy.executescript(LEGACY)
+    source = sqlite3.connect(db.db_path)
+    expected = {}
+    for table, where in (("regions", "id = 'AS'"), ("districts", "region_id = 'AS'"),
+                         ("towns", "region_id = 'AS'")):
+        rows = source.execute(f"SELECT * FROM {table} WHERE {where}").fetchall()
+        legacy.executemany(f"INSERT INTO {table} VALUES ({','.join('?' * len(rows[0]))})", rows)
+        expected[table] = _rows(legacy, table)
+    legacy.commit()
+
+    assert migrate_legacy(legacy)
+    assert not is_legacy(legacy)
+    for table, rows in expected.items():
+        assert _rows(legacy, table) == rows
+    assert not migrate_legacy(legacy)
+
+
+def test_writes_through_views(tmp_path):
+    """Script writes to the towns view land in the storage tables"""
+    source = sqlite3.connect(db.db_path)
+    source.execute("VACUUM INTO ?", (str(tmp_path / "copy.db"),))
+    conn = sqlite3.connect(tmp_path / "copy.db")
+    with conn:
+        conn.execute(
+            """INSERT OR IGNORE INTO towns (id, name, district_id, type, population, coordinates)
+               VALUES ('AS-01-T1', 'Testville', 'AS-01', 'Hamlet', 10, '{"lat": 6.5, "lng": -1.5}')"""
+        )
+        conn.execute("UPDATE towns SET id = 'GR-01-T1', district_id = 'GR-01' WHERE id = 'AS-01-T1'")
+    town = next(t for t in _rows(conn, "towns") if t["id"] == "GR-01-T1")
+    assert (town["district_name"], town["region_id"], town["type"]) == \
+           ("Accra Metropolitan", "GR", "Hamlet")
+    with conn:
+        conn.execute("DELETE FROM towns WHERE id = 'GR-01-T1'")
+    assert conn.execute("SELECT COUNT(*) FROM town_rows WHERE id = 'GR-01-T1'").fetchone()[0] == 0
+
+
+def test_opening_never_writes(tmp_path):
+    """An outdated database is left as is; queries needing the new layout say so"""
+    path = tmp_path / "legacy.db"
+    legacy = sqlite3.connect(path)
+    legacy.executescript(LEGACY)
+    legacy.execute("INSERT INTO regions (id, name, code, capital) VALUES ('AS', 'Ashanti', 'AS', 'Kumasi')")
+    legacy.commit()
+    legacy.close()
+    before = path.read_bytes()
+    path.chmod(0o444)
+    reader = GhanaGeoDB(str(path))
+    assert path.read_bytes() == before
+    assert reader.get_region_by_id("AS")["name"] == "Ashanti"
+    with pytest.raises(OutdatedDatabaseError, match="setup_database"):
+        reader.search_ranked("ash")
+    with pytest.raises(OutdatedDatabaseError):
+        reader.lookup_name("ashanti")
+
+
+def test_new_database_gets_the_schema(tmp_path):
+    reader = GhanaGeoDB(str(tmp_path / "data" / "new.db"))
+    assert reader.search_ranked("kumasi") == [] and reader.count_towns() == 0
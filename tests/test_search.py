@@ -0,0 +1,100 @@
+import pytest
+from fastapi.testclient import TestClient
+
+import ghanageo
+from app.main import app
+from ghanageo.database import db
+
+client = TestClient(app)
+
+TIERS = {"exact": 0, "prefix": 1, "word": 2, "substring": 3}
+
+
+def _tier(name, query):
+    name, query = name.lower(), query.lower()
+    if name == query:
+        return TIERS["exact"]
+    if name.startswith(query):
+        return TIERS["prefix"]
+    if f" {query}" in name or f"-{query}" in name:
+        return TIERS["word"]
+    return TIERS["substring"]
+
+
+def test_results_are_ranked():
+    ranked = db.search_ranked("accra", 200)
+    keys = [key for key, _ in ranked]
+    assert keys == sorted(keys)
+    for key, result in ranked:
+        assert key[0] == _tier(result["name"], "accra")
+        assert key[1] == ["region", "district", "town"].index(result["type"])
+    # The exact, most populous town beats every prefix match
+    assert ghanageo.search("Kumasi", limit=1)[0]["id"] == "AS-01-GN2298890"
+    assert ghanageo.search("as", limit=1)[0]["id"] == "AS"
+
+
+def test_cursor_pages_match_one_big_page():
+    full = ghanageo.search("ho", limit=45)
+    pages, cursor = [], None
+    while True:
+        page, cursor = ghanageo.search_page("ho", limit=10, cursor=cursor)
+        pages += page
+        if cursor is None or len(pages) >= 45:
+            break
+    assert pages[:45] == full
+    last, cursor = ghanageo.search_page("Kumasi Metropolitan", limit=10)
+    assert cursor is None and len(last) == 1
+
+
+def test_like_wildcards_are_literal():
+    assert ghanageo.search("%", limit=5) == []
+    assert ghanageo.search("_", limit=5) == []
+
+
+def test_bad_cursors():
+    _, cursor = ghanageo.search_page("ho", limit=2)
+    with pytest.raises(ValueError):
+        ghanageo.search_page("accra", cursor=cursor)
+    with pytest.raises(ValueError):
+        ghanageo.search_page("ho", cursor="not-a-cursor")
+
+
+def test_empty_limit():
+    assert ghanageo.search_page("ho", limit=0) == ([], None)
+    assert ghanageo.search("ho", limit=-1) == []
+    assert client.get("/search", params={"q": "a", "limit": 0}).status_code == 422
+    assert client.get("/search", params={"q": "a", "limit": -1}).status_code == 422
+
+
+def test_search_endpoint_cursor():
+    first = client.get("/search", params={"q": "ho", "limit": 5}).json()
+    assert first["count"] == 5 and first["next_cursor"]
+    second = client.get("/search", params={"q": "ho", "limit": 5, "cursor": first["next_cursor"]}).json()
+    assert not {r["id"] for r in first["data"]} & {r["id"] for r in second["data"]}
+    assert client.get("/search", params={"q": "ho", "cursor": "junk"}).status_code == 400
+    assert "next_cursor" not in client.get("/search", params={"q": "Kumasi Metropolitan"}).json()
+
+
+def test_facets_count_the_whole_matching_set():
+    matches = [r for _, r in db.search_ranked("ho", 10_000)]
+    facets = ghanageo.search_facets("ho")
+    by_level = {}
+    for r in matches:
+        by_level[r["type"]] = by_level.get(r["type"], 0) + 1
+    assert facets["level"] == dict(sorted(by_level.items(), key=lambda i: (-i[1], i[0])))
+    assert sum(facets["region"].values()) == len(matches)
+    # Regions have no type
+    assert sum(facets["type"].values()) == len(matches) - by_level.get("region", 0)
+    assert list(facets["type"].values()) == sorted(facets["type"].values(), reverse=True)
+    assert ghanageo.search_facets("zzzz", ["level"]) == {"level": {}}
+    with pytest.raises(ValueError):
+        ghanageo.search_facets("ho", ["colour"])
+
+
+def test_search_endpoint_facets():
+    body = client.get("/search", params={"q": "ho", "limit": 3, "facets": "type,region,level"}).json()
+    assert body["count"] == 3 and set(body["facets"]) == {"type", "region", "level"}
+    assert body["facets"] == ghanageo.search_facets("ho")
+    assert "facets" not in client.get("/search", params={"q": "ho"}).json()
+    assert client.get("/search", params={"q": "ho", "facets": "colour"}).status_code == 400
+    assert client.get("/search", params={"q": "ho", "facets": "type", "fuzzy": True}).status_code == 400
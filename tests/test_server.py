@@ -0,0 +1,56 @@
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+from ghanageo.client import _server_args
+
+ROOT = Path(__file__).parent.parent
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def test_server_args_defaults(monkeypatch):
+    monkeypatch.setenv("WEB_CONCURRENCY", "3")
+    monkeypatch.setenv("PORT", "9001")
+    args = _server_args([])
+    assert args.workers == 3
+    assert args.port == 9001
+    assert args.app == "app.main:app"
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="pre-fork server needs os.fork")
+def test_serve_api_multi_worker():
+    """ghanageo-api forks workers that serve on one socket and stop on SIGTERM"""
+    port = _free_port()
+    proc = subprocess.Popen(
+        [sys.executable, "-c", "import sys; from ghanageo.client import serve_api; "
+                               "sys.exit(serve_api(sys.argv[1:]))",
+         "--workers", "2", "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning"],
+        cwd=ROOT,
+    )
+    try:
+        deadline = time.monotonic() + 20
+        while True:
+            try:
+                with urllib.request.urlopen(f"http://127.0.0.1:{port}/health", timeout=1) as r:
+                    assert json.load(r)["status"] == "healthy"
+                break
+            except OSError:
+                assert proc.poll() is None, "server exited early"
+                assert time.monotonic() < deadline, "server did not come up"
+                time.sleep(0.2)
+    finally:
+        proc.send_signal(signal.SIGTERM)
+        assert proc.wait(timeout=15) == 0
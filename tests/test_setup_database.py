@@ -0,0 +1,79 @@
+import hashlib
+import shutil
+import sqlite3
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+import setup_database  # noqa: E402
+
+from ghanageo.database import GhanaGeoDB, db  # noqa: E402
+from ghanageo.schema import SCHEMA_VERSION  # noqa: E402
+
+
+def _build(path, capsys, *flags):
+    assert setup_database.main(["--db", str(path), *flags])
+    return capsys.readouterr().out
+
+
+def test_build_then_skip_until_forced(tmp_path, capsys):
+    path = tmp_path / "ghana.db"
+    assert "Building" in _build(path, capsys)
+    reader = GhanaGeoDB(str(path))
+    assert len(reader.get_all_regions()) == 16
+    assert reader.lookup_name("kumasi", "district")
+
+    built = path.read_bytes()
+    assert "skipping build" in _build(path, capsys)
+    assert path.read_bytes() == built
+    assert "Building" in _build(path, capsys, "--force")
+
+
+def test_seed_or_schema_changes_rebuild(tmp_path, capsys, monkeypatch):
+    path = tmp_path / "ghana.db"
+    seed = tmp_path / "seed"
+    shutil.copytree(setup_database.SEED_DIR, seed)
+    monkeypatch.setattr(setup_database, "SEED_DIR", seed)
+    _build(path, capsys)
+
+    towns = (seed / "towns.csv").read_text(encoding="utf-8")
+    (seed / "towns.csv").write_text(towns.replace("Cantonments", "Cantonment", 1), encoding="utf-8")
+    assert "Building" in _build(path, capsys)
+    assert GhanaGeoDB(str(path)).get_town_by_id("GR-01-T02")["name"] == "Cantonment"
+    assert "skipping build" in _build(path, capsys)
+
+    # An older layout is rebuilt (and so upgraded) even with a matching checksum
+    conn = sqlite3.connect(path)
+    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION - 1}")
+    conn.close()
+    assert setup_database.stored_checksum(path) is None
+    assert "Building" in _build(path, capsys)
+    assert GhanaGeoDB(str(path)).schema_version == SCHEMA_VERSION
+
+
+# SHA-256 of "id\tdistrict_id" lines, by id, in ghana.db before the seed
+# build: the curated towns carry their spatially reassigned districts
+TOWN_DISTRICTS_SHA256 = "0071b7b666ae46e243f4edde60c2b8927e31d9aa6d3758734e663975b43af632"
+
+
+def _town_districts(path):
+    conn = sqlite3.connect(path)
+    try:
+        return conn.execute("SELECT id, district_id FROM towns ORDER BY id").fetchall()
+    finally:
+        conn.close()
+
+
+def _digest(rows):
+    return hashlib.sha256("\n".join(f"{i}\t{d}" for i, d in rows).encode()).hexdigest()
+
+
+def test_forced_rebuild_keeps_reassigned_districts(tmp_path, capsys):
+    """Rebuilding from the seed must not move towns back to their old districts"""
+    assert _digest(_town_districts(db.db_path)) == TOWN_DISTRICTS_SHA256
+    path = tmp_path / "ghana.db"
+    shutil.copyfile(db.db_path, path)
+    assert "Building" in _build(path, capsys, "--force")
+    districts = dict(_town_districts(path))
+    assert (districts["GR-01-T01"], districts["AS-13-T01"], districts["AS-08-T01"]) == ("GR-11", "AS-01", "AS-01")
+    assert _digest(sorted(districts.items())) == TOWN_DISTRICTS_SHA256
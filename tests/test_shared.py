@@ -0,0 +1,70 @@
+import os
+import time
+from pathlib import Path
+
+from ghanageo import shared
+from ghanageo.database import db
+from ghanageo.pack import DatasetPack, load_pack
+from ghanageo.shared import ensure_shared_pack
+
+
+def test_workers_share_one_pack(tmp_path):
+    """Every caller gets the same file; only the first one builds it"""
+    first = ensure_shared_pack(db.db_path, tmp_path)
+    built = first.stat().st_mtime_ns
+    assert ensure_shared_pack(db.db_path, tmp_path) == first
+    assert first.stat().st_mtime_ns == built
+    with DatasetPack(first) as pack:
+        assert pack.is_current(db.db_path)
+
+
+def test_recovers_from_crashed_build(tmp_path):
+    """A truncated pack and stale temp files from a dead builder are replaced"""
+    path = ensure_shared_pack(db.db_path, tmp_path)
+    path.write_bytes(path.read_bytes()[:100])
+    stale = tmp_path / ".ghanageo-crashed.tmp"
+    stale.write_bytes(b"partial")
+    old = time.time() - 3600
+    os.utime(stale, (old, old))
+    other_version = tmp_path / "ghanageo-0000000000000000-v1.pack"
+    other_version.write_bytes(b"old")
+
+    assert ensure_shared_pack(db.db_path, tmp_path) == path
+    with DatasetPack(path) as pack:
+        assert pack.get_towns_count() == db.get_towns_count()
+    assert not stale.exists()
+    assert not other_version.exists()
+
+
+def test_load_pack_uses_shared_pack(tmp_path, monkeypatch):
+    monkeypatch.setenv("GHANAGEO_SHARED", "1")
+    monkeypatch.setenv("GHANAGEO_SHARED_DIR", str(tmp_path))
+    monkeypatch.delenv("GHANAGEO_PACK", raising=False)
+    pack = load_pack(db_path=db.db_path)
+    assert pack is not None
+    assert pack.get_region_by_id("AS") == db.get_region_by_id("AS")
+    assert list(tmp_path.glob("ghanageo-*.pack"))
+
+
+def test_mapped_shared_pack_is_not_rehashed(tmp_path, monkeypatch):
+    """Repeat lookups reuse the digest and the mapped pack until ghana.db changes"""
+    monkeypatch.setenv("GHANAGEO_SHARED", "1")
+    monkeypatch.setenv("GHANAGEO_SHARED_DIR", str(tmp_path))
+    monkeypatch.delenv("GHANAGEO_PACK", raising=False)
+    db_copy = tmp_path / "ghana.db"
+    db_copy.write_bytes(Path(db.db_path).read_bytes())
+    hashed = []
+    fingerprint, valid = shared.source_fingerprint, shared._valid
+    monkeypatch.setattr(shared, "source_fingerprint", lambda p: hashed.append(p) or fingerprint(p))
+    monkeypatch.setattr(shared, "_valid", lambda p: hashed.append(p) or valid(p))
+
+    pack = load_pack(db_path=db_copy)
+    assert pack is not None
+    calls = len(hashed)
+    for _ in range(5):
+        assert load_pack(db_path=db_copy) is pack
+    assert len(hashed) == calls
+
+    os.utime(db_copy, ns=(time.time_ns(), time.time_ns()))
+    assert load_pack(db_path=db_copy) is not None
+    assert len(hashed) > calls
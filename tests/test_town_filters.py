@@ -0,0 +1,57 @@
+import pytest
+from fastapi.testclient import TestClient
+
+import ghanageo
+from app.main import app
+
+client = TestClient(app)
+
+
+def _everything(region=None):
+    return ghanageo.get_towns(region=region) if region else ghanageo.get_towns(limit=100_000)
+
+
+def test_filters_match_a_full_listing():
+    expected = [t for t in _everything("AS")
+                if t["type"] in ("City", "Town") and (t["population"] or 0) > 20000]
+    expected.sort(key=lambda t: -t["population"])
+    found = ghanageo.get_towns(region="AS", type=["City", "Town"], min_population=20001,
+                               sort="-population", limit=50)
+    assert [t["population"] for t in found] == [t["population"] for t in expected][:50]
+    assert ghanageo.count_towns(region="AS", type=["City", "Town"], min_population=20001) == len(expected)
+
+
+def test_population_range_coordinates_and_paging():
+    towns = _everything()
+    expected = sorted((t for t in towns if t["coordinates"] and t["population"] is not None
+                       and 1000 <= t["population"] <= 50000), key=lambda t: t["population"])
+    found = ghanageo.get_towns(min_population=1000, max_population=50000, has_coordinates=True,
+                               sort="population", limit=len(expected) + 5)
+    assert [t["population"] for t in found] == [t["population"] for t in expected]
+    page = ghanageo.get_towns(min_population=1000, max_population=50000, has_coordinates=True,
+                              sort="population", limit=10, offset=10)
+    assert page == found[10:20]
+    assert ghanageo.count_towns(has_coordinates=False) == sum(1 for t in towns if not t["coordinates"])
+
+
+def test_name_sort_and_scopes():
+    found = ghanageo.get_towns(district="AS-01", type="City", sort="name")
+    assert found and all(t["district_id"] == "AS-01" and t["type"] == "City" for t in found)
+    names = [t["name"] for t in ghanageo.get_towns(min_population=1000, limit=200)]
+    assert names == sorted(names, key=str.lower)
+    assert ghanageo.get_towns(district="XX-99", sort="name") == []
+    assert ghanageo.count_towns(district="XX-99") == 0
+    with pytest.raises(ghanageo.DataNotFoundError):
+        ghanageo.get_towns(region="XX", sort="name")
+    with pytest.raises(ValueError):
+        ghanageo.get_towns(sort="area")
+
+
+def test_towns_endpoint_filters():
+    body = client.get("/towns", params={"region": "AS", "type": "City,Town", "min_population": 20001,
+                                        "sort": "-population", "limit": 5}).json()
+    assert body["count"] == 5
+    assert body["total"] == ghanageo.count_towns(region="AS", type=["City", "Town"], min_population=20001)
+    assert [t["population"] for t in body["data"]] == sorted((t["population"] for t in body["data"]), reverse=True)
+    assert "total" not in client.get("/towns", params={"limit": 5}).json()
+    assert client.get("/towns", params={"sort": "area"}).status_code == 422